@@ -21,6 +21,7 @@ WINDOW_WIDTH = LOGICAL_WIDTH * WINDOW_SCALE
 WINDOW_HEIGHT = LOGICAL_HEIGHT * WINDOW_SCALE
 TARGET_FPS = 60
 VSYNC = True
+DIRTY_RECTS = False  # Upload only changed regions (scenes report them from draw())
 
 # Tile Settings
 from engine.world.tiles import TILE_SIZE  # Import from central location
@@ -356,6 +357,10 @@ class DebugConfig:
     FAST_TEXT = False
     UNLOCK_ALL_AREAS = False
     
+    # Kampfaufzeichnung: jeder Kampf der BattleScene als Replay-Datei
+    RECORD_BATTLE_REPLAYS = False
+    BATTLE_REPLAY_DIR = "replays"
+    
     # Logging
     LOG_LEVEL = "INFO"  # DEBUG, INFO, WARNING, ERROR
     LOG_TO_FILE = True
@@ -405,6 +410,11 @@ class PerformanceConfig:
     MAX_CACHED_IMAGES = 100
     MAX_CACHED_SOUNDS = 50
     MAX_CACHED_MAPS = 10
+    MAX_CACHED_MAP_MB = 48  # Byte budget for rendered map chunks (Area surface cache)
+    MAX_CACHED_MONSTER_SPRITES = 24  # Least recently used monster sprites are evicted beyond this
+    
+    # Startup
+    STARTUP_BUDGET_MS = 1000  # Cold start to the first StartScene frame (python main.py --profile-startup)
     
     # Update rates
     PHYSICS_UPDATE_RATE = 60  # Hz
@@ -4,6 +4,7 @@ Verwaltet Debug-Informationen und Overlay-Rendering
 """
 
 import pygame
+from pathlib import Path
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 
@@ -48,6 +49,9 @@ class DebugOverlayManager:
         # Debug-Text zeichnen
         self._draw_debug_text(surface, debug_info)
         
+        # Battle-Profiler Messwerte
+        self._draw_battle_profile(surface)
+        
         # Input-Debug Hotkey-Hilfe
         if hasattr(self.game, 'input_manager') and self.game.input_manager.debug_enabled:
             self._draw_debug_help(surface)
@@ -114,6 +118,9 @@ class DebugOverlayManager:
         # Input-Debug Status hinzufügen
         debug_lines.append(f"Input Debug: {info.input_debug_status}")
         
+        # Surface-Cache der Maps (nur wenn Areas schon geladen wurden)
+        debug_lines.extend(self._map_cache_lines())
+        
         # Debug-Text zeichnen
         y = 20
         for line in debug_lines:
@@ -121,6 +128,45 @@ class DebugOverlayManager:
             surface.blit(text_surface, (2, y))
             y += 12
     
+    def _map_cache_lines(self) -> List[str]:
+        """Belegung und Trefferquote des Area-Surface-Caches"""
+        import sys
+        module = sys.modules.get('engine.world.area')
+        if module is None:
+            return []
+        stats = module.Area.cache_stats()
+        return [
+            f"Map Cache: {stats['entries']}/{stats['max_entries']} maps, "
+            f"{stats['bytes'] / 2**20:.1f}/{stats['max_bytes'] / 2**20:.0f} MB",
+            f"  hits {stats['hit_rate']:.0%}, evicted {stats['evictions']}",
+        ]
+    
+    def _draw_battle_profile(self, surface: pygame.Surface) -> None:
+        """Zeichnet p50/p95/p99 der teuersten Battle-Timer (nur bei aktivem Profiler)"""
+        import sys
+        # Kein Import des Battle-Pakets nur für das Overlay
+        module = sys.modules.get('engine.systems.battle.battle_profiler')
+        if module is None or not module.profiler.enabled:
+            return
+        
+        x = self.game.logical_size[0] // 2
+        y = 20
+        header = self.font.render("Battle p50/p95/p99:", True, (0, 200, 255))
+        surface.blit(header, (x, y))
+        lines = module.profiler.summary_lines(limit=8)
+        stat_cache = sys.modules.get('engine.systems.battle.stat_cache')
+        if stat_cache is not None and stat_cache.EffectiveStatCache.debug:
+            lines.append(f"Stat-Cache: {stat_cache.EffectiveStatCache.hit_rate():.0%} Treffer")
+        for line in lines:
+            y += 12
+            text_surface = self.font.render(line, True, (0, 200, 255))
+            surface.blit(text_surface, (x, y))
+    
+    def export_battle_profile(self, filename: str = "battle_profile.json") -> Path:
+        """Exportiert die Battle-Profiler-Messwerte als JSON-Datei"""
+        from engine.systems.battle.battle_profiler import profiler
+        return profiler.export(filename)
+    
     def _draw_debug_help(self, surface: pygame.Surface) -> None:
         """Zeichnet Debug-Hilfe"""
         help_lines = [
@@ -137,9 +183,13 @@ class DebugOverlayManager:
                 "F6: Find Unhandled Inputs",
                 "F7: Find Performance Issues"
             ])
+        help_lines.extend([
+            "F8: Toggle Battle-Profiler",
+            "F9: Export Battle-Profil"
+        ])
         
         # Hilfe am unteren Bildschirmrand zeichnen
-        y_help = self.game.logical_size[1] - 60
+        y_help = self.game.logical_size[1] - 12 * len(help_lines)
         for help_line in help_lines:
             text_surface = self.font.render(help_line, True, (255, 255, 0))
             surface.blit(text_surface, (2, y_help))
@@ -160,11 +210,11 @@ class DebugOverlayManager:
             pygame.draw.line(surface, color,
                            (0, y), (self.game.logical_size[0], y), 1)
     
-    def draw_fps_counter(self, surface: pygame.Surface) -> None:
-        """Zeichnet FPS-Zähler"""
+    def draw_fps_counter(self, surface: pygame.Surface) -> Optional[pygame.Rect]:
+        """Zeichnet FPS-Zähler und gibt den belegten Bereich zurück"""
         if not self.game.show_fps or not self.font:
-            return
+            return None
         
         fps_text = f"FPS: {self.game.clock.get_fps():.1f}"
         fps_surface = self.font.render(fps_text, True, (255, 255, 0))
-        surface.blit(fps_surface, (2, 2))
+        return surface.blit(fps_surface, (2, 2))
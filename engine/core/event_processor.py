@@ -21,6 +21,8 @@ class DebugKeyConfig:
     f5: int = pygame.K_F5
     f6: int = pygame.K_F6
     f7: int = pygame.K_F7
+    f8: int = pygame.K_F8
+    f9: int = pygame.K_F9
 
 
 class EventProcessor:
@@ -42,7 +44,9 @@ class EventProcessor:
             self.debug_keys.f4: self._show_current_input_status,
             self.debug_keys.f5: self._export_input_analysis,
             self.debug_keys.f6: self._find_unhandled_inputs,
-            self.debug_keys.f7: self._find_performance_issues
+            self.debug_keys.f7: self._find_performance_issues,
+            self.debug_keys.f8: self._toggle_battle_profiler,
+            self.debug_keys.f9: self._export_battle_profile
         }
     
     def process_events(self) -> None:
@@ -72,6 +76,14 @@ class EventProcessor:
             elif event.type == pygame.MOUSEMOTION:
                 self.game.mouse_pos = self._screen_to_logical(event.pos)
             
+            # Fenstergröße geändert: Letterbox-Geometrie neu berechnen
+            elif event.type in (pygame.VIDEORESIZE, pygame.WINDOWSIZECHANGED):
+                self.game.invalidate_present_geometry()
+            
+            # Fenster neu aufgedeckt: nächster Frame komplett präsentieren
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.game.request_full_present()
+            
             # Performance-Tracking für Event-Verarbeitung
             processing_time = time.time() - start_time
             
@@ -159,6 +171,25 @@ class EventProcessor:
             for event in slow_events[-5:]:  # Letzte 5
                 print(f"  Frame {event.frame}: {event.event_type} {event.key_name} - {event.processing_time*1000:.2f}ms")
     
+    def _toggle_battle_profiler(self) -> None:
+        """Battle-Profiler ein-/ausschalten"""
+        from engine.systems.battle.battle_profiler import profiler
+        from engine.systems.battle.stat_cache import EffectiveStatCache
+        if profiler.enabled:
+            profiler.disable()
+        else:
+            profiler.enable()
+            EffectiveStatCache.reset_counters()
+        # Stat-Cache-Trefferquote nur zählen, solange der Profiler läuft
+        EffectiveStatCache.debug = profiler.enabled
+        status = "aktiviert" if profiler.enabled else "deaktiviert"
+        print(f"🔍 DEBUG: Battle-Profiler {status}")
+    
+    def _export_battle_profile(self) -> None:
+        """Battle-Profiler-Messwerte als JSON exportieren"""
+        path = self.game.debug_overlay_manager.export_battle_profile()
+        print(f"🔍 DEBUG: Battle-Profil exportiert nach {path}")
+    
     def _log_input_event(self, event: pygame.event.Event, processing_time: float) -> None:
         """Loggt Input-Events für Debug-Zwecke"""
         if not hasattr(self.game, 'input_debugger') or not self.game.input_debugger:
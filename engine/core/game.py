@@ -9,8 +9,10 @@ import pygame
 import time
 
 # Import refactored components
+from engine.core.config import DIRTY_RECTS
 from engine.core.event_processor import EventProcessor
 from engine.core.debug_overlay import DebugOverlayManager
+from engine.devtools.startup_profiler import measure as measure_startup
 
 
 class Game:
@@ -82,6 +84,18 @@ class Game:
         self.running = False
         self.paused = False
         
+        # Presentation: in dirty-rect mode only changed regions are scaled and uploaded
+        self.dirty_rects_enabled = DIRTY_RECTS
+        self._dirty_rects: Optional[List[pygame.Rect]] = None  # None = full frame
+        self._full_present = True
+        self._drawn_scenes: Tuple = ()
+        self._fps_rect: Optional[pygame.Rect] = None
+        
+        # Letterbox geometry and persistent scale target, rebuilt only on resize
+        self._present_scale = 1
+        self._present_rect: Optional[pygame.Rect] = None
+        self._present_target: Optional[pygame.Surface] = None
+        
         # Font for debug overlay (legacy, wird durch DebugOverlayManager ersetzt)
         self.debug_font: Optional[pygame.font.Font] = None
         try:
@@ -98,10 +112,14 @@ class Game:
         # AudioManager is optional; provide a no-op fallback if missing
         from engine.audio.audio_manager import AudioManager
         
-        self.resources = ResourceManager()
-        self.story_manager = StoryManager()
-        self.party_manager = PartyManager(self)
-        self.cutscene_manager = CutsceneManager(self)
+        with measure_startup("ResourceManager"):
+            self.resources = ResourceManager()
+        with measure_startup("StoryManager"):
+            self.story_manager = StoryManager()
+        with measure_startup("PartyManager"):
+            self.party_manager = PartyManager(self)
+        with measure_startup("CutsceneManager"):
+            self.cutscene_manager = CutsceneManager(self)
         # Provide a simple transition controller with a start() API
         class _SimpleTransitionManager:
             def __init__(self, game: 'Game') -> None:
@@ -143,7 +161,8 @@ class Game:
                     return None
         
         self.transition_manager = _SimpleTransitionManager(self)
-        self.audio_manager = AudioManager()
+        with measure_startup("AudioManager"):
+            self.audio_manager = AudioManager()
         
         # Story-System für neues Spiel initialisieren
         self._init_story_system()
@@ -164,7 +183,8 @@ class Game:
         from engine.core.input_manager import InputManager, InputConfig
         
         # Create input manager with default config
-        self.input_manager = InputManager(InputConfig())
+        with measure_startup("InputManager"):
+            self.input_manager = InputManager(InputConfig())
         
         # Initialize extended input debugger
         try:
@@ -213,10 +233,13 @@ class Game:
             Exit code (0 for success)
         """
         self.running = True
+        exit_code = 0
         
         # Initialize with start scene
         from engine.scenes.start_scene import StartScene
-        self.push_scene(StartScene)
+        from engine.devtools.startup_profiler import StartupProfiler, finish as finish_startup_profile
+        with measure_startup("StartScene"):
+            self.push_scene(StartScene)
         
         # Main game loop
         while self.running:
@@ -237,8 +260,13 @@ class Game:
             
             # Present
             self._present()
+            
+            # --profile-startup: nach dem ersten StartScene-Frame berichten und beenden
+            if self.frame_count == 1 and StartupProfiler.active() is not None:
+                exit_code = finish_startup_profile()
+                self.running = False
         
-        return 0
+        return exit_code
     
     def _process_events(self) -> None:
         """Process all pygame events and update input state."""
@@ -284,6 +312,8 @@ class Game:
         # Draw transition if active
         if self.scene_transition:
             self.scene_transition.draw(self.logical_surface)
+            self._drawn_scenes = ()
+            self._dirty_rects = None
             return
         
         # Find the lowest visible scene that blocks drawing
@@ -294,48 +324,124 @@ class Game:
                 break
         
         # Draw scenes from bottom-most blocking scene upward
+        dirty: Optional[List[pygame.Rect]] = []
+        drawn_scenes = []
         for i in range(start_idx, len(self.scene_stack)):
             scene = self.scene_stack[i]
             if scene.is_visible:
-                scene.draw(self.logical_surface)
+                scene_dirty = scene.draw(self.logical_surface)
+                drawn_scenes.append(id(scene))
+                if scene_dirty is None or dirty is None:
+                    dirty = None
+                else:
+                    dirty.extend(scene_dirty)
+        
+        # A different set of scenes or a toggled overlay invalidates everything on screen
+        frame_key = (tuple(drawn_scenes), self.debug_overlay_enabled)
+        if frame_key != self._drawn_scenes:
+            self._drawn_scenes = frame_key
+            dirty = None
         
         # Draw debug overlay using DebugOverlayManager
         if self.debug_overlay_enabled:
             self.debug_overlay_manager.draw_debug_overlay(self.logical_surface)
+            dirty = None
         
         # Draw FPS counter using DebugOverlayManager
+        fps_rect = None
         if self.show_fps:
-            self.debug_overlay_manager.draw_fps_counter(self.logical_surface)
+            fps_rect = self.debug_overlay_manager.draw_fps_counter(self.logical_surface)
+        if dirty is not None:
+            # Old and new counter area: the text width changes with the value
+            dirty.extend(rect for rect in (self._fps_rect, fps_rect) if rect)
+        self._fps_rect = fps_rect
+        
+        self._dirty_rects = dirty
     
-    def _present(self) -> None:
-        """Scale and present the logical surface to the screen."""
-        # Calculate scaling to maintain aspect ratio
+    def request_full_present(self) -> None:
+        """Force the next frame to be presented in full (e.g. after window exposure)."""
+        self._full_present = True
+    
+    def invalidate_present_geometry(self) -> None:
+        """Recompute letterbox geometry and scale target before the next frame (window resize)."""
+        self._present_rect = None
+        self._full_present = True
+    
+    def _update_present_geometry(self) -> None:
+        """Calculate integer scale and centered destination for the current window size."""
+        self.screen = pygame.display.get_surface() or self.screen
         window_w, window_h = self.screen.get_size()
         logical_w, logical_h = self.logical_size
         
-        scale_x = window_w / logical_w
-        scale_y = window_h / logical_h
-        scale = min(scale_x, scale_y)
-        
-        # Calculate integer scale for pixel-perfect rendering
-        int_scale = max(1, int(scale))
-        
-        # Calculate destination size and position for centered display
+        # Integer scale for pixel-perfect rendering, keeping the aspect ratio
+        int_scale = max(1, int(min(window_w / logical_w, window_h / logical_h)))
         dest_w = logical_w * int_scale
         dest_h = logical_h * int_scale
-        dest_x = (window_w - dest_w) // 2
-        dest_y = (window_h - dest_h) // 2
+        self._present_scale = int_scale
+        self._present_rect = pygame.Rect((window_w - dest_w) // 2, (window_h - dest_h) // 2,
+                                         dest_w, dest_h)
+        
+        # Scale straight into the window area; windows smaller than the
+        # logical size have no valid target and use the clipped blit path
+        if self.screen.get_rect().contains(self._present_rect):
+            self._present_target = self.screen.subsurface(self._present_rect)
+        else:
+            self._present_target = None
         
-        # Clear screen with letterbox color
+        # Letterbox bars are never drawn over, so clear them once per geometry
         self.screen.fill((0, 0, 0))
+    
+    def _present(self) -> None:
+        """Scale and present the logical surface to the screen."""
+        if self._present_rect is None:
+            self._update_present_geometry()
         
-        # Scale and blit the logical surface
-        scaled = pygame.transform.scale(self.logical_surface, (dest_w, dest_h))
-        self.screen.blit(scaled, (dest_x, dest_y))
+        if (self.dirty_rects_enabled and not self._full_present and self._dirty_rects is not None
+                and self._present_target is not None):
+            self._present_dirty(self._dirty_rects)
+            return
+        self._full_present = False
+        
+        if self._present_scale == 1:
+            # No scaling needed: plain blit
+            self.screen.blit(self.logical_surface, self._present_rect)
+        elif self._present_target is not None:
+            # Scale into the persistent target instead of allocating a new surface
+            pygame.transform.scale(self.logical_surface, self._present_rect.size, self._present_target)
+        else:
+            self.screen.blit(pygame.transform.scale(self.logical_surface, self._present_rect.size),
+                             self._present_rect)
         
         # Flip the display
         pygame.display.flip()
     
+    def _present_dirty(self, rects: List[pygame.Rect]) -> None:
+        """
+        Scale and upload only the changed regions of the logical surface.
+        
+        Args:
+            rects: Changed regions in logical coordinates (empty = static frame)
+        """
+        if not rects:
+            return  # Static frame: the window already shows it
+        
+        int_scale = self._present_scale
+        dest_x, dest_y = self._present_rect.topleft
+        bounds = self.logical_surface.get_rect()
+        updates = []
+        for rect in rects:
+            rect = rect.clip(bounds)
+            if not rect.width or not rect.height:
+                continue
+            target = pygame.Rect(rect.x * int_scale, rect.y * int_scale,
+                                 rect.width * int_scale, rect.height * int_scale)
+            pygame.transform.scale(self.logical_surface.subsurface(rect), target.size,
+                                   self._present_target.subsurface(target))
+            updates.append(target.move(dest_x, dest_y))
+        
+        if updates:
+            pygame.display.update(updates)
+    
     # Scene Management Methods
     
     def push_scene(self, scene_class: Type['Scene'], **kwargs: Any) -> None:
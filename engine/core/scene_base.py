@@ -4,7 +4,7 @@ Defines the abstract base class for all game scenes
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List
 import pygame
 
 
@@ -107,12 +107,19 @@ class Scene(ABC):
         pass
     
     @abstractmethod
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface) -> Optional[List[pygame.Rect]]:
         """
         Render the scene to the given surface.
         
+        Scenes may report which regions changed since the previous frame.
+        The game only uses this in dirty-rect mode (config.DIRTY_RECTS).
+        
         Args:
             surface: The logical surface to draw on (320x180)
+            
+        Returns:
+            None if the whole surface may have changed, otherwise the changed
+            regions in logical coordinates (an empty list means nothing changed)
         """
         pass
     
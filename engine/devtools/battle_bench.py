@@ -0,0 +1,484 @@
+"""
+Battle micro-benchmarks with stored baselines.
+
+Times the battle hot paths on fixed seeds without a display:
+damage pipelines, DQM formulas, turn order, AI decisions, the turn event
+generator and full 1v1/3v3 turns of the headless simulator. Results can be
+saved as a baseline and later compared against it; comparison fails when a
+benchmark got slower by more than a threshold percentage.
+
+Usage:
+    python -m engine.devtools.battle_bench                 # run and print
+    python -m engine.devtools.battle_bench --save          # store baseline
+    python -m engine.devtools.battle_bench --compare --threshold 15
+
+The committed baseline (data/benchmarks/battle_baseline.json) records the
+machine it was taken on. Timings only compare on similar hardware, so CI
+runners should store their own baseline with --save before comparing.
+"""
+
+import os
+
+# Headless: never open a window or audio device
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+BASELINE_PATH = Path(__file__).resolve().parents[2] / "data" / "benchmarks" / "battle_baseline.json"
+DEFAULT_THRESHOLD = 10.0  # Percent
+SEED = 1234
+
+# name -> setup(seed) returning the operation to time
+Setup = Callable[[int], Callable[[], Any]]
+BENCHMARKS: Dict[str, Setup] = {}
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    """Register a benchmark setup function under a name."""
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing of one benchmark in microseconds per operation."""
+    name: str
+    best_us: float
+    median_us: float
+    operations: int
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class Regression:
+    """A baseline benchmark that got slower than allowed, failed or did not run."""
+    name: str
+    baseline_us: float
+    current_us: float
+    error: Optional[str] = None  # Set when the benchmark failed or is missing
+
+    @property
+    def percent(self) -> float:
+        if self.error is not None:
+            return float('inf')
+        return (self.current_us / self.baseline_us - 1.0) * 100.0
+
+    def __str__(self) -> str:
+        if self.error is not None:
+            return f"{self.name}: {self.error}"
+        return (f"{self.name}: {self.baseline_us:.2f}us -> {self.current_us:.2f}us "
+                f"(+{self.percent:.1f}%)")
+
+
+# --- Benchmark fixtures -----------------------------------------------------
+
+@dataclass
+class BenchMove:
+    """Move with the attributes the damage pipeline, AI and simulator read."""
+    name: str
+    power: int = 40
+    accuracy: int = 95
+    type: str = "Bestie"
+    category: str = "phys"
+    priority: int = 0
+    pp: int = 10 ** 9  # Benchmarks must never run out of PP
+    max_pp: int = 10 ** 9
+    effects: List = field(default_factory=list)
+
+    def use(self) -> bool:
+        self.pp -= 1
+        return True
+
+
+@dataclass
+class BenchSpecies:
+    name: str
+    types: List[str]
+
+
+class BenchMonster:
+    """
+    Self-contained monster for benchmarks.
+    Independent of monsters.json so game data edits do not move the baselines.
+    """
+
+    def __init__(self, name: str, level: int, types: List[str], speed: int, hp: int = 200):
+        self.name = name
+        self.level = level
+        self.species = BenchSpecies(name, types)
+        self.max_hp = hp
+        self.current_hp = hp
+        self.stats = {'hp': hp, 'atk': 40 + level * 2, 'def': 30 + level * 2,
+                      'mag': 35 + level, 'res': 30 + level, 'spd': speed}
+        self.stat_stages = {'atk': 0, 'def': 0, 'mag': 0, 'res': 0, 'spd': 0}
+        self.status = None
+        self.is_fainted = False
+        self.moves = [
+            BenchMove("Tackle"),
+            BenchMove("Glut", power=60, type="Feuer", category="mag"),
+            BenchMove("Biss", power=55, accuracy=90),
+            BenchMove("Aquastrahl", power=50, type="Wasser", category="mag"),
+        ]
+
+    def take_damage(self, damage: int) -> int:
+        actual = min(damage, self.current_hp)
+        self.current_hp -= actual
+        if self.current_hp <= 0:
+            self.is_fainted = True
+        return actual
+
+
+TYPES = (["Feuer"], ["Wasser"], ["Pflanze"], ["Bestie"], ["Erde", "Feuer"], ["Wasser", "Pflanze"])
+
+
+def make_team(prefix: str, size: int, seed: int) -> List[BenchMonster]:
+    """Deterministic team of bench monsters."""
+    import random
+    rng = random.Random(seed)
+    return [BenchMonster(f"{prefix}{i}", rng.randint(15, 30), TYPES[rng.randrange(len(TYPES))],
+                         speed=rng.randint(30, 90))
+            for i in range(size)]
+
+
+def bench_factory(species: Any, level: int, seed: int) -> BenchMonster:
+    """Monster factory for the headless simulator."""
+    return BenchMonster(str(species), level, TYPES[level % len(TYPES)], speed=40 + level)
+
+
+# --- Benchmarks ---------------------------------------------------------------
+
+def _damage_setup(seed: int, compiled: bool) -> Callable[[], Any]:
+    from engine.systems.battle.damage_calc import DamageCalculator
+
+    calculator = DamageCalculator(seed=seed, compiled=compiled)
+    attacker, defender = make_team("A", 1, seed) + make_team("D", 1, seed + 1)
+    move = attacker.moves[1]
+    return lambda: calculator.calculate(attacker, defender, move)
+
+
+@benchmark('damage.calculate')
+def bench_damage(seed: int) -> Callable[[], Any]:
+    return _damage_setup(seed, compiled=False)
+
+
+@benchmark('damage.calculate_compiled')
+def bench_damage_compiled(seed: int) -> Callable[[], Any]:
+    return _damage_setup(seed, compiled=True)
+
+
+def _real_damage_setup(seed: int, compiled: bool) -> Callable[[], Any]:
+    from engine.systems.battle.battle_simulator import create_monster
+    from engine.systems.battle.damage_calc import DamageCalculator
+
+    # Real MonsterInstances carry species traits and the full stat machinery
+    calculator = DamageCalculator(seed=seed, compiled=compiled)
+    attacker = create_monster("Glutstummel", 20, seed)
+    defender = create_monster("Urmolch", 20, seed + 1)
+    move = attacker.moves[0]
+    return lambda: calculator.calculate(attacker, defender, move)
+
+
+@benchmark('damage.calculate_real')
+def bench_damage_real(seed: int) -> Callable[[], Any]:
+    return _real_damage_setup(seed, compiled=False)
+
+
+@benchmark('damage.calculate_real_compiled')
+def bench_damage_real_compiled(seed: int) -> Callable[[], Any]:
+    return _real_damage_setup(seed, compiled=True)
+
+
+@benchmark('dqm.calculate_damage')
+def bench_dqm(seed: int) -> Callable[[], Any]:
+    from engine.systems.battle.dqm_formulas import DQMCalculator
+
+    calculator = DQMCalculator(rng_seed=seed)
+    attacker, defender = make_team("A", 1, seed) + make_team("D", 1, seed + 1)
+    return lambda: calculator.calculate_damage(attacker.stats, defender.stats, 60,
+                                               tension_level=25,
+                                               attacker_traits=['Attack Boost'])
+
+
+@benchmark('turn_order.sort_actions')
+def bench_turn_order(seed: int) -> Callable[[], Any]:
+    from engine.systems.battle.turn_logic import BattleAction, ActionType, TurnOrder
+
+    players, enemies = make_team("P", 3, seed), make_team("E", 3, seed + 1)
+    turn_order = TurnOrder(seed=seed)
+    for actor, target in zip(players + enemies, enemies + players):
+        turn_order.add_action(BattleAction(actor=actor, action_type=ActionType.ATTACK,
+                                           target=target, move=actor.moves[0]))
+    return turn_order.sort_actions
+
+
+@benchmark('ai.decide_action')
+def bench_ai(seed: int) -> Callable[[], Any]:
+    from engine.systems.battle.battle_ai import BattleAI, AILevel
+
+    ai = BattleAI(AILevel.EXPERT, seed=seed)
+    actor, targets = make_team("A", 1, seed)[0], make_team("D", 3, seed + 1)
+    return lambda: ai.decide_action(None, actor, targets)
+
+
+class _EventBattleState:
+    """Battle state with the attributes BattleEventGenerator reads."""
+
+    def __init__(self, seed: int):
+        self.player_team = make_team("P", 1, seed)
+        self.enemy_team = make_team("E", 1, seed + 1)
+        for monster in self.player_team + self.enemy_team:
+            monster.max_hp = monster.current_hp = 10 ** 9  # Nobody faints
+        self.player_active = self.player_team[0]
+        self.enemy_active = self.enemy_team[0]
+        self.turn_count = 1
+        self.weather = None
+
+    def has_able_monsters(self, team: List[BenchMonster]) -> bool:
+        return any(not monster.is_fainted for monster in team)
+
+
+@benchmark('events.turn_execution_generator')
+def bench_events(seed: int) -> Callable[[], Any]:
+    from engine.systems.battle.battle_events import BattleEventGenerator
+    from engine.systems.battle.turn_logic import BattleAction, ActionType
+
+    state = _EventBattleState(seed)
+    generator = BattleEventGenerator(state)
+    actions = [BattleAction(actor=state.player_active, action_type=ActionType.ATTACK,
+                            target=state.enemy_active, move=state.player_active.moves[0]),
+               BattleAction(actor=state.enemy_active, action_type=ActionType.ATTACK,
+                            target=state.player_active, move=state.enemy_active.moves[1])]
+    return lambda: sum(1 for _ in generator.turn_execution_generator(actions))
+
+
+def _turn_setup(seed: int, active_size: int) -> Callable[[], Any]:
+    from engine.systems.battle.battle_simulator import create_battle
+    from engine.systems.battle.battle_snapshot import BattleSnapshot
+
+    team = [(f"M{i}", 20 + i) for i in range(active_size)]
+    battle = create_battle(team, [(f"N{i}", 20 + i) for i in range(active_size)], seed,
+                           active_size=active_size, max_turns=10 ** 9,
+                           monster_factory=bench_factory)
+    start = BattleSnapshot.from_battle_state(battle)
+
+    def play_turn() -> None:
+        if battle.winner is not None:
+            # Rewind instead of rebuilding, so setup cost stays out of the timing
+            start.apply_to(battle)
+            battle.winner = None
+        battle.step()
+
+    return play_turn
+
+
+@benchmark('battle.turn_1v1')
+def bench_turn_1v1(seed: int) -> Callable[[], Any]:
+    return _turn_setup(seed, active_size=1)
+
+
+@benchmark('battle.turn_3v3')
+def bench_turn_3v3(seed: int) -> Callable[[], Any]:
+    return _turn_setup(seed, active_size=3)
+
+
+# --- Runner -------------------------------------------------------------------
+
+def time_operation(operation: Callable[[], Any], repeats: int = 5,
+                   min_time: float = 0.05) -> BenchmarkResult:
+    """
+    Time an operation in calibrated batches.
+
+    Args:
+        operation: Callable to time
+        repeats: Number of timed batches
+        min_time: Minimum duration of one batch in seconds
+
+    Returns:
+        BenchmarkResult with best and median time per call (name left empty)
+    """
+    perf_counter = time.perf_counter
+
+    # Calibrate the batch size so timer resolution does not matter
+    number = 1
+    while True:
+        start = perf_counter()
+        for _ in range(number):
+            operation()
+        elapsed = perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    samples = []
+    for _ in range(repeats):
+        start = perf_counter()
+        for _ in range(number):
+            operation()
+        samples.append((perf_counter() - start) / number * 1e6)
+
+    return BenchmarkResult('', min(samples), statistics.median(samples), number * repeats)
+
+
+def run_benchmarks(names: Optional[Iterable[str]] = None, seed: int = SEED,
+                   repeats: int = 5, min_time: float = 0.05) -> Dict[str, BenchmarkResult]:
+    """
+    Run registered benchmarks.
+    A benchmark whose setup or operation raises is reported with its error
+    instead of aborting the whole run.
+
+    Args:
+        names: Benchmarks to run (default: all)
+        seed: Seed passed to every setup
+        repeats: Timed batches per benchmark
+        min_time: Minimum batch duration in seconds
+
+    Returns:
+        Results by benchmark name
+    """
+    results = {}
+    for name in (names or BENCHMARKS):
+        if name not in BENCHMARKS:
+            raise KeyError(f"Unknown benchmark: {name}")
+        try:
+            operation = BENCHMARKS[name](seed)
+            result = time_operation(operation, repeats, min_time)
+            result.name = name
+        except Exception as e:
+            logger.warning(f"Benchmark {name} failed: {type(e).__name__}: {e}")
+            result = BenchmarkResult(name, 0.0, 0.0, 0, error=f"{type(e).__name__}: {e}")
+        results[name] = result
+    return results
+
+
+def save_baseline(results: Dict[str, BenchmarkResult], path: Path = BASELINE_PATH) -> Path:
+    """Store successful results as the baseline."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+        'benchmarks': {name: asdict(result) for name, result in results.items() if result.ok}
+    }
+    path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+    return path
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Dict[str, BenchmarkResult]:
+    """Load a stored baseline."""
+    data = json.loads(Path(path).read_text(encoding='utf-8'))
+    return {name: BenchmarkResult(**entry) for name, entry in data['benchmarks'].items()}
+
+
+def compare(results: Dict[str, BenchmarkResult], baseline: Dict[str, BenchmarkResult],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Regression]:
+    """
+    Find benchmarks slower than their baseline by more than threshold percent.
+    Best times are compared, since they are the least affected by noise.
+    A baseline benchmark that failed or is missing from results counts as a
+    regression; benchmarks without a baseline entry are ignored.
+
+    Args:
+        results: Current results
+        baseline: Stored results
+        threshold: Allowed slowdown in percent
+
+    Returns:
+        Regressions, worst first (failed and missing benchmarks first)
+    """
+    regressions = []
+    for name, reference in baseline.items():
+        result = results.get(name)
+        if result is None:
+            regressions.append(Regression(name, reference.best_us, 0.0, error="missing from this run"))
+        elif not result.ok:
+            regressions.append(Regression(name, reference.best_us, 0.0, error=f"failed ({result.error})"))
+        elif reference.best_us > 0 and result.best_us > reference.best_us * (1.0 + threshold / 100.0):
+            regressions.append(Regression(name, reference.best_us, result.best_us))
+    return sorted(regressions, key=lambda r: r.percent, reverse=True)
+
+
+def format_results(results: Dict[str, BenchmarkResult],
+                   baseline: Optional[Dict[str, BenchmarkResult]] = None) -> str:
+    """Render results (and the change against a baseline) as a table."""
+    lines = [f"{'benchmark':<36}{'best us':>12}{'median us':>12}{'vs base':>10}"]
+    for name, result in results.items():
+        if not result.ok:
+            lines.append(f"{name:<36}  skipped ({result.error})")
+            continue
+        change = ''
+        reference = baseline.get(name) if baseline else None
+        if reference is not None and reference.best_us > 0:
+            change = f"{(result.best_us / reference.best_us - 1) * 100:+.1f}%"
+        lines.append(f"{name:<36}{result.best_us:>12.2f}{result.median_us:>12.2f}{change:>10}")
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point; returns the process exit code."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Battle micro-benchmarks")
+    parser.add_argument('--only', nargs='+', metavar='NAME', help="Run only these benchmarks")
+    parser.add_argument('--list', action='store_true', help="List benchmarks and exit")
+    parser.add_argument('--save', action='store_true', help="Store results as the baseline")
+    parser.add_argument('--compare', action='store_true',
+                        help="Fail if a benchmark regressed beyond --threshold")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown in percent (default: %(default)s)")
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.05,
+                        help="Minimum seconds per timed batch")
+    parser.add_argument('--seed', type=int, default=SEED)
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print('\n'.join(BENCHMARKS))
+        return 0
+
+    baseline = None
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"No baseline at {args.baseline}, run with --save first")
+            return 2
+        baseline = load_baseline(args.baseline)
+        if args.only:
+            baseline = {name: baseline[name] for name in args.only if name in baseline}
+
+    results = run_benchmarks(args.only, args.seed, args.repeats, args.min_time)
+    print(format_results(results, baseline))
+
+    if args.save:
+        print(f"Baseline written to {save_baseline(results, args.baseline)}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold}% or failed:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold}%")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
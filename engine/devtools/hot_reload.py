@@ -280,6 +280,12 @@ class HotReloader:
     
     def _reload_map_data(self, map_id: str, data: Dict) -> None:
         """Reload map data."""
+        # Drop cached layers and composites so the next load re-renders the map
+        from engine.world.area import Area
+        from engine.world.map_prefetcher import MapPrefetcher
+        Area.invalidate_map(map_id)
+        MapPrefetcher.get().discard(map_id)
+        
         # Check if this is the current map
         if hasattr(self.game, 'current_map') and self.game.current_map == map_id:
             if hasattr(self.game, 'current_scene'):
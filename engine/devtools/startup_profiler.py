@@ -0,0 +1,157 @@
+"""
+Startup profiling for Untold Story.
+
+Records how long every first-time module import and every singleton
+initialization takes on the way to the first StartScene frame, prints a
+report and checks the total against PerformanceConfig.STARTUP_BUDGET_MS.
+The process exits with a non-zero code when the budget is exceeded, so the
+mode can gate CI runs.
+
+Usage:
+    python main.py --profile-startup
+"""
+
+import builtins
+import importlib.util
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import ContextManager, Iterator, List, Optional
+
+FLAG = "--profile-startup"
+
+
+@dataclass
+class ImportRecord:
+    """Cost of one first-time module import."""
+    module: str
+    total_ms: float   # Including nested imports
+    self_ms: float    # Excluding nested imports
+    depth: int
+
+
+@dataclass
+class InitRecord:
+    """Cost of one singleton initialization."""
+    name: str
+    ms: float
+
+
+class StartupProfiler:
+    """
+    Times module imports (via a builtins.__import__ wrapper) and named
+    initialization blocks until finish() is called.
+    """
+
+    _active: Optional['StartupProfiler'] = None
+
+    def __init__(self):
+        self.imports: List[ImportRecord] = []
+        self.inits: List[InitRecord] = []
+        self._start: Optional[float] = None
+        self._stack: List[float] = []
+        self._original_import = None
+
+    @classmethod
+    def active(cls) -> Optional['StartupProfiler']:
+        """The running profiler, if startup profiling is enabled."""
+        return cls._active
+
+    def start(self) -> 'StartupProfiler':
+        """Install the import hook and start the clock."""
+        self._start = time.perf_counter()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+        StartupProfiler._active = self
+        return self
+
+    def stop(self) -> float:
+        """
+        Remove the import hook.
+
+        Returns:
+            Milliseconds since start()
+        """
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+        if StartupProfiler._active is self:
+            StartupProfiler._active = None
+        return (time.perf_counter() - self._start) * 1000
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """builtins.__import__ replacement that times modules not yet in sys.modules."""
+        module = name
+        if level:
+            try:
+                module = importlib.util.resolve_name('.' * level + name, (globals or {}).get('__package__'))
+            except (ImportError, ValueError):
+                module = None
+        if module is None or module in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        depth = len(self._stack)
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            total = (time.perf_counter() - start) * 1000
+            nested = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += total
+            self.imports.append(ImportRecord(module, total, total - nested, depth))
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Time an initialization block under a name."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.inits.append(InitRecord(name, (time.perf_counter() - start) * 1000))
+
+    def report(self, elapsed_ms: float, budget_ms: float, top: int = 15) -> str:
+        """Human-readable summary of the slowest imports and all initializations."""
+        status = "within budget" if elapsed_ms <= budget_ms else "OVER BUDGET"
+        import_ms = sum(record.total_ms for record in self.imports if record.depth == 0)
+        lines = [
+            f"=== Startup profile: first StartScene frame after {elapsed_ms:.1f} ms "
+            f"(budget {budget_ms:.0f} ms, {status}) ===",
+            f"Imports: {len(self.imports)} modules, {import_ms:.1f} ms at top level",
+            f"  {'self':>8} {'total':>8}  module",
+        ]
+        for record in sorted(self.imports, key=lambda r: r.self_ms, reverse=True)[:top]:
+            lines.append(f"  {record.self_ms:8.1f} {record.total_ms:8.1f}  {record.module}")
+        lines.append(f"Singleton initialization: {sum(record.ms for record in self.inits):.1f} ms")
+        for record in sorted(self.inits, key=lambda r: r.ms, reverse=True):
+            lines.append(f"  {record.ms:8.1f}  {record.name}")
+        return "\n".join(lines)
+
+
+def measure(name: str) -> ContextManager[None]:
+    """Time a singleton initialization while startup profiling is enabled (no-op otherwise)."""
+    profiler = StartupProfiler._active
+    return profiler.measure(name) if profiler is not None else nullcontext()
+
+
+def finish(budget_ms: Optional[float] = None) -> int:
+    """
+    Stop profiling and print the report.
+
+    Args:
+        budget_ms: Cold-start budget (default: PerformanceConfig.STARTUP_BUDGET_MS)
+
+    Returns:
+        Exit code: 0 within budget, 1 over budget
+    """
+    profiler = StartupProfiler._active
+    if profiler is None:
+        return 0
+    elapsed_ms = profiler.stop()
+    if budget_ms is None:
+        from engine.core.config import PerformanceConfig
+        budget_ms = PerformanceConfig.STARTUP_BUDGET_MS
+    print(profiler.report(elapsed_ms, budget_ms))
+    return 0 if elapsed_ms <= budget_ms else 1
@@ -0,0 +1,210 @@
+"""
+Asset-Pack - Vorab gepackte Sprites als Rohpixel in einer einzigen Datei
+Beim Start ein Lesezugriff; Surfaces entstehen per pygame.image.frombuffer statt PNG-Dekodierung pro Datei
+"""
+
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import pygame
+
+# Dateiaufbau: Header | JSON-Index | Padding | Pixel-Blobs (BGRA, zeilenweise)
+MAGIC = b"USPAK"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<5sBII")  # Magic, Version, Index-Länge, Blob-Offset
+ALIGNMENT = 16
+PIXEL_FORMAT = "BGRA"  # Speicherlayout von SRCALPHA-Surfaces (Blit ohne Umrechnung)
+PACK_NAME = "sprites.uspk"
+
+# Ordner (relativ zum Projekt), deren PNGs der SpriteManager lädt
+SPRITE_DIRS = (
+    "data/maps/tiles",
+    "data/maps/objects",
+    "data/maps/player",
+    "data/maps/npc",
+    "assets/gfx/monster",
+)
+
+
+def default_pack_path(project_root: Path) -> Path:
+    """Pfad des Asset-Packs eines Projekts"""
+    return Path(project_root) / "data" / "cache" / PACK_NAME
+
+
+def sprite_files(project_root: Path) -> List[Path]:
+    """Alle Sprite-PNGs aus SPRITE_DIRS"""
+    files: List[Path] = []
+    for folder in SPRITE_DIRS:
+        files.extend(sorted((Path(project_root) / folder).glob("*.png")))
+    return files
+
+
+def _key(path: Path, project_root: Path) -> str:
+    """Index-Schlüssel einer Datei (Pfad relativ zum Projekt)"""
+    path, root = str(path), str(project_root)
+    if path.startswith(root + os.sep):  # schneller Pfad ohne pathlib, ein Aufruf pro Sprite
+        return path[len(root) + 1:].replace(os.sep, "/")
+    return Path(path).resolve().relative_to(Path(root).resolve()).as_posix()
+
+
+def write_pack(path: Path, project_root: Path, files: Iterable[Path]) -> Dict[str, int]:
+    """
+    Dekodiert die PNGs einmalig und schreibt sie als Asset-Pack (atomar).
+    Inhaltsgleiche Bilder teilen sich einen Blob (Schlüssel: SHA-1 der Pixel).
+
+    Args:
+        path: Ziel-Datei
+        project_root: Projektwurzel, relativ zu der die Dateien indiziert werden
+        files: PNG-Dateien
+
+    Returns:
+        Kennzahlen (files, blobs, bytes)
+    """
+    import hashlib  # nur beim Packen benötigt, nicht beim Spielstart
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    blobs: Dict[str, List[int]] = {}
+    chunks: List[bytes] = []
+    offset = 0
+    for file in files:
+        surface = pygame.image.load(str(file))
+        width, height = surface.get_size()
+        pixels = pygame.image.tobytes(surface, PIXEL_FORMAT)
+        digest = hashlib.sha1(struct.pack("<II", width, height) + pixels).hexdigest()
+        if digest not in blobs:
+            blobs[digest] = [offset, width, height]
+            chunks.append(pixels)
+            offset += len(pixels)
+        stat = Path(file).stat()
+        entries[_key(file, project_root)] = {
+            "hash": digest,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+        }
+
+    index = json.dumps({"files": entries, "blobs": blobs}, separators=(",", ":")).encode("utf-8")
+    blob_offset = HEADER.size + len(index)
+    blob_offset += -blob_offset % ALIGNMENT
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(index), blob_offset))
+        f.write(index)
+        f.write(b"\0" * (blob_offset - HEADER.size - len(index)))
+        for pixels in chunks:
+            f.write(pixels)
+    os.replace(tmp_path, path)
+    return {"files": len(entries), "blobs": len(blobs), "bytes": blob_offset + offset}
+
+
+class AssetPack:
+    """
+    Geöffnetes Asset-Pack.
+
+    Die Datei wird mit einem Lesezugriff komplett in den Speicher geholt;
+    load() erzeugt Surfaces direkt auf den Pixel-Bytes (ohne Kopie und ohne
+    PNG-Dekodierung). Ist eine Quelldatei seit dem Packen geändert oder
+    gelöscht worden, wird das Pack nicht geöffnet und der SpriteManager lädt
+    die losen Dateien (Entwicklungs-Fallback).
+    """
+
+    def __init__(self, data: bytes, index: Dict[str, Any], blob_offset: int, project_root: Path):
+        """
+        Args:
+            data: Gesamter Dateiinhalt
+            index: Geparster JSON-Index
+            blob_offset: Start der Pixel-Blobs in data
+            project_root: Projektwurzel für die Index-Schlüssel
+        """
+        self.project_root = Path(project_root)
+        self.files: Dict[str, Dict[str, Any]] = index["files"]
+        self.blobs: Dict[str, List[int]] = index["blobs"]
+        self._data = data
+        self._view = memoryview(data)
+        self._blob_offset = blob_offset
+
+    @classmethod
+    def open(cls, path: Path, project_root: Path) -> Optional['AssetPack']:
+        """
+        Öffnet ein Asset-Pack, sofern es existiert und aktuell ist.
+
+        Args:
+            path: Pack-Datei
+            project_root: Projektwurzel
+
+        Returns:
+            AssetPack oder None (dann lose Dateien laden)
+        """
+        try:
+            data = Path(path).read_bytes()
+        except OSError:
+            return None
+        try:
+            magic, version, index_length, blob_offset = HEADER.unpack_from(data)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError("inkompatibles Format")
+            index = json.loads(data[HEADER.size:HEADER.size + index_length].decode("utf-8"))
+        except (struct.error, ValueError) as e:
+            print(f"[AssetPack] {path} unbrauchbar ({e}) - lade lose Dateien")
+            return None
+
+        pack = cls(data, index, blob_offset, project_root)
+        stale = pack.stale_files()
+        if stale:
+            print(f"[AssetPack] {len(stale)} Datei(en) seit dem Packen geändert (z.B. {stale[0]}) - lade lose Dateien")
+            return None
+        return pack
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def __contains__(self, path: Path) -> bool:
+        return self._entry(path) is not None
+
+    def stale_files(self) -> List[str]:
+        """Index-Schlüssel, deren Quelldatei fehlt oder sich geändert hat"""
+        stale = []
+        root = str(self.project_root)
+        for key, entry in self.files.items():
+            try:
+                stat = os.stat(os.path.join(root, key))
+            except OSError:
+                stale.append(key)
+                continue
+            if stat.st_mtime_ns != entry["mtime_ns"] or stat.st_size != entry["size"]:
+                stale.append(key)
+        return stale
+
+    def load(self, path: Path) -> Optional[pygame.Surface]:
+        """
+        Surface einer gepackten Datei.
+
+        Args:
+            path: Pfad der ursprünglichen PNG-Datei
+
+        Returns:
+            Surface (teilt sich den Speicher mit dem Pack) oder None
+        """
+        entry = self._entry(path)
+        if entry is None:
+            return None
+        offset, width, height = self.blobs[entry["hash"]]
+        start = self._blob_offset + offset
+        pixels = self._view[start:start + width * height * 4]
+        return pygame.image.frombuffer(pixels, (width, height), PIXEL_FORMAT)
+
+    def _entry(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Index-Eintrag einer Datei"""
+        try:
+            return self.files.get(_key(path, self.project_root))
+        except ValueError:
+            return None  # liegt nicht unter der Projektwurzel
+
+    def stats(self) -> Dict[str, int]:
+        """Kennzahlen: Dateien, Blobs, Bytes"""
+        return {"files": len(self.files), "blobs": len(self.blobs), "bytes": len(self._data)}
@@ -5,12 +5,13 @@ Implementiert verbessertes Caching, Asset-Atlasierung und effizientes Font-Rende
 
 import pygame
 import weakref
-from typing import Dict, List, Tuple, Optional, Any, Set
+from typing import Dict, Hashable, List, Tuple, Any, Set
 from dataclasses import dataclass
 from pathlib import Path
 import json
 import hashlib
 from engine.core.config import LOGICAL_WIDTH, LOGICAL_HEIGHT, TILE_SIZE
+from engine.graphics.sprite_atlas import SpriteAtlas
 
 
 @dataclass
@@ -23,77 +24,6 @@ class CachedSurface:
     hash_key: str
 
 
-@dataclass
-class AtlasRegion:
-    """Region in einem Texture-Atlas."""
-    x: int
-    y: int
-    width: int
-    height: int
-    surface: pygame.Surface
-
-
-class TextureAtlas:
-    """Texture-Atlas für effizientes Rendering."""
-    
-    def __init__(self, max_size: int = 2048):
-        self.max_size = max_size
-        self.atlas_surface = pygame.Surface((max_size, max_size), pygame.SRCALPHA)
-        self.regions: Dict[str, AtlasRegion] = {}
-        self.next_x = 0
-        self.next_y = 0
-        self.row_height = 0
-        self.used_space = 0
-        
-    def add_texture(self, key: str, surface: pygame.Surface) -> bool:
-        """Fügt eine Textur zum Atlas hinzu."""
-        if key in self.regions:
-            return True  # Bereits vorhanden
-        
-        width, height = surface.get_size()
-        
-        # Neue Zeile beginnen wenn nötig
-        if self.next_x + width > self.max_size:
-            self.next_x = 0
-            self.next_y += self.row_height
-            self.row_height = 0
-        
-        # Prüfen ob Atlas voll ist
-        if self.next_y + height > self.max_size:
-            return False  # Atlas voll
-        
-        # Textur zum Atlas hinzufügen
-        self.atlas_surface.blit(surface, (self.next_x, self.next_y))
-        
-        region = AtlasRegion(
-            x=self.next_x,
-            y=self.next_y,
-            width=width,
-            height=height,
-            surface=surface
-        )
-        self.regions[key] = region
-        
-        # Position für nächste Textur aktualisieren
-        self.next_x += width
-        self.row_height = max(self.row_height, height)
-        self.used_space += width * height
-        
-        return True
-    
-    def get_region(self, key: str) -> Optional[AtlasRegion]:
-        """Gibt eine Atlas-Region zurück."""
-        return self.regions.get(key)
-    
-    def get_atlas_surface(self) -> pygame.Surface:
-        """Gibt die Atlas-Oberfläche zurück."""
-        return self.atlas_surface
-    
-    def get_usage_percentage(self) -> float:
-        """Gibt den Nutzungsgrad des Atlas zurück."""
-        return (self.used_space / (self.max_size * self.max_size)) * 100
-
-
 class FontCache:
     """Cache für gerenderte Font-Texturen."""
     
@@ -176,7 +106,7 @@ class OptimizedRenderer:
     """Optimierter Renderer mit verbesserten Performance-Features."""
     
     def __init__(self):
-        self.texture_atlas = TextureAtlas()
+        self.texture_atlas = SpriteAtlas()
         self.font_cache = FontCache()
         self.surface_cache: Dict[str, CachedSurface] = {}
         self.render_stats = {
@@ -193,12 +123,11 @@ class OptimizedRenderer:
         # Batch-Rendering
         self.render_batches: Dict[str, List[Tuple[pygame.Surface, Tuple[int, int]]]] = {}
         
-    def add_to_atlas(self, key: str, surface: pygame.Surface) -> bool:
-        """Fügt eine Textur zum Atlas hinzu."""
-        success = self.texture_atlas.add_texture(key, surface)
-        if success:
-            self.render_stats['atlas_usage'] = self.texture_atlas.get_usage_percentage()
-        return success
+    def add_to_atlas(self, textures: Dict[Hashable, pygame.Surface]) -> Dict[Hashable, pygame.Surface]:
+        """Packt Texturen in den Sprite-Atlas und gibt die Atlas-Subsurfaces zurück."""
+        packed = self.texture_atlas.pack(textures)
+        self.render_stats['atlas_usage'] = self.texture_atlas.stats()['fill'] * 100
+        return packed
     
     def render_text(self, text: str, font_name: str, size: int, 
                    color: Tuple[int, int, int], 
@@ -256,7 +185,7 @@ class OptimizedRenderer:
         """Gibt Render-Statistiken zurück."""
         return {
             **self.render_stats,
-            'atlas_usage': self.texture_atlas.get_usage_percentage(),
+            'atlas_usage': self.texture_atlas.stats()['fill'] * 100,
             'font_cache_size': len(self.font_cache.cached_texts),
             'surface_cache_size': len(self.surface_cache),
             'batch_count': len(self.render_batches)
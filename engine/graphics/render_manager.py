@@ -102,9 +102,13 @@ class RenderManager:
             if layer.name in ["entities", "overhang"]:
                 layer.entities.clear()
         
-        # Sammle sichtbare Entities mit Culling
+        # Sammle sichtbare Entities mit Culling (Bereichsabfrage im Tile-Index der Area)
         if hasattr(area, 'entities'):
-            for entity in area.entities:
+            if viewport is not None and hasattr(area, 'get_entities_in_rect'):
+                candidates = area.get_entities_in_rect(viewport)
+            else:
+                candidates = area.entities
+            for entity in candidates:
                 if entity.visible and (not self.use_culling or self._is_entity_in_viewport(entity, viewport)):
                     self.add_entity_to_layer(entity, "entities")
         
@@ -116,6 +120,10 @@ class RenderManager:
         # Rendere alle Layer in Z-Order
         sorted_layers = sorted(self.layers.values(), key=lambda l: l.z_index)
         
+        # Vorkomponierte statische Layer ersetzen ground..objects bzw. overhang/decoration
+        below_composited = False
+        overhang_composited = False
+        
         for layer in sorted_layers:
             if not layer.visible:
                 continue
@@ -123,7 +131,11 @@ class RenderManager:
             if layer.name == "background":
                 self._render_background(surface, area, camera)
             elif layer.name == "ground":
-                self._render_ground_layer(surface, area, camera)
+                below_composited = self._draw_area_composite(surface, area, camera, "draw_below_entities")
+                if not below_composited:
+                    self._render_ground_layer(surface, area, camera)
+            elif below_composited and layer.name in ("decor", "furniture", "objects"):
+                continue
             elif layer.name == "decor":
                 self._render_decor_layer(surface, area, camera)
             elif layer.name == "furniture":
@@ -133,9 +145,12 @@ class RenderManager:
             elif layer.name == "entities":
                 self._render_entities_layer(surface, layer, camera)
             elif layer.name == "overhang":
-                self._render_overhang_layer(surface, area, camera)
+                overhang_composited = self._draw_area_composite(surface, area, camera, "draw_overhang")
+                if not overhang_composited:
+                    self._render_overhang_layer(surface, area, camera)
             elif layer.name == "decoration":
-                self._render_decoration_layer(surface, area, camera)
+                if not overhang_composited:
+                    self._render_decoration_layer(surface, area, camera)
             elif layer.name == "ui" and ui_elements:
                 self._render_ui_elements(surface, ui_elements)
     
@@ -146,13 +161,10 @@ class RenderManager:
     
     def _render_ground_layer(self, surface: pygame.Surface, area: Area, camera: Camera) -> None:
         """Rendert den Boden-Layer."""
-        # Neue Priorität: layer_surfaces (fertige Surfaces) vor layers (Tile-Daten)
-        if hasattr(area, 'layer_surfaces') and "Tile Layer 1" in area.layer_surfaces:
-            # Verwende fertige Surface
-            layer_surface = area.layer_surfaces["Tile Layer 1"]
-            camera_offset = (-int(camera.x), -int(camera.y))
-            surface.blit(layer_surface, camera_offset)
-        elif hasattr(area, 'layers') and "ground" in area.layers:
+        # Neue Priorität: vorgerenderte Layer (nur sichtbare Chunks) vor layers (Tile-Daten)
+        if self._draw_area_layer(surface, area, camera, "Tile Layer 1"):
+            return
+        if hasattr(area, 'layers') and "ground" in area.layers:
             self._render_tile_layer(surface, area.layers["ground"], camera, "ground")
     
     def _render_decor_layer(self, surface: pygame.Surface, area: Area, camera: Camera) -> None:
@@ -166,12 +178,24 @@ class RenderManager:
             self._render_tile_layer(surface, area.layers["furniture"], camera, "furniture")
     
     def _render_objects_layer(self, surface: pygame.Surface, area: Area, camera: Camera) -> None:
-        """Rendert den Objects-Layer aus den Area layer_surfaces."""
-        if hasattr(area, 'layer_surfaces') and "objects" in area.layer_surfaces:
-            # Verwende fertige Surface
-            layer_surface = area.layer_surfaces["objects"]
-            camera_offset = (-int(camera.x), -int(camera.y))
-            surface.blit(layer_surface, camera_offset)
+        """Rendert den Objects-Layer aus den vorgerenderten Area-Layern."""
+        self._draw_area_layer(surface, area, camera, "objects")
+    
+    def _draw_area_layer(self, surface: pygame.Surface, area: Area, camera: Camera,
+                         layer_name: str) -> bool:
+        """Zeichnet einen vorgerenderten Area-Layer; nur Chunks im Kamera-Sichtbereich."""
+        if not hasattr(area, 'draw_layer'):
+            return False
+        return area.draw_layer(surface, layer_name, int(camera.x), int(camera.y),
+                               camera.get_visible_area())
+    
+    def _draw_area_composite(self, surface: pygame.Surface, area: Area, camera: Camera,
+                             method: str) -> bool:
+        """Zeichnet einen vorkomponierten Area-Layer (ein Blit pro sichtbarem Chunk)."""
+        draw = getattr(area, method, None)
+        if draw is None:
+            return False
+        return draw(surface, int(camera.x), int(camera.y), camera.get_visible_area())
     
     def _render_overhang_layer(self, surface: pygame.Surface, area: Area, camera: Camera) -> None:
         """Rendert den Überhang-Layer."""
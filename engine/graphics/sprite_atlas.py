@@ -0,0 +1,131 @@
+"""
+Sprite-Atlas - Packt einzelne Sprites zur Ladezeit in wenige große Atlas-Seiten
+Sprites werden als Subsurfaces der Seiten ausgegeben, Blits laufen damit gegen eine Handvoll Surfaces
+"""
+
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import pygame
+
+# Kantenlänge einer Atlas-Seite in Pixeln (1024² x 4 Bytes = 4 MB pro voller Seite)
+PAGE_SIZE = 1024
+
+# (Atlas-Seite, Quell-Rechteck) - dritter Parameter für Surface.blit/blits
+AtlasRegion = Tuple[pygame.Surface, pygame.Rect]
+
+
+def atlas_region(sprite: pygame.Surface) -> AtlasRegion:
+    """
+    Liefert Seite und Quell-Rechteck eines Sprites.
+    Für Sprites außerhalb eines Atlas ist das die Surface selbst.
+
+    Args:
+        sprite: Sprite (Subsurface einer Atlas-Seite oder eigenständig)
+
+    Returns:
+        (Surface, Rect) zum Blitten mit area-Parameter
+    """
+    parent = sprite.get_abs_parent()
+    if parent is sprite:
+        return sprite, sprite.get_rect()
+    return parent, pygame.Rect(sprite.get_abs_offset(), sprite.get_size())
+
+
+class SpriteAtlas:
+    """
+    Shelf-Packer für Sprites.
+
+    Sprites werden nach Höhe absteigend zeilenweise auf Seiten von
+    PAGE_SIZE x PAGE_SIZE gelegt. Jede Seite wird nach dem Packen genau
+    einmal ins Display-Format konvertiert (statt convert_alpha pro Datei)
+    und auf die belegte Höhe gekürzt. Mehrfach übergebene Surfaces teilen
+    sich eine Region; Sprites größer als eine Seite bleiben eigenständig.
+    Einziger Atlas der Engine (SpriteManager, OptimizedRenderer).
+    """
+
+    def __init__(self, page_size: int = PAGE_SIZE):
+        """
+        Args:
+            page_size: Kantenlänge einer Atlas-Seite in Pixeln
+        """
+        self.page_size = page_size
+        self.pages: List[pygame.Surface] = []
+        self.sprite_count = 0
+        self.used_pixels = 0
+
+    def pack(self, sprites: Dict[Hashable, pygame.Surface]) -> Dict[Hashable, pygame.Surface]:
+        """
+        Packt Sprites in neue Atlas-Seiten.
+
+        Args:
+            sprites: Schlüssel -> unkonvertierte Sprite-Surface
+
+        Returns:
+            Schlüssel -> Subsurface der Atlas-Seite (gleiche Größe und Pixel)
+        """
+        sources = {id(surface): surface for surface in sprites.values()}
+        order = sorted(sources.values(), key=lambda s: (s.get_height(), s.get_width()), reverse=True)
+
+        placements: Dict[int, Tuple[int, pygame.Rect]] = {}
+        standalone: Dict[int, pygame.Surface] = {}
+        raw_pages: List[pygame.Surface] = []
+        heights: List[int] = []
+        x = y = shelf = 0
+        for surface in order:
+            width, height = surface.get_size()
+            if width > self.page_size or height > self.page_size:
+                standalone[id(surface)] = self._convert(surface)
+                continue
+            if x + width > self.page_size:
+                x, y, shelf = 0, y + shelf, 0
+            if not raw_pages or y + height > self.page_size:
+                raw_pages.append(pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA))
+                heights.append(0)
+                x = y = shelf = 0
+            raw_pages[-1].blit(surface, (x, y))
+            placements[id(surface)] = (len(raw_pages) - 1, pygame.Rect(x, y, width, height))
+            x += width
+            shelf = max(shelf, height)
+            heights[-1] = y + shelf
+            self.used_pixels += width * height
+
+        first = len(self.pages)
+        for raw, used in zip(raw_pages, heights):
+            self.pages.append(self._convert(raw.subsurface((0, 0, self.page_size, used))))
+        self.sprite_count += len(placements)
+
+        packed: Dict[Hashable, pygame.Surface] = {}
+        for key, surface in sprites.items():
+            placement = placements.get(id(surface))
+            if placement is None:
+                packed[key] = standalone[id(surface)]
+            else:
+                page, rect = placement
+                packed[key] = self.pages[first + page].subsurface(rect)
+        return packed
+
+    @staticmethod
+    def _convert(surface: pygame.Surface) -> pygame.Surface:
+        """Konvertiert ins Display-Format (Kopie ohne Display-Modus)"""
+        try:
+            return surface.convert_alpha()
+        except pygame.error:
+            return surface.copy()
+
+    def stats(self) -> Dict[str, float]:
+        """Kennzahlen: Seiten, Sprites, belegte Bytes und Füllgrad"""
+        area = sum(page.get_width() * page.get_height() for page in self.pages)
+        return {
+            'pages': len(self.pages),
+            'sprites': self.sprite_count,
+            'bytes': sum(page.get_pitch() * page.get_height() for page in self.pages),
+            'fill': self.used_pixels / area if area else 0.0,
+        }
+
+    def page_of(self, sprite: pygame.Surface) -> Optional[int]:
+        """Index der Atlas-Seite eines Sprites (None wenn nicht gepackt)"""
+        parent = sprite.get_abs_parent()
+        for index, page in enumerate(self.pages):
+            if page is parent:
+                return index
+        return None
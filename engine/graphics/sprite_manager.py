@@ -1,12 +1,49 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 import os
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Any
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Any
 import json
 import pygame
 
+from engine.core.config import PerformanceConfig
 from engine.world.tiles import TILE_SIZE
+from engine.graphics.sprite_atlas import SpriteAtlas
+from engine.graphics.asset_pack import AssetPack, default_pack_path
+
+# Kategorien, die beim ersten Zugriff komplett geladen und in den Atlas gepackt werden.
+# Monster-Sprites werden dagegen einzeln geladen und per LRU begrenzt.
+CATEGORIES = ("tiles", "objects", "player", "npc")
+
+# sprite_cache-Präfix -> Kategorie
+SPRITE_PREFIXES = {"tile_": "tiles", "object_": "objects", "player_": "player", "npc_": "npc"}
+
+
+class MonsterSpriteView(Mapping):
+    """Dict-artige Sicht auf alle Monster-Sprites; Zugriffe laden den Sprite bei Bedarf."""
+
+    def __init__(self, manager: "SpriteManager"):
+        self._manager = manager
+
+    def __getitem__(self, monster_id: str) -> pygame.Surface:
+        sprite = self._manager.get_monster_sprite(monster_id)
+        if sprite is None:
+            raise KeyError(monster_id)
+        return sprite
+
+    def __contains__(self, monster_id: object) -> bool:
+        return str(monster_id) in self._manager._monster_paths()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._manager._monster_paths())
+
+    def __len__(self) -> int:
+        return len(self._manager._monster_paths())
+
 
 class SpriteManager:
     """
@@ -16,6 +53,9 @@ class SpriteManager:
       - player/player_*.png→ Richtungs-Sprites
       - npc/npcX_*.png     → NPC-Gruppen X=A,B,... mit Richtungen
       - monster/<id>.png   → Dex-ID als "1".."151"
+
+    Geladen wird bei Bedarf: jede Feld-Kategorie beim ersten Zugriff,
+    Monster-Sprites einzeln (LRU-begrenzt, optional im Hintergrund vorgeladen).
     """
 
     _instance: Optional["SpriteManager"] = None
@@ -47,7 +87,23 @@ class SpriteManager:
         self._objects: Dict[str, pygame.Surface] = {}
         self._player_dir_map: Dict[str, pygame.Surface] = {}
         self._npc_dir_map: Dict[Tuple[str, str], pygame.Surface] = {}
-        self._monster: Dict[str, pygame.Surface] = {}
+        # Monster-Sprites: zuletzt benutzte zuletzt, begrenzt auf max_monster_sprites
+        self._monster: OrderedDict[str, pygame.Surface] = OrderedDict()
+        self._monster_files: Optional[Dict[str, Path]] = None
+        self.max_monster_sprites = PerformanceConfig.MAX_CACHED_MONSTER_SPRITES
+        self.monster_evictions = 0
+        
+        # Hintergrund-Dekodierung wahrscheinlich benötigter Monster-Sprites
+        self._monster_jobs: Dict[str, Future] = {}
+        self._preload_executor: Optional[ThreadPoolExecutor] = None
+        
+        # Atlas-Seiten, in die alle Sprites beim Laden gepackt werden
+        self.atlas = SpriteAtlas()
+        
+        # Vorab gepackte Rohpixel (tools/utility_tools/asset_packer.py); None = lose PNGs laden
+        self.use_asset_pack = True
+        self.asset_pack: Optional[AssetPack] = None
+        self._asset_pack_checked = False
         
         # Tile-Mappings für JSON-Maps
         self._tile_mappings: Dict[str, Any] = {}
@@ -55,8 +111,9 @@ class SpriteManager:
         # Sprite-Cache für alle Sprites
         self.sprite_cache: Dict[str, pygame.Surface] = {}
         
-        # Lazy Loading
-        self._loaded = False
+        # Lazy Loading pro Kategorie
+        self._loaded_categories: set = set()
+        self._lock = threading.RLock()
         
         # GID-zu-Surface Mapping für TMX-Support (Legacy)
         self.gid_to_surface: Dict[int, pygame.Surface] = {}
@@ -65,17 +122,31 @@ class SpriteManager:
     # ---------- Public API ----------
 
     def _ensure_loaded(self) -> None:
-        """Lädt alle Sprites, falls noch nicht geschehen."""
-        if not self._loaded:
+        """Lädt alle Feld-Kategorien (Monster-Sprites werden einzeln bei Bedarf geladen)."""
+        for category in CATEGORIES:
+            self._ensure_category(category)
+    
+    def _ensure_category(self, category: str) -> None:
+        """Lädt eine Sprite-Kategorie beim ersten Zugriff und packt sie in den Atlas."""
+        if category in self._loaded_categories:
+            return
+        with self._lock:
+            if category in self._loaded_categories:
+                return
             self._ensure_display()
-            self._load_tile_mappings()
-            self._load_tiles()
-            self._load_objects()
-            self._load_player()
-            self._load_npcs()
-            self._load_monsters()
+            self._open_asset_pack()
+            if category == "tiles":
+                self._load_tile_mappings()
+                self._load_tiles()
+            elif category == "objects":
+                self._load_objects()
+            elif category == "player":
+                self._load_player()
+            elif category == "npc":
+                self._load_npcs()
+            self._pack_atlas(category)
             self._update_sprite_cache()
-            self._loaded = True
+            self._loaded_categories.add(category)
     
     def _ensure_display(self) -> None:
         """Stellt sicher, dass pygame.display initialisiert ist."""
@@ -86,6 +157,35 @@ class SpriteManager:
             pygame.display.set_mode((320, 180))
             print("[SpriteManager] WARN: Created temporary display for sprite loading")
     
+    def _open_asset_pack(self) -> None:
+        """Öffnet das Asset-Pack, falls vorhanden und aktuell."""
+        if not self.use_asset_pack or self._asset_pack_checked:
+            return
+        self._asset_pack_checked = True
+        self.asset_pack = AssetPack.open(default_pack_path(self.project_root), self.project_root)
+        if self.asset_pack is not None:
+            print(f"[SpriteManager] Asset-Pack: {len(self.asset_pack)} Sprites")
+    
+    def _load_image(self, path: Path) -> pygame.Surface:
+        """Holt ein Bild aus dem Asset-Pack oder dekodiert die lose PNG-Datei."""
+        if self.asset_pack is not None:
+            surf = self.asset_pack.load(path)
+            if surf is not None:
+                return surf
+        return pygame.image.load(str(path))
+    
+    def _pack_atlas(self, category: str) -> None:
+        """Packt die Sprites einer Kategorie in eine Atlas-Seite und ersetzt sie durch Subsurfaces."""
+        group = {
+            "tiles": self._tiles,
+            "objects": self._objects,
+            "player": self._player_dir_map,
+            "npc": self._npc_dir_map,
+        }[category]
+        group.update(self.atlas.pack(group))
+        stats = self.atlas.stats()
+        print(f"[SpriteManager] Atlas: {stats['sprites']} Sprites auf {stats['pages']} Seite(n)")
+    
     def _update_sprite_cache(self) -> None:
         """Aktualisiert das globale sprite_cache mit allen geladenen Sprites."""
         self.sprite_cache.clear()
@@ -105,22 +205,18 @@ class SpriteManager:
         # NPCs hinzufügen
         for (npc_id, direction), surf in self._npc_dir_map.items():
             self.sprite_cache[f"npc_{npc_id}_{direction}"] = surf
-            
-        # Monster hinzufügen
-        for monster_id, surf in self._monster.items():
-            self.sprite_cache[f"monster_{monster_id}"] = surf
 
     @property
-    def monster_sprites(self) -> Dict[str, pygame.Surface]:
-        """Gibt den Monster-Sprite-Cache zurück."""
-        self._ensure_loaded()
-        return self._monster
+    def monster_sprites(self) -> MonsterSpriteView:
+        """Gibt alle Monster-Sprites als Mapping zurück (lädt beim Zugriff nach)."""
+        return MonsterSpriteView(self)
 
     def get_tile_sprite(self, tile_id: Any) -> Optional[pygame.Surface]:
         """
         Hauptmethode zum Abrufen von Tile-Sprites.
         Unterstützt sowohl GID-basierte als auch String-basierte Tile-IDs.
         """
+        self._ensure_category("tiles")
         # Zuerst im Cache suchen
         if isinstance(tile_id, str):
             # String-basierter Zugriff
@@ -183,7 +279,7 @@ class SpriteManager:
             pygame.display.set_mode((1, 1))
 
     def _load_dir_16px(self, folder: Path) -> Dict[str, pygame.Surface]:
-        """Lädt alle PNGs aus einem Ordner, validiert 16x16 und konvertiert mit robusten Fallbacks."""
+        """Lädt alle PNGs aus einem Ordner und validiert 16x16 (konvertiert wird erst der Atlas)."""
         out: Dict[str, pygame.Surface] = {}
         if not folder.exists():
             print(f"[SpriteManager] WARN: Ordner {folder} existiert nicht")
@@ -191,7 +287,7 @@ class SpriteManager:
         
         for p in folder.glob("*.png"):
             try:
-                surf = pygame.image.load(str(p)).convert_alpha()
+                surf = self._load_image(p)
                 w, h = surf.get_size()
                 
                 if (w, h) != (TILE_SIZE, TILE_SIZE):
@@ -295,6 +391,7 @@ class SpriteManager:
 
     def get_tile(self, tile_name: str) -> Optional[pygame.Surface]:
         """Holt einen Tile-Sprite nach Namen."""
+        self._ensure_category("tiles")
         return self._tiles.get(tile_name.lower())
 
     def get_tile_by_gid(self, gid: int) -> Optional[pygame.Surface]:
@@ -303,6 +400,7 @@ class SpriteManager:
 
     def get_tile_by_mapping(self, tile_id: str) -> Optional[pygame.Surface]:
         """Holt einen Tile-Sprite über das Tile-Mapping."""
+        self._ensure_category("tiles")
         mapping = self._tile_mappings.get(tile_id)
         if mapping:
             sprite_file = mapping.get("sprite_file", "")
@@ -314,12 +412,13 @@ class SpriteManager:
 
     def get_tile_info(self, tile_id: int | str) -> Optional[Dict[str, Any]]:
         """Gibt Mapping-Infos für eine Tile-ID zurück."""
+        self._ensure_category("tiles")
         key = str(int(tile_id)) if isinstance(tile_id, int) else str(tile_id)
         return self._tile_mappings.get(key)
     
     def get_npc_sprite(self, npc_id: str, direction: str = "down") -> Optional[pygame.Surface]:
         """Get an NPC sprite by ID and direction."""
-        self._ensure_loaded()
+        self._ensure_category("npc")
         
         # Try to get from sprite cache first
         npc_key = f"npc_{npc_id}_{direction}"
@@ -340,23 +439,93 @@ class SpriteManager:
         return None
     
     def get_monster_sprite(self, monster_id: str) -> Optional[pygame.Surface]:
-        """Get a monster sprite by ID."""
-        self._ensure_loaded()
-        
-        # Try to get from sprite cache first
-        monster_key = f"monster_{monster_id}"
-        if monster_key in self.sprite_cache:
-            return self.sprite_cache[monster_key]
-        
-        # Try to get from monster map
-        if str(monster_id) in self._monster:
-            return self._monster[str(monster_id)]
+        """
+        Get a monster sprite by ID.
+        Loaded on first use (or taken from the preload queue); the least
+        recently used sprites are evicted beyond max_monster_sprites.
+        """
+        key = str(monster_id)
+        with self._lock:
+            sprite = self._monster.get(key)
+            if sprite is not None:
+                self._monster.move_to_end(key)
+                return sprite
+            
+            self._ensure_display()
+            self._open_asset_pack()
+            job = self._monster_jobs.pop(key, None)
+            surf = job.result() if job is not None and not job.cancel() else None
+            if surf is None:
+                surf = self._read_monster(key)
+            if surf is None:
+                return None
+            
+            try:
+                sprite = surf.convert_alpha()
+            except pygame.error:
+                sprite = surf.copy()
+            self._monster[key] = sprite
+            while len(self._monster) > self.max_monster_sprites:
+                self._monster.popitem(last=False)
+                self.monster_evictions += 1
+            return sprite
+    
+    def preload_categories(self, categories: Iterable[str]) -> None:
+        """
+        Lädt Sprite-Kategorien auf dem aufrufenden (Main-)Thread, damit spätere
+        Zugriffe, z.B. vom Map-Prefetcher-Worker, die Sprites nur noch lesen.
+
+        Args:
+            categories: Kategorien aus CATEGORIES
+        """
+        for category in categories:
+            self._ensure_category(category)
+
+    def preload_monsters(self, monster_ids: Iterable[Any]) -> None:
+        """
+        Queue monster sprites that are likely needed next (e.g. the current
+        map's encounter table) for decoding on a background worker.
+        Queued sprites that are no longer expected are dropped.
         
-        return None
+        Args:
+            monster_ids: Dex IDs
+        """
+        keys = {str(monster_id) for monster_id in monster_ids}
+        with self._lock:
+            self._open_asset_pack()
+            paths = self._monster_paths()
+            for key in [key for key in self._monster_jobs if key not in keys]:
+                self._monster_jobs.pop(key).cancel()
+            for key in keys:
+                if key in self._monster or key in self._monster_jobs or key not in paths:
+                    continue
+                if self._preload_executor is None:
+                    self._preload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sprite-preload")
+                self._monster_jobs[key] = self._preload_executor.submit(self._read_monster, key)
+    
+    def _monster_paths(self) -> Dict[str, Path]:
+        """Dex-ID -> PNG-Datei (einmaliger Verzeichnis-Scan)."""
+        if self._monster_files is None:
+            if self.monster_dir.exists():
+                self._monster_files = {p.stem: p for p in self.monster_dir.glob("*.png")}
+            else:
+                self._monster_files = {}
+        return self._monster_files
+    
+    def _read_monster(self, key: str) -> Optional[pygame.Surface]:
+        """Dekodiert einen Monster-Sprite ohne Konvertierung (läuft auch auf dem Preload-Worker)."""
+        path = self._monster_paths().get(key)
+        if path is None:
+            return None
+        try:
+            return self._load_image(path)
+        except Exception as e:
+            print(f"[SpriteManager] ERR loading {path.name}: {e}")
+            return None
     
     def get_player_sprite(self, direction: str) -> Optional[pygame.Surface]:
         """Get a player sprite by direction."""
-        self._ensure_loaded()
+        self._ensure_category("player")
         
         # Try to get from sprite cache first
         player_key = f"player_{direction}"
@@ -375,7 +544,7 @@ class SpriteManager:
     
     def get_object_sprite(self, object_id: str) -> Optional[pygame.Surface]:
         """Get an object sprite by ID."""
-        self._ensure_loaded()
+        self._ensure_category("objects")
         
         # Try to get from sprite cache first
         object_key = f"object_{object_id}"
@@ -390,7 +559,14 @@ class SpriteManager:
     
     def get_sprite(self, sprite_name: str) -> Optional[pygame.Surface]:
         """Get a sprite by name (generic method)."""
-        self._ensure_loaded()
+        if sprite_name.startswith("monster_"):
+            return self.get_monster_sprite(sprite_name[len("monster_"):])
+        category = next((category for prefix, category in SPRITE_PREFIXES.items()
+                         if sprite_name.startswith(prefix)), None)
+        if category is None:
+            self._ensure_loaded()
+        else:
+            self._ensure_category(category)
         return self.sprite_cache.get(sprite_name)
 
     def get_cache_info(self) -> Dict[str, Any]:
@@ -400,7 +576,10 @@ class SpriteManager:
             "total_sprites": len(self.sprite_cache),
             "tile_mappings": len(self._tile_mappings),
             "monster_sprites": len(self._monster),
+            "monster_evictions": self.monster_evictions,
+            "monster_preloads": len(self._monster_jobs),
             "npc_sprites": len(self._npc_dir_map),
+            "atlas": self.atlas.stats(),
             "tile_ids": list(self._tile_mappings.keys())[:20],
             "sprite_names": list(self.sprite_cache.keys())[:20],
         }
@@ -517,7 +696,7 @@ class SpriteManager:
         for direction, path in mapping.items():
             if path.exists():
                 try:
-                    surf = pygame.image.load(str(path)).convert_alpha()
+                    surf = self._load_image(path)
                     # Auto-skaliere falls nötig
                     if surf.get_size() != (TILE_SIZE, TILE_SIZE):
                         print(f"[SpriteManager] WARN Player {direction}: auto-scaling to {TILE_SIZE}x{TILE_SIZE}")
@@ -552,25 +731,12 @@ class SpriteManager:
                 continue
                 
             try:
-                surf = pygame.image.load(str(p)).convert_alpha()
+                surf = self._load_image(p)
                 self._npc_dir_map[(npc_id, direction)] = surf
             except Exception as e:
                 print(f"[SpriteManager] ERR loading {p.name}: {e}")
         print(f"[SpriteManager] NPC variants: {len(self._npc_dir_map)}")
 
-    def _load_monsters(self) -> None:
-        """Lädt Monster-Sprites nach Dex-ID."""
-        if not self.monster_dir.exists():
-            return
-        for p in self.monster_dir.glob("*.png"):
-            key = p.stem  # "1".."151"
-            try:
-                surf = pygame.image.load(str(p)).convert_alpha()
-                self._monster[key] = surf
-            except Exception as e:
-                print(f"[SpriteManager] ERR loading {p.name}: {e}")
-        print(f"[SpriteManager] Monsters: {len(self._monster)}")
-
     def get_sprite_cache_size(self) -> int:
         """Gibt die Anzahl der Sprites im Cache zurück (für Kompatibilität)."""
         self._ensure_loaded()
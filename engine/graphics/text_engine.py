@@ -0,0 +1,448 @@
+"""
+Text-Engine - Glyph-Cache und Zeilen-Layouts für Dialoge, Menüs und Kampf-Log
+Glyphen werden pro Font und Farbe einmal gerendert und in Atlas-Streifen abgelegt; laufend wachsende Zeilen entstehen per blits
+"""
+
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import pygame
+
+from engine.graphics.optimized_renderer import FontCache
+
+# Breite eines Glyph-Atlas-Streifens in Pixeln (Höhe = doppelte Zeilenhöhe des Fonts)
+GLYPH_PAGE_WIDTH = 512
+
+# Obergrenzen der LRU-Caches (Einträge)
+MAX_CACHED_LINES = 512
+MAX_CACHED_LAYOUTS = 256
+MAX_CACHED_GLYPH_LAYOUTS = 512
+
+ELLIPSIS = "..."
+
+Color = Tuple[int, ...]
+
+# (x-Offsets der Glyphen, Zeilenbreite, Abstand Oberkante -> Grundlinie, Zeilenhöhe)
+GlyphLayout = Tuple[Tuple[int, ...], int, int, int]
+
+
+class GlyphAtlas:
+    """
+    Glyphen eines Fonts in einer Farbe.
+
+    Jede Glyphe wird beim ersten Auftreten einzeln gerendert und rechts an
+    den aktuellen Atlas-Streifen angehängt; ist er voll, beginnt ein neuer.
+    Zu jeder Glyphe wird der Abstand von ihrer Oberkante zur Grundlinie
+    gespeichert, da Glyphen über der Oberlänge (Ä, Ö, Ü) höher gerendert
+    werden. Zeilen werden anschließend nur noch aus Blits dieser Streifen
+    zusammengesetzt.
+    """
+
+    def __init__(self, font: pygame.font.Font, color: Color, antialias: bool = True,
+                 page_width: int = GLYPH_PAGE_WIDTH):
+        """
+        Args:
+            font: Font der Glyphen
+            color: Textfarbe
+            antialias: Kantenglättung
+            page_width: Breite eines Atlas-Streifens in Pixeln
+        """
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.page_width = page_width
+        self.height = font.get_linesize() * 2
+        self.ascent = font.get_ascent()
+        self.pages: List[pygame.Surface] = []
+        self.glyphs: Dict[str, Tuple[pygame.Surface, pygame.Rect, int]] = {}
+        self._next_x = page_width
+
+    def glyph(self, char: str) -> Tuple[pygame.Surface, pygame.Rect, int]:
+        """
+        Atlas-Streifen, Quell-Rechteck und Grundlinie einer Glyphe.
+
+        Args:
+            char: Einzelnes Zeichen
+
+        Returns:
+            (Surface, Rect, Abstand Oberkante -> Grundlinie) zum Blitten mit area-Parameter
+        """
+        entry = self.glyphs.get(char)
+        if entry is None:
+            entry = self.glyphs[char] = self._add(char)
+        return entry
+
+    def _add(self, char: str) -> Tuple[pygame.Surface, pygame.Rect, int]:
+        """Rendert eine Glyphe und legt sie im Atlas ab"""
+        try:
+            rendered = self.font.render(char, self.antialias, self.color)
+        except pygame.error:
+            rendered = pygame.Surface((0, self.ascent), pygame.SRCALPHA)  # Zeichen ohne Breite (z.B. U+FE0F)
+        metrics = self.font.metrics(char)[0]
+        baseline = max(self.ascent, metrics[3]) if metrics else self.ascent
+        width, height = rendered.get_size()
+        if not width or width > self.page_width or height > self.height:
+            return rendered, rendered.get_rect(), baseline
+        if self._next_x + width > self.page_width:
+            self.pages.append(pygame.Surface((self.page_width, self.height), pygame.SRCALPHA))
+            self._next_x = 0
+        page = self.pages[-1]
+        rect = pygame.Rect(self._next_x, 0, width, height)
+        page.blit(rendered, rect)
+        self._next_x += width
+        return page, rect, baseline
+
+
+def measure_glyphs(text: str, font: pygame.font.Font, start: int = 0) -> Tuple[List[int], int, int, int]:
+    """
+    Vermisst die Glyphen ab einem Index.
+
+    Der Ursprung einer Glyphe ist die Breite des Präfixes bis einschließlich
+    der Glyphe minus ihre eigene Breite. font.size rechnet mit gebrochenen
+    Vorschüben und Kerning; die ganzzahligen Vorschübe aus font.metrics
+    liegen bei langen Zeilen um viele Pixel daneben.
+
+    Args:
+        text: Einzeiliger Text
+        font: Font
+        start: Index der ersten zu vermessenden Glyphe; die Zeichen davor
+            bestimmen nur die Position (Schreibmaschinen-Effekt)
+
+    Returns:
+        (x-Offsets der Glyphen ab start, Breite des ganzen Textes,
+         höchste Oberkante über und tiefste Unterkante unter der Grundlinie
+         der Glyphen ab start)
+    """
+    size = font.size
+    offsets = []
+    width = size(text)[0] if start >= len(text) else 0
+    for index in range(start, len(text)):
+        width = size(text[:index + 1])[0]
+        offsets.append(width - size(text[index])[0])
+    top = font.get_ascent()
+    bottom = -font.get_descent()
+    for metrics in (font.metrics(text[start:]) if start < len(text) else ()):
+        if metrics:
+            top = max(top, metrics[3])
+            bottom = max(bottom, -metrics[2])
+    return offsets, width, top, bottom
+
+
+class TextEngine:
+    """
+    Gemeinsamer Text-Renderer auf Basis des FontCache.
+
+    - Fertige Zeilen-Surfaces in einem LRU-Cache, einmal per font.render
+      erzeugt und damit pixelgleich
+    - Umbruch-Layouts gecacht nach (Text, Font, Breite)
+    - Kürzen mit Auslassungspunkten per Binärsuche über die Präfixbreiten
+    - Glyph-Atlas pro (Font, Farbe, Antialias) für TextLine: Zeilen, die
+      sich jedes Frame ändern (Schreibmaschinen-Effekt), werden aus Glyphen
+      zusammengesetzt statt neu gerendert
+
+    Glyph-Positionen kommen aus font.size der Präfixe (siehe measure_glyphs)
+    und werden pro Text gecacht. Zusammengesetzte Zeilen haben Höhe,
+    Grundlinie und Breite von font.render und weichen nur im Antialiasing
+    ab; Ligaturen (fi, fl) werden als Einzelglyphen gesetzt.
+    """
+
+    _instance: Optional['TextEngine'] = None
+
+    @classmethod
+    def get(cls) -> 'TextEngine':
+        """Singleton-Instanz"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self.fonts = FontCache()
+        self._atlases: Dict[Tuple[pygame.font.Font, Color, bool], GlyphAtlas] = {}
+        self._lines: 'OrderedDict[Hashable, pygame.Surface]' = OrderedDict()
+        self._layouts: 'OrderedDict[Hashable, Tuple[str, ...]]' = OrderedDict()
+        self._glyph_layouts: 'OrderedDict[Hashable, GlyphLayout]' = OrderedDict()
+        self.line_hits = 0
+        self.line_misses = 0
+
+    def get_font(self, size: int, font_name: str = "None") -> pygame.font.Font:
+        """
+        Geteilte Font-Instanz (gleiche Instanz -> gleicher Glyph-Cache).
+
+        Args:
+            size: Schriftgröße
+            font_name: Font-Datei oder "None" für den Standard-Font
+
+        Returns:
+            Font aus dem FontCache
+        """
+        return self.fonts.get_font(font_name, size)
+
+    def _atlas(self, font: pygame.font.Font, color: Color, antialias: bool) -> GlyphAtlas:
+        """Glyph-Atlas für Font und Farbe"""
+        key = (font, tuple(color), antialias)
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            atlas = self._atlases[key] = GlyphAtlas(font, key[1], antialias)
+        return atlas
+
+    def width(self, text: str, font: pygame.font.Font) -> int:
+        """Breite eines Textes in Pixeln (wie font.size)"""
+        return font.size(text)[0] if text else 0
+
+    def line_metrics(self, text: str, font: pygame.font.Font) -> Tuple[int, int]:
+        """
+        Grundlinie und Höhe einer Zeile, wie font.render sie anlegt.
+        Glyphen über der Oberlänge (Umlaute auf Großbuchstaben) oder unter
+        der Unterlänge vergrößern die Zeile.
+
+        Args:
+            text: Einzeiliger Text
+            font: Font
+
+        Returns:
+            (Abstand Oberkante -> Grundlinie, Zeilenhöhe)
+        """
+        _, _, baseline, height = self.glyph_layout(text, font)
+        return baseline, height
+
+    def glyph_layout(self, text: str, font: pygame.font.Font) -> GlyphLayout:
+        """
+        x-Offsets, Vorschub, Grundlinie und Höhe einer Zeile (gecacht pro Text).
+
+        Args:
+            text: Einzeiliger Text
+            font: Font
+
+        Returns:
+            (Offsets, Zeilenbreite, Abstand Oberkante -> Grundlinie, Zeilenhöhe)
+        """
+        key = (text, font)
+        layout = self._glyph_layouts.get(key)
+        if layout is not None:
+            self._glyph_layouts.move_to_end(key)
+            return layout
+
+        offsets, width, top, bottom = measure_glyphs(text, font)
+        layout = self._glyph_layouts[key] = (tuple(offsets), width, top,
+                                             max(font.get_height(), top + bottom))
+        if len(self._glyph_layouts) > MAX_CACHED_GLYPH_LAYOUTS:
+            self._glyph_layouts.popitem(last=False)
+        return layout
+
+    def wrap(self, text: str, font: pygame.font.Font, max_width: int) -> Tuple[str, ...]:
+        """
+        Bricht Text wortweise auf eine Breite um (gecacht).
+        Ein einzelnes Wort breiter als max_width steht allein in seiner Zeile.
+
+        Args:
+            text: Text (Leerraum wird zu einfachen Leerzeichen)
+            font: Font
+            max_width: Maximale Zeilenbreite in Pixeln
+
+        Returns:
+            Zeilen
+        """
+        key = (text, font, max_width)
+        lines = self._layouts.get(key)
+        if lines is not None:
+            self._layouts.move_to_end(key)
+            return lines
+
+        result: List[str] = []
+        current = ""
+        for word in text.split():
+            candidate = f"{current} {word}" if current else word
+            if current and font.size(candidate)[0] > max_width:
+                result.append(current)
+                current = word
+            else:
+                current = candidate
+        if current:
+            result.append(current)
+
+        lines = self._layouts[key] = tuple(result)
+        if len(self._layouts) > MAX_CACHED_LAYOUTS:
+            self._layouts.popitem(last=False)
+        return lines
+
+    def truncate(self, text: str, font: pygame.font.Font, max_width: int,
+                 ellipsis: str = ELLIPSIS) -> str:
+        """
+        Kürzt Text auf eine Breite und hängt Auslassungspunkte an.
+
+        Args:
+            text: Text
+            font: Font
+            max_width: Maximale Breite in Pixeln
+            ellipsis: Angehängte Zeichen, wenn gekürzt wurde
+
+        Returns:
+            Unveränderter Text, wenn er passt, sonst längstes passendes Präfix + ellipsis
+        """
+        if self.width(text, font) <= max_width:
+            return text
+        # Erstes Präfix, das mit Auslassungspunkten nicht mehr passt
+        cut = bisect_right(range(len(text)), max_width,
+                           key=lambda n: font.size(text[:n].rstrip() + ellipsis)[0])
+        return text[:max(0, cut - 1)].rstrip() + ellipsis
+
+    def render(self, text: str, font: pygame.font.Font, color: Color,
+               antialias: bool = True) -> pygame.Surface:
+        """
+        Gerenderte Zeile aus dem Cache (Ersatz für font.render).
+
+        Args:
+            text: Einzeilig
+            font: Font
+            color: Textfarbe
+            antialias: Kantenglättung
+
+        Returns:
+            Surface mit Alpha; nicht verändern, sie wird wiederverwendet
+        """
+        key = (text, font, tuple(color), antialias)
+        surface = self._lines.get(key)
+        if surface is not None:
+            self.line_hits += 1
+            self._lines.move_to_end(key)
+            return surface
+
+        self.line_misses += 1
+        try:
+            surface = font.render(text, antialias, color)
+        except pygame.error:
+            # Zeichen ohne Breite (z.B. U+FE0F) allein: aus Glyphen setzen
+            offsets, width, baseline, height = self.glyph_layout(text, font)
+            surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            surface.fill((*color[:3], 0))
+            self.draw_glyphs(surface, text, font, color, antialias, baseline=baseline, offsets=offsets)
+        if not surface.get_flags() & pygame.SRCALPHA:
+            # Ohne Antialiasing liefert font.render eine Palette mit Colorkey
+            line = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+            line.fill((*color[:3], 0))
+            line.blit(surface, (0, 0))
+            surface = line
+        self._lines[key] = surface
+        if len(self._lines) > MAX_CACHED_LINES:
+            self._lines.popitem(last=False)
+        return surface
+
+    def draw_glyphs(self, surface: pygame.Surface, text: str, font: pygame.font.Font,
+                    color: Color, antialias: bool = True, x: int = 0, y: int = 0,
+                    baseline: Optional[int] = None, start: int = 0,
+                    offsets: Optional[Sequence[int]] = None) -> None:
+        """
+        Setzt Text Glyphe für Glyphe auf eine transparente Zeilen-Surface.
+        Glyphen werden per Maximum geblendet, damit sich überlappende
+        Kanten wie bei font.render nicht aufaddieren.
+
+        Args:
+            surface: Ziel (SRCALPHA)
+            text: Einzeiliger Text
+            font: Font
+            color: Textfarbe
+            antialias: Kantenglättung
+            x: Startposition links
+            y: Oberkante der Zeile
+            baseline: Abstand Oberkante -> Grundlinie (Standard: glyph_layout)
+            start: Index des ersten zu zeichnenden Zeichens; die Zeichen davor
+                bestimmen nur die Position (Schreibmaschinen-Effekt)
+            offsets: x-Offsets aller Glyphen (Standard: glyph_layout)
+        """
+        if offsets is None or baseline is None:
+            layout_offsets, _, layout_baseline, _ = self.glyph_layout(text, font)
+            offsets = layout_offsets if offsets is None else offsets
+            baseline = layout_baseline if baseline is None else baseline
+        atlas = self._atlas(font, color, antialias)
+        blits = []
+        for index in range(start, len(text)):
+            page, rect, top = atlas.glyph(text[index])
+            blits.append((page, (x + offsets[index], y + baseline - top), rect, pygame.BLEND_RGBA_MAX))
+        surface.blits(blits, doreturn=False)
+
+    def clear(self) -> None:
+        """Verwirft alle gecachten Glyphen, Zeilen und Layouts"""
+        self._atlases.clear()
+        self._lines.clear()
+        self._layouts.clear()
+        self._glyph_layouts.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Kennzahlen: Glyphen, Atlas-Streifen, gecachte Zeilen/Layouts, Treffer"""
+        return {
+            'glyphs': sum(len(atlas.glyphs) for atlas in self._atlases.values()),
+            'glyph_pages': sum(len(atlas.pages) for atlas in self._atlases.values()),
+            'lines': len(self._lines),
+            'layouts': len(self._layouts),
+            'line_hits': self.line_hits,
+            'line_misses': self.line_misses,
+        }
+
+
+class TextLine:
+    """
+    Wiederverwendete Surface für eine Zeile, die sich laufend ändert.
+
+    Wächst der Text nur hinten an (Schreibmaschinen-Effekt), werden nur die
+    neuen Glyphen vermessen und geblittet; die Surface wird erst ersetzt,
+    wenn die Zeile nicht mehr hineinpasst oder eine höhere Glyphe (Umlaut
+    auf Großbuchstabe) die Grundlinie verschiebt.
+    """
+
+    def __init__(self, font: pygame.font.Font, color: Color, antialias: bool = True,
+                 engine: Optional[TextEngine] = None):
+        """
+        Args:
+            font: Font
+            color: Textfarbe
+            antialias: Kantenglättung
+            engine: TextEngine (Standard: Singleton)
+        """
+        self.engine = engine or TextEngine.get()
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.text = ""
+        self.width = 0
+        self.offsets: List[int] = []
+        self.baseline, height = self.engine.line_metrics("", font)
+        self._bottom = height - self.baseline
+        self.surface = pygame.Surface((0, height), pygame.SRCALPHA)
+
+    def set_text(self, text: str) -> None:
+        """Setzt den Zeilentext; zeichnet nur, was sich geändert hat"""
+        if text == self.text:
+            return
+        if self.text and text.startswith(self.text):
+            # Nur die angehängten Glyphen vermessen
+            added, width, top, bottom = measure_glyphs(text, self.font, len(self.text))
+            offsets = self.offsets
+            offsets.extend(added)
+            baseline, bottom = max(self.baseline, top), max(self._bottom, bottom)
+        else:
+            offsets, width, baseline, bottom = measure_glyphs(text, self.font)
+        height = max(self.font.get_height(), baseline + bottom)
+        if (width > self.surface.get_width() or baseline != self.baseline or
+                height != self.surface.get_height()):
+            self.surface = pygame.Surface((max(width, self.surface.get_width() * 2), height),
+                                          pygame.SRCALPHA)
+            self.surface.fill((*self.color[:3], 0))
+            start = 0
+        elif text.startswith(self.text):
+            start = len(self.text)
+        else:
+            self.surface.fill((*self.color[:3], 0))
+            start = 0
+        self.engine.draw_glyphs(self.surface, text, self.font, self.color, self.antialias,
+                                baseline=baseline, start=start, offsets=offsets)
+        self.text = text
+        self.width = width
+        self.offsets = offsets
+        self.baseline = baseline
+        self._bottom = bottom
+
+    def draw(self, surface: pygame.Surface, position: Tuple[int, int]) -> None:
+        """Blittet den belegten Teil der Zeile"""
+        if self.width:
+            surface.blit(self.surface, position, (0, 0, self.width, self.surface.get_height()))
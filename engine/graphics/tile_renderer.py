@@ -2,6 +2,7 @@
 import pygame
 from typing import List, Optional, Tuple, Dict, Any
 from .sprite_manager import SpriteManager
+from .sprite_atlas import atlas_region
 from ..world.tiles import TILE_SIZE
 
 # Temporärer Import für den Test
@@ -47,39 +48,48 @@ class TileRenderer:
         end_tile_x = min(len(layer_data[0]), start_tile_x + (screen.get_width() // self.tile_size) + 2)
         end_tile_y = min(len(layer_data), start_tile_y + (screen.get_height() // self.tile_size) + 2)
         
-        # Rendere nur sichtbare Tiles
+        # Sichtbare Tiles sammeln und in einem Aufruf aus den Atlas-Seiten blitten
+        blits: List[Tuple[pygame.Surface, Tuple[int, int], pygame.Rect]] = []
+        regions: Dict[Any, Optional[Tuple[pygame.Surface, pygame.Rect]]] = {}
         for y in range(start_tile_y, end_tile_y):
+            row = layer_data[y]
+            screen_y = y * self.tile_size - int(camera_y)
             for x in range(start_tile_x, end_tile_x):
-                tile_data = layer_data[y][x]
+                tile_data = row[x]
                 
                 # Überspringe leere Tiles (0 oder "grass" für leere Bereiche)
                 if self._is_empty_tile(tile_data):
                     continue
                 
-                # Berechne die Bildschirm-Position
-                screen_x = x * self.tile_size - int(camera_x)
-                screen_y = y * self.tile_size - int(camera_y)
-                
-                # Hole den Sprite für diese Tile-ID oder Tile-Name
-                tile_sprite = self._get_tile_sprite(tile_data)
-                
-                if tile_sprite:
-                    # Zeichne den Tile-Sprite
-                    screen.blit(tile_sprite, (screen_x, screen_y))
-                else:
-                    # Erstelle einen Platzhalter für fehlende Tiles
-                    placeholder = self._create_placeholder_tile(tile_data)
-                    if placeholder:
-                        screen.blit(placeholder, (screen_x, screen_y))
-                        # Log nur einmal pro Tile-ID
-                        if tile_data not in self.missing_tiles:
-                            print(f"⚠️  Platzhalter für Tile {tile_data} erstellt")
-                            self.missing_tiles.add(tile_data)
+                # Sprite (oder Platzhalter) nur einmal pro Tile-ID auflösen
+                if tile_data not in regions:
+                    regions[tile_data] = self._get_tile_region(tile_data)
+                region = regions[tile_data]
+                if region:
+                    page, area = region
+                    blits.append((page, (x * self.tile_size - int(camera_x), screen_y), area))
+        
+        if blits:
+            screen.blits(blits, doreturn=False)
         
         # Debug-Informationen rendern
         if self.debug_mode:
             self._render_debug_info(screen, layer_name, start_tile_x, start_tile_y, end_tile_x, end_tile_y)
 
+    def _get_tile_region(self, tile_data: Any) -> Optional[Tuple[pygame.Surface, pygame.Rect]]:
+        """Atlas-Seite und Quell-Rechteck für eine Tile-ID (Platzhalter bei fehlendem Sprite)"""
+        tile_sprite = self._get_tile_sprite(tile_data)
+        if not tile_sprite:
+            # Erstelle einen Platzhalter für fehlende Tiles
+            tile_sprite = self._create_placeholder_tile(tile_data)
+            if not tile_sprite:
+                return None
+            # Log nur einmal pro Tile-ID
+            if tile_data not in self.missing_tiles:
+                print(f"⚠️  Platzhalter für Tile {tile_data} erstellt")
+                self.missing_tiles.add(tile_data)
+        return atlas_region(tile_sprite)
+
     def _get_tile_sprite(self, tile_data: Any) -> Optional[pygame.Surface]:
         """
         Holt einen Tile-Sprite basierend auf den verfügbaren Daten.
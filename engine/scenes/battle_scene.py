@@ -10,11 +10,12 @@ from typing import Optional, List, Dict, Any
 from enum import Enum, auto
 
 from engine.core.scene_base import Scene
-from engine.core.config import Colors, GameState
+from engine.core.config import Colors, DebugConfig, GameState
 from engine.ui.battle_ui import BattleUI, BattleMenuState
 from engine.systems.battle.battle_controller import BattleState, BattlePhase, BattleType
 from engine.systems.battle.turn_logic import TurnOrder
-from engine.systems.battle.battle_ai import BattleAI
+from engine.systems.battle.battle_ai import BattleAI, AILevel
+from engine.systems.battle.battle_replay import BattleRecorder
 from engine.systems.monster_instance import MonsterInstance
 from engine.systems.battle.command_collection import (
     CommandCollector, CommandPhase, CommandType, MonsterCommand
@@ -53,6 +54,10 @@ class BattleScene(Scene):
         self.battle_ai = BattleAI()
         self.command_collector: Optional[CommandCollector] = None
         
+        # Optional replay recording of the live battle
+        self.battle_recorder: Optional[BattleRecorder] = None
+        self.replay_path: Optional[str] = None
+        
         # Use simplified battle manager if available
         if USE_SIMPLE_BATTLE:
             self.simple_battle = SimpleBattleManager(game)
@@ -181,13 +186,24 @@ class BattleScene(Scene):
         
         # Initialize battle state with actual party
         battle_type = BattleType.WILD if self.is_wild else BattleType.TRAINER
+        # Bosse rechnen voraus (LOOKAHEAD), sonst ai_level oder Standard nach Kampftyp
+        ai_level = AILevel.LOOKAHEAD if self.is_boss else kwargs.get('ai_level')
         self.battle_state = BattleState(
             player_team=player_team,
             enemy_team=enemy_team,
             battle_type=battle_type,
             can_flee=self.can_flee,
-            can_catch=self.is_wild
+            can_catch=self.is_wild,
+            ai_level=ai_level
         )
+        self.battle_ai = self.battle_state.battle_ai
+        
+        # Kampfaufzeichnung (opt-in): record_replay=<Pfad> oder DebugConfig.RECORD_BATTLE_REPLAYS
+        self.replay_path = kwargs.get('record_replay')
+        if self.replay_path is None and DebugConfig.RECORD_BATTLE_REPLAYS:
+            self.replay_path = os.path.join(DebugConfig.BATTLE_REPLAY_DIR,
+                                            f"battle_{self.battle_state.seed}.usrp")
+        self.battle_recorder = BattleRecorder(self.battle_state) if self.replay_path else None
         
         # Initialize turn manager
         self.turn_order = TurnOrder()
@@ -904,6 +920,9 @@ class BattleScene(Scene):
                 if hasattr(self, '_sync_party_after_battle'):
                     self._sync_party_after_battle()
             
+            # Write the replay before the battle state is dropped
+            self._save_battle_replay()
+            
             # Clear battle state
             self.battle_state = None
             self.battle_result = BattleResult.ONGOING
@@ -917,6 +936,19 @@ class BattleScene(Scene):
             # Force return to field
             self.game.pop_scene()
     
+    def _save_battle_replay(self) -> None:
+        """Aufgezeichneten Kampf als Replay-Datei schreiben (nur mit Recorder)."""
+        if not self.battle_recorder:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.replay_path) or '.', exist_ok=True)
+            self.battle_recorder.save(self.replay_path)
+            print(f"Kampf-Replay gespeichert: {self.replay_path}")
+        except Exception as e:
+            print(f"Fehler beim Speichern des Kampf-Replays: {e}")
+        finally:
+            self.battle_recorder = None
+    
     def _get_active_actors(self) -> List[str]:
         """Get list of actors that can act this turn."""
         # Wenn bereits geflohen, keine Akteure mehr
@@ -924,15 +956,16 @@ class BattleScene(Scene):
             return []
         
         actors = []
+        rng = getattr(self.battle_state, 'rng', None)
         
         # Add player monsters
         for i, monster in enumerate(self.battle_state.player_team):
-            if monster and monster.current_hp > 0 and monster.can_act():
+            if monster and monster.current_hp > 0 and monster.can_act(rng):
                 actors.append(f'player_{i}')
         
         # Add enemy monsters
         for i, monster in enumerate(self.battle_state.enemy_team):
-            if monster and monster.current_hp > 0 and monster.can_act():
+            if monster and monster.current_hp > 0 and monster.can_act(rng):
                 actors.append(f'enemy_{i}')
         
         return actors
@@ -6,6 +6,7 @@ Verwaltet Zufallsbegegnungen und Kampf-Initialisierung
 import random
 from typing import Optional
 from engine.systems.monster_instance import MonsterInstance
+from engine.world.collision_grid import TALL_GRASS
 
 
 class FieldEncounterSystem:
@@ -49,32 +50,15 @@ class FieldEncounterSystem:
         if self.steps_since_encounter < self.min_steps_between_encounters:
             return
         
-        # Terrain-Typ prüfen (Gras = 2 oder 5)
-        tile_type = self._get_tile_type(tile_x, tile_y)
+        # Nur hohes Gras (Flag im Collision-Grid der Map)
+        grid = getattr(self.scene.current_area, 'collision_grid', None)
+        if grid is None or not grid.has_flag(tile_x, tile_y, TALL_GRASS):
+            return
         
-        if tile_type in [2, 5]:  # Gras-Tiles
-            # Würfeln für Encounter
-            if random.random() < self.scene.current_area.encounter_rate:
-                # Encounter im nächsten Frame ausführen (vermeidet Movement-Probleme)
-                self.encounter_check_pending = True
-    
-    def _get_tile_type(self, tile_x: int, tile_y: int) -> int:
-        """Holt den Tile-Typ an Position."""
-        if not self.scene.current_area:
-            return 0
-        
-        # Versuche verschiedene Methoden
-        if hasattr(self.scene.current_area, 'get_tile_type'):
-            return self.scene.current_area.get_tile_type(tile_x, tile_y)
-        
-        if hasattr(self.scene.current_area, 'map_data') and self.scene.current_area.map_data:
-            layers = self.scene.current_area.map_data.layers
-            if "ground" in layers:
-                layer = layers["ground"]
-                if 0 <= tile_y < len(layer) and 0 <= tile_x < len(layer[tile_y]):
-                    return layer[tile_y][tile_x]
-        
-        return 0
+        # Würfeln für Encounter
+        if random.random() < self.scene.current_area.encounter_rate:
+            # Encounter im nächsten Frame ausführen (vermeidet Movement-Probleme)
+            self.encounter_check_pending = True
     
     def execute_encounter_check(self) -> None:
         """Führt den tatsächlichen Encounter-Check aus."""
@@ -66,9 +66,8 @@ class FieldInteractionSystem:
         if not self.scene.current_area:
             return False
         
-        for entity in self.scene.current_area.entities:
-            entity_tile = entity.get_tile_position()
-            if entity_tile == (tile_x, tile_y) and entity.interactable:
+        for entity in self.scene.current_area.get_entities_at(tile_x, tile_y):
+            if entity.interactable:
                 # NPC anschauen lassen
                 if hasattr(entity, 'grid_x') and hasattr(entity, 'grid_y'):
                     dx = entity.grid_x - self.scene.player.grid_x
@@ -91,11 +90,10 @@ class FieldInteractionSystem:
         if not self.scene.current_area or not hasattr(self.scene.current_area, 'map_data'):
             return False
         
-        if self.scene.current_area.map_data:
-            for trigger in self.scene.current_area.map_data.triggers:
-                if trigger.x == tile_x and trigger.y == tile_y:
-                    self._execute_trigger(trigger)
-                    return True
+        trigger = self.scene.current_area.trigger_index.first_at(tile_x, tile_y)
+        if trigger:
+            self._execute_trigger(trigger)
+            return True
         
         return False
     
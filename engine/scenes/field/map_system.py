@@ -15,6 +15,7 @@ from dataclasses import dataclass
 from engine.world.tiles import TILE_SIZE, tile_to_world
 from engine.world.map_loader import MapLoader, MapData, Warp
 from engine.world.area import Area
+from engine.world.map_prefetcher import MapPrefetcher
 from engine.world.camera import Camera, CameraConfig
 from engine.core.resources import resources
 
@@ -104,6 +105,10 @@ class UnifiedMapSystem:
             # 7. Encounter-Daten laden
             self._load_encounters(area, map_id)
             
+            # 8. Warp-Ziele im Hintergrund vorbereiten
+            MapPrefetcher.get().prefetch((warp.to_map, warp.to_x, warp.to_y) for warp in area.warps
+                                         if warp.to_map != map_id)
+            
             # Erfolg!
             self.current_area = area
             self.current_map_id = map_id
@@ -163,8 +168,8 @@ class UnifiedMapSystem:
     
     def _create_area(self, map_id: str, map_data: MapData) -> Area:
         """Erstellt ein Area-Objekt aus Map-Daten."""
-        # Die Area-Klasse lädt selbst die Map
-        area = Area(map_id)
+        # Vorbereitete Area vom Prefetcher, sonst lädt die Area-Klasse selbst die Map
+        area = MapPrefetcher.get().take(map_id) or Area(map_id)
         
         # Map-Data setzen falls nicht vorhanden
         if not hasattr(area, 'map_data'):
@@ -23,6 +23,9 @@ from engine.ui.transitions import TransitionType
 from engine.graphics.sprite_manager import SpriteManager
 from engine.graphics.tile_renderer import TileRenderer
 from engine.world.area import Area
+from engine.world.collision_grid import TALL_GRASS
+from engine.world.map_prefetcher import MapPrefetcher
+from engine.world.spatial_hash import SpatialHash
 import os
 
 
@@ -43,6 +46,10 @@ class FieldScene(Scene):
         self.current_area: Optional[Area] = None
         self.map_id: str = ""
         
+        # Warp-Ziele werden im Hintergrund vorbereitet
+        self.map_prefetcher = MapPrefetcher.get()
+        self.map_prefetcher.view_size = tuple(getattr(self.game, 'logical_size', (320, 240)))
+        
         # Player
         self.player: Optional[Player] = None
         
@@ -53,6 +60,10 @@ class FieldScene(Scene):
         # UI elements
         self.dialogue_box = DialogueBox(x=10, y=120, width=300, height=50)
         
+        # Letzter gezeichneter Frame (für Dirty-Rect-Präsentation)
+        self._last_world_state: Optional[Tuple] = None
+        self._last_dialogue_state: Optional[Tuple] = None
+        
         # State flags
         self.show_debug = False
         self.show_grid = False
@@ -179,9 +190,14 @@ class FieldScene(Scene):
             self.player.last_map = self.map_id
         
         try:
-            # Lade Map-Daten
-            from engine.world.map_loader import MapLoader
-            map_data = MapLoader.load_map(map_name)
+            # Vorbereitete Area vom Prefetcher übernehmen, sonst synchron laden
+            area = self.map_prefetcher.take(map_name)
+            if area is None or area.map_data is None:
+                from engine.world.area import Area
+                area = Area(map_name)
+            if area.map_data is None:
+                raise ValueError(f"Map {map_name} konnte nicht geladen werden")
+            map_data = area.map_data
             
             # Initialisiere Camera falls nötig
             if not self.camera:
@@ -194,15 +210,9 @@ class FieldScene(Scene):
                     config=self.camera_config
                 )
             
-            # Erstelle Area
-            from engine.world.area import Area
-            self.current_area = Area(map_name)
+            self.current_area = area
             self.map_id = map_name
             
-            # Setze map_data falls Area sie nicht hat
-            if not hasattr(self.current_area, 'map_data'):
-                self.current_area.map_data = map_data
-            
             # Debug-Info
             print(f"[Flint] Map geladen: {map_name}")
             print(f"[Flint] Größe: {map_data.width}x{map_data.height}")
@@ -210,6 +220,10 @@ class FieldScene(Scene):
             # Lade Encounter-Daten
             self._load_encounter_data()
             
+            # Monster-Sprites der Encounter-Tabelle im Hintergrund dekodieren
+            self.sprite_manager.preload_monsters(
+                entry.get("species_id") for entry in getattr(self.current_area, "encounter_table", []))
+            
             # Update Camera
             if self.camera:
                 world_width = map_data.width * 16
@@ -227,6 +241,7 @@ class FieldScene(Scene):
                 map_data.width,
                 map_data.height
             )
+            self.player.set_collision_grid(self.current_area.collision_grid)
             
             # Positioniere Player
             self.player.set_tile_position(spawn_x, spawn_y)
@@ -242,6 +257,9 @@ class FieldScene(Scene):
             # Lade NPCs
             self._load_area_entities()
             
+            # Nachbar-Maps im Hintergrund vorbereiten
+            self._prefetch_warp_targets()
+            
             print(f"[Flint] Map {map_name} erfolgreich geladen!")
             
         except Exception as e:
@@ -250,6 +268,14 @@ class FieldScene(Scene):
             traceback.print_exc()
             self._create_empty_area()
     
+    def _prefetch_warp_targets(self) -> None:
+        """Plant die Ziel-Maps aller Warps der aktuellen Map im Prefetcher ein."""
+        targets = [(warp.to_map, warp.to_x, warp.to_y) for warp in self.current_area.map_data.warps]
+        for warp_info in self._get_warp_index():
+            destination = warp_info.get("destination_position", [5, 5])
+            targets.append((warp_info.get("destination_map"), destination[0], destination[1]))
+        self.map_prefetcher.prefetch(target for target in targets if target[0] != self.map_id)
+    
     def _load_encounter_data(self):
         """Lade Encounter-Daten für die Area."""
         if not self.current_area:
@@ -356,8 +382,8 @@ class FieldScene(Scene):
                 npc.set_area(self.current_area)
                 npc.set_player_reference(self.player)
                 
-                # Füge zur Area hinzu
-                self.current_area.entities.append(npc)
+                # Füge zur Area hinzu (registriert den NPC im Collision-Grid)
+                self.current_area.add_entity(npc)
                 print(f"[Flint] NPC hinzugefügt: {npc.name} - Pattern: {npc_info.get('movement_pattern', 'static')}")
                 
             except Exception as e:
@@ -481,22 +507,31 @@ class FieldScene(Scene):
         if self.camera:
             self.camera.update(dt)
         
-        # Update NPCs - HIER KOMMT PATHFINDING REIN!
+        # Verteilte Pfadsuchen mit dem Frame-Budget fortsetzen
+        grid = getattr(self.current_area, 'collision_grid', None)
+        if grid is not None:
+            grid.pathfinder.update()
+        
+        # Update NPCs
         if self.current_area and hasattr(self.current_area, 'entities'):
             for entity in self.current_area.entities:
                 entity.update(dt)
-                # TODO: Pathfinding-Update für bewegende NPCs
         
         # Check Story-Events
         self._check_story_events()
     
-    def draw(self, surface: pygame.Surface) -> None:
-        """Zeichne die Scene."""
+    def draw(self, surface: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        """
+        Zeichne die Scene.
+        
+        Returns:
+            Geänderte Bereiche seit dem letzten Frame (None = alles)
+        """
         if not self.current_area:
             font = pygame.font.Font(None, 24)
             text = font.render("FEHLER: Keine Area geladen!", True, (255, 0, 0))
             surface.blit(text, (50, 50))
-            return
+            return None
         
         # Verwende RenderManager
         if not hasattr(self, 'render_manager'):
@@ -525,6 +560,54 @@ class FieldScene(Scene):
         
         # UI
         self._draw_ui(surface)
+        
+        return self._get_dirty_rects()
+    
+    def _get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """
+        Vergleicht den Frame mit dem vorherigen.
+        Steht die Welt still, ist höchstens die Dialogbox geändert.
+        Solange ein Debug-Overlay sichtbar ist, wird immer voll gezeichnet,
+        da dessen Inhalt (FPS, Spieler-Tile, ...) nicht im Vergleich steckt.
+        """
+        if self._overlay_active():
+            # Nach dem Schließen des Overlays erneut voll zeichnen
+            self._last_world_state = None
+            self._last_dialogue_state = None
+            return None
+        
+        world_state = self._get_world_state()
+        dialogue_state = self.dialogue_box.get_render_state()
+        world_changed = world_state != self._last_world_state
+        dialogue_changed = dialogue_state != self._last_dialogue_state
+        self._last_world_state = world_state
+        self._last_dialogue_state = dialogue_state
+        
+        if world_changed:
+            return None
+        if dialogue_changed:
+            return [self.dialogue_box.get_rect()]
+        return []
+    
+    def _overlay_active(self) -> bool:
+        """Prüft, ob ein Debug-Overlay über die Scene gezeichnet wird."""
+        return bool(self.show_debug or self.show_grid
+                    or getattr(getattr(self, 'render_manager', None), 'debug_mode', False))
+    
+    def _get_world_state(self) -> Tuple:
+        """Alles außer der Dialogbox, was das Bild der Scene bestimmt."""
+        entities = list(getattr(self.current_area, 'entities', []))
+        if self.player:
+            entities.append(self.player)
+        return (
+            id(self.current_area),
+            (int(self.camera.x), int(self.camera.y)) if self.camera else None,
+            self.paused,
+            tuple((id(entity), int(entity.x), int(entity.y), entity.visible,
+                   getattr(entity, 'direction', None), getattr(entity, 'animation_frame', 0),
+                   id(getattr(entity, 'sprite_surface', None)))
+                  for entity in entities),
+        )
     
     def _draw_ui(self, surface: pygame.Surface) -> None:
         """Zeichne UI-Elemente."""
@@ -680,9 +763,8 @@ class FieldScene(Scene):
         tile_x, tile_y = tile_pos
         
         # Check NPCs
-        for entity in self.current_area.entities:
-            entity_tile = entity.get_tile_position()
-            if entity_tile == tile_pos and entity.interactable:
+        for entity in self.current_area.get_entities_at(tile_x, tile_y):
+            if entity.interactable:
                 from engine.world.npc import NPC
                 if isinstance(entity, NPC):
                     entity.on_interact(self.player)
@@ -697,11 +779,9 @@ class FieldScene(Scene):
                 return
         
         # Check Triggers
-        if hasattr(self.current_area, 'map_data') and self.current_area.map_data:
-            for trigger in self.current_area.map_data.triggers:
-                if trigger.x == tile_x and trigger.y == tile_y:
-                    self._execute_trigger(trigger)
-                    return
+        trigger = self.current_area.trigger_index.first_at(tile_x, tile_y)
+        if trigger:
+            self._execute_trigger(trigger)
     
     def _interact_with_entity(self, entity: Entity) -> None:
         """Interagiere mit Entity."""
@@ -759,28 +839,30 @@ class FieldScene(Scene):
         if not self.current_area:
             return
         
-        # Lade Warps aus warps.json
-        warps_data = resources.load_json("game_data/warps.json")
-        if not warps_data:
+        for warp_info in self._get_warp_index().at(tile_x, tile_y):
+            warp = Warp(
+                x=tile_x,
+                y=tile_y,
+                to_map=warp_info.get("destination_map"),
+                to_x=warp_info.get("destination_position", [5, 5])[0],
+                to_y=warp_info.get("destination_position", [5, 5])[1],
+                direction=warp_info.get("direction"),
+                transition_type=warp_info.get("type", "fade")
+            )
+            self._execute_warp(warp)
             return
-        
-        current_map_warps = warps_data.get(self.map_id, {})
-        
-        for warp_name, warp_info in current_map_warps.items():
-            warp_pos = warp_info.get("position", [])
-            if len(warp_pos) == 2 and warp_pos[0] == tile_x and warp_pos[1] == tile_y:
-                from engine.world.map_loader import Warp
-                warp = Warp(
-                    x=tile_x,
-                    y=tile_y,
-                    to_map=warp_info.get("destination_map"),
-                    to_x=warp_info.get("destination_position", [5, 5])[0],
-                    to_y=warp_info.get("destination_position", [5, 5])[1],
-                    direction=warp_info.get("direction"),
-                    transition_type=warp_info.get("type", "fade")
-                )
-                self._execute_warp(warp)
-                return
+    
+    def _get_warp_index(self) -> SpatialHash:
+        """Warps der aktuellen Map aus warps.json als Tile-Index (einmal pro Map gebaut)."""
+        warps_data = resources.load_json("game_data/warps.json") or {}
+        key = (self.map_id, id(warps_data))
+        cached = getattr(self, '_warp_index', None)
+        if cached is None or cached[0] != key:
+            warps = [info for info in warps_data.get(self.map_id, {}).values()
+                     if len(info.get("position", [])) == 2]
+            cached = (key, SpatialHash.from_positions(warps, lambda info: tuple(info["position"])))
+            self._warp_index = cached
+        return cached[1]
     
     def _execute_warp(self, warp: Warp) -> None:
         """Führe Warp aus."""
@@ -812,12 +894,10 @@ class FieldScene(Scene):
     
     def _handle_collision_event(self, tile_x: int, tile_y: int):
         """Handle Kollision mit Tile."""
-        if hasattr(self.current_area, 'map_data') and self.current_area.map_data:
-            for trigger in self.current_area.map_data.triggers:
-                if trigger.x == tile_x and trigger.y == tile_y:
-                    if trigger.event == "sign":
-                        self._execute_trigger(trigger)
-                        break
+        trigger = self.current_area.trigger_index.first_at(
+            tile_x, tile_y, lambda trigger: trigger.event == "sign")
+        if trigger:
+            self._execute_trigger(trigger)
     
     # === ENCOUNTERS ===
     
@@ -831,26 +911,14 @@ class FieldScene(Scene):
         if self.steps_since_encounter < self.min_steps_between_encounters:
             return
         
-        # Get Terrain-Typ aus der Map
-        tile_type = None
-        if hasattr(self.current_area, 'map_data') and self.current_area.map_data:
-            # Check Tile Layer 1 (main terrain layer)
-            if 'Tile Layer 1' in self.current_area.map_data.layers:
-                layer = self.current_area.map_data.layers['Tile Layer 1']
-                if 0 <= tile_y < len(layer) and 0 <= tile_x < len(layer[tile_y]):
-                    tile_type = layer[tile_y][tile_x]
-                    print(f"[DEBUG] Tile at ({tile_x}, {tile_y}) - Tile ID: {tile_type}")
-        
-        # Check für Gras-Tiles nur auf Route 1
-        if self.map_id == "route1" and tile_type == 29:  # NUR Tile ID 29 ist hohes Gras auf Route 1
-            print(f"[DEBUG] Grass tile at ({tile_x}, {tile_y})")
-            if random.random() < self.current_area.encounter_rate:
-                print(f"[Flint] Encounter triggered auf Grass-Tile {tile_type}!")
-                self.encounter_check_pending = True
-        elif self.map_id == "kohlenstadt" and tile_type in [2, 5]:  # Fallback für Kohlenstadt
-            if random.random() < self.current_area.encounter_rate:
-                print(f"[Flint] Encounter triggered auf Grass-Tile {tile_type}!")
-                self.encounter_check_pending = True
+        # Hohes Gras kommt als Flag aus dem Collision-Grid der Map
+        grid = getattr(self.current_area, 'collision_grid', None)
+        if grid is None or not grid.has_flag(tile_x, tile_y, TALL_GRASS):
+            return
+        
+        if random.random() < self.current_area.encounter_rate:
+            print(f"[Flint] Encounter triggered auf Gras bei ({tile_x}, {tile_y})!")
+            self.encounter_check_pending = True
     
     def _execute_encounter_check(self):
         """Führe Encounter aus."""
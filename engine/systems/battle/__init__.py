@@ -1,35 +1,39 @@
 """
 Battle System Package for Untold Story
 Main battle system with all fixes and improvements
+
+Exports are resolved on first access (PEP 562), so importing a single
+submodule such as battle_simulator does not load the scene-facing
+battle_system stack.
 """
 
-from .battle_system import (
-    BattleState,
-    BattleType,
-    BattlePhase,
-    BattleCommand,
-    AIPersonality,
-    TensionState
-)
+import importlib
+from typing import Any
+
+_EXPORTS = {
+    'BattleState': 'battle_system',
+    'BattleType': 'battle_system',
+    'BattlePhase': 'battle_system',
+    'BattleCommand': 'battle_system',
+    'AIPersonality': 'battle_system',
+    'TensionState': 'battle_system',
+    'BattleAction': 'turn_logic',
+    'ActionType': 'turn_logic',
+    'TurnOrder': 'turn_logic',
+    'BattleAI': 'battle_ai',
+    'ItemEffectHandler': 'battle_effects',
+    'DamageCalculationPipeline': 'damage_calc',
+    'CompiledDamagePipeline': 'damage_calc',
+    'BattleSnapshot': 'battle_snapshot'
+}
 
-from .turn_logic import BattleAction, ActionType, TurnOrder
+__all__ = list(_EXPORTS)
 
-from .turn_logic import TurnOrder
-from .battle_ai import BattleAI
-from .battle_effects import ItemEffectHandler
-from .damage_calc import DamageCalculationPipeline
 
-__all__ = [
-    'BattleState',
-    'BattleType', 
-    'BattlePhase',
-    'BattleCommand',
-    'AIPersonality',
-    'TensionState',
-    'BattleAction',
-    'ActionType',
-    'TurnOrder',
-    'BattleAI',
-    'ItemEffectHandler',
-    'DamageCalculationPipeline'
-]
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
@@ -8,8 +8,8 @@ import random
 from typing import Dict, Any, Optional, List
 from engine.systems.monster_instance import MonsterInstance, StatusCondition
 from engine.systems.battle.turn_logic import BattleAction, ActionType
-from engine.systems.battle.battle_effects import ItemEffectHandler
-from engine.systems.battle.damage_calc import DamageCalculationPipeline
+from engine.systems.battle.battle_effects import ItemEffectHandler, StatChangeEffects
+from engine.systems.battle.damage_calc import DamageCalculationPipeline, DamageResult, CriticalTier
 from engine.systems.battle.skills_dqm import (
     get_skill_database, SkillType, SkillElement, SkillTarget
 )
@@ -18,6 +18,11 @@ from engine.systems.battle.dqm_formulas import DQMCalculator
 logger = logging.getLogger(__name__)
 
 
+def _battle_rng(battle_state: Any) -> Any:
+    """RNG of the battle, or the module RNG for states without one."""
+    return getattr(battle_state, 'rng', None) or random
+
+
 class BattleActionExecutor:
     """Executes battle actions."""
     
@@ -63,52 +68,53 @@ class BattleActionExecutor:
     def _execute_attack(self, action: BattleAction, battle_state: 'BattleState') -> Dict[str, Any]:
         """Execute an attack action."""
         try:
-            # Calculate damage
-            try:
-                # Create context for damage pipeline
-                context = {
-                    'attacker': action.actor,
-                    'defender': action.target,
-                    'move': action.move,
-                    'rng': random,
-                    'result': type('obj', (object,), {
-                        'damage': 0,
-                        'missed': False,
-                        'blocked': False,
-                        'is_critical': False,
-                        'effectiveness': 1.0,
-                        'type_text': ''
-                    })()
-                }
-                
-                # Apply tension multiplier if available
-                if hasattr(battle_state, 'tension_manager'):
-                    multiplier = battle_state.tension_manager.get_multiplier(action.actor)
-                    context['tension_multiplier'] = multiplier
+            damage_result = None
+            if action.move.category == 'support' or action.move.power <= 0:
+                # Status moves deal no damage, only their effects apply
+                damage = dealt = 0
+            else:
+                # Calculate damage
+                try:
+                    tension_multiplier = None
+                    if hasattr(battle_state, 'tension_manager'):
+                        tension_multiplier = battle_state.tension_manager.get_multiplier(action.actor)
                 
-                damage_result = self.damage_pipeline.execute(context)
-                damage = damage_result.damage
+                    # Battles that bring their own calculator (headless simulator) run it instead
+                    calculator = getattr(battle_state, 'damage_calculator', None)
+                    if calculator is not None:
+                        extra = {} if tension_multiplier is None else {'tension_multiplier': tension_multiplier}
+                        damage_result = calculator.calculate(action.actor, action.target, action.move, **extra)
+                    else:
+                        damage_result = self._run_damage_pipeline(action, battle_state, tension_multiplier)
+                    damage = damage_result.damage
                 
-                # Reset tension after attack if applicable
-                if hasattr(battle_state, 'tension_manager') and damage > 0:
-                    battle_state.tension_manager.reset_tension(action.actor)
+                    # Reset tension after attack if applicable
+                    if hasattr(battle_state, 'tension_manager') and damage > 0:
+                        battle_state.tension_manager.reset_tension(action.actor)
                     
-            except Exception as e:
-                logger.warning(f"Error calculating damage, using fallback: {str(e)}")
-                # Fallback: Simple damage calculation
-                damage = max(1, action.move.power // 2)
+                except Exception as e:
+                    logger.warning(f"Error calculating damage, using fallback: {str(e)}")
+                    # Fallback: Simple damage calculation
+                    damage = max(1, action.move.power // 2)
             
-            # Apply damage
-            action.target.take_damage(damage)
+                # Apply damage
+                dealt = action.target.take_damage(damage)
             
             # Log the attack
             self.battle_log.append(f"{action.actor.name} greift {action.target.name} an!")
             
+            # Secondary move effects only land on a hit
+            missed = damage_result is not None and damage_result.missed
+            effects = [] if missed else self._apply_move_effects(action, battle_state)
+            
             return {
                 'type': 'attack',
                 'attacker': action.actor.name,
                 'target': action.target.name,
                 'damage': damage,
+                'dealt': dealt,
+                'missed': missed,
+                'effects': effects,
                 'target_fainted': action.target.is_fainted
             }
             
@@ -116,6 +122,111 @@ class BattleActionExecutor:
             logger.error(f"Error executing attack: {str(e)}")
             return {'error': str(e)}
     
+    def _run_damage_pipeline(self, action: BattleAction, battle_state: 'BattleState',
+                             tension_multiplier: Optional[float]) -> DamageResult:
+        """Run the dict-based damage pipeline for an attack."""
+        from engine.systems.types import type_chart
+        
+        # Create context for damage pipeline
+        context = {
+            'attacker': action.actor,
+            'defender': action.target,
+            'move': action.move,
+            'type_chart': type_chart,
+            'rng': _battle_rng(battle_state),
+            'result': DamageResult(
+                damage=0,
+                is_critical=False,
+                critical_tier=CriticalTier.NONE,
+                effectiveness=1.0,
+                effectiveness_text="",
+                type_text=""
+            )
+        }
+        
+        # Apply tension multiplier if available
+        if tension_multiplier is not None:
+            context['tension_multiplier'] = tension_multiplier
+        
+        return self.damage_pipeline.execute(context)
+    
+    def _apply_move_effects(self, action: BattleAction, battle_state: 'BattleState') -> List[Dict[str, Any]]:
+        """
+        Apply the secondary effects (status, buff, debuff, heal) of a move that hit.
+        Effect chances are rolled on the battle RNG.
+        
+        Returns:
+            One result dict per effect that triggered
+        """
+        effects = getattr(action.move, 'effects', None)
+        if not effects:
+            return []
+        
+        rng = _battle_rng(battle_state)
+        targeting = getattr(getattr(action.move, 'targeting', None), 'value', None)
+        # Self/ally moves put their effects on the user
+        recipient = action.actor if targeting in ('self', 'ally', 'all_allies') else action.target
+        
+        results = []
+        for effect in effects:
+            chance = getattr(effect, 'chance', 100)
+            if chance < 100 and rng.random() * 100 >= chance:
+                continue
+            
+            kind = getattr(effect.kind, 'value', effect.kind)
+            if kind == 'status' and effect.status:
+                status = StatusCondition.from_string(effect.status)
+                if status == StatusCondition.NONE or recipient.is_fainted:
+                    continue
+                applied = recipient.apply_status(status)
+                if applied:
+                    self.battle_log.append(f"{recipient.name} hat jetzt {status.value}!")
+                results.append({'effect': 'status', 'target': recipient.name,
+                                'status': status.value, 'applied': applied})
+            
+            elif kind in ('buff', 'debuff') and effect.stat and hasattr(recipient, 'stat_stages'):
+                stages = effect.stages or (1 if kind == 'buff' else -1)
+                change = StatChangeEffects.change_stat(recipient, effect.stat, stages)
+                self.battle_log.append(change.message)
+                results.append({'effect': kind, 'target': recipient.name, 'stat': effect.stat,
+                                'change': change.value if change.success else 0})
+            
+            elif kind == 'heal':
+                amount = effect.amount or effect.power or 0
+                if effect.percent:
+                    amount = recipient.max_hp * amount // 100
+                healed = recipient.heal(amount) if amount > 0 else 0
+                results.append({'effect': 'heal', 'target': recipient.name, 'healed': healed})
+        
+        return results
+    
+    def process_end_of_turn_status(self, monster: MonsterInstance, battle_state: 'BattleState') -> Optional[str]:
+        """
+        Apply a monster's end-of-turn status: poison/burn damage, waking up from sleep.
+        
+        Returns:
+            Battle log message, or None if nothing happened
+        """
+        status = getattr(monster, 'status', None)
+        if not status:
+            return None
+        
+        if status == StatusCondition.POISON:
+            monster.take_damage(max(1, monster.max_hp // 16))
+            return f"{monster.name} suffers poison damage!"
+        
+        if status == StatusCondition.BURN:
+            monster.take_damage(max(1, monster.max_hp // 16))
+            return f"{monster.name} suffers burn damage!"
+        
+        if status == StatusCondition.SLEEP:
+            # 20% chance to wake up
+            if _battle_rng(battle_state).random() < 0.2:
+                monster.status = StatusCondition.NORMAL
+                return f"{monster.name} woke up!"
+        
+        return None
+    
     def _execute_tame(self, action: BattleAction, battle_state: 'BattleState') -> Dict[str, Any]:
         """Execute a taming action."""
         try:
@@ -123,7 +234,7 @@ class BattleActionExecutor:
             tame_chance = self._calculate_tame_chance(action.actor, action.target)
             
             # Roll for taming success
-            success = random.random() < tame_chance
+            success = _battle_rng(battle_state).random() < tame_chance
             
             if success:
                 self.battle_log.append(f"{action.target.name} wurde erfolgreich gezähmt!")
@@ -204,7 +315,7 @@ class BattleActionExecutor:
             )
             
             # Roll for flee success
-            success = random.random() < flee_chance
+            success = _battle_rng(battle_state).random() < flee_chance
             
             if success:
                 self.battle_log.append(f"{action.actor.name} ist erfolgreich geflohen!")
@@ -321,7 +432,7 @@ class BattleActionExecutor:
             if command == 'meditate':
                 return self._execute_meditate(monster)
             elif command == 'intimidate':
-                return self._execute_intimidate(monster, battle_state.enemy_active)
+                return self._execute_intimidate(monster, battle_state.enemy_active, _battle_rng(battle_state))
             else:
                 logger.warning(f"Unknown special command: {command}")
                 return {'error': f'Unknown command: {command}'}
@@ -374,7 +485,8 @@ class BattleActionExecutor:
             logger.error(f"Error in MEDITATE: {str(e)}")
             return {'error': str(e)}
     
-    def _execute_intimidate(self, monster: MonsterInstance, target: MonsterInstance) -> Dict[str, Any]:
+    def _execute_intimidate(self, monster: MonsterInstance, target: MonsterInstance,
+                            rng: Any = random) -> Dict[str, Any]:
         """Execute INTIMIDATE command - lower enemy stats."""
         try:
             if not monster or not target:
@@ -387,7 +499,7 @@ class BattleActionExecutor:
                 success_chance = min(0.95, max(0.3, success_chance + level_diff * 0.05))
             
             # Roll for success
-            success = random.random() < success_chance
+            success = rng.random() < success_chance
             
             if success:
                 # Lower enemy stats
@@ -640,7 +752,7 @@ class BattleActionExecutor:
             
             for target in targets:
                 # Check accuracy
-                if random.random() > skill.accuracy:
+                if _battle_rng(battle_state).random() > skill.accuracy:
                     results.append({
                         'target': target.name,
                         'missed': True
@@ -681,7 +793,7 @@ class BattleActionExecutor:
             
             for target in targets:
                 # Check accuracy
-                if random.random() > skill.accuracy:
+                if _battle_rng(battle_state).random() > skill.accuracy:
                     results.append({
                         'target': target.name,
                         'missed': True
@@ -810,8 +922,9 @@ class BattleActionExecutor:
             elif target_type == SkillTarget.RANDOM_ENEMIES:
                 # Get 2-4 random enemies
                 all_enemies = self._get_skill_targets(action, battle_state, SkillTarget.ALL_ENEMIES)
-                num_targets = min(len(all_enemies), random.randint(2, 4))
-                targets = random.sample(all_enemies, num_targets) if all_enemies else []
+                rng = _battle_rng(battle_state)
+                num_targets = min(len(all_enemies), rng.randint(2, 4))
+                targets = rng.sample(all_enemies, num_targets) if all_enemies else []
             
             # Filter out fainted targets
             targets = [t for t in targets if t and not t.is_fainted]
@@ -6,13 +6,25 @@ Implements heuristic-based decision making with difficulty levels.
 from typing import TYPE_CHECKING, List, Optional, Dict, Tuple
 from dataclasses import dataclass
 from enum import Enum, auto
+import logging
 import random
+import time
+
+from engine.systems.battle.battle_profiler import profiler
+from engine.systems.battle.stat_cache import effective_stats
 
 if TYPE_CHECKING:
     from engine.systems.monster_instance import MonsterInstance
     from engine.systems.moves import Move
     from engine.systems.battle.battle_controller import BattleState as Battle
     from engine.systems.battle.turn_logic import BattleAction
+    from engine.systems.battle.damage_calc import BatchDamageResult, DamageCalculator
+
+logger = logging.getLogger(__name__)
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the lookahead search when the time budget is spent."""
 
 
 class AILevel(Enum):
@@ -22,6 +34,7 @@ class AILevel(Enum):
     SMART = auto()       # Type effectiveness + status consideration
     EXPERT = auto()      # Full heuristics + prediction
     PERFECT = auto()     # Optimal play (for boss battles)
+    LOOKAHEAD = auto()   # Time-bounded expectimax search over the next turns
 
 
 @dataclass
@@ -39,16 +52,34 @@ class MoveScore:
 class BattleAI:
     """AI controller for enemy monsters in battle."""
     
-    def __init__(self, level: AILevel = AILevel.SMART, seed: Optional[int] = None):
+    # Leaf evaluation weights for the lookahead search
+    SEARCH_HP_WEIGHT = 1.0
+    SEARCH_KO_WEIGHT = 0.5
+    SEARCH_DEFEAT_PENALTY = 2.0
+    # Lookahead values kept across decisions; oldest entries go first
+    TRANSPOSITION_LIMIT = 50000
+    
+    def __init__(self, level: AILevel = AILevel.SMART, seed: Optional[int] = None,
+                 time_budget_ms: float = 5.0, search_depth: int = 2):
         """
         Initialize battle AI.
         
         Args:
             level: AI difficulty level
             seed: Random seed for deterministic behavior
+            time_budget_ms: Hard per-decision budget for LOOKAHEAD
+            search_depth: Maximum number of turns LOOKAHEAD searches
         """
         self.level = level
         self.rng = random.Random(seed)
+        self._damage_calculator: Optional['DamageCalculator'] = None
+        
+        self.time_budget_ms = time_budget_ms
+        self.search_depth = max(1, search_depth)
+        
+        # Lookahead values: (battle-state key, depth, hp state) -> value
+        self.transpositions: Dict[Tuple, float] = {}
+        self.last_search_depth = 0
     
     def choose_action(self, actor: 'MonsterInstance',
                      enemy_team: List['MonsterInstance'],
@@ -69,6 +100,19 @@ class BattleAI:
                 'actor': actor
             }
         
+        # Boss AIs search; targets are given as team slot ids for the scene
+        if self.level == AILevel.LOOKAHEAD:
+            action = self.decide_action(battle_state, actor, targets)
+            if action.move is not None and action.target is not None:
+                side, team = ('enemy', enemy_team) if actor in player_team else ('player', player_team)
+                slot = next(i for i, monster in enumerate(team) if monster is action.target)
+                return {
+                    'type': 'attack',
+                    'move_id': action.move.id,
+                    'targets': [f"{side}_{slot}"],
+                    'actor': actor
+                }
+        
         # Simple AI: choose random move and target
         available_moves = [m for m in actor.moves if m and hasattr(m, 'current_pp') and m.current_pp > 0]
         if available_moves:
@@ -88,9 +132,63 @@ class BattleAI:
                 'actor': actor
             }
     
+    def decide_team_actions(self, battle: 'Battle',
+                            actors: List['MonsterInstance'],
+                            targets: List['MonsterInstance']) -> List['BattleAction']:
+        """
+        Decide actions for all active monsters of one side.
+        Every (actor, move, target) option is evaluated in a single batch.
+        
+        Args:
+            battle: Current battle state
+            actors: Monsters making decisions (e.g. a 3v3 front row)
+            targets: Available targets
+            
+        Returns:
+            One BattleAction per actor
+        """
+        valid_targets = [t for t in targets if t.current_hp > 0]
+        
+        batch = None
+        if valid_targets and self.level != AILevel.RANDOM:
+            moves = [[m for m in actor.moves if m and self._get_pp(m) > 0] for actor in actors]
+            batch = self.evaluate_options(battle, actors, valid_targets, moves)
+        
+        return [self.decide_action(battle, actor, valid_targets, batch=batch) for actor in actors]
+    
+    def evaluate_options(self, battle: 'Battle',
+                         actors: List['MonsterInstance'],
+                         targets: List['MonsterInstance'],
+                         moves: Optional[List[List['Move']]] = None) -> Optional['BatchDamageResult']:
+        """
+        Vectorized damage evaluation of all actor/move/target combinations.
+        
+        Returns:
+            BatchDamageResult, or None if the batch cannot be built
+        """
+        try:
+            with profiler.measure('ai.evaluate_options'):
+                return self._get_damage_calculator(battle).preview_batch(actors, targets, moves)
+        except Exception as e:
+            logger.debug(f"Batch evaluation failed, scoring without it: {e}")
+            return None
+    
+    def _get_damage_calculator(self, battle: 'Battle') -> 'DamageCalculator':
+        """Use the battle's damage calculator or a lazily created one."""
+        from engine.systems.battle.damage_calc import DamageCalculator
+        
+        calculator = getattr(battle, 'damage_calculator', None)
+        if isinstance(calculator, DamageCalculator):
+            return calculator
+        
+        if self._damage_calculator is None:
+            self._damage_calculator = DamageCalculator(getattr(battle, 'type_system', None))
+        return self._damage_calculator
+    
     def decide_action(self, battle: 'Battle', 
                      actor: 'MonsterInstance',
-                     targets: List['MonsterInstance']) -> 'BattleAction':
+                     targets: List['MonsterInstance'],
+                     batch: Optional['BatchDamageResult'] = None) -> 'BattleAction':
         """
         Decide what action to take.
         
@@ -98,10 +196,24 @@ class BattleAI:
             battle: Current battle state
             actor: Monster making the decision
             targets: Available targets
+            batch: Precomputed option evaluation (see decide_team_actions)
             
         Returns:
             BattleAction to perform
         """
+        if profiler.enabled:
+            start = time.perf_counter()
+            try:
+                return self._decide_action(battle, actor, targets, batch)
+            finally:
+                profiler.record(f"ai.decide.{self.level.name.lower()}", time.perf_counter() - start)
+        return self._decide_action(battle, actor, targets, batch)
+    
+    def _decide_action(self, battle: 'Battle',
+                       actor: 'MonsterInstance',
+                       targets: List['MonsterInstance'],
+                       batch: Optional['BatchDamageResult']) -> 'BattleAction':
+        """Decision logic behind decide_action."""
         from engine.systems.battle.turn_logic import BattleAction, ActionType
         
         # Filter to valid targets (not fainted)
@@ -114,16 +226,30 @@ class BattleAI:
             return self._random_action(actor, valid_targets)
         
         # Get available moves (have PP)
-        available_moves = [m for m in actor.moves if m and m.current_pp > 0]
+        available_moves = [m for m in actor.moves if m and self._get_pp(m) > 0]
         if not available_moves:
             # No moves available, struggle or pass
             return BattleAction(actor=actor, action_type=ActionType.PASS)
         
+        # Evaluate every (move, target) pair in one vectorized pass
+        if batch is None:
+            batch = self.evaluate_options(battle, [actor], valid_targets, [available_moves])
+        
+        if self.level == AILevel.LOOKAHEAD:
+            selected = self._search_move(battle, actor, valid_targets, available_moves, batch)
+            if selected:
+                return BattleAction(
+                    actor=actor,
+                    action_type=ActionType.ATTACK,
+                    move=selected[0],
+                    target=selected[1]
+                )
+        
         # Score all possible moves
         move_scores = []
         for move in available_moves:
             for target in valid_targets:
-                score = self._score_move(battle, actor, target, move)
+                score = self._score_move(battle, actor, target, move, batch)
                 move_scores.append(score)
         
         # Sort by score
@@ -144,20 +270,156 @@ class BattleAI:
                 # Pick from top 3
                 top_moves = move_scores[:3]
                 selected = self.rng.choice(top_moves) if top_moves else None
-        else:  # PERFECT
+        else:  # PERFECT (and LOOKAHEAD when the search found nothing)
             # Always pick optimal move
             selected = move_scores[0] if move_scores else None
         
         if selected:
             return BattleAction(
                 actor=actor,
-                action_type=ActionType.MOVE,
+                action_type=ActionType.ATTACK,
                 move=selected.move,
                 target=selected.target
             )
         
         return BattleAction(actor=actor, action_type=ActionType.PASS)
     
+    def _search_move(self, battle: 'Battle',
+                     actor: 'MonsterInstance',
+                     targets: List['MonsterInstance'],
+                     moves: List['Move'],
+                     batch: Optional['BatchDamageResult']) -> Optional[Tuple['Move', 'MonsterInstance']]:
+        """
+        Expectimax search over the next turns within the time budget.
+        
+        The battle is never cloned: a search state is just the HP of the
+        actor and its targets, and all damage comes from batch evaluations.
+        Our hits branch into miss, low roll, average and high roll (crits are
+        part of the batch's expected value); opponents answer with their
+        strongest expected hit, faster ones before us. Search deepens
+        iteratively and keeps the best move of the last completed depth.
+        
+        Args:
+            battle: Current battle state
+            actor: Monster making the decision
+            targets: Valid targets
+            moves: Moves with PP left
+            batch: Batch evaluation containing the actor's options
+            
+        Returns:
+            (move, target) or None to fall back to greedy scoring
+        """
+        deadline = time.perf_counter() + self.time_budget_ms / 1000.0
+        self.last_search_depth = 0
+        if batch is None:
+            return None
+        
+        # Chance outcomes per option: [(probability, damage)]
+        options = []
+        for move in moves:
+            for t, target in enumerate(targets):
+                index = batch.index(actor, move, target)
+                if index is None or batch.expected[index] <= 0:
+                    continue
+                hit = float(batch.hit_chance[index])
+                low, high = float(batch.minimum[index]), float(batch.maximum[index])
+                mean = float(batch.expected[index]) / hit if hit > 0 else 0.0
+                outcomes = [(hit / 4, low), (hit / 2, mean), (hit / 4, high)]
+                if hit < 1.0:
+                    outcomes.append((1.0 - hit, 0.0))
+                options.append((move, target, t, outcomes))
+        if not options:
+            return None
+        
+        # Opponent replies: strongest expected hit against the actor
+        replies = self.evaluate_options(
+            battle, targets, [actor],
+            [[m for m in target.moves if m and self._get_pp(m) > 0] for target in targets])
+        if replies is None:
+            return None
+        threats = [float(replies.expected[t, :, 0].max(initial=0.0)) for t in range(len(targets))]
+        # Same stage- and status-aware speed that orders the turn
+        actor_speed = effective_stats(actor).speed()
+        faster = [effective_stats(target).speed() > actor_speed for target in targets]
+        
+        # Everything besides HP that values depend on (damage outcomes from PP,
+        # stages, stats and types, threats, turn order, max HP) is part of the
+        # keys, so entries stay valid across turns and decisions. The tuple
+        # itself is the key: a bare hash could collide with another state
+        target_max = [target.max_hp for target in targets]
+        state_key = (tuple((t, tuple(outcomes)) for _, _, t, outcomes in options),
+                     tuple(threats), tuple(faster), actor.max_hp, tuple(target_max))
+        
+        search = (options, threats, faster, actor.max_hp, target_max, deadline, state_key)
+        root = (actor.current_hp, tuple(target.current_hp for target in targets))
+        
+        best = None
+        try:
+            for depth in range(1, self.search_depth + 1):
+                values = [self._expect(search, root, outcomes, t, depth)
+                          for _, _, t, outcomes in options]
+                index = max(range(len(options)), key=values.__getitem__)
+                best = (options[index][0], options[index][1])
+                self.last_search_depth = depth
+        except _SearchTimeout:
+            logger.debug(f"Lookahead stopped at depth {self.last_search_depth}")
+        
+        return best
+    
+    def _expect(self, search: Tuple, state: Tuple[int, Tuple[int, ...]],
+                outcomes: List[Tuple[float, float]], t: int, depth: int) -> float:
+        """Chance node: expected value of one option over its damage outcomes."""
+        _, threats, faster, _, _, deadline, _ = search
+        if time.perf_counter() > deadline:
+            raise _SearchTimeout()
+        
+        actor_hp, target_hps = state
+        before = sum(threats[i] for i, hp in enumerate(target_hps) if hp > 0 and faster[i])
+        
+        value = 0.0
+        for probability, damage in outcomes:
+            hp = actor_hp - before
+            hps = target_hps
+            if hp > 0:
+                hps = hps[:t] + (max(0, int(round(hps[t] - damage))),) + hps[t + 1:]
+                hp -= sum(threats[i] for i, target_hp in enumerate(hps)
+                          if target_hp > 0 and not faster[i])
+            value += probability * self._value(search, (max(0, int(round(hp))), hps), depth - 1)
+        return value
+    
+    def _value(self, search: Tuple, state: Tuple[int, Tuple[int, ...]], depth: int) -> float:
+        """Max node: best option value from a state, cached in the transposition table."""
+        options, _, _, actor_max, target_max, _, state_key = search
+        actor_hp, target_hps = state
+        
+        live = [(t, outcomes) for _, _, t, outcomes in options if target_hps[t] > 0]
+        if depth <= 0 or actor_hp <= 0 or not live:
+            value = self.SEARCH_HP_WEIGHT * (actor_hp / actor_max)
+            for hp, max_hp in zip(target_hps, target_max):
+                value -= self.SEARCH_HP_WEIGHT * (hp / max_hp)
+                if hp <= 0:
+                    value += self.SEARCH_KO_WEIGHT
+            if actor_hp <= 0:
+                value -= self.SEARCH_DEFEAT_PENALTY
+            return value
+        
+        transpositions = self.transpositions
+        key = (state_key, depth, state)
+        cached = transpositions.get(key)
+        if cached is not None:
+            return cached
+        
+        value = max(self._expect(search, state, outcomes, t, depth) for t, outcomes in live)
+        while len(transpositions) >= self.TRANSPOSITION_LIMIT:
+            del transpositions[next(iter(transpositions))]
+        transpositions[key] = value
+        return value
+    
+    @staticmethod
+    def _get_pp(move: 'Move') -> int:
+        """Get remaining PP for both Move (pp) and legacy move objects (current_pp)."""
+        return getattr(move, 'current_pp', getattr(move, 'pp', 0))
+    
     def _random_action(self, actor: 'MonsterInstance', 
                       targets: List['MonsterInstance']) -> 'BattleAction':
         """
@@ -172,7 +434,7 @@ class BattleAI:
         """
         from engine.systems.battle.turn_logic import BattleAction, ActionType
         
-        available_moves = [m for m in actor.moves if m and m.current_pp > 0]
+        available_moves = [m for m in actor.moves if m and self._get_pp(m) > 0]
         if not available_moves:
             return BattleAction(actor=actor, action_type=ActionType.PASS)
         
@@ -181,7 +443,7 @@ class BattleAI:
         
         return BattleAction(
             actor=actor,
-            action_type=ActionType.MOVE,
+            action_type=ActionType.ATTACK,
             move=move,
             target=target
         )
@@ -189,7 +451,8 @@ class BattleAI:
     def _score_move(self, battle: 'Battle',
                    actor: 'MonsterInstance',
                    target: 'MonsterInstance',
-                   move: 'Move') -> MoveScore:
+                   move: 'Move',
+                   batch: Optional['BatchDamageResult'] = None) -> MoveScore:
         """
         Score a potential move.
         
@@ -198,12 +461,14 @@ class BattleAI:
             actor: Monster using the move
             target: Target monster
             move: Move to score
+            batch: Batch evaluation containing this option, if available
             
         Returns:
             MoveScore with calculated score and reasoning
         """
         score = 0.0
         reasoning = []
+        option = batch.index(actor, move, target) if batch is not None else None
         
         # Base score from move power
         if move.category in ['phys', 'mag']:
@@ -212,8 +477,13 @@ class BattleAI:
             reasoning.append(f"Base power: +{base_power * 50:.1f}")
         
         # Type effectiveness
-        if hasattr(battle, 'type_system') and battle.type_system:
-            effectiveness = battle.type_system.get_effectiveness(move.type, target.species.types)
+        effectiveness = None
+        if option is not None:
+            effectiveness = float(batch.effectiveness[option])
+        elif hasattr(battle, 'type_system') and battle.type_system:
+            effectiveness = battle.type_system.calculate_type_multiplier(move.type, target.species.types)
+        
+        if effectiveness is not None:
             if effectiveness > 1.0:
                 bonus = (effectiveness - 1.0) * 30
                 score += bonus
@@ -247,14 +517,21 @@ class BattleAI:
             score += 20
             reasoning.append("Low HP target: +20")
         
+        # Knockout chance from the batch evaluation
+        if option is not None and self.level in [AILevel.EXPERT, AILevel.PERFECT, AILevel.LOOKAHEAD]:
+            ko_chance = float(batch.ko_probability[option])
+            if ko_chance > 0:
+                score += ko_chance * 25
+                reasoning.append(f"KO chance: +{ko_chance * 25:.1f}")
+        
         # Consider healing if low on health
         if actor_hp_percent < 0.3 and 'heal' in [e.get('kind') for e in move.effects]:
             score += 30
             reasoning.append("Need healing: +30")
         
         # PP conservation for high-level AI
-        if self.level in [AILevel.EXPERT, AILevel.PERFECT]:
-            if move.current_pp <= 2:
+        if self.level in [AILevel.EXPERT, AILevel.PERFECT, AILevel.LOOKAHEAD]:
+            if self._get_pp(move) <= 2:
                 score -= 10
                 reasoning.append("Low PP: -10")
         
@@ -273,7 +550,7 @@ class BattleAI:
                 reasoning.append(f"Target {target.status}: +5")
         
         # Random factor for non-perfect AI
-        if self.level != AILevel.PERFECT:
+        if self.level not in [AILevel.PERFECT, AILevel.LOOKAHEAD]:
             random_factor = self.rng.uniform(0.8, 1.2)
             score *= random_factor
             reasoning.append(f"Random factor: ×{random_factor:.2f}")
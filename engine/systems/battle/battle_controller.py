@@ -6,13 +6,13 @@ Main coordinator for battle system, delegates to specialized modules
 import logging
 import random
 from typing import List, Optional, Dict, Any, Callable
-from engine.systems.monster_instance import MonsterInstance, StatusCondition
+from engine.systems.monster_instance import MonsterInstance
 from engine.systems.battle.battle_enums import BattleType, BattlePhase, BattleCommand, AIPersonality
 from engine.systems.battle.battle_validation import BattleValidator
 from engine.systems.battle.battle_tension import TensionManager
 from engine.systems.battle.battle_actions import BattleActionExecutor
 from engine.systems.battle.turn_logic import BattleAction, ActionType, TurnOrder
-from engine.systems.battle.battle_ai import BattleAI
+from engine.systems.battle.battle_ai import BattleAI, AILevel
 from engine.systems.battle.battle_events import (
     BattleEventGenerator, EventType, BattleEvent,
     create_battle_event_system
@@ -34,6 +34,9 @@ class BattleState:
     Coordinates all battle subsystems and maintains battle state.
     """
     
+    # Battle types whose opponents search ahead unless an AI level is given
+    BOSS_BATTLE_TYPES = (BattleType.GYM, BattleType.ELITE, BattleType.CHAMPION, BattleType.LEGENDARY)
+    
     def __init__(self, 
                  player_team: List[MonsterInstance],
                  enemy_team: List[MonsterInstance],
@@ -42,7 +45,9 @@ class BattleState:
                  can_catch: bool = True,
                  enable_3v3: bool = False,
                  player_formation_type: FormationType = FormationType.STANDARD,
-                 enemy_formation_type: FormationType = FormationType.STANDARD):
+                 enemy_formation_type: FormationType = FormationType.STANDARD,
+                 seed: Optional[int] = None,
+                 ai_level: Optional[AILevel] = None):
         """
         Initialize battle state.
         
@@ -52,8 +57,13 @@ class BattleState:
             battle_type: Type of battle
             can_flee: Whether fleeing is allowed
             can_catch: Whether catching is allowed
+            seed: Seed of the battle RNG (random if omitted; kept for replays)
+            ai_level: Enemy AI level (LOOKAHEAD for boss battle types, SMART otherwise)
         """
         # Validate input parameters
+        if not player_team or not enemy_team:
+            raise ValueError("Player and enemy teams cannot be empty!")
+        
         # Ensure all monsters have positive HP
         for monster in player_team + enemy_team:
             if not hasattr(monster, 'current_hp') or monster.current_hp <= 0:
@@ -63,8 +73,6 @@ class BattleState:
                     monster.current_hp = 100
                     monster.max_hp = 100
                 print(f"WARNING: Fixed {monster.name} HP to {monster.current_hp}")
-                if not player_team or not enemy_team:
-            raise ValueError("Player and enemy teams cannot be empty!")
         
         if not all(isinstance(m, MonsterInstance) for m in player_team + enemy_team):
             raise TypeError("All team members must be MonsterInstance objects!")
@@ -126,11 +134,23 @@ class BattleState:
         # Escape attempts
         self.escape_attempts = 0
         
+        # Battle RNG: turn order, DQM formulas, actions and status rolls all draw from it
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.rng = random.Random(self.seed)
+        self.dqm_calculator = DQMCalculator(rng=self.rng)
+        
+        # Queued actions and the battle RNG state at the start of every
+        # resolved turn while a BattleRecorder is attached
+        self.recorded_turns: Optional[List[List[BattleAction]]] = None
+        self.recorded_rng_states: Optional[List[Any]] = None
+        
         # Initialize subsystems
         self.validator = BattleValidator()
         self.tension_manager = TensionManager()
         self.action_executor = BattleActionExecutor()
-        self.battle_ai = BattleAI()
+        if ai_level is None:
+            ai_level = AILevel.LOOKAHEAD if battle_type in self.BOSS_BATTLE_TYPES else AILevel.SMART
+        self.battle_ai = BattleAI(ai_level)
         
         # Initialize event system
         self.event_generator = create_battle_event_system(self)
@@ -412,10 +432,15 @@ class BattleState:
                 logger.warning("No actions in queue for turn resolution!")
                 return {'error': 'No actions to resolve'}
             
+            if self.recorded_turns is not None:
+                self.recorded_turns.append(list(self.action_queue))
+                # Rolls between turns (e.g. the scene's can_act) also draw from self.rng
+                self.recorded_rng_states.append(self.rng.getstate())
+            
             # Sort actions by priority
             if self.enable_3v3 and self.formation_manager:
                 # 3v3 mode: Get turn order from all active monsters
-                turn_order = self.formation_manager.get_turn_order()
+                turn_order = self.formation_manager.get_turn_order(self.rng)
                 
                 # Create ordered action queue based on speed
                 ordered_queue = []
@@ -433,7 +458,6 @@ class BattleState:
                 self.action_queue = ordered_queue
             else:
                 # 1v1 mode: Use DQM turn order formula: Agility + Random(0-255)
-                dqm_calc = DQMCalculator()
                 # Convert actions to DQM format
                 monsters_data = []
                 for action in self.action_queue:
@@ -443,7 +467,7 @@ class BattleState:
                         'status': getattr(action.actor, 'status', None)
                     })
                 # Calculate DQM turn order
-                sorted_monsters = dqm_calc.calculate_turn_order(monsters_data)
+                sorted_monsters = self.dqm_calculator.calculate_turn_order(monsters_data)
                 self.action_queue = [m['action'] for m in sorted_monsters]
             
             # Execute actions
@@ -527,27 +551,10 @@ class BattleState:
             if not monster or not hasattr(monster, 'status'):
                 return
             
-            status = monster.status
-            if not status:
-                return
+            message = self.action_executor.process_end_of_turn_status(monster, self)
+            if message:
+                self.battle_log.append(message)
             
-            # Process different status effects
-            if status == StatusCondition.POISON:
-                damage = max(1, monster.max_hp // 16)
-                monster.take_damage(damage)
-                self.battle_log.append(f"{monster.name} suffers poison damage!")
-            
-            elif status == StatusCondition.BURN:
-                damage = max(1, monster.max_hp // 16)
-                monster.take_damage(damage)
-                self.battle_log.append(f"{monster.name} suffers burn damage!")
-            
-            elif status == StatusCondition.SLEEP:
-                # 20% chance to wake up
-                if random.random() < 0.2:
-                    monster.status = StatusCondition.NORMAL
-                    self.battle_log.append(f"{monster.name} woke up!")
-                    
         except Exception as e:
             logger.error(f"Error processing monster status: {str(e)}")
     
@@ -909,8 +916,7 @@ class BattleState:
     
     def calculate_dqm_damage(self, attacker, defender, move):
         """Calculate damage using DQM formulas."""
-        dqm_calc = DQMCalculator()
-        result = dqm_calc.calculate_damage(
+        result = self.dqm_calculator.calculate_damage(
             attacker_stats=attacker.stats,
             defender_stats=defender.stats,
             move_power=move.power if hasattr(move, 'power') else 50,
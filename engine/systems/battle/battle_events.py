@@ -10,8 +10,11 @@ from typing import Generator, Dict, Any, List, Optional, Tuple, Callable
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from collections import deque
+import random
 import time
 
+from engine.systems.battle.battle_profiler import profiler
+
 logger = logging.getLogger(__name__)
 
 
@@ -164,10 +167,16 @@ class BattleEventGenerator:
         self.event_queue = EventQueue()
         self.event_handlers: Dict[EventType, List[Callable]] = {}
         self.current_phase = "init"
+        self._damage_calculator = None  # Created on first attack, draws from the battle RNG
         
         # Register default handlers
         self._register_default_handlers()
     
+    @property
+    def rng(self) -> Any:
+        """RNG of the battle, or the module RNG for states without one."""
+        return getattr(self.battle_state, 'rng', None) or random
+    
     def _register_default_handlers(self) -> None:
         """Register default event handlers."""
         # These can be overridden by the UI layer
@@ -306,21 +315,26 @@ class BattleEventGenerator:
             
             # Generate events based on action type
             if action.action_type.value == 'attack':
-                yield from self._attack_event_generator(action)
+                yield from profiler.profile_generator(
+                    'events.attack', self._attack_event_generator(action))
             elif action.action_type.value == 'item':
-                yield from self._item_event_generator(action)
+                yield from profiler.profile_generator(
+                    'events.item', self._item_event_generator(action))
             elif action.action_type.value == 'switch':
-                yield from self._switch_event_generator(action)
+                yield from profiler.profile_generator(
+                    'events.switch', self._switch_event_generator(action))
             elif action.action_type.value == 'flee':
-                yield from self._flee_event_generator(action)
+                yield from profiler.profile_generator(
+                    'events.flee', self._flee_event_generator(action))
             elif action.action_type.value == 'tame':
-                yield from self._tame_event_generator(action)
+                yield from profiler.profile_generator(
+                    'events.tame', self._tame_event_generator(action))
             
             # Check for faints after each action
-            yield from self._check_faint_events()
+            yield from profiler.profile_generator('events.faint_check', self._check_faint_events())
         
         # Process end-of-turn effects
-        yield from self._end_of_turn_generator()
+        yield from profiler.profile_generator('events.end_of_turn', self._end_of_turn_generator())
         
         # Turn end
         yield BattleEvent(
@@ -354,9 +368,10 @@ class BattleEventGenerator:
         )
         
         # Calculate damage (using DQM formulas)
-        from engine.systems.battle.damage_calc import DamageCalculator
-        damage_calc = DamageCalculator()
-        result = damage_calc.calculate(actor, target, move)
+        if self._damage_calculator is None:
+            from engine.systems.battle.damage_calc import DamageCalculator
+            self._damage_calculator = DamageCalculator(rng=self.rng)
+        result = self._damage_calculator.calculate(actor, target, move)
         
         # Check for miss
         if result.missed:
@@ -556,8 +571,7 @@ class BattleEventGenerator:
             self.battle_state.escape_attempts
         )
         
-        import random
-        if random.random() < escape_chance:
+        if self.rng.random() < escape_chance:
             yield BattleEvent(
                 EventType.MESSAGE_SHOW,
                 data={'message': "Du bist entkommen!"},
@@ -611,8 +625,7 @@ class BattleEventGenerator:
         hp_ratio = target.current_hp / target.max_hp
         base_chance = 0.3 * (1 - hp_ratio)  # Lower HP = higher chance
         
-        import random
-        if random.random() < base_chance:
+        if self.rng.random() < base_chance:
             yield BattleEvent(
                 EventType.MESSAGE_SHOW,
                 data={'message': f"{target.name} wurde gezähmt!"},
@@ -420,19 +420,23 @@ class FormationManager:
                 
         return all_active
     
-    def get_turn_order(self) -> List[Tuple[str, MonsterSlot]]:
+    def get_turn_order(self, rng=None) -> List[Tuple[str, MonsterSlot]]:
         """
         Berechnet die Zugreihenfolge basierend auf Speed
         Verwendet DQM-Formel: Agility + Random(0-255)
+        
+        Args:
+            rng: Zufallsgenerator des Kampfes (Standard: Modul-RNG)
         """
         active_monsters = self.get_all_active_monsters()
         
         # Sortiere nach Speed + Random
         import random
+        rng = rng or random
         def get_speed_value(entry):
             team_id, slot = entry
             base_speed = slot.monster.stats.get('agility', 50)
-            return base_speed + random.randint(0, 255)
+            return base_speed + rng.randint(0, 255)
         
         sorted_monsters = sorted(active_monsters, key=get_speed_value, reverse=True)
         
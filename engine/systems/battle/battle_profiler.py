@@ -0,0 +1,271 @@
+"""
+Battle Profiler Module
+Opt-in timing instrumentation for the battle package
+"""
+
+import json
+import logging
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Generator, Iterator, List, Optional, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Log-linear bucket layout: 2**SUB_BUCKET_BITS linear buckets per power of two
+SUB_BUCKET_BITS = 4
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+MAX_EXPONENT = 40  # Values are clamped to 2**40 ns (~18 minutes)
+BUCKET_COUNT = (MAX_EXPONENT - SUB_BUCKET_BITS + 1) * SUB_BUCKETS
+MAX_VALUE_NS = (1 << MAX_EXPONENT) - 1
+
+
+def bucket_index(value_ns: int) -> int:
+    """Bucket of a duration in nanoseconds (relative error below 1/SUB_BUCKETS)."""
+    if value_ns < SUB_BUCKETS:
+        return max(0, value_ns)
+    if value_ns > MAX_VALUE_NS:
+        value_ns = MAX_VALUE_NS
+    shift = value_ns.bit_length() - SUB_BUCKET_BITS - 1
+    return (shift + 1) * SUB_BUCKETS + (value_ns >> shift) - SUB_BUCKETS
+
+
+def bucket_bounds(index: int) -> tuple:
+    """Inclusive lower and exclusive upper bound of a bucket in nanoseconds."""
+    if index < SUB_BUCKETS:
+        return index, index + 1
+    shift = index // SUB_BUCKETS - 1
+    low = (index % SUB_BUCKETS + SUB_BUCKETS) << shift
+    return low, low + (1 << shift)
+
+
+class TimingHistogram:
+    """
+    Fixed-size HDR-style histogram of durations.
+
+    Durations are stored as nanosecond counts in log-linear buckets, so memory
+    is constant no matter how many samples are recorded and percentiles are
+    accurate to about 6%. Histograms with the same layout merge by adding
+    their bucket counts.
+    """
+
+    __slots__ = ('counts', 'count', 'total_ns', 'min_ns', 'max_ns')
+
+    def __init__(self):
+        self.counts: List[int] = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def record(self, seconds: float) -> None:
+        """Add one duration in seconds."""
+        value = int(seconds * 1e9)
+        self.counts[bucket_index(value)] += 1
+        if self.count == 0 or value < self.min_ns:
+            self.min_ns = value
+        if value > self.max_ns:
+            self.max_ns = value
+        self.count += 1
+        self.total_ns += value
+
+    def merge(self, other: 'TimingHistogram') -> None:
+        """Add another histogram's samples to this one."""
+        if other.count == 0:
+            return
+        counts = self.counts
+        for index, value in enumerate(other.counts):
+            if value:
+                counts[index] += value
+        self.min_ns = other.min_ns if self.count == 0 else min(self.min_ns, other.min_ns)
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.count += other.count
+        self.total_ns += other.total_ns
+
+    def reset(self) -> None:
+        """Drop all samples."""
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def percentile(self, percent: float) -> float:
+        """
+        Get a percentile in seconds.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Midpoint of the bucket holding the percentile, clamped to min/max
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(self.count * percent / 100.0 + 0.5))
+        seen = 0
+        for index, value in enumerate(self.counts):
+            seen += value
+            if seen >= rank:
+                low, high = bucket_bounds(index)
+                midpoint = (low + high - 1) / 2
+                return min(max(midpoint, self.min_ns), self.max_ns) / 1e9
+        return self.max_ns / 1e9
+
+    @property
+    def mean(self) -> float:
+        """Mean duration in seconds."""
+        return self.total_ns / self.count / 1e9 if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export count, total and percentiles (microseconds) as a dictionary."""
+        return {
+            'count': self.count,
+            'total_ms': self.total_ns / 1e6,
+            'mean_us': self.mean * 1e6,
+            'min_us': self.min_ns / 1e3,
+            'p50_us': self.percentile(50) * 1e6,
+            'p95_us': self.percentile(95) * 1e6,
+            'p99_us': self.percentile(99) * 1e6,
+            'max_us': self.max_ns / 1e3
+        }
+
+
+class BattleProfiler:
+    """
+    Named timing histograms for the battle package.
+
+    Disabled by default. Instrumented call sites check `enabled` before
+    reading the clock, so the disabled cost is a single attribute lookup.
+    Timer names are dotted paths: damage.stage.<stage>, damage.calculate,
+    ai.decide.<level>, events.<generator>.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.histograms: Dict[str, TimingHistogram] = {}
+
+    def enable(self) -> None:
+        """Start recording."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording; collected histograms are kept."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Drop all histograms."""
+        self.histograms.clear()
+
+    def histogram(self, name: str) -> TimingHistogram:
+        """Get (or create) the histogram of a timer."""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = TimingHistogram()
+        return histogram
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record a duration for a timer."""
+        self.histogram(name).record(seconds)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Time the enclosed block (no-op while disabled)."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.histogram(name).record(time.perf_counter() - start)
+
+    def profile_generator(self, name: str,
+                          generator: Generator[T, None, None]) -> Generator[T, None, None]:
+        """
+        Wrap a generator to record the time spent inside it.
+        The time consumers spend between events is not counted. While the
+        profiler is disabled the generator is returned unchanged.
+
+        Args:
+            name: Timer name
+            generator: Generator to wrap
+
+        Returns:
+            Generator yielding the same items
+        """
+        if not self.enabled:
+            return generator
+        return self._timed(name, generator)
+
+    def _timed(self, name: str, generator: Generator[T, None, None]) -> Generator[T, None, None]:
+        perf_counter = time.perf_counter
+        elapsed = 0.0
+        try:
+            while True:
+                start = perf_counter()
+                try:
+                    item = next(generator)
+                except StopIteration:
+                    elapsed += perf_counter() - start
+                    return
+                elapsed += perf_counter() - start
+                yield item
+        finally:
+            generator.close()
+            self.histogram(name).record(elapsed)
+
+    def merge(self, other: 'BattleProfiler') -> None:
+        """Add another profiler's histograms (e.g. from a worker process)."""
+        for name, histogram in other.histograms.items():
+            self.histogram(name).merge(histogram)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export all timers as a JSON-serializable dictionary."""
+        return {
+            'enabled': self.enabled,
+            'timers': {name: self.histograms[name].to_dict() for name in sorted(self.histograms)}
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Export all timers as JSON."""
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def export(self, path: Union[str, Path]) -> Path:
+        """
+        Write the JSON export to a file.
+
+        Args:
+            path: Target file
+
+        Returns:
+            Path written
+        """
+        path = Path(path)
+        path.write_text(self.to_json(), encoding='utf-8')
+        logger.info(f"Battle profile written to {path}")
+        return path
+
+    def summary_lines(self, limit: int = 8) -> List[str]:
+        """
+        Short text lines for the timers with the highest total time.
+
+        Args:
+            limit: Maximum number of timers
+
+        Returns:
+            One 'name p50/p95/p99' line per timer
+        """
+        ranked = sorted(self.histograms.items(), key=lambda item: item[1].total_ns, reverse=True)
+        lines = []
+        for name, histogram in ranked[:limit]:
+            lines.append(f"{name}: {histogram.percentile(50) * 1e6:.1f}/"
+                         f"{histogram.percentile(95) * 1e6:.1f}/"
+                         f"{histogram.percentile(99) * 1e6:.1f}us n={histogram.count}")
+        return lines
+
+
+# Process-wide profiler used by the battle package
+profiler = BattleProfiler()
@@ -0,0 +1,769 @@
+"""
+Battle Replay
+Compact binary recordings of headless battles and a fast-forward replay engine.
+Live battles of the battle scene (BattleState) are recorded with BattleRecorder.
+
+A recording stores the battle setup (team specs, options), the complete seed
+set and the queued BattleAction stream of every turn. Replaying re-executes
+the battle without any AI: the recorded actions are queued again and the
+seeded TurnOrder, damage pipeline and battle RNGs reproduce the exact same
+resolution. The ReplayEngine keeps periodic checkpoints so jumping to any
+turn only re-simulates the turns since the nearest checkpoint.
+
+Recordings of live battles additionally carry a LiveBattleSetup: the
+BattleState options, the starting team state (moves, names and a
+BattleSnapshot, since party monsters are not reproducible from a spec)
+and the battle RNG state before turns whose start the scene's own rolls
+moved. The ReplayEngine re-executes them on a BattleState.
+"""
+
+import copy
+import struct
+
+import numpy as np
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from engine.systems.battle.turn_logic import BattleAction, ActionType
+from engine.systems.battle.battle_ai import AILevel
+from engine.systems.battle.battle_snapshot import COLUMNS, BattleSnapshot
+from engine.systems.battle.battle_simulator import (
+    BattleOutcome, BattleSeeds, HeadlessBattle, MonsterFactory, MonsterSpec, TeamSpec,
+    build_team, create_battle, load_move_table
+)
+
+REPLAY_MAGIC = b'USRP'
+REPLAY_VERSION = 2
+# Version 1 files (headless battles only) lack the live battle section
+_READABLE_VERSIONS = (1, REPLAY_VERSION)
+
+# magic, version, active size, AI level, max turns, player count, enemy count
+_HEADER = struct.Struct('<4sBBBHBB')
+# master, battle, turn order, player AI, enemy AI, damage
+_SEEDS = struct.Struct('<qIIIII')
+# side, actor, action type, move, target side, target
+_ACTION = struct.Struct('<BBBbbb')
+# Mersenne Twister state words and position, has gauss_next, gauss_next
+_RNG_STATE = struct.Struct('<625IBd')
+
+# Live battle flags
+_CAN_FLEE, _CAN_CATCH, _ENABLE_3V3, _STARTED = 1, 2, 4, 8
+
+_ACTION_TYPES = list(ActionType)
+_AI_LEVELS = list(AILevel)
+
+
+class ReplayError(Exception):
+    """Raised for malformed or incompatible replay data."""
+
+
+def _pack_text(text: str) -> bytes:
+    data = text.encode('utf-8')
+    if len(data) > 255:
+        raise ReplayError(f"Text too long for a replay: {text[:20]!r}...")
+    return struct.pack('<B', len(data)) + data
+
+
+def _unpack_text(data: bytes, offset: int) -> Tuple[str, int]:
+    (length,) = struct.unpack_from('<B', data, offset)
+    offset += 1
+    if offset + length > len(data):
+        raise ReplayError("Corrupt replay data: truncated text")
+    return data[offset:offset + length].decode('utf-8'), offset + length
+
+
+def _pack_rng_state(state: Any) -> bytes:
+    _, words, gauss = state
+    return _RNG_STATE.pack(*words, gauss is not None, gauss or 0.0)
+
+
+def _unpack_rng_state(data: bytes, offset: int) -> Tuple[Any, int]:
+    values = _RNG_STATE.unpack_from(data, offset)
+    gauss = values[626] if values[625] else None
+    return (3, values[:625], gauss), offset + _RNG_STATE.size
+
+
+@dataclass
+class RecordedAction:
+    """A queued action, stored as team indices."""
+    side: int
+    actor: int
+    action_type: ActionType
+    move: int = -1
+    target_side: int = -1
+    target: int = -1
+
+
+@dataclass
+class LiveBattleSetup:
+    """What a recorded live battle (BattleState) needs beyond the team specs."""
+    options: Dict[str, Any]  # BattleState keyword options (battle type, flee/catch, 3v3)
+    started: bool  # Whether start_battle() ran before the first turn
+    moves: List[List[str]]  # Move ids per monster, player team first
+    names: List[Optional[str]]  # Nicknames per monster
+    start_state: BattleSnapshot  # HP, MP, status, stats, stages and PP at the start
+    rng_states: Dict[int, Any] = field(default_factory=dict)  # Battle RNG state before a turn
+
+    def to_bytes(self) -> bytes:
+        """Encode the live battle section."""
+        options = self.options
+        flags = ((_CAN_FLEE if options.get('can_flee') else 0) |
+                 (_CAN_CATCH if options.get('can_catch') else 0) |
+                 (_ENABLE_3V3 if options.get('enable_3v3') else 0) |
+                 (_STARTED if self.started else 0))
+        parts = [struct.pack('<B', flags), _pack_text(options['battle_type'].value)]
+        for key in ('player_formation_type', 'enemy_formation_type'):
+            formation = options.get(key)
+            parts.append(_pack_text(formation.value if formation is not None else ''))
+
+        for move_ids, name in zip(self.moves, self.names):
+            parts.append(_pack_text(name or ''))
+            parts.append(struct.pack('<B', len(move_ids)))
+            parts.extend(_pack_text(move_id) for move_id in move_ids)
+
+        parts.append(self.start_state.player.astype('<i4').tobytes())
+        parts.append(self.start_state.enemy.astype('<i4').tobytes())
+
+        parts.append(struct.pack('<H', len(self.rng_states)))
+        for turn, state in sorted(self.rng_states.items()):
+            parts.append(struct.pack('<H', turn) + _pack_rng_state(state))
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int,
+                   n_player: int, n_enemy: int) -> Tuple['LiveBattleSetup', int]:
+        """Decode the live battle section; returns the setup and the end offset."""
+        from engine.systems.battle.battle_enums import BattleType
+        from engine.systems.battle.battle_formation import FormationType
+
+        (flags,) = struct.unpack_from('<B', data, offset)
+        battle_type, offset = _unpack_text(data, offset + 1)
+        options: Dict[str, Any] = {
+            'battle_type': BattleType(battle_type),
+            'can_flee': bool(flags & _CAN_FLEE),
+            'can_catch': bool(flags & _CAN_CATCH),
+            'enable_3v3': bool(flags & _ENABLE_3V3)
+        }
+        for key in ('player_formation_type', 'enemy_formation_type'):
+            formation, offset = _unpack_text(data, offset)
+            if formation:
+                options[key] = FormationType(formation)
+
+        moves, names = [], []
+        for _ in range(n_player + n_enemy):
+            name, offset = _unpack_text(data, offset)
+            names.append(name or None)
+            (n_moves,) = struct.unpack_from('<B', data, offset)
+            offset += 1
+            move_ids = []
+            for _ in range(n_moves):
+                move_id, offset = _unpack_text(data, offset)
+                move_ids.append(move_id)
+            moves.append(move_ids)
+
+        sides = []
+        for rows in (n_player, n_enemy):
+            size = rows * COLUMNS * 4
+            if offset + size > len(data):
+                raise ReplayError("Corrupt replay data: truncated team state")
+            sides.append(np.frombuffer(data, dtype='<i4', count=rows * COLUMNS, offset=offset)
+                         .reshape(rows, COLUMNS).astype(np.int32))
+            offset += size
+
+        (n_states,) = struct.unpack_from('<H', data, offset)
+        offset += 2
+        rng_states = {}
+        for _ in range(n_states):
+            (turn,) = struct.unpack_from('<H', data, offset)
+            rng_states[turn], offset = _unpack_rng_state(data, offset + 2)
+
+        setup = cls(options=options, started=bool(flags & _STARTED), moves=moves, names=names,
+                    start_state=BattleSnapshot(sides[0], sides[1]), rng_states=rng_states)
+        return setup, offset
+
+
+@dataclass
+class BattleReplay:
+    """Everything needed to re-execute a headless or live battle."""
+    seeds: BattleSeeds
+    player_spec: List[MonsterSpec]
+    enemy_spec: List[MonsterSpec]
+    active_size: int = 1
+    max_turns: int = 100
+    ai_level: AILevel = AILevel.SMART
+    turns: List[List[RecordedAction]] = field(default_factory=list)
+    live: Optional[LiveBattleSetup] = None  # Set for battles recorded with BattleRecorder
+
+    @property
+    def turn_count(self) -> int:
+        """Number of recorded turns."""
+        return len(self.turns)
+
+    def to_bytes(self) -> bytes:
+        """Encode the replay in the binary replay format."""
+        parts = [
+            _HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.active_size,
+                         _AI_LEVELS.index(self.ai_level), self.max_turns,
+                         len(self.player_spec), len(self.enemy_spec)),
+            _SEEDS.pack(self.seeds.master, self.seeds.battle, self.seeds.turn_order,
+                        self.seeds.player_ai, self.seeds.enemy_ai, self.seeds.damage)
+        ]
+
+        for species, level in list(self.player_spec) + list(self.enemy_spec):
+            if isinstance(species, int):
+                parts.append(struct.pack('<BHH', 0, species, level))
+            else:
+                name = str(species).encode('utf-8')
+                parts.append(struct.pack('<BH', 1, level) + struct.pack('<B', len(name)) + name)
+
+        parts.append(struct.pack('<H', len(self.turns)))
+        for actions in self.turns:
+            parts.append(struct.pack('<B', len(actions)))
+            for action in actions:
+                parts.append(_ACTION.pack(action.side, action.actor,
+                                          _ACTION_TYPES.index(action.action_type),
+                                          action.move, action.target_side, action.target))
+
+        parts.append(struct.pack('<B', self.live is not None))
+        if self.live is not None:
+            parts.append(self.live.to_bytes())
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BattleReplay':
+        """
+        Decode a replay.
+
+        Raises:
+            ReplayError: If the data is not a valid replay
+        """
+        try:
+            magic, version, active_size, ai_level, max_turns, n_player, n_enemy = \
+                _HEADER.unpack_from(data, 0)
+            if magic != REPLAY_MAGIC:
+                raise ReplayError("Not a battle replay")
+            if version not in _READABLE_VERSIONS:
+                raise ReplayError(f"Unsupported replay version: {version}")
+
+            offset = _HEADER.size
+            seeds = BattleSeeds(*_SEEDS.unpack_from(data, offset))
+            offset += _SEEDS.size
+
+            specs: List[MonsterSpec] = []
+            for _ in range(n_player + n_enemy):
+                (tag,) = struct.unpack_from('<B', data, offset)
+                if tag == 0:
+                    _, species, level = struct.unpack_from('<BHH', data, offset)
+                    offset += 5
+                    specs.append((species, level))
+                else:
+                    _, level, length = struct.unpack_from('<BHB', data, offset)
+                    offset += 4
+                    specs.append((data[offset:offset + length].decode('utf-8'), level))
+                    offset += length
+
+            (n_turns,) = struct.unpack_from('<H', data, offset)
+            offset += 2
+            turns = []
+            for _ in range(n_turns):
+                (n_actions,) = struct.unpack_from('<B', data, offset)
+                offset += 1
+                actions = []
+                for _ in range(n_actions):
+                    side, actor, action_type, move, target_side, target = _ACTION.unpack_from(data, offset)
+                    offset += _ACTION.size
+                    actions.append(RecordedAction(side, actor, _ACTION_TYPES[action_type],
+                                                  move, target_side, target))
+                turns.append(actions)
+
+            live = None
+            if version >= 2:
+                (has_live,) = struct.unpack_from('<B', data, offset)
+                if has_live:
+                    live, offset = LiveBattleSetup.from_bytes(data, offset + 1, n_player, n_enemy)
+        except (struct.error, IndexError, UnicodeDecodeError, ValueError) as e:
+            raise ReplayError(f"Corrupt replay data: {e}") from e
+
+        return cls(seeds=seeds,
+                   player_spec=specs[:n_player],
+                   enemy_spec=specs[n_player:],
+                   active_size=active_size,
+                   max_turns=max_turns,
+                   ai_level=_AI_LEVELS[ai_level],
+                   turns=turns,
+                   live=live)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the replay to a file."""
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'BattleReplay':
+        """Read a replay from a file."""
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+def encode_actions(battle: Any, actions: List[BattleAction]) -> List[RecordedAction]:
+    """Convert queued actions into index-based recorded actions."""
+    teams = (battle.player_team, battle.enemy_team)
+
+    def locate(monster: Any) -> Tuple[int, int]:
+        for side, team in enumerate(teams):
+            for index, member in enumerate(team):
+                if member is monster:
+                    return side, index
+        return -1, -1
+
+    recorded = []
+    for action in actions:
+        side, actor = locate(action.actor)
+        move = -1
+        if action.move is not None:
+            move = next((i for i, m in enumerate(action.actor.moves) if m is action.move), -1)
+        target_side, target = locate(action.target) if action.target is not None else (-1, -1)
+        recorded.append(RecordedAction(side, actor, action.action_type, move, target_side, target))
+    return recorded
+
+
+def monster_rng_states(battle: Any) -> List[Any]:
+    """RNG states of all monsters (status rolls); None for monsters without an RNG."""
+    return [monster.rng.getstate() if hasattr(monster, 'rng') else None
+            for monster in list(battle.player_team) + list(battle.enemy_team)]
+
+
+def restore_monster_rngs(battle: Any, states: List[Any]) -> None:
+    """Put monster RNGs back into states taken with monster_rng_states."""
+    for monster, state in zip(list(battle.player_team) + list(battle.enemy_team), states):
+        if state is not None:
+            monster.rng.setstate(state)
+
+
+def decode_actions(battle: Any, recorded: List[RecordedAction]) -> List[BattleAction]:
+    """Convert index-based recorded actions back into actions on the battle's teams."""
+    teams = (battle.player_team, battle.enemy_team)
+    actions = []
+    for entry in recorded:
+        actor = teams[entry.side][entry.actor]
+        actions.append(BattleAction(
+            actor=actor,
+            action_type=entry.action_type,
+            move=actor.moves[entry.move] if entry.move >= 0 else None,
+            target=teams[entry.target_side][entry.target] if entry.target_side >= 0 else None
+        ))
+    return actions
+
+
+def record_battle(player_spec: TeamSpec,
+                  enemy_spec: TeamSpec,
+                  seed: int,
+                  active_size: int = 1,
+                  max_turns: int = 100,
+                  ai_level: AILevel = AILevel.SMART,
+                  monster_factory: Optional[MonsterFactory] = None) -> Tuple[BattleOutcome, BattleReplay]:
+    """
+    Run a headless battle and record it.
+
+    Returns:
+        (outcome, replay) for this seed
+    """
+    battle = create_battle(player_spec, enemy_spec, seed,
+                           active_size=active_size,
+                           max_turns=max_turns,
+                           ai_level=ai_level,
+                           monster_factory=monster_factory)
+    battle.recorded_turns = []
+    outcome = battle.run()
+
+    replay = BattleReplay(seeds=battle.seeds,
+                          player_spec=list(player_spec),
+                          enemy_spec=list(enemy_spec),
+                          active_size=battle.active_size,
+                          max_turns=max_turns,
+                          ai_level=ai_level,
+                          turns=[encode_actions(battle, turn) for turn in battle.recorded_turns])
+    return outcome, replay
+
+
+class ReplayBattle(HeadlessBattle):
+    """A headless battle that queues recorded actions instead of asking the AI."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.recorded: List[List[RecordedAction]] = []
+
+    def _collect_actions(self) -> List[BattleAction]:
+        """Decode the recorded actions of the current turn."""
+        if self.turn_count > len(self.recorded):
+            return []
+        return decode_actions(self, self.recorded[self.turn_count - 1])
+
+
+class BattleRecorder:
+    """
+    Records a live battle (the BattleState driven by the battle scene).
+    Attach it before the first turn: it keeps deep copies of the starting
+    teams (including the monster RNGs) and the battle options, and the
+    battle appends its queued actions and its RNG state on every
+    resolve_turn. Since all battle randomness draws from the state's seeded
+    RNG, replay() reproduces the battle exactly without touching the live
+    teams, and to_replay() turns the recording into a BattleReplay for
+    files and the ReplayEngine.
+    """
+
+    def __init__(self, battle: Any):
+        """
+        Start recording a battle.
+
+        Args:
+            battle: BattleState before its first resolved turn
+        """
+        self.battle = battle
+        self.seed = battle.seed
+        self.start_teams = copy.deepcopy((battle.player_team, battle.enemy_team))
+        self.options: Dict[str, Any] = {
+            'battle_type': battle.battle_type,
+            'can_flee': battle.can_flee,
+            'can_catch': battle.can_catch,
+            'enable_3v3': battle.enable_3v3
+        }
+        if battle.enable_3v3:
+            self.options['player_formation_type'] = battle.player_formation.formation_type
+            self.options['enemy_formation_type'] = battle.enemy_formation.formation_type
+        battle.recorded_turns = []
+        battle.recorded_rng_states = []
+
+    @property
+    def turns(self) -> List[List[RecordedAction]]:
+        """Recorded turns as index-based actions."""
+        return [encode_actions(self.battle, turn) for turn in self.battle.recorded_turns or []]
+
+    @property
+    def started(self) -> bool:
+        """Whether start_battle() ran (the battle scene resolves turns without it)."""
+        return self.battle.phase.value != 'init'
+
+    def replay(self) -> Any:
+        """
+        Re-run every recorded turn on a fresh battle state with the recorded
+        seed, played on copies of the starting teams.
+
+        Returns:
+            The new battle state after the last recorded turn
+        """
+        return self._run()[0]
+
+    def to_replay(self) -> BattleReplay:
+        """
+        Serialize the recording: seed, starting team specs and state, and the
+        encoded turns. The result round-trips through BattleReplay.to_bytes()
+        and replays with the ReplayEngine.
+        """
+        _, rng_states = self._run()
+        player_team, enemy_team = self.start_teams
+        teams = list(player_team) + list(enemy_team)
+        turns = self.turns
+
+        battle_ai = getattr(self.battle, 'battle_ai', None)
+        return BattleReplay(
+            seeds=BattleSeeds.from_master(self.seed),
+            player_spec=[(monster.species.id, monster.level) for monster in player_team],
+            enemy_spec=[(monster.species.id, monster.level) for monster in enemy_team],
+            active_size=3 if self.options['enable_3v3'] else 1,
+            max_turns=max(1, len(turns)),
+            ai_level=getattr(battle_ai, 'level', AILevel.SMART),
+            turns=turns,
+            live=LiveBattleSetup(
+                options=dict(self.options),
+                started=self.started,
+                moves=[[move.id for move in monster.moves if move] for monster in teams],
+                names=[getattr(monster, 'nickname', None) for monster in teams],
+                start_state=BattleSnapshot.from_teams(player_team, enemy_team),
+                rng_states=rng_states
+            )
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the recording as a replay file."""
+        self.to_replay().save(path)
+
+    def _run(self) -> Tuple[Any, Dict[int, Any]]:
+        """
+        Replay on copies of the starting teams.
+
+        Returns:
+            (battle state, battle RNG states of the turns whose start was
+            moved by rolls outside resolve_turn)
+        """
+        turns = self.turns
+        recorded_states = self.battle.recorded_rng_states or []
+        player_team, enemy_team = copy.deepcopy(self.start_teams)
+
+        battle = type(self.battle)(player_team, enemy_team, seed=self.seed, **self.options)
+        if self.started:
+            battle.start_battle()
+        rng_states = {}
+        for turn, actions in enumerate(turns):
+            if turn < len(recorded_states) and battle.rng.getstate() != recorded_states[turn]:
+                rng_states[turn] = recorded_states[turn]
+                battle.rng.setstate(recorded_states[turn])
+            battle.action_queue = decode_actions(battle, actions)
+            battle.resolve_turn()
+        return battle, rng_states
+
+
+class LiveReplayBattle:
+    """
+    Re-executes a recorded live battle on a BattleState.
+    Offers the part of the HeadlessBattle interface the ReplayEngine drives;
+    its checkpoints are deep copies of the whole BattleState, which holds
+    more mutable state (tension, active monsters, log) than a snapshot.
+    """
+
+    def __init__(self, replay: BattleReplay, monster_factory: Optional[MonsterFactory] = None):
+        """
+        Rebuild the starting teams and the battle state.
+
+        Args:
+            replay: Recording with a LiveBattleSetup
+            monster_factory: Factory for the team specs (MonsterInstances)
+
+        Raises:
+            ReplayError: If a recorded move is unknown
+        """
+        from engine.systems.battle.battle_controller import BattleState
+
+        live = replay.live
+        player_team = build_team(replay.player_spec, replay.seeds.master, monster_factory)
+        enemy_team = build_team(replay.enemy_spec, replay.seeds.master ^ 0x5EED, monster_factory)
+
+        move_table = load_move_table()
+        for monster, move_ids, name in zip(player_team + enemy_team, live.moves, live.names):
+            try:
+                monster.moves = [copy.copy(move_table[move_id]) for move_id in move_ids]
+            except KeyError as e:
+                raise ReplayError(f"Unknown move in replay: {e}") from e
+            monster.nickname = name
+        live.start_state.apply_to_teams(player_team, enemy_team)
+
+        self.seed = replay.seeds.master
+        self.recorded = replay.turns
+        self.rng_states = live.rng_states
+        self.state = BattleState(player_team, enemy_team, seed=self.seed, **live.options)
+        if live.started:
+            self.state.start_battle()
+
+        self.turn_count = 0
+        self.winner: Optional[str] = None
+        # Live battles keep no per-hit damage log
+        self.player_damage: List[int] = []
+        self.enemy_damage: List[int] = []
+
+    @property
+    def player_team(self) -> List[Any]:
+        return self.state.player_team
+
+    @property
+    def enemy_team(self) -> List[Any]:
+        return self.state.enemy_team
+
+    def step(self) -> Optional[str]:
+        """Resolve the next recorded turn."""
+        if self.winner is not None or self.turn_count >= len(self.recorded):
+            return self.winner
+
+        state = self.state
+        rng_state = self.rng_states.get(self.turn_count)
+        if rng_state is not None:
+            state.rng.setstate(rng_state)
+        state.action_queue = decode_actions(state, self.recorded[self.turn_count])
+        result = state.resolve_turn()
+        self.turn_count += 1
+
+        ended = result.get('battle_ended')
+        if ended:
+            self.winner = {'victory': 'player', 'defeat': 'enemy'}.get(ended, 'draw')
+        return self.winner
+
+    def capture(self) -> 'ReplayCheckpoint':
+        """Checkpoint the current turn."""
+        return ReplayCheckpoint(
+            turn=self.turn_count,
+            winner=self.winner,
+            snapshot=BattleSnapshot.from_teams(self.player_team, self.enemy_team, self.turn_count),
+            rng_states={'battle': self.state.rng.getstate()},
+            player_damage=[],
+            enemy_damage=[],
+            state=copy.deepcopy(self.state)
+        )
+
+    def restore(self, checkpoint: 'ReplayCheckpoint') -> None:
+        """Go back to a checkpoint taken with capture()."""
+        self.state = copy.deepcopy(checkpoint.state)
+        self.turn_count = checkpoint.turn
+        self.winner = checkpoint.winner
+
+    def _outcome(self, winner: str) -> BattleOutcome:
+        return BattleOutcome(
+            seed=self.seed,
+            winner=winner,
+            turns=self.turn_count,
+            player_damage=self.player_damage,
+            enemy_damage=self.enemy_damage,
+            player_survivors=sum(1 for m in self.player_team if not m.is_fainted and m.current_hp > 0),
+            enemy_survivors=sum(1 for m in self.enemy_team if not m.is_fainted and m.current_hp > 0)
+        )
+
+
+@dataclass
+class ReplayCheckpoint:
+    """Battle state at the end of a turn."""
+    turn: int
+    winner: Optional[str]
+    snapshot: BattleSnapshot
+    rng_states: Dict[str, Any]
+    player_damage: List[int]
+    enemy_damage: List[int]
+    state: Any = None  # Deep copy of the BattleState (live replays)
+
+
+class ReplayEngine:
+    """
+    Re-executes a recorded battle at full speed.
+    Checkpoints are taken every snapshot_interval turns while playing, so
+    seeking backwards or to any later turn never starts from turn 0 again.
+    """
+
+    def __init__(self,
+                 replay: BattleReplay,
+                 monster_factory: Optional[MonsterFactory] = None,
+                 snapshot_interval: int = 10):
+        """
+        Initialize the replay engine.
+
+        Args:
+            replay: Recorded battle
+            monster_factory: Factory used when the battle was recorded
+            snapshot_interval: Turns between automatic checkpoints
+        """
+        self.replay = replay
+        self.monster_factory = monster_factory
+        self.snapshot_interval = max(1, snapshot_interval)
+        self.checkpoints: Dict[int, ReplayCheckpoint] = {}
+
+        if replay.live is not None:
+            self.battle = LiveReplayBattle(replay, monster_factory)
+        else:
+            self.battle = create_battle(replay.player_spec, replay.enemy_spec, replay.seeds.master,
+                                        active_size=replay.active_size,
+                                        max_turns=replay.max_turns,
+                                        ai_level=replay.ai_level,
+                                        monster_factory=monster_factory,
+                                        seeds=replay.seeds,
+                                        battle_class=ReplayBattle)
+            self.battle.recorded = replay.turns
+        self.checkpoints[0] = self._capture()
+
+    @property
+    def turn(self) -> int:
+        """Turn the battle is currently at."""
+        return self.battle.turn_count
+
+    def step(self) -> Optional[str]:
+        """Play the next recorded turn."""
+        winner = self.battle.step()
+        if self.battle.turn_count % self.snapshot_interval == 0 and self.turn not in self.checkpoints:
+            self.checkpoints[self.turn] = self._capture()
+        return winner
+
+    def seek(self, turn: int) -> Union[HeadlessBattle, LiveReplayBattle]:
+        """
+        Jump to the end of a turn.
+
+        Args:
+            turn: Target turn (0 = before the first turn)
+
+        Returns:
+            The battle in its state at that turn
+        """
+        turn = max(0, min(turn, self.replay.turn_count))
+
+        # Rewind, or skip ahead if a later checkpoint is already known
+        start = max(t for t in self.checkpoints if t <= turn)
+        if turn < self.turn or start > self.turn:
+            self._restore(self.checkpoints[start])
+
+        while self.turn < turn and self.battle.winner is None:
+            self.step()
+        return self.battle
+
+    def run_to_end(self) -> BattleOutcome:
+        """Play all remaining recorded turns."""
+        while self.battle.winner is None and self.turn < self.replay.turn_count:
+            self.step()
+        outcome = self.battle._outcome(self.battle.winner or 'draw')
+
+        # Detach from the live lists, which later seeks rewrite
+        outcome.player_damage = list(outcome.player_damage)
+        outcome.enemy_damage = list(outcome.enemy_damage)
+        return outcome
+
+    def _capture(self) -> ReplayCheckpoint:
+        """Snapshot the mutable battle state."""
+        battle = self.battle
+        if isinstance(battle, LiveReplayBattle):
+            return battle.capture()
+        return ReplayCheckpoint(
+            turn=battle.turn_count,
+            winner=battle.winner,
+            snapshot=BattleSnapshot.from_battle_state(battle),
+            rng_states={
+                'battle': battle.rng.getstate(),
+                'turn_order': battle.turn_order.rng.getstate(),
+                'damage': battle.damage_calculator.rng.getstate(),
+                'monsters': monster_rng_states(battle)
+            },
+            player_damage=list(battle.player_damage),
+            enemy_damage=list(battle.enemy_damage)
+        )
+
+    def _restore(self, checkpoint: ReplayCheckpoint) -> None:
+        """Put the battle back into a checkpointed state."""
+        battle = self.battle
+        if isinstance(battle, LiveReplayBattle):
+            battle.restore(checkpoint)
+            return
+        checkpoint.snapshot.apply_to(battle)
+        battle.turn_count = checkpoint.turn
+        battle.winner = checkpoint.winner
+        battle.rng.setstate(checkpoint.rng_states['battle'])
+        battle.turn_order.rng.setstate(checkpoint.rng_states['turn_order'])
+        battle.damage_calculator.rng.setstate(checkpoint.rng_states['damage'])
+        restore_monster_rngs(battle, checkpoint.rng_states['monsters'])
+        battle.player_damage[:] = checkpoint.player_damage
+        battle.enemy_damage[:] = checkpoint.enemy_damage
+
+
+if __name__ == '__main__':
+    import argparse
+    import json
+    import time
+
+    parser = argparse.ArgumentParser(description="Battle replay tool")
+    parser.add_argument('replay', help="Replay file")
+    parser.add_argument('--turn', type=int, default=None, help="Jump to this turn and print the state")
+    args = parser.parse_args()
+
+    engine = ReplayEngine(BattleReplay.load(args.replay))
+    start = time.perf_counter()
+    if args.turn is None:
+        outcome = engine.run_to_end()
+        print(json.dumps({'winner': outcome.winner, 'turns': outcome.turns}, indent=2))
+    else:
+        battle = engine.seek(args.turn)
+        print(json.dumps({
+            'turn': battle.turn_count,
+            'player': [(m.name, m.current_hp) for m in battle.player_team],
+            'enemy': [(m.name, m.current_hp) for m in battle.enemy_team]
+        }, indent=2))
+    print(f"Replayed in {(time.perf_counter() - start) * 1000:.1f} ms")
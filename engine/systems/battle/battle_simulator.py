@@ -0,0 +1,699 @@
+"""
+Headless Battle Simulator
+Runs complete battles without scenes or rendering for balancing sweeps.
+
+Battles are driven by the same TurnOrder, BattleAI and BattleActionExecutor
+that BattleState uses, so damage, secondary move effects and end-of-turn
+status follow the live rules, but resolve a whole turn per loop iteration
+instead of waiting for UI events. Large sweeps are distributed over a multiprocessing
+pool; each worker returns a compact BattleOutcome which is folded into a
+SimulationReport.
+"""
+
+import copy
+import json
+import logging
+import multiprocessing
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from engine.systems.battle.turn_logic import BattleAction, ActionType, TurnOrder
+from engine.systems.battle.battle_ai import BattleAI, AILevel
+from engine.systems.battle.battle_actions import BattleActionExecutor
+from engine.systems.battle.damage_calc import DamageCalculator
+from engine.systems.battle.battle_profiler import BattleProfiler, profiler
+
+logger = logging.getLogger(__name__)
+
+# (species id or species name, level)
+MonsterSpec = Tuple[Union[int, str], int]
+TeamSpec = Sequence[MonsterSpec]
+MonsterFactory = Callable[[Union[int, str], int, int], Any]
+
+MONSTERS_JSON = Path(__file__).resolve().parents[3] / "data" / "monsters.json"
+MOVES_JSON = Path(__file__).resolve().parents[3] / "data" / "moves.json"
+
+# Learnset moves that are missing from moves.json are replaced by this one
+FALLBACK_MOVE = "tackle"
+
+# Species and move table caches per worker process
+_species_table: Optional[Dict[Union[int, str], Dict[str, Any]]] = None
+_move_table: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class BattleSeeds:
+    """Seeds for every RNG a headless battle uses."""
+    master: int
+    battle: int
+    turn_order: int
+    player_ai: int
+    enemy_ai: int
+    damage: int
+
+    @classmethod
+    def from_master(cls, seed: int) -> 'BattleSeeds':
+        """Derive independent streams from a master seed."""
+        seeder = random.Random(seed)
+        return cls(master=seed,
+                   battle=seeder.getrandbits(32),
+                   turn_order=seeder.getrandbits(32),
+                   player_ai=seeder.getrandbits(32),
+                   enemy_ai=seeder.getrandbits(32),
+                   damage=seeder.getrandbits(32))
+
+
+@dataclass
+class BattleOutcome:
+    """Result of a single simulated battle."""
+    seed: int
+    winner: str  # 'player', 'enemy' or 'draw'
+    turns: int
+    player_damage: List[int] = field(default_factory=list)  # Per-hit damage dealt by player side
+    enemy_damage: List[int] = field(default_factory=list)   # Per-hit damage dealt by enemy side
+    player_survivors: int = 0
+    enemy_survivors: int = 0
+
+
+@dataclass
+class SimulationReport:
+    """Aggregated statistics over many simulated battles."""
+    battles: int = 0
+    player_wins: int = 0
+    enemy_wins: int = 0
+    draws: int = 0
+    failures: int = 0  # Seeds whose battle raised instead of finishing
+    turn_counts: Counter = field(default_factory=Counter)
+    player_damage: Counter = field(default_factory=Counter)
+    enemy_damage: Counter = field(default_factory=Counter)
+    profile: Optional[BattleProfiler] = None  # Timings, only for profiled runs
+
+    def add(self, outcome: BattleOutcome) -> None:
+        """Fold a single battle outcome into the aggregate."""
+        self.battles += 1
+        if outcome.winner == 'player':
+            self.player_wins += 1
+        elif outcome.winner == 'enemy':
+            self.enemy_wins += 1
+        else:
+            self.draws += 1
+
+        self.turn_counts[outcome.turns] += 1
+        self.player_damage.update(outcome.player_damage)
+        self.enemy_damage.update(outcome.enemy_damage)
+
+    def merge(self, other: 'SimulationReport') -> None:
+        """Merge another report into this one."""
+        self.battles += other.battles
+        self.player_wins += other.player_wins
+        self.enemy_wins += other.enemy_wins
+        self.draws += other.draws
+        self.failures += other.failures
+        self.turn_counts.update(other.turn_counts)
+        self.player_damage.update(other.player_damage)
+        self.enemy_damage.update(other.enemy_damage)
+        if other.profile is not None:
+            if self.profile is None:
+                self.profile = BattleProfiler()
+            self.profile.merge(other.profile)
+
+    @property
+    def player_win_rate(self) -> float:
+        """Fraction of battles won by the player side."""
+        return self.player_wins / self.battles if self.battles else 0.0
+
+    @property
+    def enemy_win_rate(self) -> float:
+        """Fraction of battles won by the enemy side."""
+        return self.enemy_wins / self.battles if self.battles else 0.0
+
+    @property
+    def draw_rate(self) -> float:
+        """Fraction of battles that hit the turn limit."""
+        return self.draws / self.battles if self.battles else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export the report as a JSON-serializable dictionary."""
+        data = {
+            'battles': self.battles,
+            'player_wins': self.player_wins,
+            'enemy_wins': self.enemy_wins,
+            'draws': self.draws,
+            'failures': self.failures,
+            'player_win_rate': self.player_win_rate,
+            'enemy_win_rate': self.enemy_win_rate,
+            'draw_rate': self.draw_rate,
+            'turns': summarize_distribution(self.turn_counts),
+            'player_damage': summarize_distribution(self.player_damage),
+            'enemy_damage': summarize_distribution(self.enemy_damage)
+        }
+        if self.profile is not None:
+            data['profile'] = self.profile.to_dict()['timers']
+        return data
+
+
+def summarize_distribution(counts: Counter) -> Dict[str, Any]:
+    """
+    Summarize a value histogram.
+
+    Args:
+        counts: Counter mapping value -> occurrences
+
+    Returns:
+        Dictionary with count, min, max, mean and percentiles
+    """
+    total = sum(counts.values())
+    if total == 0:
+        return {'count': 0, 'min': 0, 'max': 0, 'mean': 0.0,
+                'p50': 0, 'p90': 0, 'p99': 0, 'histogram': {}}
+
+    values = sorted(counts)
+    mean = sum(value * n for value, n in counts.items()) / total
+
+    percentiles = {}
+    targets = [('p50', 0.50), ('p90', 0.90), ('p99', 0.99)]
+    seen = 0
+    index = 0
+    for value in values:
+        seen += counts[value]
+        while index < len(targets) and seen >= targets[index][1] * total:
+            percentiles[targets[index][0]] = value
+            index += 1
+
+    return {
+        'count': total,
+        'min': values[0],
+        'max': values[-1],
+        'mean': mean,
+        **percentiles,
+        'histogram': {str(value): counts[value] for value in values}
+    }
+
+
+def load_species_table(path: Optional[Path] = None) -> Dict[Union[int, str], Dict[str, Any]]:
+    """
+    Load monsters.json indexed by species id and lowercase name.
+    Reads the JSON directly so workers never touch the resource manager.
+    """
+    global _species_table
+
+    if _species_table is not None and path is None:
+        return _species_table
+
+    with open(path or MONSTERS_JSON, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    entries = data.get('monsters', []) if isinstance(data, dict) else data
+    table: Dict[Union[int, str], Dict[str, Any]] = {}
+    for entry in entries:
+        table[entry['id']] = entry
+        table[entry['name'].lower()] = entry
+
+    if path is None:
+        _species_table = table
+    return table
+
+
+def load_move_table(path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Load moves.json as Move objects indexed by move id and lowercase name.
+    The global move registry is never filled at runtime, so the simulator
+    reads the move data itself like it does for species.
+    """
+    from engine.systems.moves import Move
+
+    global _move_table
+
+    if _move_table is not None and path is None:
+        return _move_table
+
+    with open(path or MOVES_JSON, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    entries = data.get('moves', []) if isinstance(data, dict) else data
+    table: Dict[str, Any] = {}
+    for entry in entries:
+        move = Move.from_dict({'max_pp': entry.get('pp', 1), 'effects': [], 'description': '', **entry})
+        table[move.id] = move
+        table[move.name.lower()] = move
+
+    if path is None:
+        _move_table = table
+    return table
+
+
+def learn_moves(species: Any, level: int) -> List[Any]:
+    """
+    Pick the last four learnset moves up to a level from moves.json.
+
+    Args:
+        species: MonsterSpecies with a (level, move name) learnset
+        level: Monster level
+
+    Returns:
+        Fresh Move copies; unknown moves become FALLBACK_MOVE
+    """
+    table = load_move_table()
+    names = [name for learn_level, name in sorted(species.learnset, key=lambda entry: entry[0])
+             if learn_level <= level][-4:]
+
+    moves = []
+    for name in names:
+        move = table.get(str(name).lower()) or table[FALLBACK_MOVE]
+        if all(known.id != move.id for known in moves):
+            moves.append(copy.copy(move))
+    return moves or [copy.copy(table[FALLBACK_MOVE])]
+
+
+def create_monster(species_key: Union[int, str], level: int, seed: int):
+    """
+    Default monster factory: build a MonsterInstance from monsters.json.
+
+    Args:
+        species_key: Species id or name
+        level: Monster level
+        seed: Seed for IVs and per-instance RNG
+
+    Returns:
+        Fresh MonsterInstance with private move copies
+
+    Raises:
+        KeyError: Unknown species
+    """
+    from engine.systems.monster_instance import MonsterSpecies, MonsterInstance
+
+    table = load_species_table()
+    key = species_key.lower() if isinstance(species_key, str) else species_key
+    if key not in table:
+        raise KeyError(f"Unknown species: {species_key}")
+
+    species = MonsterSpecies.from_dict(table[key])
+    monster = MonsterInstance(species, level)
+
+    # Re-roll IVs from the battle seed so every run is reproducible
+    monster.set_random_seed(seed)
+    monster.ivs = monster._generate_ivs()
+    monster.stats = monster._calculate_stats()
+    monster.max_hp = monster.stats['hp']
+    monster.current_hp = monster.max_hp
+
+    # Private move copies; PP must not leak between monsters
+    monster.moves = learn_moves(species, level)
+    return monster
+
+
+class HeadlessBattle:
+    """
+    A battle that runs to completion without scenes, events or rendering.
+    Exposes the attributes BattleAI and BattleActionExecutor read from a
+    battle (type_system, turn_count, rng, damage_calculator).
+    """
+
+    def __init__(self,
+                 player_team: List[Any],
+                 enemy_team: List[Any],
+                 seed: int,
+                 active_size: int = 1,
+                 max_turns: int = 100,
+                 ai_level: AILevel = AILevel.SMART,
+                 seeds: Optional[BattleSeeds] = None):
+        """
+        Initialize a headless battle.
+
+        Args:
+            player_team: Player side monsters
+            enemy_team: Enemy side monsters
+            seed: Master seed for all battle RNGs
+            active_size: Monsters per side on the field (1 for 1v1, 3 for 3v3)
+            max_turns: Turn limit after which the battle is a draw
+            ai_level: AI level used for both sides
+            seeds: Explicit seed set (derived from seed if omitted)
+        """
+        from engine.systems.types import type_chart
+
+        if not player_team or not enemy_team:
+            raise ValueError("Player and enemy teams cannot be empty!")
+
+        self.player_team = player_team
+        self.enemy_team = enemy_team
+        self.seed = seed
+        self.active_size = max(1, active_size)
+        self.max_turns = max_turns
+        self.ai_level = ai_level
+        self.type_system = type_chart
+        self.turn_count = 0
+        self.winner: Optional[str] = None
+
+        self.seeds = seeds or BattleSeeds.from_master(seed)
+        self.rng = random.Random(self.seeds.battle)
+        self.turn_order = TurnOrder(seed=self.seeds.turn_order)
+        self.player_ai = BattleAI(ai_level, seed=self.seeds.player_ai)
+        self.enemy_ai = BattleAI(ai_level, seed=self.seeds.enemy_ai)
+        self.damage_calculator = DamageCalculator(type_chart, seed=self.seeds.damage,
+                                                 compiled=True)
+        self.action_executor = BattleActionExecutor()
+
+        self.player_damage: List[int] = []
+        self.enemy_damage: List[int] = []
+
+        # Queued actions per turn, filled when recording is enabled
+        self.recorded_turns: Optional[List[List[BattleAction]]] = None
+
+    def get_active(self, team: List[Any]) -> List[Any]:
+        """Get the monsters currently on the field for a team."""
+        alive = [m for m in team if not m.is_fainted and m.current_hp > 0]
+        return alive[:self.active_size]
+
+    def is_defeated(self, team: List[Any]) -> bool:
+        """Check if a team has no able monsters left."""
+        return all(m.is_fainted or m.current_hp <= 0 for m in team)
+
+    def run(self) -> BattleOutcome:
+        """Run the battle to completion."""
+        while self.winner is None:
+            self.step()
+        return self._outcome(self.winner)
+
+    def step(self) -> Optional[str]:
+        """
+        Play a single turn.
+
+        Returns:
+            Winner ('player', 'enemy', 'draw') once the battle is over, else None
+        """
+        if self.winner is not None:
+            return self.winner
+
+        self.turn_count += 1
+        if profiler.enabled:
+            start = time.perf_counter()
+            self._play_turn()
+            profiler.record('battle.turn', time.perf_counter() - start)
+        else:
+            self._play_turn()
+
+        if self.is_defeated(self.enemy_team):
+            self.winner = 'player'
+        elif self.is_defeated(self.player_team):
+            self.winner = 'enemy'
+        elif self.turn_count >= self.max_turns:
+            self.winner = 'draw'
+        return self.winner
+
+    def _collect_actions(self) -> List[BattleAction]:
+        """Ask both AIs for this turn's actions."""
+        player_active = self.get_active(self.player_team)
+        enemy_active = self.get_active(self.enemy_team)
+        return (self._decide(self.player_ai, player_active, enemy_active) +
+                self._decide(self.enemy_ai, enemy_active, player_active))
+
+    def _play_turn(self) -> None:
+        """Collect actions for both sides and resolve them in turn order."""
+        self.turn_order.clear()
+
+        actions = self._collect_actions()
+        if self.recorded_turns is not None:
+            self.recorded_turns.append(list(actions))
+        for action in actions:
+            self.turn_order.add_action(action)
+
+        for action in self.turn_order.sort_actions():
+            if action.actor.is_fainted or action.actor.current_hp <= 0:
+                continue
+            self._execute(action)
+            if self.is_defeated(self.player_team) or self.is_defeated(self.enemy_team):
+                return
+
+        self._process_status_damage(self.get_active(self.player_team) + self.get_active(self.enemy_team))
+
+    def _decide(self, ai: BattleAI, actors: List[Any], targets: List[Any]) -> List[BattleAction]:
+        """Ask the AI for one side's actions, falling back to the first usable move."""
+        try:
+            actions = ai.decide_team_actions(self, actors, targets)
+        except Exception as e:
+            logger.debug(f"AI decision failed, using fallback: {e}")
+            actions = [BattleAction(actor=actor, action_type=ActionType.PASS) for actor in actors]
+
+        return [action if action.action_type != ActionType.PASS else self._fallback(action.actor, targets)
+                for action in actions]
+
+    def _fallback(self, actor: Any, targets: List[Any]) -> BattleAction:
+        """Use the first move with PP left on the first target."""
+        usable = [m for m in actor.moves if m and getattr(m, 'pp', 0) > 0]
+        if usable and targets:
+            return BattleAction(actor=actor, action_type=ActionType.ATTACK,
+                                move=usable[0], target=targets[0])
+        return BattleAction(actor=actor, action_type=ActionType.PASS)
+
+    def _execute(self, action: BattleAction) -> None:
+        """Resolve a single attack action through the BattleActionExecutor."""
+        if action.action_type != ActionType.ATTACK or not action.move:
+            return
+
+        is_player = action.actor in self.player_team
+        opponents = self.get_active(self.enemy_team if is_player else self.player_team)
+        if not opponents:
+            return
+
+        # Retarget if the chosen target fainted earlier this turn
+        if action.target not in opponents:
+            action = copy.copy(action)
+            action.target = self.rng.choice(opponents)
+
+        if hasattr(action.move, 'use'):
+            action.move.use()
+
+        result = self.action_executor.execute_action(action, self)
+        self.action_executor.battle_log.clear()
+        dealt = result.get('dealt', 0) if result else 0
+        if dealt <= 0:
+            return
+
+        if is_player:
+            self.player_damage.append(dealt)
+        else:
+            self.enemy_damage.append(dealt)
+
+    def _process_status_damage(self, monsters: List[Any]) -> None:
+        """Apply end-of-turn status through the executor, like BattleState does."""
+        for monster in monsters:
+            self.action_executor.process_end_of_turn_status(monster, self)
+
+    def _outcome(self, winner: str) -> BattleOutcome:
+        """Build the outcome record for this battle."""
+        return BattleOutcome(
+            seed=self.seed,
+            winner=winner,
+            turns=self.turn_count,
+            player_damage=self.player_damage,
+            enemy_damage=self.enemy_damage,
+            player_survivors=len([m for m in self.player_team if not m.is_fainted]),
+            enemy_survivors=len([m for m in self.enemy_team if not m.is_fainted])
+        )
+
+
+def build_team(spec: TeamSpec, seed: int,
+               monster_factory: Optional[MonsterFactory] = None) -> List[Any]:
+    """
+    Build a team from (species, level) pairs.
+
+    Args:
+        spec: Team specification
+        seed: Battle seed; each slot gets its own derived seed
+        monster_factory: Callable(species, level, seed) -> monster
+
+    Returns:
+        List of monsters
+    """
+    factory = monster_factory or create_monster
+    seeder = random.Random(seed)
+    return [factory(species, level, seeder.getrandbits(32)) for species, level in spec]
+
+
+def simulate_battle(player_spec: TeamSpec,
+                    enemy_spec: TeamSpec,
+                    seed: int,
+                    active_size: int = 1,
+                    max_turns: int = 100,
+                    ai_level: AILevel = AILevel.SMART,
+                    monster_factory: Optional[MonsterFactory] = None) -> BattleOutcome:
+    """
+    Run one full battle deterministically from a seed.
+
+    Args:
+        player_spec: Player team as (species, level) pairs
+        enemy_spec: Enemy team as (species, level) pairs
+        seed: Battle seed
+        active_size: Monsters per side on the field
+        max_turns: Turn limit before a draw is declared
+        ai_level: AI level for both sides
+        monster_factory: Optional custom monster factory
+
+    Returns:
+        BattleOutcome for this seed
+    """
+    return create_battle(player_spec, enemy_spec, seed,
+                         active_size=active_size,
+                         max_turns=max_turns,
+                         ai_level=ai_level,
+                         monster_factory=monster_factory).run()
+
+
+def create_battle(player_spec: TeamSpec,
+                  enemy_spec: TeamSpec,
+                  seed: int,
+                  active_size: int = 1,
+                  max_turns: int = 100,
+                  ai_level: AILevel = AILevel.SMART,
+                  monster_factory: Optional[MonsterFactory] = None,
+                  seeds: Optional[BattleSeeds] = None,
+                  battle_class: type = HeadlessBattle) -> HeadlessBattle:
+    """
+    Build teams and a ready-to-run battle for a seed.
+    All randomness runs on the battle's own generators; the module-level
+    RNG is left untouched.
+
+    Returns:
+        Battle of type battle_class
+    """
+    player_team = build_team(player_spec, seed, monster_factory)
+    enemy_team = build_team(enemy_spec, seed ^ 0x5EED, monster_factory)
+
+    return battle_class(player_team, enemy_team, seed,
+                        active_size=active_size,
+                        max_turns=max_turns,
+                        ai_level=ai_level,
+                        seeds=seeds)
+
+
+def _simulate_chunk(args: Tuple) -> SimulationReport:
+    """
+    Pool worker: simulate a chunk of seeds and return a partial report.
+    Failed seeds are counted in the report; a chunk in which every seed
+    fails raises, since that points at a setup error rather than a bad seed.
+    """
+    player_spec, enemy_spec, seeds, active_size, max_turns, ai_level, monster_factory, profile = args
+
+    report = SimulationReport()
+    was_enabled = profiler.enabled
+    if profile:
+        profiler.reset()
+        profiler.enable()
+    last_error: Optional[Exception] = None
+    for seed in seeds:
+        try:
+            report.add(simulate_battle(player_spec, enemy_spec, seed,
+                                       active_size=active_size,
+                                       max_turns=max_turns,
+                                       ai_level=ai_level,
+                                       monster_factory=monster_factory))
+        except Exception as e:
+            logger.error(f"Simulation for seed {seed} failed: {e}")
+            report.failures += 1
+            last_error = e
+
+    if seeds and report.failures == len(seeds):
+        if profile:
+            profiler.enabled = was_enabled
+        raise RuntimeError(f"All {len(seeds)} battles of the chunk failed: {last_error!r}") from last_error
+
+    if profile:
+        report.profile = BattleProfiler()
+        report.profile.merge(profiler)
+        profiler.enabled = was_enabled
+    return report
+
+
+def run_simulation(player_spec: TeamSpec,
+                   enemy_spec: TeamSpec,
+                   seeds: Iterable[int],
+                   processes: Optional[int] = None,
+                   chunk_size: int = 250,
+                   active_size: int = 1,
+                   max_turns: int = 100,
+                   ai_level: AILevel = AILevel.SMART,
+                   monster_factory: Optional[MonsterFactory] = None,
+                   profile: bool = False) -> SimulationReport:
+    """
+    Run many battles across a process pool and aggregate the results.
+
+    Args:
+        player_spec: Player team as (species, level) pairs
+        enemy_spec: Enemy team as (species, level) pairs
+        seeds: One seed per battle
+        processes: Worker count (None = CPU count, 1 = run in-process)
+        chunk_size: Seeds per worker task
+        active_size: Monsters per side on the field (1 or 3)
+        max_turns: Turn limit per battle
+        ai_level: AI level for both sides
+        monster_factory: Optional picklable monster factory
+        profile: Record battle profiler timings into SimulationReport.profile
+
+    Returns:
+        Aggregated SimulationReport
+    """
+    seeds = list(seeds)
+    chunk_size = max(1, chunk_size)
+    tasks = [
+        (list(player_spec), list(enemy_spec), seeds[i:i + chunk_size],
+         active_size, max_turns, ai_level, monster_factory, profile)
+        for i in range(0, len(seeds), chunk_size)
+    ]
+
+    report = SimulationReport()
+    if processes == 1 or len(tasks) <= 1:
+        for task in tasks:
+            report.merge(_simulate_chunk(task))
+        return report
+
+    # close()/join() instead of the context manager: pygame installs a SIGTERM
+    # handler, so Pool.terminate() can hang on workers that imported it
+    pool = multiprocessing.Pool(processes=processes)
+    try:
+        for partial in pool.imap_unordered(_simulate_chunk, tasks):
+            report.merge(partial)
+    finally:
+        pool.close()
+        pool.join()
+
+    return report
+
+
+def _parse_team(text: str) -> List[MonsterSpec]:
+    """Parse 'species:level,species:level' into a team spec."""
+    team = []
+    for entry in text.split(','):
+        species, _, level = entry.strip().partition(':')
+        key: Union[int, str] = int(species) if species.isdigit() else species
+        team.append((key, int(level or 5)))
+    return team
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Headless battle simulator")
+    parser.add_argument('--player', required=True, help="Player team, e.g. '1:10,2:8'")
+    parser.add_argument('--enemy', required=True, help="Enemy team, e.g. 'Glutstummel:10'")
+    parser.add_argument('--battles', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0, help="First seed of the sweep")
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--active', type=int, default=1, help="Active monsters per side")
+    parser.add_argument('--max-turns', type=int, default=100)
+    parser.add_argument('--profile', metavar='PATH', default=None,
+                        help="Record stage/AI/turn timings and write them as JSON to PATH")
+    args = parser.parse_args()
+
+    result = run_simulation(_parse_team(args.player), _parse_team(args.enemy),
+                            range(args.seed, args.seed + args.battles),
+                            processes=args.processes,
+                            active_size=args.active,
+                            max_turns=args.max_turns,
+                            profile=args.profile is not None)
+    if result.profile is not None:
+        result.profile.export(args.profile)
+    print(json.dumps(result.to_dict(), indent=2))
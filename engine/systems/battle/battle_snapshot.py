@@ -0,0 +1,219 @@
+"""
+Battle Snapshot Module
+Compact struct-of-arrays copy of the mutable battle state
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from engine.systems.monster_instance import StatusCondition
+
+logger = logging.getLogger(__name__)
+
+STAT_KEYS = ('hp', 'atk', 'def', 'mag', 'res', 'spd')
+STAGE_KEYS = ('atk', 'def', 'mag', 'res', 'spd', 'acc', 'eva')
+MAX_MOVES = 4
+
+# Column layout of one side's state matrix (one row per monster)
+HP, MAX_HP, MP, STATUS, STATUS_TURNS, FAINTED = range(6)
+STATS = slice(6, 6 + len(STAT_KEYS))
+STAGES = slice(STATS.stop, STATS.stop + len(STAGE_KEYS))
+PP = slice(STAGES.stop, STAGES.stop + MAX_MOVES)
+COLUMNS = PP.stop
+
+COLUMN_NAMES = (['hp', 'max_hp', 'mp', 'status', 'status_turns', 'fainted'] +
+                [f"stat.{key}" for key in STAT_KEYS] +
+                [f"stage.{key}" for key in STAGE_KEYS] +
+                [f"pp.{i}" for i in range(MAX_MOVES)])
+
+# Status values are stored as small codes: 0 is "no status", then every
+# StatusCondition member, then the plain strings legacy code assigns
+# (the enum values, the 'badly_poisoned' condition id and 'fainted')
+_STATUS_VALUES: Tuple[Any, ...] = (
+    None,
+    *StatusCondition,
+    *dict.fromkeys([*(member.value for member in StatusCondition), 'badly_poisoned', 'fainted']),
+)
+_STATUS_CODES: Dict[Any, int] = {value: code for code, value in enumerate(_STATUS_VALUES)}
+
+
+def encode_status(status: Any) -> int:
+    """Get the snapshot code of a status value."""
+    try:
+        return _STATUS_CODES[status]
+    except (KeyError, TypeError):
+        raise ValueError(f"Status {status!r} has no snapshot code") from None
+
+
+def decode_status(code: int) -> Any:
+    """Get the status value stored under a snapshot code."""
+    return _STATUS_VALUES[code]
+
+
+def _move_pp_attribute(move: Any) -> Optional[str]:
+    """Moves track PP either as current_pp (legacy) or pp."""
+    if hasattr(move, 'current_pp'):
+        return 'current_pp'
+    if hasattr(move, 'pp'):
+        return 'pp'
+    return None
+
+
+class BattleSnapshot:
+    """
+    Mutable battle state of both teams in two int32 matrices.
+
+    Each row holds one monster: hp, max_hp, mp, status code, status turns,
+    fainted flag, stats, stat stages and up to MAX_MOVES PP values (-1 for
+    empty slots). Cloning copies two small arrays instead of deep-copying
+    MonsterInstances, and diffs are a single vectorized comparison.
+    """
+
+    __slots__ = ('player', 'enemy', 'turn')
+
+    def __init__(self, player: np.ndarray, enemy: np.ndarray, turn: int = 0):
+        """
+        Initialize from state matrices.
+
+        Args:
+            player: (N, COLUMNS) player side state
+            enemy: (M, COLUMNS) enemy side state
+            turn: Turn count at capture time
+        """
+        self.player = player
+        self.enemy = enemy
+        self.turn = turn
+
+    @classmethod
+    def from_battle_state(cls, battle: Any) -> 'BattleSnapshot':
+        """
+        Capture a battle (anything with player_team, enemy_team and turn_count).
+
+        Args:
+            battle: Battle to capture
+
+        Returns:
+            New snapshot
+        """
+        return cls.from_teams(battle.player_team, battle.enemy_team,
+                              getattr(battle, 'turn_count', 0))
+
+    @classmethod
+    def from_teams(cls, player_team: Sequence[Any], enemy_team: Sequence[Any],
+                   turn: int = 0) -> 'BattleSnapshot':
+        """Capture two teams of monsters."""
+        return cls(cls._capture_side(player_team), cls._capture_side(enemy_team), turn)
+
+    @staticmethod
+    def _capture_side(team: Sequence[Any]) -> np.ndarray:
+        state = np.zeros((len(team), COLUMNS), dtype=np.int32)
+        for row, monster in zip(state, team):
+            row[HP] = monster.current_hp
+            row[MAX_HP] = monster.max_hp
+            row[MP] = getattr(monster, 'current_mp', 0)
+            row[STATUS] = encode_status(monster.status)
+            row[STATUS_TURNS] = getattr(monster, 'status_turns', 0)
+            row[FAINTED] = bool(getattr(monster, 'is_fainted', monster.current_hp <= 0))
+
+            stats = monster.stats
+            row[STATS] = [stats.get(key, 0) for key in STAT_KEYS]
+            stages = getattr(monster, 'stat_stages', None) or {}
+            row[STAGES] = [stages.get(key, 0) for key in STAGE_KEYS]
+
+            pp = row[PP]
+            pp[:] = -1
+            for slot, move in enumerate(monster.moves[:MAX_MOVES]):
+                attribute = _move_pp_attribute(move) if move else None
+                if attribute:
+                    pp[slot] = getattr(move, attribute)
+        return state
+
+    def apply_to(self, battle: Any) -> None:
+        """
+        Write the snapshot back into a battle's monsters.
+        The battle must have the same team layout as the captured one.
+
+        Args:
+            battle: Battle to restore
+        """
+        self.apply_to_teams(battle.player_team, battle.enemy_team)
+        if hasattr(battle, 'turn_count'):
+            battle.turn_count = self.turn
+
+    def apply_to_teams(self, player_team: Sequence[Any], enemy_team: Sequence[Any]) -> None:
+        """Write the snapshot back into two teams of monsters."""
+        if len(player_team) != len(self.player) or len(enemy_team) != len(self.enemy):
+            raise ValueError(
+                f"Snapshot holds {len(self.player)}v{len(self.enemy)} monsters, "
+                f"battle has {len(player_team)}v{len(enemy_team)}")
+        self._apply_side(self.player, player_team)
+        self._apply_side(self.enemy, enemy_team)
+
+    @staticmethod
+    def _apply_side(state: np.ndarray, team: Sequence[Any]) -> None:
+        from engine.systems.battle.stat_cache import invalidate_stats
+
+        for row, monster in zip(state.tolist(), team):
+            invalidate_stats(monster)
+            monster.current_hp = row[HP]
+            monster.max_hp = row[MAX_HP]
+            if hasattr(monster, 'current_mp'):
+                monster.current_mp = row[MP]
+            monster.status = decode_status(row[STATUS])
+            if hasattr(monster, 'status_turns'):
+                monster.status_turns = row[STATUS_TURNS]
+            if hasattr(monster, 'is_fainted'):
+                monster.is_fainted = bool(row[FAINTED])
+
+            stats = monster.stats
+            for key, value in zip(STAT_KEYS, row[STATS]):
+                if value or key in stats:
+                    stats[key] = value
+            stages = monster.stat_stages
+            for key, value in zip(STAGE_KEYS, row[STAGES]):
+                if value or key in stages:
+                    stages[key] = value
+
+            for move, pp in zip(monster.moves[:MAX_MOVES], row[PP]):
+                attribute = _move_pp_attribute(move) if move else None
+                if attribute and pp >= 0:
+                    setattr(move, attribute, pp)
+
+    def copy(self) -> 'BattleSnapshot':
+        """Clone the snapshot."""
+        return BattleSnapshot(self.player.copy(), self.enemy.copy(), self.turn)
+
+    def diff(self, other: 'BattleSnapshot') -> List[Tuple[str, int, str, int, int]]:
+        """
+        Compare with another snapshot of the same battle.
+
+        Args:
+            other: Snapshot to compare with
+
+        Returns:
+            (side, monster index, column name, own value, other value) per difference
+        """
+        if self.player.shape != other.player.shape or self.enemy.shape != other.enemy.shape:
+            raise ValueError("Snapshots have different team layouts")
+
+        changes = []
+        for side, mine, theirs in (('player', self.player, other.player),
+                                   ('enemy', self.enemy, other.enemy)):
+            for index, column in zip(*np.nonzero(mine != theirs)):
+                changes.append((side, int(index), COLUMN_NAMES[column],
+                                int(mine[index, column]), int(theirs[index, column])))
+        return changes
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BattleSnapshot):
+            return NotImplemented
+        return (self.turn == other.turn and
+                np.array_equal(self.player, other.player) and
+                np.array_equal(self.enemy, other.enemy))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"BattleSnapshot(turn={self.turn}, {len(self.player)}v{len(self.enemy)})"
@@ -4,8 +4,14 @@ Contains all validation logic for battle states and actions
 """
 
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+import numpy as np
+
 from engine.systems.monster_instance import MonsterInstance
+from engine.systems.battle.battle_snapshot import (
+    BattleSnapshot, HP, MAX_HP, FAINTED, STAGES
+)
 
 logger = logging.getLogger(__name__)
 
@@ -208,3 +214,41 @@ class BattleValidator:
         except Exception as e:
             logger.error(f"Error validating action: {str(e)}")
             return False
+    
+    @staticmethod
+    def validate_snapshot(snapshot: BattleSnapshot) -> bool:
+        """
+        Validate a battle snapshot without touching any monster.
+        
+        Args:
+            snapshot: Snapshot to check
+            
+        Returns:
+            True if HP, faint flags and stat stages are consistent, False otherwise
+        """
+        for side, state in (('player', snapshot.player), ('enemy', snapshot.enemy)):
+            hp = state[:, HP]
+            invalid = (hp < 0) | (hp > state[:, MAX_HP]) | (state[:, FAINTED].astype(bool) != (hp <= 0))
+            invalid |= np.any(np.abs(state[:, STAGES]) > 6, axis=1)
+            if invalid.any():
+                logger.error(f"Invalid {side} snapshot rows: {np.flatnonzero(invalid).tolist()}")
+                return False
+        return True
+    
+    @staticmethod
+    def diff_snapshots(before: BattleSnapshot,
+                       after: BattleSnapshot) -> List[Tuple[str, int, str, int, int]]:
+        """
+        List every state change between two snapshots of the same battle.
+        
+        Args:
+            before: Earlier snapshot
+            after: Later snapshot
+            
+        Returns:
+            (side, monster index, field, before, after) per changed value
+        """
+        changes = before.diff(after)
+        for side, index, field, old, new in changes:
+            logger.debug(f"{side}[{index}].{field}: {old} -> {new}")
+        return changes
@@ -72,7 +72,7 @@ class CommandCollector:
         self.command_history: List[Dict[str, MonsterCommand]] = []
         self.current_phase = CommandPhase.WAITING
         self.current_input_index = 0
-        self.battle_ai = BattleAI()
+        self.battle_ai = getattr(battle_state, 'battle_ai', None) or BattleAI()
         
         # Track which monsters need commands
         self.player_monsters_needing_commands: List[Tuple[str, MonsterInstance]] = []
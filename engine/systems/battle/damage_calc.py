@@ -14,6 +14,8 @@ import time
 
 # Import trait system
 from engine.systems.battle.monster_traits import get_trait_database, TraitManager, TraitTrigger
+from engine.systems.battle.battle_profiler import profiler
+from engine.systems.battle.stat_cache import effective_stats
 
 if TYPE_CHECKING:
     from engine.systems.monster_instance import MonsterInstance
@@ -31,6 +33,44 @@ class CriticalTier(IntEnum):
     DEVASTATING = 4
 
 
+# Critical multipliers per tier (DQM-style)
+CRITICAL_MULTIPLIERS = {
+    CriticalTier.NORMAL: 2.0,      # DQM standard is 2x
+    CriticalTier.IMPROVED: 2.25,
+    CriticalTier.GUARANTEED: 2.5,
+    CriticalTier.DEVASTATING: 3.0  # Rare super critical
+}
+
+# Critical hit chance by crit stage (DQM rates), scaled by CRITICAL_BASE_RATIO
+CRITICAL_BASE_RATIO = 1/32
+CRITICAL_STAGE_CHANCES = (1/32, 1/16, 1/8, 1/4, 1/2)
+
+# Tier of a landed critical hit: upper bound of the tier roll per tier
+CRITICAL_TIER_THRESHOLDS = (
+    (0.7, CriticalTier.NORMAL),
+    (0.9, CriticalTier.IMPROVED),
+    (0.98, CriticalTier.GUARANTEED),
+    (1.0, CriticalTier.DEVASTATING)
+)
+
+# Weather and terrain effects on damage, by move type
+WEATHER_MODIFIERS = {
+    'sunny': {'Feuer': 1.5, 'Wasser': 0.5},
+    'rain': {'Wasser': 1.5, 'Feuer': 0.5},
+    'sandstorm': {'Erde': 1.2},
+    'hail': {'Luft': 1.2},
+    'fog': {'Mystik': 1.3, 'Energie': 0.7}
+}
+
+TERRAIN_MODIFIERS = {
+    'grassy': {'Pflanze': 1.3},
+    'electric': {'Energie': 1.3},
+    'psychic': {'Mystik': 1.3},
+    'misty': {'Chaos': 0.5},
+    'volcanic': {'Feuer': 1.4, 'Wasser': 0.6}
+}
+
+
 # Damage types for special calculations
 class DamageType(Enum):
     """Types of damage for special mechanics."""
@@ -112,17 +152,304 @@ class MultiHitResult(DamageResult):
         return sum(self.individual_damages)
 
 
+# Direct (name-based) traits each trait stage reacts to
+DIRECT_TRAIT_STAGES = {
+    'pre_damage': frozenset({"Attack Boost"}),
+    'on_attack': frozenset({"Critical Master", "Attack Boost"}),
+    'on_defend': frozenset({"Metal Body", "Defense Boost", "Counter"})
+}
+
+
+@lru_cache(maxsize=1024)
+def direct_trait_plan(trait_names: Tuple[str, ...]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Dispatch table for a monster's direct trait list.
+    
+    Args:
+        trait_names: Monster's traits in order
+        
+    Returns:
+        Stage name -> known traits handled by that stage, in original order
+    """
+    trait_db = get_trait_database()
+    known = [name for name in trait_names if trait_db.get_trait(name)]
+    return {stage: tuple(name for name in known if name in handled)
+            for stage, handled in DIRECT_TRAIT_STAGES.items()}
+
+
+# Direct traits that resist one element: name -> (element, damage multiplier)
+TRAIT_RESISTANCES = {
+    "Fire Breath Guard": ("fire", 0.5),
+    "Ice Breath Guard": ("ice", 0.5),
+    "Bang Ward": ("explosion", 0.5),
+}
+
+
+# Column order of stat and stage arrays for batch calculations
+BATCH_STATS = ('atk', 'def', 'mag', 'res', 'spd')
+BATCH_STAGES = ('atk', 'def', 'mag', 'res', 'spd', 'acc', 'eva')
+
+
+# --- Shared stage arithmetic -------------------------------------------------
+# The dict-based and the compiled pipeline only differ in how they read their
+# context; the rules themselves live here so both paths stay identical.
+
+def has_active_traits(attacker: Any, defender: Any) -> bool:
+    """
+    Check if any trait stage can affect this attacker/defender pair.
+    
+    Direct traits only count when direct_trait_plan() or TRAIT_RESISTANCES
+    knows them, so species traits without a battle effect keep the trait
+    stages off; a TraitManager counts when it has traits for the triggers
+    the damage stages process.
+    """
+    traits = getattr(attacker, 'traits', None)
+    if traits:
+        plan = direct_trait_plan(tuple(traits))
+        if plan['pre_damage'] or plan['on_attack']:
+            return True
+    traits = getattr(defender, 'traits', None)
+    if traits:
+        if direct_trait_plan(tuple(traits))['on_defend']:
+            return True
+        if any(name in TRAIT_RESISTANCES for name in traits):
+            return True
+    manager = getattr(attacker, 'trait_manager', None)
+    if manager is not None and (manager.has_trigger(TraitTrigger.ALWAYS) or
+                                manager.has_trigger(TraitTrigger.ON_ATTACK)):
+        return True
+    manager = getattr(defender, 'trait_manager', None)
+    return manager is not None and (manager.has_trigger(TraitTrigger.ON_DEFEND) or
+                                    bool(manager.get_element_resistances()))
+
+
+def roll_accuracy(result: 'DamageResult', move: 'Move', attacker: 'MonsterInstance',
+                  defender: 'MonsterInstance', rng: random.Random) -> None:
+    """Roll to hit and mark the result as missed on failure."""
+    # Moves with -1 accuracy always hit
+    if move.accuracy < 0:
+        return
+    
+    # Combined accuracy/evasion stage
+    combined_stage = max(-6, min(6, attacker.stat_stages.get('acc', 0) -
+                                 defender.stat_stages.get('eva', 0)))
+    if combined_stage >= 0:
+        stage_multiplier = (3 + combined_stage) / 3
+    else:
+        stage_multiplier = 3 / (3 - combined_stage)
+    
+    final_accuracy = move.accuracy * stage_multiplier
+    if attacker.status == 'paralysis':
+        final_accuracy *= 0.75
+    
+    if rng.uniform(0, 100) >= final_accuracy:
+        result.missed = True
+        result.type_text = "Daneben!"
+
+
+def battle_stats(move: 'Move', attacker: 'MonsterInstance', defender: 'MonsterInstance',
+                 modified: Optional[Dict[str, int]],
+                 get_effective_stat: Callable[[Any, str], int]) -> Tuple[int, int]:
+    """
+    Attack and defense stat used by a move.
+    
+    Args:
+        modified: Attacker stats changed by pre-damage traits, if any
+        get_effective_stat: Staged stat lookup
+        
+    Returns:
+        (attack_stat, defense_stat)
+    """
+    attack_key, defense_key = ('atk', 'def') if move.category == 'phys' else ('mag', 'res')
+    if modified is not None and attack_key in modified:
+        attack_stat = modified[attack_key]
+    else:
+        attack_stat = get_effective_stat(attacker, attack_key)
+    return attack_stat, get_effective_stat(defender, defense_key)
+
+
+def base_damage(level: int, power: int, attack_stat: int, defense_stat: int) -> int:
+    """Base damage formula."""
+    return int((((2 * level / 5 + 2) * power * attack_stat / defense_stat) / 50) + 2)
+
+
+def critical_chance(attacker: 'MonsterInstance', move: 'Move') -> float:
+    """Chance that a move lands a critical hit of any tier."""
+    base_ratio = CRITICAL_BASE_RATIO
+    
+    # Check for Critical Master trait (both systems)
+    if hasattr(attacker, 'trait_manager') and attacker.trait_manager.has_trait('Critical Master'):
+        base_ratio *= 2  # Double critical chance
+    
+    if hasattr(attacker, 'traits') and 'Critical Master' in attacker.traits:
+        base_ratio *= 2  # Double critical chance
+    
+    # Get critical stage
+    crit_stage = 0
+    crit_ratio = getattr(move, 'crit_ratio', 0)
+    if crit_ratio > 1/4:
+        crit_stage = 2
+    elif crit_ratio > 1/8:
+        crit_stage = 1
+    
+    return CRITICAL_STAGE_CHANCES[min(crit_stage, 4)] * base_ratio
+
+
+def critical_tier_weights() -> Dict[CriticalTier, float]:
+    """Share of landed critical hits per tier (expected-value form of the tier roll)."""
+    weights = {}
+    lower = 0.0
+    for upper, tier in CRITICAL_TIER_THRESHOLDS:
+        weights[tier] = upper - lower
+        lower = upper
+    return weights
+
+
+def roll_critical_tier(chance: float, rng: random.Random) -> CriticalTier:
+    """Roll for a critical hit and, if it lands, for its tier."""
+    if rng.random() >= chance:
+        return CriticalTier.NONE
+    
+    tier_roll = rng.random()
+    for upper, tier in CRITICAL_TIER_THRESHOLDS:
+        if tier_roll < upper:
+            return tier
+    return CRITICAL_TIER_THRESHOLDS[-1][1]
+
+
+def apply_critical(result: 'DamageResult', crit_tier: CriticalTier, move: 'Move',
+                   attacker: 'MonsterInstance', defender: 'MonsterInstance',
+                   attack_stat: Any, defense_stat: Any) -> Tuple[Any, Any]:
+    """
+    Apply a rolled critical tier to the result.
+    
+    Returns:
+        (attack_stat, defense_stat) with stages that hurt the attacker ignored
+    """
+    result.critical_tier = crit_tier
+    if crit_tier == CriticalTier.NONE:
+        return attack_stat, defense_stat
+    
+    result.is_critical = True
+    
+    # Recalculate stats ignoring stages
+    attack_key, defense_key = ('atk', 'def') if move.category == 'phys' else ('mag', 'res')
+    if attacker.stat_stages.get(attack_key, 0) < 0:
+        attack_stat = attacker.stats[attack_key]
+    if defender.stat_stages.get(defense_key, 0) > 0:
+        defense_stat = defender.stats[defense_key]
+    
+    # Apply critical multiplier based on tier (DQM-style)
+    result.damage = int(result.damage * CRITICAL_MULTIPLIERS.get(crit_tier, 1.5))
+    result.modifiers_applied.append(f"Critical {crit_tier.name}")
+    return attack_stat, defense_stat
+
+
+def apply_stab(result: 'DamageResult', move: 'Move', attacker: 'MonsterInstance') -> None:
+    """Apply the same-type attack bonus."""
+    if move.type in attacker.species.types:
+        result.has_stab = True
+        result.damage = int(result.damage * 1.2)
+        result.modifiers_applied.append("STAB")
+
+
+def apply_effectiveness(result: 'DamageResult', effectiveness: float) -> None:
+    """Apply a type effectiveness multiplier."""
+    result.effectiveness = effectiveness
+    result.damage = int(result.damage * effectiveness)
+    result.effectiveness_text = result.get_effectiveness_text()
+    result.type_text = result.effectiveness_text  # Compatibility
+    
+    if effectiveness != 1.0:
+        result.modifiers_applied.append(f"Type {effectiveness}x")
+
+
+def apply_field_modifier(result: 'DamageResult', modifiers: Dict[str, Dict[str, float]],
+                         condition: Optional[str], move_type: str, label: str) -> None:
+    """Apply a weather or terrain modifier table."""
+    mods = modifiers.get(condition)
+    if mods is not None:
+        mod = mods.get(move_type)
+        if mod is not None:
+            result.damage = int(result.damage * mod)
+            result.modifiers_applied.append(f"{label} {condition}")
+
+
+def apply_status_modifier(result: 'DamageResult', move: 'Move', attacker: 'MonsterInstance') -> None:
+    """Apply status effect modifiers."""
+    # Burn reduces physical damage
+    if attacker.status == 'burn' and move.category == 'phys':
+        result.damage = int(result.damage * 0.5)
+        result.modifiers_applied.append("Burn")
+
+
+def apply_random_spread(result: 'DamageResult', rng: random.Random) -> None:
+    """Apply random damage spread (DQM uses 7/8 to 9/8)."""
+    result.damage = int(result.damage * rng.uniform(0.875, 1.125))
+
+
+def finalize_damage(result: 'DamageResult') -> None:
+    """Minimum damage is 1 (unless immune or missed)."""
+    if result.effectiveness > 0 and result.damage < 1 and not result.missed:
+        result.damage = 1
+
+
+@dataclass
+class BatchDamageResult:
+    """
+    Damage estimates for every (attacker, move, defender) combination.
+    All arrays have shape (attackers, moves, defenders).
+    """
+    expected: np.ndarray        # Mean damage including misses and crits
+    minimum: np.ndarray         # Lowest non-critical roll
+    maximum: np.ndarray         # Highest non-critical roll
+    ko_probability: np.ndarray  # Chance that one use knocks the defender out
+    hit_chance: np.ndarray
+    effectiveness: np.ndarray
+    
+    # Source objects when built by preview_batch
+    attackers: List[Any] = field(default_factory=list)
+    moves: List[List[Any]] = field(default_factory=list)
+    defenders: List[Any] = field(default_factory=list)
+    
+    def index(self, attacker: Any, move: Any, defender: Any) -> Optional[Tuple[int, int, int]]:
+        """
+        Find the array index of a combination built by preview_batch.
+        
+        Returns:
+            (attacker, move, defender) index or None if not part of the batch
+        """
+        for a, candidate in enumerate(self.attackers):
+            if candidate is not attacker:
+                continue
+            for m, candidate_move in enumerate(self.moves[a]):
+                if candidate_move is not move:
+                    continue
+                for d, candidate_defender in enumerate(self.defenders):
+                    if candidate_defender is defender:
+                        return a, m, d
+        return None
+
+
 class DamageCalculationPipeline:
     """
     Pipeline for damage calculation with stages.
     Allows for modular and extensible damage calculation.
     """
     
-    def __init__(self):
-        """Initialize calculation pipeline."""
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize calculation pipeline.
+        
+        Args:
+            seed: Seed for the RNG shared by calculate_damage calls
+        """
         self.stages: List[Tuple[str, Callable, int]] = []
+        self._compiled: Optional['CompiledDamagePipeline'] = None
         self.setup_default_stages()
         self.trait_manager = None  # Will be set if traits are enabled
+        self.rng = random.Random(seed)
+        self._type_chart = None
     
     def setup_default_stages(self) -> None:
         """Set up default calculation stages."""
@@ -146,13 +473,30 @@ class DamageCalculationPipeline:
         """Add a calculation stage."""
         self.stages.append((name, function, priority))
         self.stages.sort(key=lambda x: x[2])
+        self._compiled = None
     
     def remove_stage(self, name: str) -> None:
         """Remove a calculation stage."""
         self.stages = [(n, f, p) for n, f, p in self.stages if n != name]
+        self._compiled = None
+    
+    def compile(self) -> 'CompiledDamagePipeline':
+        """
+        Freeze the current stage list into a compiled pipeline.
+        The result is cached until add_stage/remove_stage is called.
+        
+        Returns:
+            CompiledDamagePipeline for the current stages
+        """
+        if self._compiled is None:
+            self._compiled = CompiledDamagePipeline(self)
+        return self._compiled
     
     def execute(self, context: Dict[str, Any]) -> DamageResult:
         """Execute the calculation pipeline."""
+        if profiler.enabled:
+            return self._execute_profiled(context)
+        
         for name, function, _ in self.stages:
             function(context)
             
@@ -161,6 +505,19 @@ class DamageCalculationPipeline:
                 break
         
         return context['result']
+    
+    def _execute_profiled(self, context: Dict[str, Any]) -> DamageResult:
+        """Execute the pipeline, recording each stage's time."""
+        perf_counter = time.perf_counter
+        for name, function, _ in self.stages:
+            start = perf_counter()
+            function(context)
+            profiler.record(f"damage.stage.{name}", perf_counter() - start)
+            
+            if context['result'].missed or context['result'].blocked:
+                break
+        
+        return context['result']
 
     def calculate_damage(self, attacker: 'MonsterInstance', 
                         defender: 'MonsterInstance', 
@@ -177,12 +534,17 @@ class DamageCalculationPipeline:
             DamageResult with calculated damage
         """
         try:
+            if self._type_chart is None:
+                from engine.systems.types import type_chart
+                self._type_chart = type_chart
+            
             # Create context for pipeline
             context = {
                 'attacker': attacker,
                 'defender': defender,
                 'move': move,
-                'rng': random.Random(),
+                'type_chart': self._type_chart,
+                'rng': self.rng,
                 'result': DamageResult(
                     damage=0,
                     is_critical=False,
@@ -219,39 +581,8 @@ class DamageCalculationPipeline:
     
     def _accuracy_stage(self, context: Dict[str, Any]) -> None:
         """Check if move hits."""
-        move = context['move']
-        attacker = context['attacker']
-        defender = context['defender']
-        rng = context['rng']
-        
-        # Moves with -1 accuracy always hit
-        if move.accuracy < 0:
-            return
-        
-        # Get accuracy and evasion stages
-        acc_stage = attacker.stat_stages.get('acc', 0)
-        eva_stage = defender.stat_stages.get('eva', 0)
-        
-        # Combined stage for accuracy calculation
-        combined_stage = max(-6, min(6, acc_stage - eva_stage))
-        
-        # Accuracy multiplier from stages
-        if combined_stage >= 0:
-            stage_multiplier = (3 + combined_stage) / 3
-        else:
-            stage_multiplier = 3 / (3 - combined_stage)
-        
-        # Final accuracy
-        final_accuracy = move.accuracy * stage_multiplier
-        
-        # Status effects
-        if attacker.status == 'paralysis':
-            final_accuracy *= 0.75
-        
-        # Roll for hit
-        if rng.uniform(0, 100) >= final_accuracy:
-            context['result'].missed = True
-            context['result'].type_text = "Daneben!"
+        roll_accuracy(context['result'], context['move'], context['attacker'],
+                      context['defender'], context['rng'])
     
     def _base_damage_stage(self, context: Dict[str, Any]) -> None:
         """Calculate base damage."""
@@ -260,37 +591,19 @@ class DamageCalculationPipeline:
         
         move = context['move']
         attacker = context['attacker']
-        defender = context['defender']
         
         # Support moves don't deal damage
         if move.category == 'support' or move.power <= 0:
             context['result'].damage = 0
             return
         
-        # Get stats (use modified stats if available)
-        if move.category == 'phys':
-            if 'attacker_stats_modified' in context and 'atk' in context['attacker_stats_modified']:
-                attack_stat = context['attacker_stats_modified']['atk']
-            else:
-                attack_stat = self._get_effective_stat(attacker, 'atk')
-            defense_stat = self._get_effective_stat(defender, 'def')
-        else:  # 'mag'
-            if 'attacker_stats_modified' in context and 'mag' in context['attacker_stats_modified']:
-                attack_stat = context['attacker_stats_modified']['mag']
-            else:
-                attack_stat = self._get_effective_stat(attacker, 'mag')
-            defense_stat = self._get_effective_stat(defender, 'res')
-        
         # Store for critical hit stage
+        attack_stat, defense_stat = battle_stats(move, attacker, context['defender'],
+                                                 context.get('attacker_stats_modified'),
+                                                 self._get_effective_stat)
         context['attack_stat'] = attack_stat
         context['defense_stat'] = defense_stat
-        
-        # Base damage formula
-        level = attacker.level
-        power = move.power
-        
-        base_damage = (((2 * level / 5 + 2) * power * attack_stat / defense_stat) / 50) + 2
-        context['result'].damage = int(base_damage)
+        context['result'].damage = base_damage(attacker.level, move.power, attack_stat, defense_stat)
     
     def _critical_stage(self, context: Dict[str, Any]) -> None:
         """Check and apply critical hit."""
@@ -298,74 +611,30 @@ class DamageCalculationPipeline:
             return
         
         attacker = context['attacker']
-        defender = context['defender']
         move = context['move']
-        rng = context['rng']
-        
-        # Determine critical tier
-        crit_tier = self._determine_critical_tier(attacker, move, rng)
-        context['result'].critical_tier = crit_tier
-        
-        if crit_tier != CriticalTier.NONE:
-            context['result'].is_critical = True
-            
-            # Recalculate stats ignoring stages
-            if move.category == 'phys':
-                if attacker.stat_stages.get('atk', 0) < 0:
-                    context['attack_stat'] = attacker.stats['atk']
-                if defender.stat_stages.get('def', 0) > 0:
-                    context['defense_stat'] = defender.stats['def']
-            else:
-                if attacker.stat_stages.get('mag', 0) < 0:
-                    context['attack_stat'] = attacker.stats['mag']
-                if defender.stat_stages.get('res', 0) > 0:
-                    context['defense_stat'] = defender.stats['res']
-            
-            # Apply critical multiplier based on tier (DQM-style)
-            multipliers = {
-                CriticalTier.NORMAL: 2.0,      # DQM standard is 2x
-                CriticalTier.IMPROVED: 2.25,
-                CriticalTier.GUARANTEED: 2.5,
-                CriticalTier.DEVASTATING: 3.0  # Rare super critical
-            }
-            
-            crit_multiplier = multipliers.get(crit_tier, 1.5)
-            context['result'].damage = int(context['result'].damage * crit_multiplier)
-            context['result'].modifiers_applied.append(f"Critical {crit_tier.name}")
+        crit_tier = self._determine_critical_tier(attacker, move, context['rng'])
+        attack_stat, defense_stat = apply_critical(
+            context['result'], crit_tier, move, attacker, context['defender'],
+            context.get('attack_stat'), context.get('defense_stat'))
+        if context['result'].is_critical:
+            context['attack_stat'] = attack_stat
+            context['defense_stat'] = defense_stat
     
     def _stab_stage(self, context: Dict[str, Any]) -> None:
         """Apply STAB bonus."""
         if context['result'].damage == 0:
             return
-        
-        move = context['move']
-        attacker = context['attacker']
-        
-        if move.type in attacker.species.types:
-            context['result'].has_stab = True
-            context['result'].damage = int(context['result'].damage * 1.2)
-            context['result'].modifiers_applied.append("STAB")
+        apply_stab(context['result'], context['move'], context['attacker'])
     
     def _type_effectiveness_stage(self, context: Dict[str, Any]) -> None:
         """Apply type effectiveness."""
         if context['result'].damage == 0:
             return
         
-        move = context['move']
-        defender = context['defender']
-        type_chart = context['type_chart']
-        
-        effectiveness = type_chart.calculate_type_multiplier(
-            move.type, defender.species.types
+        effectiveness = context['type_chart'].calculate_type_multiplier(
+            context['move'].type, context['defender'].species.types
         )
-        
-        context['result'].effectiveness = effectiveness
-        context['result'].damage = int(context['result'].damage * effectiveness)
-        context['result'].effectiveness_text = context['result'].get_effectiveness_text()
-        context['result'].type_text = context['result'].effectiveness_text  # Compatibility
-        
-        if effectiveness != 1.0:
-            context['result'].modifiers_applied.append(f"Type {effectiveness}x")
+        apply_effectiveness(context['result'], effectiveness)
     
     def _trait_resistances_stage(self, context: Dict[str, Any]) -> None:
         """Apply trait-based elemental resistances."""
@@ -377,12 +646,6 @@ class DamageCalculationPipeline:
         
         # Check for elemental resistance traits
         if hasattr(defender, 'traits'):
-            resistance_map = {
-                "Fire Breath Guard": ("fire", 0.5),
-                "Ice Breath Guard": ("ice", 0.5),
-                "Bang Ward": ("explosion", 0.5),
-            }
-            
             # Get move element (try different attributes)
             move_element = None
             if hasattr(move, 'element'):
@@ -392,8 +655,8 @@ class DamageCalculationPipeline:
             
             if move_element:
                 for trait_name in defender.traits:
-                    if trait_name in resistance_map:
-                        resist_element, resist_value = resistance_map[trait_name]
+                    if trait_name in TRAIT_RESISTANCES:
+                        resist_element, resist_value = TRAIT_RESISTANCES[trait_name]
                         if move_element == resist_element:
                             context['result'].damage = int(context['result'].damage * resist_value)
                             context['result'].modifiers_applied.append(f"Trait: {trait_name}")
@@ -415,25 +678,9 @@ class DamageCalculationPipeline:
             return
         
         weather = context.get('weather')
-        if not weather:
-            return
-        
-        move = context['move']
-        damage = context['result'].damage
-        
-        # Weather effects on damage
-        weather_mods = {
-            'sunny': {'Feuer': 1.5, 'Wasser': 0.5},
-            'rain': {'Wasser': 1.5, 'Feuer': 0.5},
-            'sandstorm': {'Erde': 1.2},
-            'hail': {'Luft': 1.2},
-            'fog': {'Mystik': 1.3, 'Energie': 0.7}
-        }
-        
-        if weather in weather_mods and move.type in weather_mods[weather]:
-            mod = weather_mods[weather][move.type]
-            context['result'].damage = int(damage * mod)
-            context['result'].modifiers_applied.append(f"Weather {weather}")
+        if weather:
+            apply_field_modifier(context['result'], WEATHER_MODIFIERS, weather,
+                                 context['move'].type, "Weather")
     
     def _terrain_stage(self, context: Dict[str, Any]) -> None:
         """Apply terrain effects."""
@@ -441,56 +688,26 @@ class DamageCalculationPipeline:
             return
         
         terrain = context.get('terrain')
-        if not terrain:
-            return
-        
-        move = context['move']
-        damage = context['result'].damage
-        
-        # Terrain effects on damage
-        terrain_mods = {
-            'grassy': {'Pflanze': 1.3},
-            'electric': {'Energie': 1.3},
-            'psychic': {'Mystik': 1.3},
-            'misty': {'Chaos': 0.5},
-            'volcanic': {'Feuer': 1.4, 'Wasser': 0.6}
-        }
-        
-        if terrain in terrain_mods and move.type in terrain_mods[terrain]:
-            mod = terrain_mods[terrain][move.type]
-            context['result'].damage = int(damage * mod)
-            context['result'].modifiers_applied.append(f"Terrain {terrain}")
+        if terrain:
+            apply_field_modifier(context['result'], TERRAIN_MODIFIERS, terrain,
+                                 context['move'].type, "Terrain")
     
     def _status_stage(self, context: Dict[str, Any]) -> None:
         """Apply status effect modifiers."""
         if context['result'].damage == 0:
             return
-        
-        attacker = context['attacker']
-        move = context['move']
-        
-        # Burn reduces physical damage
-        if attacker.status == 'burn' and move.category == 'phys':
-            context['result'].damage = int(context['result'].damage * 0.5)
-            context['result'].modifiers_applied.append("Burn")
+        apply_status_modifier(context['result'], context['move'], context['attacker'])
     
     def _random_stage(self, context: Dict[str, Any]) -> None:
         """Apply random damage spread (DQM uses 7/8 to 9/8)."""
         if context['result'].damage == 0:
             return
-        
-        rng = context['rng']
-        # DQM damage range: 87.5% to 112.5% of base damage
-        random_factor = rng.uniform(0.875, 1.125)
-        context['result'].damage = int(context['result'].damage * random_factor)
+        apply_random_spread(context['result'], context['rng'])
     
     def _finalize_stage(self, context: Dict[str, Any]) -> None:
         """Finalize damage calculation."""
         result = context['result']
-        
-        # Minimum damage is 1 (unless immune or missed)
-        if result.effectiveness > 0 and result.damage < 1 and not result.missed:
-            result.damage = 1
+        finalize_damage(result)
         
         # Set calculation time
         result.calculation_time = time.time() - context.get('start_time', time.time())
@@ -505,13 +722,7 @@ class DamageCalculationPipeline:
         
         # Process direct traits for stat boosts
         if hasattr(attacker, 'traits'):
-            trait_db = get_trait_database()
-            
-            for trait_name in attacker.traits:
-                trait = trait_db.get_trait(trait_name)
-                if not trait:
-                    continue
-                
+            for trait_name in direct_trait_plan(tuple(attacker.traits))['pre_damage']:
                 # Attack Boost trait
                 if trait_name == "Attack Boost":
                     if 'attacker_stats_modified' not in context:
@@ -519,11 +730,12 @@ class DamageCalculationPipeline:
                     context['attacker_stats_modified']['atk'] = int(context['attacker_stats_modified']['atk'] * 1.1)
         
         # Legacy trait manager support
-        if hasattr(attacker, 'trait_manager'):
+        if hasattr(attacker, 'trait_manager') and attacker.trait_manager.has_trigger(TraitTrigger.ALWAYS):
             trait_context = {
                 'phase': 'pre_damage',
                 'stats': attacker.stats.copy(),
-                'hp_percent': attacker.current_hp / max(1, attacker.max_hp)
+                'hp_percent': attacker.current_hp / max(1, attacker.max_hp),
+                'rng': context['rng']
             }
             attacker.trait_manager.process_traits(TraitTrigger.ALWAYS, trait_context)
             # Apply stat modifications
@@ -539,16 +751,10 @@ class DamageCalculationPipeline:
         
         # Check for direct traits on attacker
         if hasattr(attacker, 'traits'):
-            trait_db = get_trait_database()
-            
-            for trait_name in attacker.traits:
-                trait = trait_db.get_trait(trait_name)
-                if not trait:
-                    continue
-                
+            for trait_name in direct_trait_plan(tuple(attacker.traits))['on_attack']:
                 # Critical Master - additional crit chance
                 if trait_name == "Critical Master" and not context['result'].is_critical:
-                    if random.random() < 0.0625:  # Additional 1/16 chance
+                    if context['rng'].random() < 0.0625:  # Additional 1/16 chance
                         context['result'].is_critical = True
                         context['result'].damage = int(context['result'].damage * 2)
                         context['result'].modifiers_applied.append("Trait: Critical Master")
@@ -559,12 +765,13 @@ class DamageCalculationPipeline:
                     context['result'].modifiers_applied.append("Trait: Attack Boost")
         
         # Legacy trait manager support
-        if hasattr(attacker, 'trait_manager'):
+        if hasattr(attacker, 'trait_manager') and attacker.trait_manager.has_trigger(TraitTrigger.ON_ATTACK):
             trait_context = {
                 'phase': 'on_attack',
                 'damage': context['result'].damage,
                 'hp_percent': attacker.current_hp / max(1, attacker.max_hp),
-                'is_critical': context['result'].is_critical
+                'is_critical': context['result'].is_critical,
+                'rng': context['rng']
             }
             
             effects = attacker.trait_manager.process_traits(TraitTrigger.ON_ATTACK, trait_context)
@@ -587,19 +794,13 @@ class DamageCalculationPipeline:
         
         # Check for direct traits on defender
         if hasattr(defender, 'traits'):
-            trait_db = get_trait_database()
-            
-            for trait_name in defender.traits:
-                trait = trait_db.get_trait(trait_name)
-                if not trait:
-                    continue
-                
+            for trait_name in direct_trait_plan(tuple(defender.traits))['on_defend']:
                 # Metal Body - massive defense
                 if trait_name == "Metal Body":
                     if context['result'].damage < 1000:
-                        context['result'].damage = random.choice([0, 1])  # 0 or 1 damage
+                        context['result'].damage = context['rng'].choice([0, 1])  # 0 or 1 damage
                     else:
-                        context['result'].damage = random.randint(1, 2)  # 1-2 for strong attacks
+                        context['result'].damage = context['rng'].randint(1, 2)  # 1-2 for strong attacks
                     context['result'].modifiers_applied.append("Trait: Metal Body")
                     return  # No other defense traits apply
                 
@@ -610,20 +811,21 @@ class DamageCalculationPipeline:
                 
                 # Counter trait
                 elif trait_name == "Counter":
-                    if random.random() < 0.25:  # 25% counter chance
+                    if context['rng'].random() < 0.25:  # 25% counter chance
                         # Set a flag for counter-attack
                         if not hasattr(defender, 'pending_counter'):
                             defender.pending_counter = context['attacker']
                         context['result'].modifiers_applied.append("Trait: Counter activated")
         
         # Legacy trait manager support
-        if hasattr(defender, 'trait_manager'):
+        if hasattr(defender, 'trait_manager') and defender.trait_manager.has_trigger(TraitTrigger.ON_DEFEND):
             trait_context = {
                 'phase': 'on_defend',
                 'damage': context['result'].damage,
                 'hp_percent': defender.current_hp / max(1, defender.max_hp),
                 'attacker': context['attacker'],
-                'move': context['move']
+                'move': context['move'],
+                'rng': context['rng']
             }
             
             effects = defender.trait_manager.process_traits(TraitTrigger.ON_DEFEND, trait_context)
@@ -659,67 +861,320 @@ class DamageCalculationPipeline:
             # The counter-attack will be handled by the battle system
     
     def _has_traits(self, context: Dict[str, Any]) -> bool:
-        """Check if traits system is enabled."""
-        attacker = context.get('attacker')
-        defender = context.get('defender')
-        return (hasattr(attacker, 'traits') or hasattr(defender, 'traits') or 
-                hasattr(attacker, 'trait_manager') or hasattr(defender, 'trait_manager'))
+        """Check if any trait stage can affect this calculation."""
+        return has_active_traits(context.get('attacker'), context.get('defender'))
     
     def _get_effective_stat(self, monster: 'MonsterInstance', stat: str) -> int:
-        """Get effective stat with stages."""
-        base_stat = monster.stats.get(stat, 100)
-        stage = monster.stat_stages.get(stat, 0)
-        
-        if stage >= 0:
-            multiplier = (2 + stage) / 2
-        else:
-            multiplier = 2 / (2 - stage)
-        
-        return int(base_stat * multiplier)
+        """Get effective stat with stages (cached per monster)."""
+        cache = getattr(monster, '_stat_cache', None)
+        if cache is None:
+            cache = effective_stats(monster)
+        return cache.staged(stat)
     
     def _determine_critical_tier(self, attacker: 'MonsterInstance', 
                                 move: 'Move', rng: random.Random) -> CriticalTier:
         """Determine critical hit tier."""
-        # Base critical ratio (DQM uses 1/32)
-        base_ratio = 1/32
-        
-        # Check for Critical Master trait (both systems)
-        if hasattr(attacker, 'trait_manager') and attacker.trait_manager.has_trait('Critical Master'):
-            base_ratio *= 2  # Double critical chance
-        
-        if hasattr(attacker, 'traits') and 'Critical Master' in attacker.traits:
-            base_ratio *= 2  # Double critical chance
-        
-        # Get critical stage
-        crit_stage = 0
-        if hasattr(move, 'crit_ratio'):
-            crit_ratio = move.crit_ratio
-            if crit_ratio > 1/4:
-                crit_stage = 2
-            elif crit_ratio > 1/8:
-                crit_stage = 1
-        
-        # Critical hit chance by stage (DQM rates)
-        chances = [1/32, 1/16, 1/8, 1/4, 1/2]
-        chance = chances[min(crit_stage, 4)]
-        
-        # Apply trait multiplier
-        chance *= base_ratio
-        
-        # Roll for critical
-        if rng.random() >= chance:
-            return CriticalTier.NONE
-        
-        # Determine tier based on additional roll
-        tier_roll = rng.random()
-        if tier_roll < 0.7:
-            return CriticalTier.NORMAL
-        elif tier_roll < 0.9:
-            return CriticalTier.IMPROVED
-        elif tier_roll < 0.98:
-            return CriticalTier.GUARANTEED
+        return roll_critical_tier(critical_chance(attacker, move), rng)
+
+
+# Marks context fields that have not been set for the current calculation
+_UNSET = object()
+
+
+class DamageContext:
+    """
+    Slotted per-calculation context for the compiled pipeline.
+    Implements the mapping protocol so dict-based stages run on it unchanged.
+    """
+    
+    __slots__ = ('attacker', 'defender', 'move', 'type_chart', 'weather', 'terrain',
+                 'rng', 'result', 'start_time', 'attack_stat', 'defense_stat',
+                 'attacker_stats_modified', 'counter_attack', 'thorns_damage', 'extras')
+    
+    _FIELDS = frozenset(__slots__) - {'extras'}
+    
+    def __init__(self, attacker: 'MonsterInstance' = None, defender: 'MonsterInstance' = None,
+                 move: 'Move' = None, type_chart: Any = _UNSET, weather: Optional[str] = None,
+                 terrain: Optional[str] = None, rng: Any = _UNSET, start_time: Any = _UNSET):
+        """Initialize a context, empty unless participants are given."""
+        self.extras: Dict[str, Any] = {}
+        self.reset(attacker, defender, move, type_chart, weather, terrain, rng, start_time)
+    
+    def reset(self, attacker: 'MonsterInstance', defender: 'MonsterInstance', move: 'Move',
+              type_chart: Any = _UNSET, weather: Optional[str] = None,
+              terrain: Optional[str] = None, rng: Any = _UNSET,
+              start_time: Any = _UNSET) -> None:
+        """Clear all per-calculation state and bind new participants."""
+        self.attacker = attacker
+        self.defender = defender
+        self.move = move
+        self.type_chart = type_chart
+        self.weather = weather
+        self.terrain = terrain
+        self.rng = rng
+        self.result = _UNSET
+        self.start_time = start_time
+        self.attack_stat = _UNSET
+        self.defense_stat = _UNSET
+        self.attacker_stats_modified = _UNSET
+        self.counter_attack = _UNSET
+        self.thorns_damage = _UNSET
+        if self.extras:
+            self.extras.clear()
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELDS:
+            value = getattr(self, key)
+            if value is _UNSET:
+                raise KeyError(key)
+            return value
+        return self.extras[key]
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._FIELDS:
+            setattr(self, key, value)
         else:
-            return CriticalTier.DEVASTATING
+            self.extras[key] = value
+    
+    def __contains__(self, key: str) -> bool:
+        if key in self._FIELDS:
+            return getattr(self, key) is not _UNSET
+        return key in self.extras
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style get."""
+        if key in self._FIELDS:
+            value = getattr(self, key)
+            return default if value is _UNSET else value
+        return self.extras.get(key, default)
+    
+    def update(self, values: Dict[str, Any]) -> None:
+        """Dict-style update."""
+        for key, value in values.items():
+            self[key] = value
+
+
+class CompiledDamagePipeline:
+    """
+    Frozen, specialized form of a DamageCalculationPipeline.
+    
+    Built-in stages are replaced by attribute-access versions that run on a
+    slotted DamageContext. For every combination of (traits, weather, terrain)
+    a plan is prepared that leaves out the stages which cannot apply.
+    Custom stages are kept and called with the context as a mapping.
+    Results are identical to DamageCalculationPipeline.execute.
+    
+    Every calculation gets its own context, so a stage may start another
+    calculation on the same pipeline (e.g. counter damage) without
+    clobbering the outer one.
+    """
+    
+    def __init__(self, pipeline: DamageCalculationPipeline):
+        """
+        Compile a pipeline.
+        
+        Args:
+            pipeline: Source pipeline; its stage list is frozen here
+        """
+        self.pipeline = pipeline
+        
+        # Built-in stage -> (replacement, feature it requires)
+        builtins = {
+            DamageCalculationPipeline._accuracy_stage: (self._accuracy_stage, None),
+            DamageCalculationPipeline._traits_pre_damage_stage: (pipeline._traits_pre_damage_stage, 'traits'),
+            DamageCalculationPipeline._base_damage_stage: (self._base_damage_stage, None),
+            DamageCalculationPipeline._critical_stage: (self._critical_stage, None),
+            DamageCalculationPipeline._traits_on_attack_stage: (pipeline._traits_on_attack_stage, 'traits'),
+            DamageCalculationPipeline._stab_stage: (self._stab_stage, None),
+            DamageCalculationPipeline._type_effectiveness_stage: (self._type_effectiveness_stage, None),
+            DamageCalculationPipeline._trait_resistances_stage: (pipeline._trait_resistances_stage, 'traits'),
+            DamageCalculationPipeline._traits_on_defend_stage: (pipeline._traits_on_defend_stage, 'traits'),
+            DamageCalculationPipeline._weather_stage: (self._weather_stage, 'weather'),
+            DamageCalculationPipeline._terrain_stage: (self._terrain_stage, 'terrain'),
+            DamageCalculationPipeline._status_stage: (self._status_stage, None),
+            DamageCalculationPipeline._random_stage: (self._random_stage, None),
+            DamageCalculationPipeline._traits_final_stage: (pipeline._traits_final_stage, 'traits'),
+            DamageCalculationPipeline._finalize_stage: (self._finalize_stage, None),
+        }
+        
+        self.stage_names: Tuple[str, ...] = tuple(name for name, _, _ in pipeline.stages)
+        self._steps: List[Tuple[Callable, Optional[str]]] = []
+        for name, function, _ in pipeline.stages:
+            # Only unmodified built-ins bound to this pipeline are replaced
+            if getattr(function, '__self__', None) is pipeline:
+                step = builtins.get(getattr(function, '__func__', None))
+                if step is not None:
+                    self._steps.append(step)
+                    continue
+            self._steps.append((function, None))
+        
+        self._plans: Dict[Tuple[bool, bool, bool], Tuple[Callable, ...]] = {}
+        self._plan_names: Dict[Tuple[bool, bool, bool], Tuple[str, ...]] = {}
+        
+        # Type chart lookups are pure, so they are memoized per compiled pipeline
+        self._effectiveness: Dict[Tuple[Any, str, Tuple[str, ...]], float] = {}
+    
+    def plan(self, has_traits: bool, has_weather: bool, has_terrain: bool) -> Tuple[Callable, ...]:
+        """
+        Get the stage plan for a combination of active features.
+        
+        Returns:
+            Tuple of stage callables taking a DamageContext
+        """
+        key = (has_traits, has_weather, has_terrain)
+        plan = self._plans.get(key)
+        if plan is None:
+            active = {'traits': has_traits, 'weather': has_weather, 'terrain': has_terrain}
+            plan = tuple(function for function, requirement in self._steps
+                         if requirement is None or active[requirement])
+            self._plans[key] = plan
+            self._plan_names[key] = tuple(
+                name for name, (_, requirement) in zip(self.stage_names, self._steps)
+                if requirement is None or active[requirement])
+        return plan
+    
+    def prepare(self, attacker: 'MonsterInstance', defender: 'MonsterInstance', move: 'Move',
+                type_chart: Any, rng: random.Random, weather: Optional[str] = None,
+                terrain: Optional[str] = None, start_time: Any = _UNSET,
+                extras: Optional[Dict[str, Any]] = None) -> DamageContext:
+        """
+        Build the context for a new calculation.
+        
+        Returns:
+            A fresh DamageContext, ready for execute()
+        """
+        context = DamageContext(attacker, defender, move, type_chart, weather, terrain, rng, start_time)
+        context.result = DamageResult(
+            damage=0,
+            is_critical=False,
+            critical_tier=CriticalTier.NONE,
+            effectiveness=1.0,
+            effectiveness_text="",
+            type_text=""
+        )
+        if extras:
+            context.update(extras)
+        return context
+    
+    def execute(self, context: DamageContext) -> DamageResult:
+        """Execute the compiled plan on a prepared context."""
+        has_traits = has_active_traits(context.attacker, context.defender)
+        
+        result = context.result
+        plan = self.plan(has_traits, bool(context.weather), bool(context.terrain))
+        if profiler.enabled:
+            names = self._plan_names[(has_traits, bool(context.weather), bool(context.terrain))]
+            return self._execute_profiled(context, plan, names)
+        
+        for function in plan:
+            function(context)
+            
+            # Early exit conditions
+            if result.missed or result.blocked:
+                break
+        
+        return result
+    
+    def _execute_profiled(self, context: DamageContext, plan: Tuple[Callable, ...],
+                          names: Tuple[str, ...]) -> DamageResult:
+        """Execute a plan, recording each stage's time."""
+        perf_counter = time.perf_counter
+        result = context.result
+        for name, function in zip(names, plan):
+            start = perf_counter()
+            function(context)
+            profiler.record(f"damage.stage.{name}", perf_counter() - start)
+            
+            if result.missed or result.blocked:
+                break
+        
+        return result
+    
+    def _accuracy_stage(self, context: DamageContext) -> None:
+        """Check if move hits."""
+        roll_accuracy(context.result, context.move, context.attacker, context.defender, context.rng)
+    
+    def _base_damage_stage(self, context: DamageContext) -> None:
+        """Calculate base damage."""
+        result = context.result
+        if result.missed:
+            return
+        
+        move = context.move
+        
+        # Support moves don't deal damage
+        if move.category == 'support' or move.power <= 0:
+            result.damage = 0
+            return
+        
+        modified = context.attacker_stats_modified
+        attack_stat, defense_stat = battle_stats(move, context.attacker, context.defender,
+                                                 None if modified is _UNSET else modified,
+                                                 self.pipeline._get_effective_stat)
+        context.attack_stat = attack_stat
+        context.defense_stat = defense_stat
+        result.damage = base_damage(context.attacker.level, move.power, attack_stat, defense_stat)
+    
+    def _critical_stage(self, context: DamageContext) -> None:
+        """Check and apply critical hit."""
+        if context.result.damage == 0:
+            return
+        
+        crit_tier = self.pipeline._determine_critical_tier(context.attacker, context.move, context.rng)
+        context.attack_stat, context.defense_stat = apply_critical(
+            context.result, crit_tier, context.move, context.attacker, context.defender,
+            context.attack_stat, context.defense_stat)
+    
+    def _stab_stage(self, context: DamageContext) -> None:
+        """Apply STAB bonus."""
+        if context.result.damage:
+            apply_stab(context.result, context.move, context.attacker)
+    
+    def _type_effectiveness_stage(self, context: DamageContext) -> None:
+        """Apply type effectiveness (memoized per compiled pipeline)."""
+        if context.result.damage == 0:
+            return
+        
+        type_chart = context.type_chart
+        move_type = context.move.type
+        defender_types = tuple(context.defender.species.types)
+        key = (type_chart, move_type, defender_types)
+        
+        effectiveness = self._effectiveness.get(key)
+        if effectiveness is None:
+            effectiveness = type_chart.calculate_type_multiplier(move_type, list(defender_types))
+            self._effectiveness[key] = effectiveness
+        apply_effectiveness(context.result, effectiveness)
+    
+    def _weather_stage(self, context: DamageContext) -> None:
+        """Apply weather effects."""
+        if context.result.damage:
+            apply_field_modifier(context.result, WEATHER_MODIFIERS, context.weather,
+                                 context.move.type, "Weather")
+    
+    def _terrain_stage(self, context: DamageContext) -> None:
+        """Apply terrain effects."""
+        if context.result.damage:
+            apply_field_modifier(context.result, TERRAIN_MODIFIERS, context.terrain,
+                                 context.move.type, "Terrain")
+    
+    def _status_stage(self, context: DamageContext) -> None:
+        """Apply status effect modifiers."""
+        if context.result.damage:
+            apply_status_modifier(context.result, context.move, context.attacker)
+    
+    def _random_stage(self, context: DamageContext) -> None:
+        """Apply random damage spread (DQM uses 7/8 to 9/8)."""
+        if context.result.damage:
+            apply_random_spread(context.result, context.rng)
+    
+    def _finalize_stage(self, context: DamageContext) -> None:
+        """Finalize damage calculation."""
+        result = context.result
+        finalize_damage(result)
+        
+        start_time = context.start_time
+        result.calculation_time = 0.0 if start_time is _UNSET else time.time() - start_time
 
 
 class DamageCalculator:
@@ -735,20 +1190,24 @@ class DamageCalculator:
     RANDOM_MIN = 0.875  # DQM uses 7/8 (was 0.85)
     RANDOM_MAX = 1.125  # DQM uses 9/8 (was 1.0)
     
-    def __init__(self, type_chart: Optional['TypeChart'] = None, seed: Optional[int] = None):
+    def __init__(self, type_chart: Optional['TypeChart'] = None, seed: Optional[int] = None,
+                 compiled: bool = False, rng: Optional[random.Random] = None):
         """
         Initialize damage calculator.
         
         Args:
             type_chart: Type effectiveness chart (optional for compatibility)
             seed: Random seed for deterministic behavior
+            compiled: Run the compiled pipeline (same results, much cheaper per hit)
+            rng: Shared random generator (e.g. the battle RNG); overrides seed
         """
         # Import here to avoid circular dependency
         from engine.systems.types import type_chart as global_type_chart
         
         self.type_chart = type_chart or global_type_chart
-        self.rng = random.Random(seed)
+        self.rng = rng if rng is not None else random.Random(seed)
         self.pipeline = DamageCalculationPipeline()
+        self.compiled = compiled
         
         # Global modifiers that apply to all calculations
         self.global_modifiers: List[DamageModifier] = []
@@ -759,19 +1218,14 @@ class DamageCalculator:
     
     def process_traits_in_damage(self, attacker, defender, base_damage, is_critical):
         """Apply trait effects to damage calculation."""
-        trait_db = get_trait_database()
         final_damage = base_damage
         
         # Check attacker traits
         if hasattr(attacker, 'traits'):
-            for trait_name in attacker.traits:
-                trait = trait_db.get_trait(trait_name)
-                if not trait:
-                    continue
-                    
+            for trait_name in direct_trait_plan(tuple(attacker.traits))['on_attack']:
                 # Critical Master doubles crit chance
                 if trait_name == "Critical Master" and not is_critical:
-                    if random.random() < 0.0625:  # Additional 1/16 chance
+                    if self.rng.random() < 0.0625:  # Additional 1/16 chance
                         is_critical = True
                         final_damage *= 2
                 
@@ -781,17 +1235,13 @@ class DamageCalculator:
         
         # Check defender traits
         if hasattr(defender, 'traits'):
-            for trait_name in defender.traits:
-                trait = trait_db.get_trait(trait_name)
-                if not trait:
-                    continue
-                
+            for trait_name in direct_trait_plan(tuple(defender.traits))['on_defend']:
                 # Metal Body - massive defense
                 if trait_name == "Metal Body":
                     if final_damage < 1000:
-                        final_damage = random.choice([0, 1])  # 0 or 1 damage
+                        final_damage = self.rng.choice([0, 1])  # 0 or 1 damage
                     else:
-                        final_damage = random.randint(1, 2)  # 1-2 for strong attacks
+                        final_damage = self.rng.randint(1, 2)  # 1-2 for strong attacks
                     return int(final_damage), is_critical
                 
                 # Defense Boost
@@ -800,7 +1250,7 @@ class DamageCalculator:
                 
                 # Counter trait
                 elif trait_name == "Counter":
-                    if random.random() < 0.25:  # 25% counter chance
+                    if self.rng.random() < 0.25:  # 25% counter chance
                         # Set a flag for counter-attack
                         if not hasattr(defender, 'pending_counter'):
                             defender.pending_counter = attacker
@@ -812,16 +1262,10 @@ class DamageCalculator:
         if not hasattr(defender, 'traits'):
             return 1.0
         
-        resistance_map = {
-            "Fire Breath Guard": ("fire", 0.5),
-            "Ice Breath Guard": ("ice", 0.5),
-            "Bang Ward": ("explosion", 0.5),
-        }
-        
         multiplier = 1.0
         for trait_name in defender.traits:
-            if trait_name in resistance_map:
-                resist_element, resist_value = resistance_map[trait_name]
+            if trait_name in TRAIT_RESISTANCES:
+                resist_element, resist_value = TRAIT_RESISTANCES[trait_name]
                 if element == resist_element:
                     multiplier *= resist_value
         
@@ -853,6 +1297,13 @@ class DamageCalculator:
         """
         start_time = time.time()
         
+        if self.compiled:
+            compiled = self.pipeline.compile()
+            context = compiled.prepare(attacker, defender, move, self.type_chart, self.rng,
+                                       weather, terrain, start_time, kwargs)
+            result = compiled.execute(context)
+            return self._apply_post_pipeline(attacker, defender, result, context)
+        
         # Build context
         context = {
             'attacker': attacker,
@@ -876,7 +1327,11 @@ class DamageCalculator:
         
         # Execute pipeline
         result = self.pipeline.execute(context)
-        
+        return self._apply_post_pipeline(attacker, defender, result, context)
+    
+    def _apply_post_pipeline(self, attacker: 'MonsterInstance', defender: 'MonsterInstance',
+                             result: DamageResult, context: Any) -> DamageResult:
+        """Apply trait damage, global modifiers and performance tracking."""
         # Apply traits to damage
         if hasattr(self, 'process_traits_in_damage'):
             damage, is_critical = self.process_traits_in_damage(
@@ -894,6 +1349,8 @@ class DamageCalculator:
         # Track performance
         self.total_calculations += 1
         self.total_time += result.calculation_time
+        if profiler.enabled:
+            profiler.record('damage.calculate', result.calculation_time)
         
         return result
     
@@ -1000,6 +1457,246 @@ class DamageCalculator:
             'can_critical': min_result.critical_tier != CriticalTier.NONE
         }
     
+    def calculate_batch(self,
+                        attacker_stats: np.ndarray,
+                        defender_stats: np.ndarray,
+                        move_powers: np.ndarray,
+                        move_types: np.ndarray,
+                        attacker_levels: np.ndarray,
+                        attacker_stages: Optional[np.ndarray] = None,
+                        defender_stages: Optional[np.ndarray] = None,
+                        attacker_types: Optional[np.ndarray] = None,
+                        defender_types: Optional[np.ndarray] = None,
+                        defender_hp: Optional[np.ndarray] = None,
+                        move_physical: Optional[np.ndarray] = None,
+                        move_accuracies: Optional[np.ndarray] = None,
+                        crit_chances: Optional[np.ndarray] = None,
+                        attacker_burned: Optional[np.ndarray] = None,
+                        attacker_paralyzed: Optional[np.ndarray] = None) -> BatchDamageResult:
+        """
+        Evaluate the full cartesian product of attackers, moves and defenders
+        with the deterministic part of the pipeline (stages, base damage, STAB,
+        type effectiveness, burn, random spread) in one vectorized pass.
+        Trait, weather and terrain stages are not modelled.
+        
+        Args:
+            attacker_stats: (A, 5) base stats in BATCH_STATS order
+            defender_stats: (D, 5) base stats in BATCH_STATS order
+            move_powers: (A, M) move power, 0 for support moves and padding
+            move_types: (A, M) type ids from the type chart, -1 if unknown
+            attacker_levels: (A,) attacker levels
+            attacker_stages: (A, 7) stat stages in BATCH_STAGES order
+            defender_stages: (D, 7) stat stages in BATCH_STAGES order
+            attacker_types: (A, T) attacker type ids, padded with -1
+            defender_types: (D, T) defender type ids, padded with -1
+            defender_hp: (D,) current defender HP for KO probabilities
+            move_physical: (A, M) True for physical, False for magical moves
+            move_accuracies: (A, M) accuracy, negative values never miss
+            crit_chances: (A, M) critical hit chance per use
+            attacker_burned: (A,) burn flags
+            attacker_paralyzed: (A,) paralysis flags
+            
+        Returns:
+            BatchDamageResult with (A, M, D) arrays
+        """
+        attacker_stats = np.asarray(attacker_stats, dtype=np.float64)
+        defender_stats = np.asarray(defender_stats, dtype=np.float64)
+        move_powers = np.asarray(move_powers, dtype=np.float64)
+        move_types = np.asarray(move_types, dtype=np.int64)
+        n_attackers, n_moves = move_powers.shape
+        n_defenders = defender_stats.shape[0]
+        
+        def stages_or_zero(stages, rows):
+            if stages is None:
+                return np.zeros((rows, len(BATCH_STAGES)))
+            return np.asarray(stages, dtype=np.float64)
+        
+        def flags_or_false(flags, shape):
+            if flags is None:
+                return np.zeros(shape, dtype=bool)
+            return np.asarray(flags, dtype=bool)
+        
+        attacker_stages = stages_or_zero(attacker_stages, n_attackers)
+        defender_stages = stages_or_zero(defender_stages, n_defenders)
+        levels = np.asarray(attacker_levels, dtype=np.float64)[:, None, None]
+        physical = (np.ones((n_attackers, n_moves), dtype=bool) if move_physical is None
+                    else np.asarray(move_physical, dtype=bool))
+        burned = flags_or_false(attacker_burned, n_attackers)
+        paralyzed = flags_or_false(attacker_paralyzed, n_attackers)
+        
+        # Effective stats: same stage multipliers and truncation as _get_effective_stat
+        def effective(stats, stages, stat):
+            column = BATCH_STATS.index(stat)
+            stage = stages[:, BATCH_STAGES.index(stat)]
+            multiplier = (2 + np.maximum(stage, 0)) / (2 - np.minimum(stage, 0))
+            return np.floor(stats[:, column] * multiplier)
+        
+        attack = np.where(physical,
+                          effective(attacker_stats, attacker_stages, 'atk')[:, None],
+                          effective(attacker_stats, attacker_stages, 'mag')[:, None])[:, :, None]
+        defense = np.where(physical[:, :, None],
+                           effective(defender_stats, defender_stages, 'def')[None, None, :],
+                           effective(defender_stats, defender_stages, 'res')[None, None, :])
+        power = move_powers[:, :, None]
+        damaging = np.broadcast_to(power > 0, (n_attackers, n_moves, n_defenders))
+        
+        # Base damage formula (same operation order as _base_damage_stage)
+        base = np.floor((((2 * levels / 5 + 2) * power * attack / defense) / 50) + 2)
+        
+        # Type effectiveness from the chart matrix
+        effectiveness = np.ones((n_attackers, n_moves, n_defenders))
+        if defender_types is not None and self.type_chart.effectiveness_matrix is not None:
+            matrix = np.asarray(self.type_chart.effectiveness_matrix, dtype=np.float32)
+            defender_types = np.asarray(defender_types, dtype=np.int64)
+            move_ids = move_types[:, :, None, None]
+            defender_ids = defender_types[None, None, :, :]
+            valid = (move_ids >= 0) & (defender_ids >= 0)
+            lookup = matrix[np.maximum(move_ids, 0), np.maximum(defender_ids, 0)]
+            product = np.prod(np.where(valid, lookup, np.float32(1.0)), axis=-1, dtype=np.float32)
+            product = product.astype(np.float64)
+            
+            # Dual types are capped like calculate_type_multiplier
+            dual = (defender_types >= 0).sum(axis=1) > 1
+            cap = self.type_chart.config['combo_cap']
+            effectiveness = np.where(dual[None, None, :], np.minimum(product, cap), product)
+        
+        stab = np.zeros((n_attackers, n_moves), dtype=bool)
+        if attacker_types is not None:
+            attacker_types = np.asarray(attacker_types, dtype=np.int64)
+            stab = ((move_types[:, :, None] == attacker_types[:, None, :]) &
+                    (move_types[:, :, None] >= 0)).any(axis=-1)
+        stab = stab[:, :, None]
+        burn = (burned[:, None] & physical)[:, :, None]
+        
+        def apply_modifiers(damage):
+            damage = np.where(stab, np.floor(damage * self.STAB_MULTIPLIER), damage)
+            damage = np.floor(damage * effectiveness)
+            return np.where(burn, np.floor(damage * 0.5), damage)
+        
+        def roll(damage, factor):
+            rolled = np.floor(damage * factor)
+            rolled = np.where(effectiveness > 0, np.maximum(rolled, 1), rolled)
+            return np.where(damaging, rolled, 0)
+        
+        def ko_chance(damage):
+            # P(floor(damage * r) >= hp) for r ~ U(RANDOM_MIN, RANDOM_MAX)
+            needed = np.divide(hp, damage, out=np.full(damage.shape, np.inf), where=damage > 0)
+            chance = np.clip((self.RANDOM_MAX - needed) / (self.RANDOM_MAX - self.RANDOM_MIN), 0.0, 1.0)
+            chance = np.where((hp <= 1) & (effectiveness > 0), 1.0, chance)
+            return np.where(damaging, chance, 0.0)
+        
+        hp = (np.full(n_defenders, np.inf) if defender_hp is None
+              else np.asarray(defender_hp, dtype=np.float64))[None, None, :]
+        
+        # Mean of floor(damage * r); truncation costs half a point on average
+        mean_factor = (self.RANDOM_MIN + self.RANDOM_MAX) / 2
+        
+        normal = apply_modifiers(base)
+        expected_hit = normal * mean_factor - 0.5
+        ko_hit = ko_chance(normal)
+        
+        # Critical tiers (same rules as the scalar roll_critical_tier)
+        crit = (np.full((n_attackers, n_moves), CRITICAL_STAGE_CHANCES[0] * CRITICAL_BASE_RATIO)
+                if crit_chances is None
+                else np.asarray(crit_chances, dtype=np.float64))[:, :, None]
+        crit_expected = np.zeros_like(base)
+        crit_ko = np.zeros_like(base)
+        for tier, weight in critical_tier_weights().items():
+            critical = apply_modifiers(np.floor(base * CRITICAL_MULTIPLIERS[tier]))
+            crit_expected += weight * np.maximum(critical * mean_factor - 0.5, 1)
+            crit_ko += weight * ko_chance(critical)
+        
+        # Hit chance (same stage formula as _accuracy_stage)
+        accuracy = (np.full((n_attackers, n_moves), 100.0) if move_accuracies is None
+                    else np.asarray(move_accuracies, dtype=np.float64))[:, :, None]
+        combined = np.clip(attacker_stages[:, BATCH_STAGES.index('acc')][:, None, None] -
+                           defender_stages[:, BATCH_STAGES.index('eva')][None, None, :], -6, 6)
+        stage_multiplier = (3 + np.maximum(combined, 0)) / (3 - np.minimum(combined, 0))
+        final_accuracy = accuracy * stage_multiplier * np.where(paralyzed, 0.75, 1.0)[:, None, None]
+        hit_chance = np.where(accuracy < 0, 1.0, np.clip(final_accuracy / 100, 0.0, 1.0))
+        
+        expected = hit_chance * ((1 - crit) * np.maximum(expected_hit, 1) + crit * crit_expected)
+        expected = np.where(damaging & (effectiveness > 0), expected, 0.0)
+        
+        return BatchDamageResult(
+            expected=expected,
+            minimum=roll(normal, self.RANDOM_MIN),
+            maximum=roll(normal, self.RANDOM_MAX),
+            ko_probability=hit_chance * ((1 - crit) * ko_hit + crit * crit_ko),
+            hit_chance=np.broadcast_to(hit_chance, expected.shape).copy(),
+            effectiveness=effectiveness
+        )
+    
+    def preview_batch(self,
+                      attackers: List['MonsterInstance'],
+                      defenders: List['MonsterInstance'],
+                      moves: Optional[List[List['Move']]] = None) -> BatchDamageResult:
+        """
+        Build batch arrays from monsters and evaluate every option at once.
+        
+        Args:
+            attackers: Attacking monsters
+            defenders: Defending monsters
+            moves: Moves per attacker (defaults to each attacker's move list)
+            
+        Returns:
+            BatchDamageResult that also references the source objects
+        """
+        if moves is None:
+            moves = [[m for m in attacker.moves if m] for attacker in attackers]
+        
+        type_ids = self.type_chart.type_ids
+        n_moves = max([len(move_list) for move_list in moves] + [1])
+        n_types = max([len(m.species.types) for m in list(attackers) + list(defenders)] + [1])
+        
+        def type_row(types):
+            ids = [type_ids.get(t, -1) for t in types]
+            return ids + [-1] * (n_types - len(ids))
+        
+        def stat_row(monster):
+            return [monster.stats.get(stat, 100) for stat in BATCH_STATS]
+        
+        def stage_row(monster):
+            return [monster.stat_stages.get(stat, 0) for stat in BATCH_STAGES]
+        
+        shape = (len(attackers), n_moves)
+        powers = np.zeros(shape)
+        move_types = np.full(shape, -1, dtype=np.int64)
+        physical = np.ones(shape, dtype=bool)
+        accuracies = np.full(shape, 100.0)
+        crit_chances = np.zeros(shape)
+        
+        for a, (attacker, move_list) in enumerate(zip(attackers, moves)):
+            for m, move in enumerate(move_list):
+                if move.category != 'support' and move.power > 0:
+                    powers[a, m] = move.power
+                move_types[a, m] = type_ids.get(move.type, -1)
+                physical[a, m] = move.category == 'phys'
+                accuracies[a, m] = move.accuracy
+                crit_chances[a, m] = critical_chance(attacker, move)
+        
+        result = self.calculate_batch(
+            attacker_stats=np.array([stat_row(m) for m in attackers], dtype=np.float64),
+            defender_stats=np.array([stat_row(m) for m in defenders], dtype=np.float64),
+            move_powers=powers,
+            move_types=move_types,
+            attacker_levels=np.array([m.level for m in attackers], dtype=np.float64),
+            attacker_stages=np.array([stage_row(m) for m in attackers], dtype=np.float64),
+            defender_stages=np.array([stage_row(m) for m in defenders], dtype=np.float64),
+            attacker_types=np.array([type_row(m.species.types) for m in attackers], dtype=np.int64),
+            defender_types=np.array([type_row(m.species.types) for m in defenders], dtype=np.int64),
+            defender_hp=np.array([m.current_hp for m in defenders], dtype=np.float64),
+            move_physical=physical,
+            move_accuracies=accuracies,
+            crit_chances=crit_chances,
+            attacker_burned=np.array([m.status == 'burn' for m in attackers], dtype=bool),
+            attacker_paralyzed=np.array([m.status == 'paralysis' for m in attackers], dtype=bool)
+        )
+        result.attackers = list(attackers)
+        result.moves = [list(move_list) for move_list in moves]
+        result.defenders = list(defenders)
+        return result
+    
     def add_global_modifier(self, modifier: DamageModifier) -> None:
         """Add a global damage modifier."""
         self.global_modifiers.append(modifier)
@@ -1013,12 +1710,18 @@ class DamageCalculator:
         """Get performance statistics."""
         avg_time = self.total_time / self.total_calculations if self.total_calculations > 0 else 0
         
-        return {
+        stats = {
             'total_calculations': self.total_calculations,
             'total_time': self.total_time,
             'average_time': avg_time,
             'calculations_per_second': 1 / avg_time if avg_time > 0 else 0
         }
+        
+        # Percentiles are only available while the battle profiler records
+        histogram = profiler.histograms.get('damage.calculate')
+        if histogram is not None:
+            stats['timing'] = histogram.to_dict()
+        return stats
 
 
 # Legacy compatibility classes
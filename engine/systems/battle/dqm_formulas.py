@@ -114,14 +114,15 @@ class DQMCalculator:
     Based on reverse-engineered formulas from the DQM series.
     """
     
-    def __init__(self, rng_seed: Optional[int] = None):
+    def __init__(self, rng_seed: Optional[int] = None, rng: Optional[random.Random] = None):
         """
         Initialize DQM calculator.
         
         Args:
             rng_seed: Seed for random number generator (for testing)
+            rng: Shared random generator (e.g. the battle's), takes precedence over rng_seed
         """
-        self.rng = random.Random(rng_seed)
+        self.rng = rng if rng is not None else random.Random(rng_seed)
     
     def calculate_damage(self, 
                         attacker_stats: Dict[str, int],
@@ -80,10 +80,11 @@ class MonsterTrait:
     def apply_effects(self, context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Wendet Trait-Effekte an"""
         applied = []
+        rng = context.get('rng', random)  # RNG des Kampfes, falls übergeben (Replays)
         
         for effect in self.effects:
             # Prüfe Aktivierungschance
-            if random.random() > effect.chance:
+            if rng.random() > effect.chance:
                 continue
             
             # Prüfe zusätzliche Bedingung
@@ -723,12 +724,25 @@ class TraitDatabase:
 class TraitManager:
     """Verwaltet Traits für ein Monster im Kampf"""
     
+    # Aktivierungsschwellen der HP-Trigger (siehe MonsterTrait.can_activate)
+    HP_THRESHOLDS = {
+        TraitTrigger.HEALTH_LOW: 0.25,
+        TraitTrigger.HEALTH_CRITICAL: 0.10
+    }
+    
     def __init__(self, monster: Any):
         self.monster = monster
         self.traits: List[MonsterTrait] = []
         self.trait_db = get_trait_database()
         self.active_effects: Dict[str, Any] = {}
         
+        # Vorberechnete Dispatch-Tabellen und Modifikatoren
+        # (nur über add_trait/remove_trait ändern, sonst veralten sie)
+        self._dispatch: Dict[TraitTrigger, Tuple[Tuple[Optional[str], Optional[float], Callable], ...]] = {}
+        self._stat_modifiers: Optional[Dict[str, float]] = None
+        self._element_resistances: Optional[Dict[str, float]] = None
+        self.version = 0  # Erhöht bei jeder Trait-Änderung (Stat-Caches)
+        
     def add_trait(self, trait_name: str) -> bool:
         """Füge einen Trait hinzu"""
         trait = self.trait_db.get_trait(trait_name)
@@ -742,6 +756,7 @@ class TraitManager:
             return False
         
         self.traits.append(trait)
+        self._compile()
         logger.info(f"Added trait {trait_name} to {self.monster.name}")
         return True
     
@@ -750,14 +765,49 @@ class TraitManager:
         for i, trait in enumerate(self.traits):
             if trait.name == trait_name:
                 self.traits.pop(i)
+                self._compile()
                 logger.info(f"Removed trait {trait_name} from {self.monster.name}")
                 return True
         return False
     
+    def _compile(self) -> None:
+        """
+        Baue die Dispatch-Tabellen pro Trigger neu auf.
+        
+        Jeder Eintrag ist (benötigte Phase, HP-Schwelle, apply_effects) und
+        entspricht MonsterTrait.can_activate, ohne den Trait erneut zu prüfen.
+        Trigger ohne Traits fehlen in der Tabelle und kosten nichts.
+        """
+        always = [t for t in self.traits if t.trigger == TraitTrigger.ALWAYS]
+        
+        self._dispatch = {}
+        for trigger in TraitTrigger:
+            relevant = [t for t in self.traits if t.trigger == trigger]
+            if trigger != TraitTrigger.ALWAYS:
+                relevant.extend(always)
+            if relevant:
+                self._dispatch[trigger] = tuple(self._dispatch_entry(t) for t in relevant)
+        
+        self._stat_modifiers = None
+        self.version += 1
+        self._element_resistances = None
+    
+    def _dispatch_entry(self, trait: MonsterTrait) -> Tuple[Optional[str], Optional[float], Callable]:
+        """Aktivierungsbedingung eines Traits als (Phase, HP-Schwelle, Callable)"""
+        if trait.trigger in (TraitTrigger.ALWAYS, TraitTrigger.RANDOM):
+            return None, None, trait.apply_effects
+        if trait.trigger in self.HP_THRESHOLDS:
+            return None, self.HP_THRESHOLDS[trait.trigger], trait.apply_effects
+        return trait.trigger.value, None, trait.apply_effects
+    
     def has_trait(self, trait_name: str) -> bool:
         """Prüfe ob Monster einen Trait hat"""
         return any(t.name == trait_name for t in self.traits)
     
+    def has_trigger(self, trigger: TraitTrigger) -> bool:
+        """Prüfe ob process_traits für diesen Trigger etwas zu tun hat"""
+        return trigger in self._dispatch
+    
     def get_traits_by_trigger(self, trigger: TraitTrigger) -> List[MonsterTrait]:
         """Hole alle Traits mit bestimmtem Trigger"""
         return [t for t in self.traits if t.trigger == trigger]
@@ -779,63 +829,65 @@ class TraitManager:
         context['monster'] = self.monster
         context['hp_percent'] = self.monster.current_hp / max(1, self.monster.max_hp)
         
-        # Hole relevante Traits
-        relevant_traits = self.get_traits_by_trigger(trigger)
-        
-        # Zusätzlich ALWAYS-Traits wenn nicht bereits verarbeitet
-        if trigger != TraitTrigger.ALWAYS:
-            relevant_traits.extend(self.get_traits_by_trigger(TraitTrigger.ALWAYS))
-        
-        # Verarbeite jeden Trait
-        for trait in relevant_traits:
-            if trait.can_activate(context):
-                effects = trait.apply_effects(context)
-                applied_effects.extend(effects)
+        # Trigger-Traits und danach ALWAYS-Traits, vorab sortiert
+        for phase, threshold, apply_effects in self._dispatch.get(trigger, ()):
+            if threshold is not None:
+                if context.get('hp_percent', 1.0) > threshold:
+                    continue
+            elif phase is not None and context.get('phase', '') != phase:
+                continue
+            applied_effects.extend(apply_effects(context))
         
         return applied_effects
     
     def get_stat_modifiers(self) -> Dict[str, float]:
         """Hole alle Stat-Modifikatoren von Traits"""
-        modifiers = {
-            'atk': 1.0,
-            'def': 1.0,
-            'mag': 1.0,
-            'res': 1.0,
-            'agility': 1.0,
-            'accuracy': 1.0
-        }
-        
-        for trait in self.traits:
-            if trait.trigger != TraitTrigger.ALWAYS:
-                continue
+        if self._stat_modifiers is None:
+            modifiers = {
+                'atk': 1.0,
+                'def': 1.0,
+                'mag': 1.0,
+                'res': 1.0,
+                'agility': 1.0,
+                'accuracy': 1.0
+            }
             
-            for effect in trait.effects:
-                if effect.effect_type == 'stat_boost':
-                    stat = effect.value.get('stat')
-                    amount = effect.value.get('amount', 0)
-                    if stat in modifiers:
-                        # Konvertiere zu Multiplikator
-                        modifiers[stat] *= (1 + amount / 100)
+            for trait in self.traits:
+                if trait.trigger != TraitTrigger.ALWAYS:
+                    continue
+                
+                for effect in trait.effects:
+                    if effect.effect_type == 'stat_boost':
+                        stat = effect.value.get('stat')
+                        amount = effect.value.get('amount', 0)
+                        if stat in modifiers:
+                            # Konvertiere zu Multiplikator
+                            modifiers[stat] *= (1 + amount / 100)
+            
+            self._stat_modifiers = modifiers
         
-        return modifiers
+        return dict(self._stat_modifiers)
     
     def get_element_resistances(self) -> Dict[str, float]:
         """Hole alle Element-Resistenzen"""
-        resistances = {}
-        
-        for trait in self.traits:
-            for effect in trait.effects:
-                if effect.effect_type == 'element_resist':
-                    element = effect.value.get('element')
-                    reduction = effect.value.get('reduction', 0)
-                    
-                    if element not in resistances:
-                        resistances[element] = 1.0
-                    
-                    # Multiplikative Stacking
-                    resistances[element] *= (1 - reduction)
-        
-        return resistances
+        if self._element_resistances is None:
+            resistances = {}
+            
+            for trait in self.traits:
+                for effect in trait.effects:
+                    if effect.effect_type == 'element_resist':
+                        element = effect.value.get('element')
+                        reduction = effect.value.get('reduction', 0)
+                        
+                        if element not in resistances:
+                            resistances[element] = 1.0
+                        
+                        # Multiplikative Stacking
+                        resistances[element] *= (1 - reduction)
+            
+            self._element_resistances = resistances
+        
+        return dict(self._element_resistances)
 
 
 # Singleton-Instanz
@@ -845,7 +897,9 @@ def get_trait_database() -> TraitDatabase:
     """Hole Singleton-Instanz der Trait-Datenbank"""
     global _trait_db_instance
     if _trait_db_instance is None:
-        _trait_db_instance = TraitDatabase()
+        from engine.devtools.startup_profiler import measure
+        with measure("TraitDatabase"):
+            _trait_db_instance = TraitDatabase()
     return _trait_db_instance
 
 
@@ -642,7 +642,9 @@ def get_skill_database() -> DQMSkillDatabase:
     """Hole Singleton-Instanz der Skill-Datenbank"""
     global _skill_db_instance
     if _skill_db_instance is None:
-        _skill_db_instance = DQMSkillDatabase()
+        from engine.devtools.startup_profiler import measure
+        with measure("DQMSkillDatabase"):
+            _skill_db_instance = DQMSkillDatabase()
     return _skill_db_instance
 
 
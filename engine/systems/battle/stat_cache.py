@@ -0,0 +1,215 @@
+"""
+Effective Stat Cache Module
+Per-monster cache of battle stats, recomputed only when their inputs change
+"""
+
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Managers whose get_stat_modifiers() feed into modified stats
+_MANAGERS = ('condition_manager', 'status_manager', 'trait_manager')
+
+# Trait and status managers name some stats differently
+_MODIFIER_ALIASES = {
+    'spd': ('spd', 'agility', 'speed'),
+    'acc': ('acc', 'accuracy'),
+}
+
+# Status modifiers for monsters without a ConditionManager (mirrors
+# ConditionManager.get_stat_modifiers, which keeps monster.status in sync)
+_STATUS_MODIFIERS = {
+    'burn': {'atk': 0.5},
+    'paralysis': {'spd': 0.5},
+}
+
+
+class EffectiveStatCache:
+    """
+    Cached effective stats of one monster.
+
+    Each kind of value is stored together with a stamp of the inputs it
+    depends on and recomputed only when the stamp changes:
+
+    - staged: base stats and stat stages (damage formula)
+    - modified: additionally status, condition/status/trait manager
+      modifiers, tension and held item (turn order speed)
+
+    Stages and managers are compared through the version counters their
+    mutators bump (StatStages, ConditionManager, DQMStatusManager,
+    TraitManager). Unversioned stages, e.g. plain dicts on test doubles, are
+    never cached. Code that writes base stats in place must call
+    invalidate().
+    """
+
+    __slots__ = ('monster', '_staged_stamp', '_staged', '_modified_stamp', '_modified')
+
+    # Hit/miss counting for the battle profiler overlay (EffectiveStatCache.debug = True)
+    debug = False
+    hits = 0
+    misses = 0
+
+    def __init__(self, monster: Any):
+        self.monster = monster
+        self._staged_stamp: Optional[Tuple] = None
+        self._staged: Dict[str, int] = {}
+        self._modified_stamp: Optional[Tuple] = None
+        self._modified: Dict[str, int] = {}
+
+    def invalidate(self) -> None:
+        """Drop all cached values."""
+        self._staged_stamp = None
+        self._staged.clear()
+        self._modified_stamp = None
+        self._modified.clear()
+
+    def staged(self, stat: str) -> int:
+        """Base stat with its stage multiplier (damage formula)."""
+        monster = self.monster
+        stages = monster.stat_stages
+        version = getattr(stages, 'version', None)
+        if version is None:
+            return self._compute_staged(stat)
+
+        stamp = (monster.stats, stages, version)
+        if stamp != self._staged_stamp:
+            self._staged_stamp = stamp
+            self._staged.clear()
+
+        value = self._staged.get(stat)
+        if value is None:
+            value = self._staged[stat] = self._compute_staged(stat)
+            if self.debug:
+                EffectiveStatCache.misses += 1
+        elif self.debug:
+            EffectiveStatCache.hits += 1
+        return value
+
+    def modified(self, stat: str) -> int:
+        """Staged stat with status, condition, status manager and trait multipliers."""
+        stamp = self._modified_key()
+        if stamp is None:
+            return self._compute_modified(stat)
+
+        if stamp != self._modified_stamp:
+            self._modified_stamp = stamp
+            self._modified.clear()
+
+        value = self._modified.get(stat)
+        if value is None:
+            value = self._modified[stat] = self._compute_modified(stat)
+            if self.debug:
+                EffectiveStatCache.misses += 1
+        elif self.debug:
+            EffectiveStatCache.hits += 1
+        return value
+
+    def speed(self) -> int:
+        """Turn order speed: the modified speed stat, at least 1."""
+        return max(1, self.modified('spd'))
+
+    def _modified_key(self) -> Optional[Tuple]:
+        """Stamp of every input of modified(), or None if one is untracked."""
+        monster = self.monster
+        stages = monster.stat_stages
+        stage_version = getattr(stages, 'version', None)
+        if stage_version is None:
+            return None
+
+        stamp = [monster.stats, stages, stage_version, getattr(monster, 'status', None)]
+        for name in _MANAGERS:
+            manager = getattr(monster, name, None)
+            if manager is not None:
+                version = getattr(manager, 'version', None)
+                if version is None:
+                    return None
+                stamp += (manager, version)
+        stamp += (getattr(monster, 'tension', None), getattr(monster, 'held_item', None))
+        return tuple(stamp)
+
+    @staticmethod
+    def _stage_multiplier(stage: int) -> float:
+        if stage >= 0:
+            return (2 + stage) / 2
+        return 2 / (2 - stage)
+
+    def _compute_staged(self, stat: str) -> int:
+        base_stat = self.monster.stats.get(stat, 100)
+        stage = self.monster.stat_stages.get(stat, 0)
+        return int(base_stat * self._stage_multiplier(stage))
+
+    def _compute_modified(self, stat: str) -> int:
+        monster = self.monster
+        base_stat = monster.stats.get(stat, 100)
+        if stat == 'spd' and (not isinstance(base_stat, (int, float)) or base_stat <= 0):
+            base_stat = 1
+
+        # Modifiers scale the base stat before stages, like paralysis always did
+        multiplier = self._modifier(stat)
+        if multiplier != 1.0:
+            base_stat = int(base_stat * multiplier)
+
+        stage = monster.stat_stages.get(stat, 0)
+        return int(base_stat * self._stage_multiplier(stage))
+
+    def _modifier(self, stat: str) -> float:
+        monster = self.monster
+        aliases = _MODIFIER_ALIASES.get(stat, (stat,))
+        multiplier = 1.0
+
+        if getattr(monster, 'condition_manager', None) is None:
+            status = getattr(monster, 'status', None)
+            status = getattr(status, 'value', status)
+            if isinstance(status, str):
+                multiplier *= _STATUS_MODIFIERS.get(status.lower(), {}).get(stat, 1.0)
+
+        for name in _MANAGERS:
+            manager = getattr(monster, name, None)
+            if manager is None:
+                continue
+            modifiers = manager.get_stat_modifiers()
+            for alias in aliases:
+                if alias in modifiers:
+                    multiplier *= modifiers[alias]
+                    break
+        return multiplier
+
+    @classmethod
+    def reset_counters(cls) -> None:
+        """Reset the debug hit/miss counters."""
+        cls.hits = 0
+        cls.misses = 0
+
+    @classmethod
+    def hit_rate(cls) -> float:
+        """Share of lookups answered from the cache since the last reset."""
+        total = cls.hits + cls.misses
+        return cls.hits / total if total else 0.0
+
+
+def effective_stats(monster: Any) -> EffectiveStatCache:
+    """
+    Get (or attach) the effective stat cache of a monster.
+
+    Args:
+        monster: Monster with stats, stat_stages and status
+
+    Returns:
+        The monster's EffectiveStatCache
+    """
+    cache = getattr(monster, '_stat_cache', None)
+    if cache is None or cache.monster is not monster:
+        cache = EffectiveStatCache(monster)
+        try:
+            monster._stat_cache = cache
+        except AttributeError:
+            pass  # Slotted monsters get a throwaway cache
+    return cache
+
+
+def invalidate_stats(monster: Any) -> None:
+    """Drop a monster's cached stats after writing its base stats in place."""
+    cache = getattr(monster, '_stat_cache', None)
+    if cache is not None:
+        cache.invalidate()
@@ -51,10 +51,17 @@ class StatusEffect:
 class DQMStatusManager:
     """Manages all status effects for a monster."""
     
-    def __init__(self, monster: Any):
+    def __init__(self, monster: Any, rng: Optional[random.Random] = None):
+        """
+        Args:
+            monster: Monster whose statuses are managed
+            rng: Battle RNG for status rolls (unseeded if omitted)
+        """
         self.monster = monster
+        self.rng = rng if rng is not None else random.Random()
         self.active_statuses: Dict[DQMStatus, StatusEffect] = {}
         self.status_resistances: Dict[DQMStatus, float] = {}
+        self.version = 0  # Bumped when stat modifiers may change
         
     def apply_status(self, status: DQMStatus, duration: int = 3, 
                     potency: float = 1.0, source: str = None) -> bool:
@@ -84,6 +91,7 @@ class DQMStatusManager:
             potency=potency,
             source=source
         )
+        self.version += 1
         
         logger.info(f"{self.monster.name} hat jetzt {status.value}!")
         
@@ -96,6 +104,7 @@ class DQMStatusManager:
         """Remove a status effect."""
         if status in self.active_statuses:
             del self.active_statuses[status]
+            self.version += 1
             self._remove_status_effects(status)
             return True
         return False
@@ -118,7 +127,7 @@ class DQMStatusManager:
         
         # Check if can act
         if DQMStatus.SLEEP in self.active_statuses:
-            if random.random() < 0.25:  # 25% wake chance
+            if self.rng.random() < 0.25:  # 25% wake chance
                 self.remove_status(DQMStatus.SLEEP)
                 effects['message'] = f"{self.monster.name} wacht auf!"
             else:
@@ -126,12 +135,12 @@ class DQMStatusManager:
                 effects['message'] = f"{self.monster.name} schläft!"
                 
         elif DQMStatus.PARALYSIS in self.active_statuses:
-            if random.random() < 0.25:  # 25% paralysis
+            if self.rng.random() < 0.25:  # 25% paralysis
                 effects['skip_turn'] = True
                 effects['message'] = f"{self.monster.name} ist paralysiert!"
                 
         elif DQMStatus.FREEZE in self.active_statuses:
-            if random.random() < 0.20:  # 20% thaw chance
+            if self.rng.random() < 0.20:  # 20% thaw chance
                 self.remove_status(DQMStatus.FREEZE)
                 effects['message'] = f"{self.monster.name} ist aufgetaut!"
             else:
@@ -140,7 +149,7 @@ class DQMStatusManager:
         
         # Confusion
         if DQMStatus.CONFUSION in self.active_statuses:
-            if random.random() < 0.33:  # 33% confusion
+            if self.rng.random() < 0.33:  # 33% confusion
                 effects['confused'] = True
                 effects['message'] = f"{self.monster.name} ist verwirrt!"
         
@@ -229,7 +238,7 @@ class DQMStatusManager:
         """Check if immune to status."""
         # Check monster traits
         if hasattr(self.monster, 'traits'):
-            if 'Status Guard' in self.monster.traits and random.random() < 0.5:
+            if 'Status Guard' in self.monster.traits and self.rng.random() < 0.5:
                 return True
         
         # Type-based immunities
@@ -251,7 +260,7 @@ class DQMStatusManager:
             level_bonus = self.monster.level * 0.01  # 1% per level
             base_resistance += level_bonus
         
-        return random.random() < base_resistance
+        return self.rng.random() < base_resistance
     
     def _remove_conflicts(self, new_status: DQMStatus):
         """Remove conflicting statuses."""
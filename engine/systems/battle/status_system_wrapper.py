@@ -3,25 +3,34 @@ Status Effect System Compatibility Wrapper
 Provides unified interface for status effects
 """
 
+import random
+from typing import Optional
+
 from engine.systems.battle.status_effects_dqm import DQMStatusManager, DQMStatus, StatusEffect
 
 class StatusEffectSystem:
     """Compatibility wrapper for DQMStatusManager."""
     
-    def __init__(self):
-        """Initialize without requiring a monster."""
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        Initialize without requiring a monster.
+        
+        Args:
+            rng: Battle RNG shared by all status managers
+        """
+        self.rng = rng
         self.managers = {}
         
     def initialize_monster(self, monster):
         """Initialize status manager for a monster."""
         if monster not in self.managers:
-            self.managers[monster] = DQMStatusManager(monster)
+            self.managers[monster] = DQMStatusManager(monster, rng=self.rng)
         return self.managers[monster]
         
     def apply_status(self, monster, status):
         """Apply status to a monster."""
         if monster not in self.managers:
-            self.managers[monster] = DQMStatusManager(monster)
+            self.managers[monster] = DQMStatusManager(monster, rng=self.rng)
         
         # Convert string to DQMStatus if needed
         if isinstance(status, str):
@@ -33,7 +42,7 @@ class StatusEffectSystem:
     def process_turn_end(self, monster):
         """Process end of turn for a monster."""
         if monster not in self.managers:
-            self.managers[monster] = DQMStatusManager(monster)
+            self.managers[monster] = DQMStatusManager(monster, rng=self.rng)
         
         effects = self.managers[monster].process_turn_end()
         
@@ -3,31 +3,24 @@ Turn order and priority system for battles.
 Handles initiative, speed calculations, and action resolution order.
 """
 
-<<<<<<< HEAD
-import logging
 from typing import List, Tuple, Optional, TYPE_CHECKING
-=======
-from typing import List, Tuple, Optional, TYPE_CHECKING, Union
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
 from dataclasses import dataclass
 from enum import Enum, auto
 import random
 import logging
 
+from engine.systems.battle.stat_cache import effective_stats
+
 if TYPE_CHECKING:
     from engine.systems.monster_instance import MonsterInstance
     from engine.systems.moves import Move
 
-<<<<<<< HEAD
 # Import Formation System
 from engine.systems.battle.battle_formation import (
     BattleFormation, FormationManager, FormationType, MonsterSlot
 )
 
 # Logger für das Turn-Logic-System
-=======
-# Logger für bessere Fehlerverfolgung
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
 logger = logging.getLogger(__name__)
 
 class ActionType(Enum):
@@ -39,6 +32,8 @@ class ActionType(Enum):
     TAME = auto()      # Priority 3
     PASS = auto()      # Priority 0
     AUTO = auto()      # Priority 0
+    SKILL = auto()     # DQM skills, priority like attacks
+    SPECIAL = auto()   # Special commands like psyche up
     
     @classmethod
     def from_string(cls, value: str) -> 'ActionType':
@@ -58,24 +53,6 @@ class ActionType(Enum):
             }
             return action_type_map.get(value.lower(), cls.PASS)
 
-    @classmethod
-    def from_string(cls, value: str) -> 'ActionType':
-        """Convert string to ActionType with fallback."""
-        try:
-            return cls[value.upper()]
-        except KeyError:
-            # Fallback für verschiedene Schreibweisen
-            action_type_map = {
-                'attack': cls.ATTACK,
-                'switch': cls.SWITCH,
-                'item': cls.ITEM,
-                'flee': cls.FLEE,
-                'tame': cls.TAME,
-                'pass': cls.PASS,
-                'auto': cls.AUTO
-            }
-            return action_type_map.get(value.lower(), cls.PASS)
-
 
 @dataclass
 class BattleAction:
@@ -110,7 +87,6 @@ class BattleAction:
             elif self.action_type == ActionType.TAME:
                 return 3
             elif self.action_type == ActionType.ATTACK and self.move:
-<<<<<<< HEAD
                 return self.move.priority
             elif self.action_type == ActionType.SKILL and self.move:
                 # Skills have similar priority to attacks
@@ -119,13 +95,6 @@ class BattleAction:
                 return 0
         except Exception as e:
             logger.error(f"Fehler bei der Prioritätsberechnung: {str(e)}")
-=======
-                return getattr(self.move, 'priority', 0)
-            else:  # PASS or invalid
-                return 0
-        except Exception as e:
-            logger.error(f"Fehler bei Priority-Berechnung: {e}")
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
             return 0
     
     @property
@@ -133,7 +102,6 @@ class BattleAction:
         """Get the effective speed of the actor."""
         try:
             if not self.actor:
-<<<<<<< HEAD
                 logger.warning("Actor ist None bei Geschwindigkeitsberechnung!")
                 return 0
             
@@ -151,61 +119,9 @@ class BattleAction:
                 logger.warning(f"Ungültige Geschwindigkeit bei Monster {getattr(self.actor, 'name', 'Unknown')}: {base_speed}")
                 return 1
             
-            # Apply paralysis speed reduction
-            if hasattr(self.actor, 'status') and self.actor.status == 'paralysis':
-                base_speed = int(base_speed * 0.5)
-            
-            # Apply stat stage multipliers
-            if hasattr(self.actor, 'stat_stages') and self.actor.stat_stages:
-                try:
-                    stage = self.actor.stat_stages.get('spd', 0)
-=======
-                return 0
-                
-            # Hole Basis-Speed
-            if hasattr(self.actor, 'stats') and isinstance(self.actor.stats, dict):
-                base_speed = self.actor.stats.get('spd', 0)
-            elif hasattr(self.actor, 'stats') and hasattr(self.actor.stats, 'spd'):
-                base_speed = self.actor.stats.spd
-            else:
-                base_speed = 0
-            
-            if not isinstance(base_speed, (int, float)) or base_speed <= 0:
-                base_speed = 1  # Fallback
-            
-            # Apply paralysis speed reduction
-            if hasattr(self.actor, 'status'):
-                status = self.actor.status
-                if isinstance(status, str) and status.lower() == 'paralysis':
-                    base_speed = int(base_speed * 0.5)
-                elif hasattr(status, 'value') and status.value == 'paralysis':
-                    base_speed = int(base_speed * 0.5)
-            
-            # Apply stat stage multipliers
-            if hasattr(self.actor, 'stat_stages'):
-                stat_stages = self.actor.stat_stages
-                if hasattr(stat_stages, 'get'):
-                    stage = stat_stages.get('spd', 0)
-                elif hasattr(stat_stages, 'spd'):
-                    stage = stat_stages.spd
-                else:
-                    stage = 0
-                
-                if isinstance(stage, (int, float)):
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
-                    if stage >= 0:
-                        multiplier = (2 + stage) / 2
-                    else:
-                        multiplier = 2 / (2 - stage)
-<<<<<<< HEAD
-                    
-                    base_speed = int(base_speed * multiplier)
-                except Exception as e:
-                    logger.error(f"Fehler bei der Stat-Stage-Berechnung: {str(e)}")
-                    # Verwende Basis-Geschwindigkeit bei Fehlern
-                    pass
-            
-            return max(1, base_speed)  # Mindestens 1
+            # Status, Stat-Stufen und Trait-Modifikatoren, pro Monster gecacht
+            # und nur bei Änderungen neu berechnet (mindestens 1)
+            return effective_stats(self.actor).speed()
             
         except Exception as e:
             logger.error(f"Fehler bei der Geschwindigkeitsberechnung: {str(e)}")
@@ -241,15 +157,6 @@ class BattleAction:
         except Exception as e:
             logger.error(f"Fehler bei der effektiven Prioritätsberechnung: {str(e)}")
             return self.priority
-    SPECIAL = auto()  # Special commands like psyche up
-=======
-                    base_speed = int(base_speed * multiplier)
-            
-            return max(1, int(base_speed))  # Mindestens 1
-            
-        except Exception as e:
-            logger.error(f"Fehler bei Speed-Berechnung: {e}")
-            return 1  # Fallback
     
     def is_valid(self) -> bool:
         """Validiere die Action."""
@@ -260,7 +167,7 @@ class BattleAction:
             if self.action_type == ActionType.ATTACK:
                 if not self.move:
                     return False
-                if not self.target:
+                if not self.target and not self.targets:
                     return False
             elif self.action_type == ActionType.SWITCH:
                 if not self.switch_to:
@@ -294,7 +201,6 @@ class BattleAction:
         except Exception as e:
             logger.error(f"Fehler bei Action-zu-Dict-Konvertierung: {e}")
             return {'error': str(e)}
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
 
 
 class TurnOrder:
@@ -310,59 +216,6 @@ class TurnOrder:
         self.rng = random.Random(seed)
         self.actions: List[BattleAction] = []
         self.resolved_actions: List[BattleAction] = []
-
-
-class FormationTurnOrder(TurnOrder):
-    """Turn order system for 3v3 formation battles."""
-    
-    def __init__(self, formation_manager: Optional[FormationManager] = None, seed=None):
-        super().__init__(seed)
-        self.formation_manager = formation_manager
-    
-    def get_all_active_actors(self) -> List[Tuple[str, MonsterSlot]]:
-        """Get all monsters that can act this turn from formations."""
-        if not self.formation_manager:
-            return []
-        
-        active_actors = []
-        for team_id, formation in self.formation_manager.formations.items():
-            for slot in formation.get_active_monsters():
-                if slot.can_act():
-                    active_actors.append((team_id, slot))
-        
-        return active_actors
-    
-    def calculate_formation_turn_order(self) -> List[Tuple[str, MonsterSlot]]:
-        """Calculate turn order for all active monsters in formations."""
-        actors = self.get_all_active_actors()
-        
-        # DQM formula: Speed + Random(0-255)
-        def get_speed_value(actor_tuple):
-            team_id, slot = actor_tuple
-            base_speed = slot.monster.stats.get('spd', 50)
-            
-            # Apply status effects
-            if hasattr(slot.monster, 'status'):
-                if slot.monster.status == 'paralysis':
-                    base_speed = int(base_speed * 0.5)
-            
-            # Apply formation bonus
-            if self.formation_manager:
-                formation = self.formation_manager.formations.get(team_id)
-                if formation:
-                    bonuses = formation.get_formation_bonus()
-                    base_speed = int(base_speed * bonuses.get('spd', 1.0))
-            
-            return base_speed + self.rng.randint(0, 255)
-        
-        # Sort by speed value
-        actors.sort(key=get_speed_value, reverse=True)
-        return actors
-    
-    def add_formation_action(self, team_id: str, slot: MonsterSlot, action: BattleAction):
-        """Add an action from a formation slot."""
-        action.formation_slot = slot
-        self.add_action(action)
     
     def set_seed(self, seed: int) -> None:
         """Setze RNG-Seed für deterministische Tests."""
@@ -374,43 +227,25 @@ class FormationTurnOrder(TurnOrder):
             self.actions.clear()
             self.resolved_actions.clear()
         except Exception as e:
-<<<<<<< HEAD
             logger.error(f"Fehler beim Löschen der Aktionen: {str(e)}")
-=======
-            logger.error(f"Fehler beim Löschen der Actions: {e}")
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
     
     def add_action(self, action: BattleAction) -> bool:
         """Add an action to the current turn."""
         try:
-<<<<<<< HEAD
             if not action:
                 logger.warning("Versuch, None-Aktion hinzuzufügen!")
-                return
+                return False
             
             if not hasattr(action, 'actor') or not action.actor:
                 logger.warning("Aktion ohne gültigen Actor!")
-                return
-            
-            self.actions.append(action)
-            
-        except Exception as e:
-            logger.error(f"Fehler beim Hinzufügen der Aktion: {str(e)}")
-=======
-            if not action or not isinstance(action, BattleAction):
-                logger.warning("Ungültige Action hinzugefügt")
-                return False
-            
-            if not action.is_valid():
-                logger.warning("Ungültige Action kann nicht hinzugefügt werden")
                 return False
             
             self.actions.append(action)
             return True
+            
         except Exception as e:
-            logger.error(f"Fehler beim Hinzufügen der Action: {e}")
+            logger.error(f"Fehler beim Hinzufügen der Aktion: {str(e)}")
             return False
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
     
     def sort_actions(self, use_dqm_formula: bool = True) -> List[BattleAction]:
         """
@@ -423,7 +258,6 @@ class FormationTurnOrder(TurnOrder):
             Sorted list of actions
         """
         try:
-<<<<<<< HEAD
             if use_dqm_formula:
                 # Use DQM turn order formula: Agility + Random(0-255)
                 def sort_key(action: BattleAction) -> Tuple[int, int, float]:
@@ -476,40 +310,10 @@ class FormationTurnOrder(TurnOrder):
         Returns:
             Next action or None if no actions remain
         """
-=======
-            # Validiere alle Actions vor dem Sortieren
-            valid_actions = [action for action in self.actions if action and action.is_valid()]
-            
-            # Sortiere nach Priority (höher = zuerst) und dann nach Speed (höher = zuerst)
-            sorted_actions = sorted(
-                valid_actions,
-                key=lambda a: (a.priority, a.speed),
-                reverse=True
-            )
-            
-            return sorted_actions
-            
-        except Exception as e:
-            logger.error(f"Fehler beim Sortieren der Actions: {e}")
-            # Fallback: einfache Sortierung nach Priority
-            try:
-                return sorted(
-                    [a for a in self.actions if a],
-                    key=lambda a: getattr(a, 'priority', 0),
-                    reverse=True
-                )
-            except Exception as e2:
-                logger.error(f"Fallback-Sortierung fehlgeschlagen: {e2}")
-                return self.actions.copy()  # Rückgabe der ursprünglichen Liste
-    
-    def get_next_action(self) -> Optional[BattleAction]:
-        """Get the next action to execute."""
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
         try:
             if not self.actions:
                 return None
             
-<<<<<<< HEAD
             action = self.actions.pop(0)
             if action:
                 self.resolved_actions.append(action)
@@ -577,6 +381,107 @@ class FormationTurnOrder(TurnOrder):
         except Exception as e:
             logger.error(f"Fehler bei der Aktionen-Vorschau: {str(e)}")
             return ["Fehler bei der Vorschau"]
+    
+    def execute_action(self, action: BattleAction) -> bool:
+        """Mark an action as executed."""
+        try:
+            if action in self.actions:
+                self.actions.remove(action)
+                self.resolved_actions.append(action)
+                return True
+            return False
+        except Exception as e:
+            logger.error(f"Fehler beim Ausführen der Action: {e}")
+            return False
+    
+    def get_turn_summary(self) -> dict:
+        """Hole eine Zusammenfassung des aktuellen Turns."""
+        try:
+            sorted_actions = self.sort_actions()
+            return {
+                'total_actions': len(self.actions),
+                'resolved_actions': len(self.resolved_actions),
+                'next_action': sorted_actions[0].to_dict() if sorted_actions else None,
+                'all_actions': [action.to_dict() for action in self.actions]
+            }
+        except Exception as e:
+            logger.error(f"Fehler beim Erstellen der Turn-Zusammenfassung: {e}")
+            return {'error': str(e)}
+    
+    def validate_turn_state(self) -> bool:
+        """Validiere den aktuellen Turn-Status."""
+        try:
+            # Prüfe, dass alle Actions gültig sind
+            for action in self.actions:
+                if not action or not action.is_valid():
+                    return False
+            
+            # Prüfe, dass keine doppelten Actions existieren
+            action_ids = []
+            for action in self.actions:
+                if hasattr(action, 'actor') and hasattr(action.actor, 'id'):
+                    action_ids.append(action.actor.id)
+            
+            if len(action_ids) != len(set(action_ids)):
+                return False
+            
+            return True
+        except Exception as e:
+            logger.error(f"Fehler bei Turn-Status-Validierung: {e}")
+            return False
+
+
+class FormationTurnOrder(TurnOrder):
+    """Turn order system for 3v3 formation battles."""
+    
+    def __init__(self, formation_manager: Optional[FormationManager] = None, seed=None):
+        super().__init__(seed)
+        self.formation_manager = formation_manager
+    
+    def get_all_active_actors(self) -> List[Tuple[str, MonsterSlot]]:
+        """Get all monsters that can act this turn from formations."""
+        if not self.formation_manager:
+            return []
+        
+        active_actors = []
+        for team_id, formation in self.formation_manager.formations.items():
+            for slot in formation.get_active_monsters():
+                if slot.can_act():
+                    active_actors.append((team_id, slot))
+        
+        return active_actors
+    
+    def calculate_formation_turn_order(self) -> List[Tuple[str, MonsterSlot]]:
+        """Calculate turn order for all active monsters in formations."""
+        actors = self.get_all_active_actors()
+        
+        # DQM formula: Speed + Random(0-255)
+        def get_speed_value(actor_tuple):
+            team_id, slot = actor_tuple
+            base_speed = slot.monster.stats.get('spd', 50)
+            
+            # Apply status effects
+            if hasattr(slot.monster, 'status'):
+                if slot.monster.status == 'paralysis':
+                    base_speed = int(base_speed * 0.5)
+            
+            # Apply formation bonus
+            if self.formation_manager:
+                formation = self.formation_manager.formations.get(team_id)
+                if formation:
+                    bonuses = formation.get_formation_bonus()
+                    base_speed = int(base_speed * bonuses.get('spd', 1.0))
+            
+            return base_speed + self.rng.randint(0, 255)
+        
+        # Sort by speed value
+        actors.sort(key=get_speed_value, reverse=True)
+        return actors
+    
+    def add_formation_action(self, team_id: str, slot: MonsterSlot, action: BattleAction):
+        """Add an action from a formation slot."""
+        action.formation_slot = slot
+        self.add_action(action)
 
 
 class SpeedTier:
@@ -720,53 +625,16 @@ class TrickRoom:
             
         except Exception as e:
             logger.error(f"Fehler beim Tick von Trick Room: {str(e)}")
-=======
-            # Sortiere Actions falls noch nicht geschehen
-            sorted_actions = self.sort_actions()
-            
-            if sorted_actions:
-                return sorted_actions[0]
-            return None
-            
-        except Exception as e:
-            logger.error(f"Fehler beim Abrufen der nächsten Action: {e}")
-            return None
-    
-    def execute_action(self, action: BattleAction) -> bool:
-        """Mark an action as executed."""
-        try:
-            if action in self.actions:
-                self.actions.remove(action)
-                self.resolved_actions.append(action)
-                return True
             return False
-        except Exception as e:
-            logger.error(f"Fehler beim Ausführen der Action: {e}")
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
-            return False
-    
-    def get_turn_summary(self) -> dict:
-        """Hole eine Zusammenfassung des aktuellen Turns."""
-        try:
-            return {
-                'total_actions': len(self.actions),
-                'resolved_actions': len(self.resolved_actions),
-                'next_action': self.get_next_action().to_dict() if self.get_next_action() else None,
-                'all_actions': [action.to_dict() for action in self.actions]
-            }
-        except Exception as e:
-            logger.error(f"Fehler beim Erstellen der Turn-Zusammenfassung: {e}")
-            return {'error': str(e)}
     
-    def validate_turn_state(self) -> bool:
-        """Validiere den aktuellen Turn-Status."""
-        try:
-            # Prüfe, dass alle Actions gültig sind
-            for action in self.actions:
-                if not action or not action.is_valid():
-                    return False
+    def modify_speed(self, speed: int, max_speed: int = 999) -> int:
+        """
+        Modify speed for turn order calculation.
+        
+        Args:
+            speed: Original speed
+            max_speed: Upper speed bound used for inversion
             
-<<<<<<< HEAD
         Returns:
             Modified speed (inverted if Trick Room active)
         """
@@ -818,51 +686,19 @@ def determine_move_order(actions: List[BattleAction],
                         trick_room: Optional[TrickRoom] = None,
                         seed: Optional[int] = None,
                         use_dqm_formula: bool = True) -> List[BattleAction]:
-=======
-            # Prüfe, dass keine doppelten Actions existieren
-            action_ids = []
-            for action in self.actions:
-                if hasattr(action, 'actor') and hasattr(action.actor, 'id'):
-                    action_ids.append(action.actor.id)
-            
-            if len(action_ids) != len(set(action_ids)):
-                return False
-            
-            return True
-        except Exception as e:
-            logger.error(f"Fehler bei Turn-Status-Validierung: {e}")
-            return False
-
-
-def create_action_from_dict(action_data: dict, 
-                           actor: 'MonsterInstance',
-                           target: Optional['MonsterInstance'] = None,
-                           move: Optional['Move'] = None,
-                           switch_to: Optional['MonsterInstance'] = None) -> Optional[BattleAction]:
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
     """
-    Erstelle eine BattleAction aus einem Dictionary.
+    Determine the order in which actions resolve.
     
     Args:
-<<<<<<< HEAD
         actions: List of actions to sort
         trick_room: Optional Trick Room effect
         seed: Random seed for tiebreakers
         use_dqm_formula: Whether to use DQM turn order formula
         
-=======
-        action_data: Dictionary mit Action-Daten
-        actor: Das ausführende Monster
-        target: Ziel-Monster (optional)
-        move: Zu verwendender Move (optional)
-        switch_to: Wechsel-Monster (optional)
-    
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
     Returns:
-        BattleAction oder None bei Fehlern
+        Sorted list of actions
     """
     try:
-<<<<<<< HEAD
         turn_order = TurnOrder(seed)
         
         # Filtere ungültige Aktionen heraus
@@ -890,30 +726,6 @@ def create_action_from_dict(action_data: dict,
     except Exception as e:
         logger.error(f"Fehler bei der Zugreihenfolge-Bestimmung: {str(e)}")
         return []
-=======
-        if not action_data or 'action_type' not in action_data:
-            return None
-        
-        # Konvertiere action_type
-        action_type_str = action_data['action_type']
-        if isinstance(action_type_str, str):
-            action_type = ActionType.from_string(action_type_str)
-        else:
-            action_type = action_type_str
-        
-        return BattleAction(
-            actor=actor,
-            action_type=action_type,
-            target=target,
-            move=move,
-            item_id=action_data.get('item_id'),
-            switch_to=switch_to
-        )
-        
-    except Exception as e:
-        logger.error(f"Fehler beim Erstellen der Action aus Dict: {e}")
-        return None
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
 
 
 def validate_action_sequence(actions: List[BattleAction]) -> Tuple[bool, List[str]]:
@@ -946,7 +758,24 @@ def validate_action_sequence(actions: List[BattleAction]) -> Tuple[bool, List[st
         
         return len(errors) == 0, errors
         
-<<<<<<< HEAD
+    except Exception as e:
+        errors.append(f"Fehler bei der Action-Sequenz-Validierung: {e}")
+        return False, errors
+
+
+class TurnManager:
+    """Tracks turn count and battle phase around a TurnOrder."""
+    
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: Random seed for the underlying turn order
+        """
+        self.turn_count = 0
+        self.current_phase = "input"
+        self.turn_order = TurnOrder(seed)
+        self.actions_this_turn: List[BattleAction] = []
+    
     def start_new_turn(self) -> None:
         """Begin a new turn."""
         try:
@@ -1007,8 +836,3 @@ def validate_action_sequence(actions: List[BattleAction]) -> Tuple[bool, List[st
         except Exception as e:
             logger.error(f"Fehler bei der Runden-Vollständigkeits-Überprüfung: {str(e)}")
             return False
-=======
-    except Exception as e:
-        errors.append(f"Fehler bei der Action-Sequenz-Validierung: {e}")
-        return False, errors
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
@@ -246,6 +246,7 @@ class ConditionManager:
         self.volatile_conditions: Dict[str, int] = {}  # condition_id -> duration
         self.condition_counters: Dict[str, int] = {}  # For escalating effects
         self.last_move_used: Optional[str] = None  # For torment tracking
+        self.version = 0  # Bumped when stat modifiers may change
     
     def can_inflict_primary(self, condition_id: str) -> Tuple[bool, str]:
         """
@@ -302,6 +303,7 @@ class ConditionManager:
             self.primary_duration = -1  # Permanent
         
         self.primary_condition = condition_id
+        self.version += 1
         
         # Initialize counter for escalating conditions
         if condition_id == 'badly_poisoned':
@@ -352,6 +354,7 @@ class ConditionManager:
         
         self.primary_condition = None
         self.primary_duration = 0
+        self.version += 1
         self.condition_counters.clear()
         
         # Update monster's status field
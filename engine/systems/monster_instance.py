@@ -3,11 +3,6 @@ Simplified MonsterInstance for 3v3 Battle Testing
 This is a temporary implementation for testing the 3v3 system
 """
 
-<<<<<<< HEAD
-from enum import Enum
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
-=======
 from typing import Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass
 from enum import Enum
@@ -15,7 +10,6 @@ import random
 import logging
 from engine.systems.stats import BaseStats, StatCalculator, Experience, GrowthCurve, StatStages
 from engine.systems.moves import Move, move_registry
-from engine.core.resources import resources
 
 # Logger für bessere Fehlerverfolgung
 logger = logging.getLogger(__name__)
@@ -23,6 +17,7 @@ logger = logging.getLogger(__name__)
 class StatusCondition(Enum):
     """Status conditions that can affect monsters."""
     NONE = "none"
+    NORMAL = "none"        # Alias of NONE used by the battle actions
     BURN = "burn"          # Feuer damage over time, halves ATK
     POISON = "poison"      # Seuche damage over time
     PARALYSIS = "paralysis"  # May skip turn, reduces SPD
@@ -51,6 +46,8 @@ class StatusCondition(Enum):
         elif isinstance(other, str):
             return self.value == other.lower()
         return False
+    
+    __hash__ = Enum.__hash__
 
 
 class MonsterRank(Enum):
@@ -93,25 +90,25 @@ class MonsterRank(Enum):
         }
         return modifiers.get(self.value, 1.0)
 
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
 
 @dataclass
 class MonsterSpecies:
     """Monster species data"""
-    id: int
+    id: Union[int, str]
     name: str
-    base_stats: Dict[str, int]
-    types: List[str]
-    rank: str = "F"
-    abilities: List[str] = None
-    evolution_level: Optional[int] = None
-    evolution_to: Optional[int] = None
+    era: str = "present"
+    rank: MonsterRank = MonsterRank.E
+    types: Optional[List[str]] = None
+    base_stats: Optional[BaseStats] = None
+    growth_curve: GrowthCurve = GrowthCurve.MEDIUM_FAST
+    base_exp_yield: int = 64
+    capture_rate: int = 45
+    traits: Optional[List[str]] = None
+    learnset: Optional[List[Tuple[int, str]]] = None
+    evolution: Optional[Dict[str, Any]] = None
+    description: str = ""
     
     def __post_init__(self):
-<<<<<<< HEAD
-        if self.abilities is None:
-            self.abilities = []
-=======
         """Validiere und setze Standardwerte nach der Initialisierung."""
         if self.types is None:
             self.types = ["Bestie"]
@@ -119,10 +116,12 @@ class MonsterSpecies:
             self.traits = []
         if self.learnset is None:
             self.learnset = []
+        if isinstance(self.base_stats, dict):
+            self.base_stats = BaseStats.from_dict(self.base_stats)
         
         # Validiere kritische Felder
-        if not isinstance(self.id, int):
-            raise ValueError("ID muss eine Ganzzahl sein")
+        if not isinstance(self.id, (int, str)):
+            raise ValueError("ID muss eine Ganzzahl oder ein String sein")
         if not self.name or not isinstance(self.name, str):
             raise ValueError("Name muss ein nicht-leerer String sein")
         if not isinstance(self.rank, MonsterRank):
@@ -146,19 +145,11 @@ class MonsterSpecies:
             except ValueError:
                 logger.warning(f"Ungültige Growth Curve: {curve_str}, verwende Standard")
             
-            # Convert rank string to enum
-            rank = MonsterRank.E
-            rank_str = data.get("rank", "E")
-            try:
-                rank = MonsterRank.from_string(str(rank_str))
-            except ValueError:
-                logger.warning(f"Ungültiger Rank: {rank_str}, verwende E")
-            
             return cls(
                 id=data["id"],
                 name=data["name"],
                 era=data.get("era", "present"),
-                rank=rank,
+                rank=MonsterRank.from_string(str(data.get("rank", "E"))),
                 types=data.get("types", ["Bestie"]),
                 base_stats=BaseStats.from_dict(data["base_stats"]) if "base_stats" in data else None,
                 growth_curve=growth_curve,
@@ -172,103 +163,61 @@ class MonsterSpecies:
         except Exception as e:
             logger.error(f"Fehler beim Erstellen der MonsterSpecies aus Dict: {e}")
             raise
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
 
-class StatusCondition(Enum):
-    """Status conditions for monsters"""
-    NORMAL = "normal"
-    POISON = "poison"
-    BURN = "burn"
-    PARALYSIS = "paralysis"
-    SLEEP = "sleep"
-    FREEZE = "freeze"
-    CONFUSION = "confusion"
 
 class MonsterInstance:
     """Simplified monster instance for battle testing"""
     
-<<<<<<< HEAD
-    def __init__(self, species_id: str = "test", level: int = 5, **kwargs):
-        # Basic info
-        self.species_id = species_id
-        self.id = kwargs.get('id', species_id)  # For compatibility
-=======
-    def __init__(self, species: 'MonsterSpecies', level: int = 5,
-                 nickname: Optional[str] = None):
+    def __init__(self, species: Union['MonsterSpecies', str, None] = None, level: int = 5,
+                 nickname: Optional[str] = None, **overrides):
         """
         Create a monster instance.
         
         Args:
-            species: The species data
+            species: The species data; a species id string creates a
+                placeholder species (legacy keyword style, see overrides)
             level: Starting level
             nickname: Optional nickname
+            **overrides: Legacy keywords (species_id, name, stats, max_hp,
+                current_hp, max_mp, current_mp, moves, rank, experience)
         """
-        # Validiere Input-Parameter
-        if not species:
-            raise ValueError("Species darf nicht None sein")
         if not isinstance(level, int) or level < 1:
             raise ValueError("Level muss eine positive Ganzzahl sein")
         
+        if not isinstance(species, MonsterSpecies):
+            # Legacy-Aufruf: MonsterInstance("Schleim", level=8, stats={...})
+            species_id = overrides.pop('species_id', species if species is not None else "test")
+            species = MonsterSpecies(
+                id=species_id,
+                name=overrides.pop('name', None) or f"Monster_{species_id}",
+                rank=overrides.pop('rank', MonsterRank.F),
+            )
+        
         self.species = species
+        self.species_id = species.id
+        self.species_name = overrides.pop('species_name', species.name)
+        self.id = overrides.pop('id', species.id)
         self.nickname = nickname
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
         self.level = level
-        self.name = kwargs.get('name', f"Monster_{species_id}")
-        self.species_name = kwargs.get('species_name', self.name)
-        self.species = kwargs.get('species', None)
-        self.nickname = kwargs.get('nickname', None)
-        self.rank = kwargs.get('rank', 'F')
-        self.experience = kwargs.get('experience', 0)
         
-<<<<<<< HEAD
-        # HP/MP
-        # Use stats['hp'] if available, otherwise calculate
-        hp_stat = self.stats.get('hp', 100) if hasattr(self, 'stats') else 100
-        self.max_hp = kwargs.get('max_hp', hp_stat + level * 10)
-        self.current_hp = kwargs.get('current_hp', self.max_hp)
-=======
         # RNG für deterministische Tests (muss vor _generate_ivs gesetzt werden)
         self.rng = random.Random()
         
         # Individual Values (IVs) - genetic potential (0-31)
         self.ivs = self._generate_ivs()
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
+        self.evs = {"hp": 0, "atk": 0, "def": 0, "mag": 0, "res": 0, "spd": 0}
         
-        # Ensure HP is never 0 on creation
-        if self.current_hp <= 0:
-            self.current_hp = self.max_hp
-        self.max_mp = kwargs.get('max_mp', 50 + level * 5)
-        self.current_mp = kwargs.get('current_mp', self.max_mp)
-        
-<<<<<<< HEAD
-        # Stats
-        base_stat = 40 + level * 2
-        self.stats = kwargs.get('stats', {
-            'atk': base_stat,
-            'def': base_stat - 5,
-            'mag': base_stat - 10,
-            'res': base_stat - 10,
-            'agility': base_stat,
-            'speed': base_stat  # Alias for agility
-        })
-        
-        # Status
-        self.status = StatusCondition.NORMAL
-=======
         # Nature (affects stat growth)
         self.nature = self._generate_nature()
         
         # Calculate stats
-        try:
-            self.stats = self._calculate_stats()
-            self.max_hp = self.stats["hp"]
+        self.stats = overrides.pop('stats', None) or self._calculate_stats()
+        self.max_hp = overrides.pop('max_hp', self.stats.get("hp", 100))
+        self.current_hp = overrides.pop('current_hp', self.max_hp)
+        if self.current_hp <= 0:
             self.current_hp = self.max_hp
-        except Exception as e:
-            logger.error(f"Fehler bei der Stats-Berechnung: {e}")
-            # Fallback-Stats
-            self.stats = {"hp": 100, "atk": 50, "def": 50, "mag": 30, "res": 30, "spd": 70}
-            self.max_hp = 100
-            self.current_hp = 100
+        self.max_mp = overrides.pop('max_mp', 50 + level * 5)
+        self.current_mp = overrides.pop('current_mp', self.max_mp)
         
         # Battle stats (stages)
         self.stat_stages = StatStages()
@@ -278,12 +227,15 @@ class MonsterInstance:
         self.status_turns = 0
         
         # Moves (max 4)
-        self.moves: List[Move] = []
-        self._learn_initial_moves()
+        self.moves: List[Move] = list(overrides.pop('moves', None) or [])
+        if not self.moves:
+            self._learn_initial_moves()
         
         # Experience
         try:
-            self.exp = Experience.get_exp_for_level(level, species.growth_curve)
+            self.exp = overrides.pop('experience', None)
+            if self.exp is None:
+                self.exp = Experience.get_exp_for_level(level, species.growth_curve)
         except Exception as e:
             logger.error(f"Fehler bei der EP-Berechnung: {e}")
             self.exp = 0
@@ -293,97 +245,15 @@ class MonsterInstance:
         self.held_item: Optional[str] = None
         
         # Battle state
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
         self.is_fainted = False
-        self.stat_stages = {'atk': 0, 'def': 0, 'mag': 0, 'res': 0, 'spd': 0}
-        
-<<<<<<< HEAD
-        # Moves (simplified)
-        self.moves = kwargs.get('moves', [])
-        if not self.moves:
-            # Create some default moves
-            from dataclasses import dataclass
-            
-            # Default moves
-            from dataclasses import dataclass
-            
-            @dataclass
-            class Move:
-                name: str
-                power: int
-                pp: int
-                max_pp: int
-                target_type: str = "single"
-                element: str = "normal"
-                
-                @property
-                def id(self):
-                    """Generate ID from name."""
-                    return self.name.lower().replace(" ", "_")
-                
-                @property 
-                def category(self):
-                    """Determine category."""
-                    return "phys" if self.element in ["normal", "fighting"] else "mag"
-
-            self.moves = [
-                Move("Tackle", 40, 35, 35),
-                Move("Fireball", 50, 20, 20, "single", "fire"),
-                Move("Ice Storm", 45, 15, 15, "all", "ice"),
-                Move("Heal", 0, 10, 10, "self", "heal")
-            ]
-    
-    def take_damage(self, damage: int) -> int:
-        """Take damage and update status"""
-        actual_damage = min(damage, self.current_hp)
-        self.current_hp -= actual_damage
-        
-        if self.current_hp <= 0:
-            self.current_hp = 0
-            self.is_fainted = True
-            self.status = StatusCondition.NORMAL  # Clear status on faint
-        
-        return actual_damage
-    
-    def heal(self, amount: int) -> int:
-        """Heal HP"""
-        if self.is_fainted:
-            return 0
-        
-        actual_heal = min(amount, self.max_hp - self.current_hp)
-        self.current_hp += actual_heal
-        return actual_heal
-    
-    def use_mp(self, amount: int) -> bool:
-        """Use MP for a skill"""
-        if self.current_mp >= amount:
-            self.current_mp -= amount
-            return True
-        return False
-    
-    def restore_mp(self, amount: int) -> int:
-        """Restore MP"""
-        actual_restore = min(amount, self.max_mp - self.current_mp)
-        self.current_mp += actual_restore
-        return actual_restore
-    
-    def get_stat(self, stat_name: str) -> int:
-        """Get effective stat value with stages"""
-        base_value = self.stats.get(stat_name, 50)
         
-        # Apply stat stages if they exist
-        if hasattr(self, 'stat_stages') and stat_name in self.stat_stages:
-            stage = self.stat_stages[stat_name]
-            # Each stage is 10% boost/reduction
-            multiplier = 1.0 + (stage * 0.1)
-            return int(base_value * multiplier)
-        
-        return base_value
-=======
         # Capture info
         self.original_trainer = None
         self.capture_location = None
         self.capture_level = level
+        
+        if overrides:
+            logger.warning(f"Unbekannte MonsterInstance-Parameter ignoriert: {sorted(overrides)}")
     
     def set_random_seed(self, seed: int) -> None:
         """Setze RNG-Seed für deterministische Tests."""
@@ -392,12 +262,35 @@ class MonsterInstance:
     @property
     def name(self) -> str:
         """Hole den Namen des Monsters (Nickname oder Spezies-Name)."""
-        return self.nickname or self.species.name
+        return self.nickname or self.species_name
+    
+    @name.setter
+    def name(self, value: str) -> None:
+        self.nickname = value
+    
+    @property
+    def stat_stages(self) -> StatStages:
+        """Stat-Stufen im Kampf (versioniert, für den Effektivwert-Cache)."""
+        return self._stat_stages
+    
+    @stat_stages.setter
+    def stat_stages(self, value: Dict[str, int]) -> None:
+        # Auch zugewiesene Dicts (Szenen, Snapshots) müssen versioniert bleiben
+        self._stat_stages = value if isinstance(value, StatStages) else StatStages(value)
     
     @property
-    def id(self) -> int:
-        """Hole die ID des Monsters."""
-        return getattr(self.species, 'id', 0)
+    def rank(self) -> MonsterRank:
+        """Rank of the monster's species."""
+        return getattr(self.species, 'rank', MonsterRank.E)
+    
+    @property
+    def experience(self) -> int:
+        """Alias of exp for older save and battle code."""
+        return self.exp
+    
+    @experience.setter
+    def experience(self, value: int) -> None:
+        self.exp = value
     
     def _generate_ivs(self) -> Dict[str, int]:
         """Generate random IVs for the monster."""
@@ -429,13 +322,17 @@ class MonsterInstance:
     
     def _calculate_stats(self) -> Dict[str, int]:
         """Calculate the monster's stats based on species, level, IVs, and EVs."""
+        if not self.species.base_stats:
+            # Platzhalter-Spezies ohne Basiswerte: einfache Level-Skalierung
+            base_stat = 40 + self.level * 2
+            return {'hp': base_stat + 20, 'atk': base_stat, 'def': base_stat - 5,
+                    'mag': base_stat - 10, 'res': base_stat - 10, 'spd': base_stat}
         try:
-            if not self.species.base_stats:
-                raise ValueError("Keine Basis-Stats verfügbar")
+            base_stats = self.species.base_stats.to_dict()
             
             stats = {}
             for stat_name in ["hp", "atk", "def", "mag", "res", "spd"]:
-                base_stat = getattr(self.species.base_stats, stat_name, 0)
+                base_stat = base_stats.get(stat_name, 0)
                 
                 if stat_name == "hp":
                     # HP formula
@@ -570,6 +467,32 @@ class MonsterInstance:
             logger.error(f"Fehler beim Heilen: {e}")
             return 0
     
+    def use_mp(self, amount: int) -> bool:
+        """Use MP for a skill"""
+        if self.current_mp >= amount:
+            self.current_mp -= amount
+            return True
+        return False
+    
+    def restore_mp(self, amount: int) -> int:
+        """Restore MP"""
+        actual_restore = min(amount, self.max_mp - self.current_mp)
+        self.current_mp += actual_restore
+        return actual_restore
+    
+    def get_stat(self, stat_name: str) -> int:
+        """Get effective stat value with stages"""
+        base_value = self.stats.get(stat_name, 50)
+        
+        # Apply stat stages if they exist
+        if hasattr(self, 'stat_stages') and stat_name in self.stat_stages:
+            stage = self.stat_stages[stat_name]
+            # Each stage is 10% boost/reduction
+            multiplier = 1.0 + (stage * 0.1)
+            return int(base_value * multiplier)
+        
+        return base_value
+    
     def gain_exp(self, exp_amount: int) -> Dict[str, Any]:
         """Gain experience and return level up information."""
         try:
@@ -663,11 +586,10 @@ class MonsterInstance:
         except Exception as e:
             logger.error(f"Fehler bei der Monster-Validierung: {e}")
             return False
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
     
     def reset_stat_stages(self):
         """Reset all stat stages to 0"""
-        self.stat_stages = {'atk': 0, 'def': 0, 'mag': 0, 'res': 0, 'spd': 0}
+        self.stat_stages = StatStages()
     
     def apply_status(self, status: StatusCondition) -> bool:
         """Apply a status condition"""
@@ -684,8 +606,13 @@ class MonsterInstance:
         """Remove status condition"""
         self.status = StatusCondition.NORMAL
     
-    def can_act(self) -> bool:
-        """Check if monster can take action"""
+    def can_act(self, rng: Optional[random.Random] = None) -> bool:
+        """
+        Check if monster can take action.
+        
+        Args:
+            rng: Battle RNG for the paralysis roll (defaults to the monster's own RNG)
+        """
         if self.is_fainted:
             return False
         
@@ -694,8 +621,7 @@ class MonsterInstance:
         
         if self.status == StatusCondition.PARALYSIS:
             # 25% chance to not act
-            import random
-            return random.random() > 0.25
+            return (rng if rng is not None else self.rng).random() > 0.25
         
         return True
     
@@ -706,66 +632,12 @@ class MonsterInstance:
         return self.name
     
     @classmethod
-    def create_from_species(cls, species: 'MonsterSpecies', level: int = 1) -> 'MonsterInstance':
-        """Create a monster instance from species data"""
-        # Handle both dict and object
+    def create_from_species(cls, species: Union['MonsterSpecies', Dict[str, Any]],
+                            level: int = 1) -> 'MonsterInstance':
+        """Create a monster instance from species data (object or dict)"""
         if isinstance(species, dict):
-            species_id = species.get('id', 'unknown')
-            name = species.get('name', 'Unknown')
-            base_stats = species.get('base_stats', {})
-            rank = species.get('rank', 'F')
-        else:
-            species_id = getattr(species, 'id', 'unknown')
-            name = getattr(species, 'name', 'Unknown')
-            base_stats = getattr(species, 'base_stats', {})
-            rank = getattr(species, 'rank', 'F')
-        
-        # Calculate stats based on level
-        stats = {}
-        for stat_name, base_value in base_stats.items():
-            # Simple level scaling
-            stats[stat_name] = base_value + (level - 1) * 2
-        
-        # Ensure all required stats exist
-        required_stats = ['hp', 'atk', 'def', 'mag', 'res', 'spd']
-        for stat in required_stats:
-            if stat not in stats:
-                stats[stat] = 40 + level * 2
-        
-        # Calculate HP and MP
-        max_hp = stats.get('hp', 100) + level * 10
-        max_mp = 50 + level * 5
-        
-        return cls(
-            species_id=str(species_id),
-            level=level,
-            name=name,
-            species_name=name,
-            species=species,
-            max_hp=max_hp,
-            current_hp=max_hp,
-            max_mp=max_mp,
-            current_mp=max_mp,
-            stats=stats,
-            rank=rank
-        )
-    
-    def gain_exp(self, amount: int):
-        """Gain experience points"""
-        self.experience += amount
-        # Simple level up check
-        exp_needed = self.level * 100
-        while self.experience >= exp_needed:
-            self.experience -= exp_needed
-            self.level += 1
-            # Increase stats on level up
-            for stat in self.stats:
-                self.stats[stat] += 2
-            self.max_hp += 10
-            self.current_hp = self.max_hp
-            self.max_mp += 5
-            self.current_mp = self.max_mp
-            exp_needed = self.level * 100
+            species = MonsterSpecies.from_dict(species)
+        return cls(species, level)
 
 
 # For backwards compatibility
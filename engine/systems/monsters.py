@@ -375,5 +375,12 @@ class MonsterDatabase:
         return min(1.0, base_rate)
 
 
-# Global singleton instance
-monster_db = MonsterDatabase()
+# Global singleton instance, created on first access (PEP 562)
+def __getattr__(name: str) -> Any:
+    if name != 'monster_db':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from engine.devtools.startup_profiler import measure
+    global monster_db
+    with measure('MonsterDatabase'):
+        monster_db = MonsterDatabase()
+    return monster_db
@@ -7,7 +7,6 @@ from typing import Dict, List, Optional, Any, Callable, Tuple, Union
 from enum import Enum
 from dataclasses import dataclass
 import logging
-from engine.core.resources import resources
 
 # Logger für bessere Fehlerverfolgung
 logger = logging.getLogger(__name__)
@@ -564,7 +563,6 @@ class MoveRegistry:
         except Exception as e:
             logger.error(f"Fehler beim Abrufen aller Moves: {e}")
             return []
-<<<<<<< HEAD
     
     def create_move_instance_by_name(self, move_name: str) -> Optional[Move]:
         """Create a move instance by name."""
@@ -634,8 +632,6 @@ class MoveRegistry:
         except Exception as e:
             logger.error(f"Fehler beim Erstellen des Move-Instanz für ID '{move_id}': {e}")
             return None
-=======
->>>>>>> 7ecd4982cbdea3a309c5b8eeb21d18deda1810fc
 
 
 # Global move registry instance
@@ -63,12 +63,22 @@ class BaseStats:
         )
 
 
-class StatStages:
+class StatStages(dict):
     """
     Manages stat stage modifiers in battle.
     Stages range from -6 to +6, affecting stats multiplicatively.
+    
+    Keyed by stat name ('atk', 'spd', ...), so it can stand in for the plain
+    stage dict monsters carry. Every write bumps `version`, which lets the
+    effective stat cache detect changes without comparing contents.
     """
     
+    # Stages a monster starts a battle with
+    BATTLE_STATS = ('atk', 'def', 'mag', 'res', 'spd')
+    
+    # Every stat that can carry a stage
+    STAGE_STATS = BATTLE_STATS + ('acc', 'eva')
+    
     # Stage multipliers (index 0 = stage -6, index 6 = stage 0, index 12 = stage +6)
     STAGE_MULTIPLIERS = [
         0.25,   # -6
@@ -103,23 +113,29 @@ class StatStages:
         3.00    # +6
     ]
     
-    def __init__(self) -> None:
-        """Initialize all stages to 0."""
-        self.stages = {
-            Stat.ATK: 0,
-            Stat.DEF: 0,
-            Stat.MAG: 0,
-            Stat.RES: 0,
-            Stat.SPD: 0,
-            Stat.ACC: 0,
-            Stat.EVA: 0
-        }
+    # Class default, so unpickling (which fills the dict before the
+    # instance state) can already count writes
+    version = 0
+    
+    def __init__(self, stages: Optional[Dict[str, int]] = None) -> None:
+        """
+        Initialize the stages.
+        
+        Args:
+            stages: Initial stages by stat name (default: all battle stats at 0)
+        """
+        super().__init__(dict.fromkeys(self.BATTLE_STATS, 0) if stages is None else stages)
+        self.version = 0
+    
+    @staticmethod
+    def _key(stat: 'Stat | str') -> str:
+        return stat.value if isinstance(stat, Stat) else stat
     
-    def get_stage(self, stat: Stat) -> int:
+    def get_stage(self, stat: 'Stat | str') -> int:
         """Get the current stage for a stat."""
-        return self.stages.get(stat, 0)
+        return self.get(self._key(stat), 0)
     
-    def modify_stage(self, stat: Stat, change: int) -> int:
+    def modify_stage(self, stat: 'Stat | str', change: int) -> int:
         """
         Modify a stat stage by a certain amount.
         
@@ -130,17 +146,19 @@ class StatStages:
         Returns:
             The actual change applied (may be limited by bounds)
         """
-        if stat not in self.stages:
+        key = self._key(stat)
+        if key not in self.STAGE_STATS:
             return 0
         
-        old_stage = self.stages[stat]
+        old_stage = self.get(key, 0)
         new_stage = max(-6, min(6, old_stage + change))
         actual_change = new_stage - old_stage
         
-        self.stages[stat] = new_stage
+        if actual_change:
+            self[key] = new_stage
         return actual_change
     
-    def get_multiplier(self, stat: Stat) -> float:
+    def get_multiplier(self, stat: 'Stat | str') -> float:
         """
         Get the multiplier for a stat based on its stage.
         
@@ -150,24 +168,59 @@ class StatStages:
         Returns:
             The multiplier value
         """
-        stage = self.get_stage(stat)
-        index = stage + 6  # Convert to array index
+        key = self._key(stat)
+        index = self.get_stage(key) + 6  # Convert to array index
         
-        if stat in [Stat.ACC, Stat.EVA]:
+        if key in ('acc', 'eva'):
             return self.ACC_EVA_MULTIPLIERS[index]
         else:
             return self.STAGE_MULTIPLIERS[index]
     
     def reset(self) -> None:
         """Reset all stages to 0."""
-        for stat in self.stages:
-            self.stages[stat] = 0
+        for stat in self:
+            dict.__setitem__(self, stat, 0)
+        self.version += 1
     
     def reset_negative(self) -> None:
         """Reset only negative stages to 0 (used for switching out)."""
-        for stat in self.stages:
-            if self.stages[stat] < 0:
-                self.stages[stat] = 0
+        for stat, stage in self.items():
+            if stage < 0:
+                dict.__setitem__(self, stat, 0)
+        self.version += 1
+    
+    # --- Versioned dict writes ---
+    
+    def __setitem__(self, key: str, value: int) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+    
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.version += 1
+    
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self.version += 1
+    
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+    
+    def pop(self, *args) -> int:
+        self.version += 1
+        return super().pop(*args)
+    
+    def popitem(self) -> Tuple[str, int]:
+        self.version += 1
+        return super().popitem()
+    
+    def setdefault(self, key: str, default: int = 0) -> int:
+        self.version += 1
+        return super().setdefault(key, default)
+    
+    def copy(self) -> 'StatStages':
+        return StatStages(self)
 
 
 class Experience:
@@ -132,8 +132,9 @@ class TypeChart:
         self.combos: Dict[Tuple[str, ...], float] = {}
         self.adaptive_resistances: Dict[Tuple[str, str], float] = {}
         
-        # Performance tracking
-        self._calculation_times = []
+        # Performance tracking (running totals, memory stays constant)
+        self._calculation_time_total = 0.0
+        self._calculation_count = 0
         self._last_cleanup = time.time()
         
         # Load data
@@ -348,7 +349,8 @@ class TypeChart:
         
         # Track performance
         calc_time = time.time() - start_time
-        self._calculation_times.append(calc_time)
+        self._calculation_time_total += calc_time
+        self._calculation_count += 1
         
         # Cleanup cache if needed
         self._cleanup_cache()
@@ -401,7 +403,7 @@ class TypeChart:
             'cache_hits': self._cache_hits,
             'cache_misses': self._cache_misses,
             'cache_hit_rate': self._cache_hits / max(1, self._cache_hits + self._cache_misses),
-            'avg_calculation_time': sum(self._calculation_times) / max(1, len(self._calculation_times)),
+            'avg_calculation_time': self._calculation_time_total / max(1, self._calculation_count),
             'matrix_initialized': self._matrix_initialized,
             'numpy_available': NUMPY_AVAILABLE,
             'cache_size': len(self.lookup_cache)
@@ -412,7 +414,8 @@ class TypeChart:
         self.lookup_cache.clear()
         self._cache_hits = 0
         self._cache_misses = 0
-        self._calculation_times.clear()
+        self._calculation_time_total = 0.0
+        self._calculation_count = 0
 
 
 class TypeSystemAPI:
@@ -646,6 +649,16 @@ class TypeSystemAPI:
         }
 
 
-# Create global instances for convenience
-type_chart = TypeChart()
-type_api = TypeSystemAPI()
\ No newline at end of file
+# Global instances for convenience, created on first access (PEP 562)
+_LAZY_SINGLETONS = {'type_chart': TypeChart, 'type_api': TypeSystemAPI}
+
+
+def __getattr__(name: str) -> Any:
+    factory = _LAZY_SINGLETONS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from engine.devtools.startup_profiler import measure
+    with measure(name):
+        instance = factory()
+    globals()[name] = instance
+    return instance
\ No newline at end of file
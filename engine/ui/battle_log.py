@@ -12,6 +12,7 @@ from enum import Enum, auto
 from pathlib import Path
 
 from engine.core.config import Colors, LOGICAL_WIDTH, LOGICAL_HEIGHT
+from engine.graphics.text_engine import TextEngine
 
 
 class MessagePriority(Enum):
@@ -84,9 +85,10 @@ class BattleLog:
             MessageCategory.SYSTEM: "ℹ️"
         }
         
-        # Font setup
-        self.font = pygame.font.Font(None, 12)
-        self.small_font = pygame.font.Font(None, 10)
+        # Font setup (shared fonts and glyph cache)
+        self.text_engine = TextEngine.get()
+        self.font = self.text_engine.get_font(12)
+        self.small_font = self.text_engine.get_font(10)
         
         # Display settings
         self.log_position = (10, LOGICAL_HEIGHT - 120)
@@ -337,8 +339,10 @@ class BattleLog:
         pygame.draw.rect(surface, Colors.UI_BG, (x, y, self.log_width, self.log_height))
         pygame.draw.rect(surface, Colors.UI_BORDER, (x, y, self.log_width, self.log_height), 2)
         
+        render = self.text_engine.render
+        
         # Title bar
-        title = self.font.render("Kampf-Log", True, Colors.WHITE)
+        title = render("Kampf-Log", self.font, Colors.WHITE)
         surface.blit(title, (x + 5, y + 2))
         
         # Scroll indicator
@@ -356,32 +360,20 @@ class BattleLog:
             
             # Category icon
             icon = self.category_icons.get(message.category, "ℹ️")
-            icon_surface = self.small_font.render(icon, True, Colors.WHITE)
+            icon_surface = render(icon, self.small_font, Colors.WHITE)
             surface.blit(icon_surface, (x + 5, line_y))
             
-            # Message text with priority color
+            # Message text with priority color, truncated if too long
             color = self.priority_colors.get(message.priority, Colors.WHITE)
-            text_surface = self.font.render(message.text, True, color)
-            
-            # Truncate text if too long
-            if text_surface.get_width() > self.log_width - 30:
-                # Find last space before cutoff
-                text = message.text
-                while text and self.font.render(text + "...", True, color).get_width() > self.log_width - 30:
-                    text = text[:-1]
-                    if text.rfind(' ') > 0:
-                        text = text[:text.rfind(' ')]
-                text += "..."
-                text_surface = self.font.render(text, True, color)
-            
-            surface.blit(text_surface, (x + 20, line_y))
+            text = self.text_engine.truncate(message.text, self.font, self.log_width - 30)
+            surface.blit(render(text, self.font, color), (x + 20, line_y))
             
             # Special effect indicators
             if message.is_critical:
-                crit_indicator = self.small_font.render("CRIT!", True, Colors.YELLOW)
+                crit_indicator = render("CRIT!", self.small_font, Colors.YELLOW)
                 surface.blit(crit_indicator, (x + self.log_width - 40, line_y))
             elif message.is_super_effective:
-                se_indicator = self.small_font.render("SE!", True, Colors.MAGENTA)
+                se_indicator = render("SE!", self.small_font, Colors.MAGENTA)
                 surface.blit(se_indicator, (x + self.log_width - 30, line_y))
     
     def export_to_file(self, filename: Optional[str] = None) -> str:
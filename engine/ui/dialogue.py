@@ -8,6 +8,8 @@ from typing import List, Optional, Tuple, Callable, Dict, Any
 from enum import Enum
 from dataclasses import dataclass
 
+from engine.graphics.text_engine import TextEngine, TextLine
+
 
 class DialogueState(Enum):
     """States for dialogue box."""
@@ -75,9 +77,11 @@ class DialogueBox:
         self.border_width = 2
         
         # Font settings
+        self.text_engine = TextEngine.get()
         self.font: Optional[pygame.font.Font] = None
         self.speaker_font: Optional[pygame.font.Font] = None
         self._load_fonts()
+        self._text_lines: List[TextLine] = []  # Reused per visible line (typewriter)
         
         # Dialogue state
         self.state = DialogueState.CLOSED
@@ -118,8 +122,8 @@ class DialogueBox:
     def _load_fonts(self) -> None:
         """Load fonts for dialogue rendering."""
         try:
-            self.font = pygame.font.Font(None, 14)
-            self.speaker_font = pygame.font.Font(None, 16)
+            self.font = self.text_engine.get_font(14)
+            self.speaker_font = self.text_engine.get_font(16)
         except:
             print("Warning: Could not load dialogue fonts")
     
@@ -217,29 +221,8 @@ class DialogueBox:
         if not self.font:
             return text
         
-        words = text.split()
-        lines = []
-        current_line = []
-        
         max_width = self.width - (self.padding * 2)
-        
-        for word in words:
-            # Check if adding this word exceeds width
-            test_line = ' '.join(current_line + [word])
-            text_width = self.font.size(test_line)[0]
-            
-            if text_width > max_width and current_line:
-                # Start new line
-                lines.append(' '.join(current_line))
-                current_line = [word]
-            else:
-                current_line.append(word)
-        
-        # Add remaining words
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        return '\n'.join(lines)
+        return '\n'.join(self.text_engine.wrap(text, self.font, max_width))
     
     def update(self, dt: float) -> None:
         """
@@ -461,9 +444,9 @@ class DialogueBox:
         # Draw speaker name if present
         y_offset = self.padding
         if self.current_page and self.current_page.speaker and self.speaker_font:
-            speaker_surface = self.speaker_font.render(
+            speaker_surface = self.text_engine.render(
                 self.current_page.speaker,
-                True,
+                self.speaker_font,
                 self.speaker_color
             )
             surface.blit(speaker_surface, (self.x + self.padding, self.y + y_offset))
@@ -472,12 +455,16 @@ class DialogueBox:
         # Draw dialogue text
         if self.font and self.displayed_text:
             lines = self.displayed_text.split('\n')
-            for line in lines:
+            for i, line in enumerate(lines):
                 if y_offset + 14 > self.current_height - self.padding:
                     break  # Don't draw text outside box
                 
-                text_surface = self.font.render(line, True, self.text_color)
-                surface.blit(text_surface, (self.x + self.padding, self.y + y_offset))
+                # Only the newly typed glyphs are blitted into the reused line
+                if i == len(self._text_lines):
+                    self._text_lines.append(TextLine(self.font, self.text_color, engine=self.text_engine))
+                text_line = self._text_lines[i]
+                text_line.set_text(line)
+                text_line.draw(surface, (self.x + self.padding, self.y + y_offset))
                 y_offset += 14
         
         # Draw choices if in choice state
@@ -513,7 +500,7 @@ class DialogueBox:
             
             # Draw choice text
             text = marker + choice.text
-            text_surface = self.font.render(text, True, color)
+            text_surface = self.text_engine.render(text, self.font, color)
             surface.blit(text_surface, (self.x + self.padding, choice_y))
             
             choice_y += 16
@@ -527,7 +514,7 @@ class DialogueBox:
             y = self.y + self.current_height - self.padding - 10
             
             if self.font:
-                indicator_surface = self.font.render(indicator, True, self.text_color)
+                indicator_surface = self.text_engine.render(indicator, self.font, self.text_color)
                 surface.blit(indicator_surface, (x, y))
     
     def _play_sound(self, sound_path: Optional[str]) -> None:
@@ -542,6 +529,19 @@ class DialogueBox:
         except:
             pass  # Ignore sound errors
     
+    def get_rect(self) -> pygame.Rect:
+        """Screen area the dialogue box can draw into."""
+        return pygame.Rect(self.x, self.y, self.width, self.target_height)
+    
+    def get_render_state(self) -> Tuple:
+        """
+        Snapshot of everything draw() depends on.
+        Equal snapshots produce identical pixels, so callers can skip redraws.
+        """
+        blink = int(self.continue_blink_timer * 2) % 2 if self.show_continue else -1
+        return (self.state, int(self.current_height), self.current_page_index,
+                len(self.displayed_text), self.selected_choice, blink)
+    
     def is_open(self) -> bool:
         """Check if dialogue is currently open."""
         return self.state != DialogueState.CLOSED
\ No newline at end of file
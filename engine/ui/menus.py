@@ -8,6 +8,8 @@ from dataclasses import dataclass
 from enum import Enum, auto
 from abc import ABC, abstractmethod
 
+from engine.graphics.text_engine import TextEngine
+
 if TYPE_CHECKING:
     from engine.core.game import Game
     from engine.systems.monster_instance import MonsterInstance
@@ -21,8 +23,9 @@ class MenuBase(ABC):
     def __init__(self, game: 'Game'):
         """Initialize menu base."""
         self.game = game
-        self.font = pygame.font.Font(None, 14)
-        self.small_font = pygame.font.Font(None, 12)
+        self.text_engine = TextEngine.get()
+        self.font = self.text_engine.get_font(14)
+        self.small_font = self.text_engine.get_font(12)
         self.selected_index = 0
         self.scroll_offset = 0
         self.items_per_page = 8
@@ -55,6 +58,10 @@ class MenuBase(ABC):
         """Draw menu."""
         pass
     
+    def _wrap_text(self, text: str, max_width: int) -> List[str]:
+        """Wrap text to fit within width (cached layout)."""
+        return list(self.text_engine.wrap(text, self.small_font, max_width))
+    
     def draw_window(self, surface: pygame.Surface, x: int, y: int, 
                    width: int, height: int, title: Optional[str] = None) -> None:
         """Draw a window frame."""
@@ -65,7 +72,7 @@ class MenuBase(ABC):
         
         # Title
         if title:
-            title_surf = self.font.render(title, True, self.selected_color)
+            title_surf = self.text_engine.render(title, self.font, self.selected_color)
             title_rect = title_surf.get_rect(center=(x + width // 2, y + 12))
             surface.blit(title_surf, title_rect)
             
@@ -140,7 +147,7 @@ class InventoryMenu(MenuBase):
         if not self.items_list:
             # Empty inventory
             text = "Keine Items vorhanden"
-            text_surf = self.font.render(text, True, self.disabled_color)
+            text_surf = self.text_engine.render(text, self.font, self.disabled_color)
             text_rect = text_surf.get_rect(center=(self.window_x + self.window_width // 2,
                                                    self.window_y + self.window_height // 2))
             surface.blit(text_surf, text_rect)
@@ -163,7 +170,7 @@ class InventoryMenu(MenuBase):
             # Item name and quantity
             text = f"{item.name} x{quantity}"
             color = self.selected_color if is_selected else self.unselected_color
-            text_surf = self.small_font.render(text, True, color)
+            text_surf = self.text_engine.render(text, self.small_font, color)
             surface.blit(text_surf, (self.window_x + 10, y_offset))
             
             y_offset += 14
@@ -171,7 +178,7 @@ class InventoryMenu(MenuBase):
         # Scroll indicator
         if len(self.items_list) > self.items_per_page:
             scroll_text = f"↑↓ {self.scroll_offset + 1}-{min(self.scroll_offset + self.items_per_page, len(self.items_list))}/{len(self.items_list)}"
-            scroll_surf = self.small_font.render(scroll_text, True, self.disabled_color)
+            scroll_surf = self.text_engine.render(scroll_text, self.small_font, self.disabled_color)
             surface.blit(scroll_surf, (self.window_x + self.window_width - 50,
                                       self.window_y + self.window_height - 15))
         
@@ -193,37 +200,15 @@ class InventoryMenu(MenuBase):
         y_offset = desc_y + 5
         
         for line in desc_lines[:2]:  # Max 2 lines
-            line_surf = self.small_font.render(line, True, self.unselected_color)
+            line_surf = self.text_engine.render(line, self.small_font, self.unselected_color)
             surface.blit(line_surf, (desc_x + 10, y_offset))
             y_offset += 12
         
         # Price
         price_text = f"Wert: {item.sell_price}€"
-        price_surf = self.small_font.render(price_text, True, self.disabled_color)
+        price_surf = self.text_engine.render(price_text, self.small_font, self.disabled_color)
         surface.blit(price_surf, (desc_x + desc_width - 60, desc_y + desc_height - 15))
     
-    def _wrap_text(self, text: str, max_width: int) -> List[str]:
-        """Wrap text to fit within width."""
-        words = text.split(' ')
-        lines = []
-        current_line = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            if self.small_font.size(test_line)[0] > max_width:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    lines.append(word)
-            else:
-                current_line.append(word)
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        return lines
-
 
 class PartyMenu(MenuBase):
     """Party management menu."""
@@ -311,7 +296,7 @@ class PartyMenu(MenuBase):
                 # Name and level
                 text = f"{i+1}. {name} Lv.{level}"
                 color = self.selected_color if is_selected else self.unselected_color
-                text_surf = self.small_font.render(text, True, color)
+                text_surf = self.text_engine.render(text, self.small_font, color)
                 surface.blit(text_surf, (self.window_x + 15, y_offset))
                 
                 # HP bar
@@ -339,7 +324,7 @@ class PartyMenu(MenuBase):
                 
                 # HP text
                 hp_text = f"{monster.current_hp}/{monster.max_hp}"
-                hp_surf = self.small_font.render(hp_text, True, (255, 255, 255))
+                hp_surf = self.text_engine.render(hp_text, self.small_font, (255, 255, 255))
                 hp_rect = hp_surf.get_rect(center=(bar_x + bar_width // 2, bar_y + 5))
                 surface.blit(hp_surf, hp_rect)
                 
@@ -365,13 +350,13 @@ class PartyMenu(MenuBase):
                     pygame.draw.rect(surface, status_color, status_rect)
                     
                     status_text = status_name[:3].upper() if len(status_name) >= 3 else status_name.upper()
-                    status_surf = pygame.font.Font(None, 10).render(status_text, True, (255, 255, 255))
+                    status_surf = self.text_engine.render(status_text, self.text_engine.get_font(10), (255, 255, 255))
                     surface.blit(status_surf, (bar_x - 23, bar_y + 1))
             else:
                 # Empty slot
                 text = f"{i+1}. ---"
                 color = self.disabled_color
-                text_surf = self.small_font.render(text, True, color)
+                text_surf = self.text_engine.render(text, self.small_font, color)
                 surface.blit(text_surf, (self.window_x + 15, y_offset))
             
             y_offset += 20
@@ -382,7 +367,7 @@ class PartyMenu(MenuBase):
         else:
             inst_text = "E: Tauschen  Q: Zurück"
         
-        inst_surf = self.small_font.render(inst_text, True, self.disabled_color)
+        inst_surf = self.text_engine.render(inst_text, self.small_font, self.disabled_color)
         inst_rect = inst_surf.get_rect(center=(self.window_x + self.window_width // 2,
                                               self.window_y + self.window_height - 10))
         surface.blit(inst_surf, inst_rect)
@@ -454,7 +439,7 @@ class QuestMenu(MenuBase):
         
         if not self.active_quests:
             text = "Keine aktiven Quests"
-            text_surf = self.font.render(text, True, self.disabled_color)
+            text_surf = self.text_engine.render(text, self.font, self.disabled_color)
             text_rect = text_surf.get_rect(center=(self.window_x + self.window_width // 2,
                                                    self.window_y + self.window_height // 2))
             surface.blit(text_surf, text_rect)
@@ -482,20 +467,20 @@ class QuestMenu(MenuBase):
             }
             type_color = type_colors.get(quest.quest_type.name, (150, 150, 150))
             type_indicator = "●"
-            type_surf = self.small_font.render(type_indicator, True, type_color)
+            type_surf = self.text_engine.render(type_indicator, self.small_font, type_color)
             surface.blit(type_surf, (self.window_x + 10, y_offset))
             
             # Quest name
             text = quest.name
             color = self.selected_color if is_selected else self.unselected_color
-            text_surf = self.small_font.render(text, True, color)
+            text_surf = self.text_engine.render(text, self.small_font, color)
             surface.blit(text_surf, (self.window_x + 25, y_offset))
             
             # Completion percentage
             percent = int(quest.get_completion_percentage())
             percent_text = f"{percent}%"
             percent_color = (0, 200, 0) if percent == 100 else self.disabled_color
-            percent_surf = self.small_font.render(percent_text, True, percent_color)
+            percent_surf = self.text_engine.render(percent_text, self.small_font, percent_color)
             surface.blit(percent_surf, (self.window_x + self.window_width - 35, y_offset))
             
             y_offset += 14
@@ -512,7 +497,7 @@ class QuestMenu(MenuBase):
         # Description
         desc_lines = self._wrap_text(quest.description, self.window_width - 20)
         for line in desc_lines[:2]:
-            line_surf = self.small_font.render(line, True, self.unselected_color)
+            line_surf = self.text_engine.render(line, self.small_font, self.unselected_color)
             surface.blit(line_surf, (self.window_x + 10, y_offset))
             y_offset += 12
         
@@ -520,50 +505,28 @@ class QuestMenu(MenuBase):
         
         # Objectives
         objectives_text = "Ziele:"
-        obj_surf = self.font.render(objectives_text, True, self.selected_color)
+        obj_surf = self.text_engine.render(objectives_text, self.font, self.selected_color)
         surface.blit(obj_surf, (self.window_x + 10, y_offset))
         y_offset += 15
         
         for obj in quest.get_active_objectives()[:3]:  # Max 3 visible
             # Checkbox
             check = "☑" if obj.is_complete() else "☐"
-            check_surf = self.small_font.render(check, True, 
-                                               (0, 200, 0) if obj.is_complete() else self.unselected_color)
+            check_surf = self.text_engine.render(check, self.small_font,
+                                                 (0, 200, 0) if obj.is_complete() else self.unselected_color)
             surface.blit(check_surf, (self.window_x + 15, y_offset))
             
             # Objective text
             obj_text = obj.get_progress_text()
-            obj_surf = self.small_font.render(obj_text[:35], True, self.unselected_color)
+            obj_surf = self.text_engine.render(obj_text[:35], self.small_font, self.unselected_color)
             surface.blit(obj_surf, (self.window_x + 30, y_offset))
             y_offset += 12
         
         # Back instruction
         back_text = "Q: Zurück zur Liste"
-        back_surf = self.small_font.render(back_text, True, self.disabled_color)
+        back_surf = self.text_engine.render(back_text, self.small_font, self.disabled_color)
         surface.blit(back_surf, (self.window_x + 10, self.window_y + self.window_height - 15))
     
-    def _wrap_text(self, text: str, max_width: int) -> List[str]:
-        """Wrap text to fit within width."""
-        words = text.split(' ')
-        lines = []
-        current_line = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            if self.small_font.size(test_line)[0] > max_width:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    lines.append(word)
-            else:
-                current_line.append(word)
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        return lines
-
 
 class SaveMenu(MenuBase):
     """Save game menu."""
@@ -643,16 +606,16 @@ class SaveMenu(MenuBase):
                 
                 color = self.selected_color if is_selected else self.unselected_color
                 
-                text1_surf = self.small_font.render(line1, True, color)
+                text1_surf = self.text_engine.render(line1, self.small_font, color)
                 surface.blit(text1_surf, (self.window_x + 15, y_offset))
                 
-                text2_surf = self.small_font.render(line2, True, self.disabled_color)
+                text2_surf = self.text_engine.render(line2, self.small_font, self.disabled_color)
                 surface.blit(text2_surf, (self.window_x + 15, y_offset + 12))
             else:
                 # Empty slot
                 text = f"Slot {i+1}: Leer"
                 color = self.selected_color if is_selected else self.disabled_color
-                text_surf = self.font.render(text, True, color)
+                text_surf = self.text_engine.render(text, self.font, color)
                 surface.blit(text_surf, (self.window_x + 15, y_offset + 6))
             
             y_offset += 35
@@ -668,12 +631,12 @@ class SaveMenu(MenuBase):
             else:
                 text = "Hier speichern?"
             
-            text_surf = self.font.render(text, True, self.selected_color)
+            text_surf = self.text_engine.render(text, self.font, self.selected_color)
             text_rect = text_surf.get_rect(center=(confirm_rect.centerx, confirm_rect.centery - 10))
             surface.blit(text_surf, text_rect)
             
             inst_text = "E: Ja  Q: Nein"
-            inst_surf = self.small_font.render(inst_text, True, self.unselected_color)
+            inst_surf = self.text_engine.render(inst_text, self.small_font, self.unselected_color)
             inst_rect = inst_surf.get_rect(center=(confirm_rect.centerx, confirm_rect.centery + 10))
             surface.blit(inst_surf, inst_rect)
 
@@ -725,14 +688,14 @@ class ConfirmDialog(MenuBase):
                         self.window_width, self.window_height)
         
         # Title
-        title_surf = self.font.render(self.title, True, self.selected_color)
+        title_surf = self.text_engine.render(self.title, self.font, self.selected_color)
         title_rect = title_surf.get_rect(center=(self.window_x + self.window_width // 2,
                                                 self.window_y + 20))
         surface.blit(title_surf, title_rect)
         
         # Message
         if self.message:
-            msg_surf = self.small_font.render(self.message[:30], True, self.unselected_color)
+            msg_surf = self.text_engine.render(self.message[:30], self.small_font, self.unselected_color)
             msg_rect = msg_surf.get_rect(center=(self.window_x + self.window_width // 2,
                                                 self.window_y + 35))
             surface.blit(msg_surf, msg_rect)
@@ -742,12 +705,12 @@ class ConfirmDialog(MenuBase):
         no_color = self.selected_color if self.selected == 1 else self.unselected_color
         
         yes_text = "Ja"
-        yes_surf = self.font.render(yes_text, True, yes_color)
+        yes_surf = self.text_engine.render(yes_text, self.font, yes_color)
         yes_rect = yes_surf.get_rect(center=(self.window_x + 60, self.window_y + 55))
         surface.blit(yes_surf, yes_rect)
         
         no_text = "Nein"
-        no_surf = self.font.render(no_text, True, no_color)
+        no_surf = self.text_engine.render(no_text, self.font, no_color)
         no_rect = no_surf.get_rect(center=(self.window_x + 140, self.window_y + 55))
         surface.blit(no_surf, no_rect)
         
@@ -758,5 +721,5 @@ class ConfirmDialog(MenuBase):
             indicator_x = self.window_x + 120
         
         indicator = ">"
-        indicator_surf = self.font.render(indicator, True, self.selected_color)
+        indicator_surf = self.text_engine.render(indicator, self.font, self.selected_color)
         surface.blit(indicator_surf, (indicator_x, self.window_y + 50))
\ No newline at end of file
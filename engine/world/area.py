@@ -6,7 +6,7 @@ OPTIMIERT: Surface-Caching und reduzierte JSON-Operationen
 
 import pygame
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 from functools import lru_cache
 import time
@@ -16,8 +16,40 @@ from engine.world.map_loader import MapLoader, MapData
 from engine.graphics.sprite_manager import SpriteManager
 from engine.world.entity import Entity
 from engine.world.npc import NPC
-from engine.core.resources import resources
 from engine.world.tile_manager import TileManager
+from engine.world.collision_grid import CollisionGrid
+from engine.world.spatial_hash import SpatialHash
+from engine.world.surface_cache import SurfaceCache
+from engine.core.config import PerformanceConfig
+from engine.world.layer_chunks import (
+    ChunkedLayer, composite_layer, tile_region_renderer, placement_region_renderer
+)
+
+# GID-zu-Tile-Mapping basierend auf den TSX-Dateien
+# WICHTIG: GID = firstgid + tile_id, also GID 43 = Tile ID 42 = wall.png, GID 44 = Tile ID 43 = warp_carpet.png
+GID_TILE_NAMES = {
+    # Tileset 1 (firstgid=1) - GID = 1 + tile_id
+    1: "bush_1", 2: "bush_2", 3: "bush", 4: "carpet", 5: "cliff_face",
+    6: "dirt_1", 7: "dirt_2", 8: "flower_blue", 9: "flower_red",
+    10: "grass_1", 11: "grass_2", 12: "grass_3", 13: "grass_4", 14: "grass",
+    15: "gravel_1", 16: "gravel_2", 17: "gravel", 18: "ledge",
+    19: "path_1", 20: "path_2", 21: "path", 22: "rock_1", 23: "rock_2",
+    24: "rock", 25: "roof_blue", 26: "roof_red", 27: "roof_ridge", 28: "roof",
+    29: "sand_1", 30: "sand_2", 31: "snow", 32: "stairs_h", 33: "stairs_v",
+    34: "stairs", 35: "stone_floor", 36: "stump", 37: "tall_grass_1",
+    38: "tall_grass_2", 39: "tall_grass", 40: "tree_small", 41: "wall_brick",
+    42: "wall_plaster", 43: "wall", 44: "warp_carpet", 45: "water_1",
+    46: "water_2", 47: "water_corner_ne", 48: "water_corner_nw",
+    49: "water_corner_se", 50: "water_corner_sw", 51: "water_edge_e",
+    52: "water_edge_n", 53: "water_edge_s", 54: "water_edge_w", 55: "wood_floor",
+    
+    # Tileset 2 (firstgid=56) - Object tiles
+    56: "barrel", 57: "bed", 58: "bookshelf", 59: "boulder", 60: "chair",
+    61: "crate", 62: "door", 63: "fence_h", 64: "fence_v", 65: "gravestone",
+    66: "lamp_post", 67: "mailbox", 68: "potted_plant", 69: "sign",
+    70: "table", 71: "tv", 72: "well", 73: "window"
+}
+
 
 @dataclass
 class AreaConfig:
@@ -31,22 +63,32 @@ class AreaConfig:
 class Area:
     """Eine spielbare Map-Region mit TMX-Support und Performance-Optimierungen"""
     
-    # Klassenweite Caches für bessere Performance
-    _surface_cache: Dict[str, pygame.Surface] = {}
-    _json_cache: Dict[str, Dict] = {}
-    _cache_timestamps: Dict[str, float] = {}
-    _cache_ttl = 300.0  # 5 Minuten Cache-Lebensdauer
+    # Klassenweiter LRU-Cache der gerenderten Layer, begrenzt nach Bytes und Maps
+    _surface_cache = SurfaceCache(PerformanceConfig.MAX_CACHED_MAP_MB * 1024 * 1024,
+                                  PerformanceConfig.MAX_CACHED_MAPS)
+    
+    # Zeichenreihenfolge der Layer: statische Layer unter den Entities, dann Überhang
+    BELOW_ENTITY_LAYERS = ("ground", "decor", "Tile Layer 1", "Tile Layer 2", "furniture", "objects")
+    OVERHANG_LAYERS = ("Tile Layer 3", "overlay", "overhang", "Tile Layer 4", "decoration")
+    LAYER_ORDER = BELOW_ENTITY_LAYERS + OVERHANG_LAYERS
+    
+    # Sprite-Kategorien, aus denen die Layer rendern
+    SPRITE_CATEGORIES = ("tiles", "objects")
     
-    def __init__(self, map_id: str):
+    def __init__(self, map_id: str, map_data: Optional[MapData] = None, detached: bool = False):
         """
         Initialisiert eine Area aus einer Map-ID.
         
         Args:
             map_id: ID der zu ladenden Map (ohne Dateiendung)
+            map_data: Bereits geladene MapData (z.B. vom Map-Prefetcher)
+            detached: Layer nicht mit dem Surface-Cache teilen (Aufbau auf dem
+                      Map-Prefetcher-Worker); finalize() trägt sie nach
         """
         self.map_id = map_id
         self.name = map_id.replace('_', ' ').title()  # Konvertiere map_id zu lesbarem Namen
-        self.map_data: Optional[MapData] = None
+        self.map_data: Optional[MapData] = map_data
+        self.detached = detached
         self.sprite_manager = SpriteManager.get()
         
         # Standard-Größe falls TMX-Loading fehlschlägt
@@ -55,13 +97,28 @@ class Area:
         self.tile_width = TILE_SIZE
         self.tile_height = TILE_SIZE
         
-        # Surfaces für jede Layer - OPTIMIERT: Caching implementiert
+        # Gerenderte Layer: Tile- und Object-Layer als lazy Chunks,
+        # Vollbild-Surfaces nur noch für Fallback-Maps
+        self.layer_chunks: Dict[str, ChunkedLayer] = {}
         self.layer_surfaces: Dict[str, pygame.Surface] = {}
         
+        # Vorkomponierte Layer: alles unter den Entities / alle Überhang-Layer
+        self.static_below: Optional[ChunkedLayer] = None
+        self.static_overhang: Optional[ChunkedLayer] = None
+        
+        # Begehbarkeit: statische Kollision + Belegung durch Entities
+        self.collision_grid = CollisionGrid(self.width, self.height)
+        
         # Entities und NPCs
         self.entities: List[Entity] = []
         self.npcs: List[NPC] = []
         
+        # Tile-Indizes: Entities werden beim Bewegen umgetragen, Warps/Trigger sind statisch
+        self.entity_index = SpatialHash()
+        self._indexed_lists: Tuple = ()
+        self.warp_index = SpatialHash()
+        self.trigger_index = SpatialHash()
+        
         # Encounter-System (für FieldScene Kompatibilität)
         self.encounter_rate = 0.1
         self.encounter_table = []
@@ -75,54 +132,16 @@ class Area:
         self._load_map()
     
     @classmethod
-    def _cleanup_cache(cls) -> None:
-        """Bereinigt abgelaufene Cache-Einträge"""
-        current_time = time.time()
-        expired_keys = [
-            key for key, timestamp in cls._cache_timestamps.items()
-            if current_time - timestamp > cls._cache_ttl
-        ]
-        
-        for key in expired_keys:
-            cls._surface_cache.pop(key, None)
-            cls._json_cache.pop(key, None)
-            cls._cache_timestamps.pop(key, None)
-    
-    @classmethod
-    def _get_cached_surface(cls, cache_key: str) -> Optional[pygame.Surface]:
-        """Holt eine gecachte Surface aus dem Cache"""
-        cls._cleanup_cache()
-        if cache_key in cls._surface_cache:
-            cls._cache_timestamps[cache_key] = time.time()
-            return cls._surface_cache[cache_key]
-        return None
-    
-    @classmethod
-    def _cache_surface(cls, cache_key: str, surface: pygame.Surface) -> None:
-        """Speichert eine Surface im Cache"""
-        cls._surface_cache[cache_key] = surface
-        cls._cache_timestamps[cache_key] = time.time()
-    
-    @classmethod
-    def _get_cached_json(cls, map_id: str) -> Optional[Dict]:
-        """Holt gecachte JSON-Daten aus dem Cache"""
-        cls._cleanup_cache()
-        if map_id in cls._json_cache:
-            cls._cache_timestamps[map_id] = time.time()
-            return cls._json_cache[map_id]
-        return None
-    
-    @classmethod
-    def _cache_json(cls, map_id: str, data: Dict) -> None:
-        """Speichert JSON-Daten im Cache"""
-        cls._json_cache[map_id] = data
-        cls._cache_timestamps[map_id] = time.time()
+    def cache_stats(cls) -> Dict[str, object]:
+        """Kennzahlen des Surface-Caches (Einträge, Bytes, Hits, Verdrängungen)"""
+        return cls._surface_cache.stats()
 
     def _load_map(self):
         """Lädt die Map-Daten mit optimiertem Caching"""
         try:
             # Verwende nur noch den MapLoader für JSON-Maps
-            self.map_data = MapLoader.load_map(self.map_id)
+            if self.map_data is None:
+                self.map_data = MapLoader.load_map(self.map_id)
             # Setze Attribute aus MapData
             if self.map_data:
                 self.width = self.map_data.width
@@ -130,6 +149,10 @@ class Area:
                 self.name = self.map_data.name or self.name
                 self.tile_width = self.map_data.tile_size
                 self.tile_height = self.map_data.tile_size
+                self.collision_grid = CollisionGrid.from_map_data(
+                    self.map_data, self.map_data.tile_names or GID_TILE_NAMES)
+                self.warp_index = SpatialHash.from_positions(self.map_data.warps, lambda w: (w.x, w.y))
+                self.trigger_index = SpatialHash.from_positions(self.map_data.triggers, lambda t: (t.x, t.y))
             self._render_layers()
                 
         except Exception as e:
@@ -155,6 +178,8 @@ class Area:
                 y=tile_y * TILE_SIZE,
                 npc_id=npc_id
             )
+            npc.set_collision_grid(self.collision_grid)
+            npc.set_spatial_index(self.entity_index)
             self.npcs.append(npc)
         except Exception as e:
             print(f"[Area] Fehler beim Erstellen von NPC {npc_id}: {e}")
@@ -166,116 +191,135 @@ class Area:
         
         start_time = time.time()
         
-        # OPTIMIERT: Verwende gecachte Surfaces wenn möglich
-        cache_key = f"{self.map_id}_layers_{self.map_data.width}x{self.map_data.height}"
-        cached_surfaces = self._get_cached_surface(cache_key)
+        # OPTIMIERT: Chunk-Layer werden nur gelesen und können geteilt werden
+        cached = None if self.detached else self._surface_cache.get(self._layer_cache_key())
         
-        if cached_surfaces:
-            # OPTIMIERT: Kopiere gecachte Surfaces
-            for layer_name, surface in cached_surfaces.items():
-                self.layer_surfaces[layer_name] = surface.copy()
+        if cached:
+            layers, composites = cached
+            self.layer_chunks.update(layers)
+            self.static_below = composites.get("below")
+            self.static_overhang = composites.get("overhang")
             self._cache_hits += 1
             self._render_time = time.time() - start_time
             return
         
         self._cache_misses += 1
         
-        # Rendere Tile-Layer
-        for layer_name, layer_data in self.map_data.layers.items():
+        # Tile-Layer werden erst beim Sichtbarwerden chunkweise gerendert
+        width = self.map_data.width * TILE_SIZE
+        height = self.map_data.height * TILE_SIZE
+        # Kompilierte Maps: memory-mapped Arrays statt Listen-Zeilen
+        layers = self.map_data.layer_arrays or self.map_data.layers
+        for layer_name, layer_data in layers.items():
             if layer_name == "collision":
                 continue  # Collision wird nicht gerendert
             
-            # OPTIMIERT: Erstelle Surface nur wenn nötig
-            surface = pygame.Surface(
-                (self.map_data.width * TILE_SIZE, 
-                 self.map_data.height * TILE_SIZE),
-                pygame.SRCALPHA
+            self.layer_chunks[layer_name] = ChunkedLayer(
+                layer_name, width, height,
+                tile_region_renderer(layer_data, self._get_tile_sprite_from_gid,
+                                     self.map_data.layer_gids.get(layer_name))
             )
-            
-            # OPTIMIERT: Batch-Rendering für bessere Performance
-            self._render_tile_layer_batch(surface, layer_data)
-            
-            self.layer_surfaces[layer_name] = surface
         
         # Rendere Object-Layer aus der ursprünglichen JSON-Daten
         self._render_object_layers()
         
-        # OPTIMIERT: Cache die gerenderten Surfaces
-        self._cache_surface(cache_key, self.layer_surfaces.copy())
+        # Statische Layer zu zwei Composites verschmelzen: 2 statt bis zu 8 Blits pro Chunk
+        self._build_composites()
+        
+        # OPTIMIERT: Cache die Chunk-Layer (Speicher wird über die gerenderten Chunks verbucht)
+        if not self.detached:
+            self._cache_layers()
         
         self._render_time = time.time() - start_time
     
-    def _render_tile_layer_batch(self, surface: pygame.Surface, layer_data: List[List[int]]) -> None:
-        """OPTIMIERT: Batch-Rendering für Tile-Layer"""
-        # Sammle alle Tiles in einem Batch
-        tile_batch = []
+    def _layer_cache_key(self) -> str:
+        """Schlüssel der Layer dieser Map im Surface-Cache"""
+        return f"{self.map_id}_layers_{self.map_data.width}x{self.map_data.height}"
+    
+    def _cache_layers(self) -> None:
+        """Legt Chunk-Layer und Composites im Surface-Cache ab"""
+        composites = {"below": self.static_below, "overhang": self.static_overhang}
+        self._surface_cache.put(self._layer_cache_key(), (dict(self.layer_chunks), composites),
+                                [*self.layer_chunks.values(), *composites.values()])
+    
+    def prerender(self, view: pygame.Rect) -> int:
+        """
+        Rendert die gezeichneten Layer in einem Welt-Bereich vor (ohne Display-Konvertierung).
+        Wird vom Map-Prefetcher auf dem Worker-Thread für abgekoppelte Areas aufgerufen.
         
-        for y, row in enumerate(layer_data):
-            for x, tile in enumerate(row):
-                if tile:
-                    sprite = self._get_tile_sprite_from_gid(tile)
-                    if sprite:
-                        tile_batch.append((sprite, x * TILE_SIZE, y * TILE_SIZE))
+        Args:
+            view: Welt-Rechteck in Pixeln
+            
+        Returns:
+            Anzahl neu gerenderter Chunks
+        """
+        return sum(layer.prerender(view) for layer in self._drawn_layers())
+    
+    def finalize(self) -> None:
+        """
+        Schließt den Aufbau auf dem Main-Thread ab: konvertiert vorgerenderte
+        Chunks ins Display-Format und legt abgekoppelte Layer im Surface-Cache ab.
+        """
+        for layer in self._drawn_layers():
+            layer.convert_prerendered()
+        if self.detached:
+            self.detached = False
+            if self.map_data and self.layer_chunks:
+                self._cache_layers()
+    
+    def _drawn_layers(self) -> List[ChunkedLayer]:
+        """Layer, deren Chunks draw() blittet: die Composites, sonst die Einzel-Layer"""
+        if self.static_below or self.static_overhang:
+            return [layer for layer in (self.static_below, self.static_overhang) if layer]
+        return list(self.layer_chunks.values())
+    
+    def _build_composites(self) -> None:
+        """Verschmilzt die statischen Layer unter den Entities und die Überhang-Layer"""
+        self.static_below = composite_layer(
+            "static_below", [self.layer_chunks[name] for name in self.BELOW_ENTITY_LAYERS
+                             if name in self.layer_chunks])
+        self.static_overhang = composite_layer(
+            "static_overhang", [self.layer_chunks[name] for name in self.OVERHANG_LAYERS
+                                if name in self.layer_chunks])
+    
+    @classmethod
+    def invalidate_map(cls, map_id: str) -> None:
+        """
+        Verwirft gecachte Layer und Composites einer Map.
+        Wird vom Hot-Reloader bei Map-Änderungen aufgerufen.
         
-        # OPTIMIERT: Batch-Blitting für bessere Performance
-        for sprite, x, y in tile_batch:
-            surface.blit(sprite, (x, y))
+        Args:
+            map_id: ID der geänderten Map
+        """
+        cls._surface_cache.discard_prefix(f"{map_id}_layers_")
     
     def _render_object_layers(self):
-        """Rendert Object-Layer mit optimiertem Caching"""
+        """Rendert die Tile-Objekte der Object-Layer aus den MapData"""
         try:
-            # OPTIMIERT: Verwende gecachte JSON-Daten
-            json_data = self._get_cached_json(self.map_id)
-            
-            if not json_data:
-                # Lade die Original-JSON-Datei nur wenn nicht im Cache
-                json_data = resources.load_json(f"maps/{self.map_id}.json")
-                if json_data:
-                    self._cache_json(self.map_id, json_data)
-            
-            if not json_data:
-                print(f"[Area] Keine JSON-Daten für Object-Layer gefunden: {self.map_id}")
-                return
-            
-            # OPTIMIERT: Erstelle Object-Layer Surface nur wenn nötig
-            object_surface = pygame.Surface(
-                (self.map_data.width * TILE_SIZE, 
-                 self.map_data.height * TILE_SIZE),
-                pygame.SRCALPHA
-            )
-            
-            # OPTIMIERT: Batch-Rendering für Objekte
+            # OPTIMIERT: Objekte kommen aus den (kompilierten) MapData, kein erneutes JSON-Parsen
             object_batch = []
-            
-            # Durchsuche alle Layer nach Object-Layern
-            for layer in json_data.get("layers", []):
-                if layer.get("type") == "objectgroup":
-                    layer_name = layer.get("name", "objects")
-                    print(f"[Area] Verarbeite Object-Layer: {layer_name} mit {len(layer.get('objects', []))} Objekten")
+            for obj in self.map_data.objects:
+                gid = obj.get("gid")
+                if gid:
+                    # Konvertiere Pixel-Koordinaten zu Tile-Koordinaten
+                    # Wichtig: Tiled verwendet bottom-left Koordinaten für Objekte!
+                    obj_x = int(obj.get("x", 0))
+                    obj_y = int(obj.get("y", 0)) - TILE_SIZE  # Bottom-aligned korrigieren
                     
-                    # Sammle alle Objekte in einem Batch
-                    for obj in layer.get("objects", []):
-                        gid = obj.get("gid")
-                        if gid:
-                            # Konvertiere Pixel-Koordinaten zu Tile-Koordinaten
-                            # Wichtig: Tiled verwendet bottom-left Koordinaten für Objekte!
-                            obj_x = int(obj.get("x", 0))
-                            obj_y = int(obj.get("y", 0)) - TILE_SIZE  # Bottom-aligned korrigieren
-                            
-                            # Hole Object-Sprite basierend auf GID
-                            sprite = self._get_tile_sprite_from_gid(gid)
-                            if sprite:
-                                object_batch.append((sprite, obj_x, obj_y))
-                                print(f"[Area] Object geladen: GID {gid} an Position ({obj_x}, {obj_y})")
-                            else:
-                                print(f"[Area] Kein Sprite für GID {gid} gefunden")
-            
-            # OPTIMIERT: Batch-Blitting für Objekte
-            for sprite, x, y in object_batch:
-                object_surface.blit(sprite, (x, y))
+                    # Hole Object-Sprite basierend auf GID
+                    sprite = self._get_tile_sprite_from_gid(gid)
+                    if sprite:
+                        object_batch.append((sprite, obj_x, obj_y))
+                    else:
+                        print(f"[Area] Kein Sprite für GID {gid} gefunden")
             
-            # Füge Object-Layer zur Layer-Liste hinzu
-            self.layer_surfaces["objects"] = object_surface
+            # Füge Object-Layer zur Layer-Liste hinzu (chunkweise gerendert)
+            self.layer_chunks["objects"] = ChunkedLayer(
+                "objects",
+                self.map_data.width * TILE_SIZE,
+                self.map_data.height * TILE_SIZE,
+                placement_region_renderer(object_batch)
+            )
             print(f"[Area] Object-Layer erstellt mit {len(object_batch)} Objekten")
             
         except Exception as e:
@@ -286,34 +330,10 @@ class Area:
     @lru_cache(maxsize=256)
     def _get_tile_sprite_from_gid(self, gid: int) -> Optional[pygame.Surface]:
         """Übersetzt GIDs aus Tiled-Format in Tile-Sprites mit LRU-Cache"""
-        # GID-zu-Tile-Mapping basierend auf den TSX-Dateien
-        # WICHTIG: GID = firstgid + tile_id, also GID 43 = Tile ID 42 = wall.png, GID 44 = Tile ID 43 = warp_carpet.png
-        gid_to_tile_mapping = {
-            # Tileset 1 (firstgid=1) - GID = 1 + tile_id
-            1: "bush_1", 2: "bush_2", 3: "bush", 4: "carpet", 5: "cliff_face",
-            6: "dirt_1", 7: "dirt_2", 8: "flower_blue", 9: "flower_red",
-            10: "grass_1", 11: "grass_2", 12: "grass_3", 13: "grass_4", 14: "grass",
-            15: "gravel_1", 16: "gravel_2", 17: "gravel", 18: "ledge",
-            19: "path_1", 20: "path_2", 21: "path", 22: "rock_1", 23: "rock_2",
-            24: "rock", 25: "roof_blue", 26: "roof_red", 27: "roof_ridge", 28: "roof",
-            29: "sand_1", 30: "sand_2", 31: "snow", 32: "stairs_h", 33: "stairs_v",
-            34: "stairs", 35: "stone_floor", 36: "stump", 37: "tall_grass_1",
-            38: "tall_grass_2", 39: "tall_grass", 40: "tree_small", 41: "wall_brick",
-            42: "wall_plaster", 43: "wall", 44: "warp_carpet", 45: "water_1",
-            46: "water_2", 47: "water_corner_ne", 48: "water_corner_nw",
-            49: "water_corner_se", 50: "water_corner_sw", 51: "water_edge_e",
-            52: "water_edge_n", 53: "water_edge_s", 54: "water_edge_w", 55: "wood_floor",
-            
-            # Tileset 2 (firstgid=56) - Object tiles
-            56: "barrel", 57: "bed", 58: "bookshelf", 59: "boulder", 60: "chair",
-            61: "crate", 62: "door", 63: "fence_h", 64: "fence_v", 65: "gravestone",
-            66: "lamp_post", 67: "mailbox", 68: "potted_plant", 69: "sign",
-            70: "table", 71: "tv", 72: "well", 73: "window"
-        }
-        
-        # Versuche über das GID-Mapping
-        if gid in gid_to_tile_mapping:
-            tile_name = gid_to_tile_mapping[gid]
+        # Versuche über das GID-Mapping (aus den Tilesets aufgelöst, sonst statisch)
+        tile_names = self.map_data.tile_names if self.map_data and self.map_data.tile_names else GID_TILE_NAMES
+        if gid in tile_names:
+            tile_name = tile_names[gid]
             
             # Prüfe zuerst ob es ein Tile ist
             tile_sprite = self.sprite_manager.get_tile(tile_name)
@@ -333,6 +353,7 @@ class Area:
         """Erstellt eine leere Fallback-Map"""
         self.width = 20
         self.height = 15
+        self.collision_grid = CollisionGrid(self.width, self.height)
         
         # Erstelle einfachen Gras-Hintergrund
         surface = pygame.Surface(
@@ -342,7 +363,8 @@ class Area:
         
         self.layer_surfaces["ground"] = surface
     
-    def draw(self, screen: pygame.Surface, camera_x: int = 0, camera_y: int = 0):
+    def draw(self, screen: pygame.Surface, camera_x: int = 0, camera_y: int = 0,
+             view: Optional[pygame.Rect] = None):
         """
         Zeichnet die Area auf den Bildschirm.
         
@@ -350,15 +372,76 @@ class Area:
             screen: Ziel-Surface
             camera_x: Kamera X-Offset
             camera_y: Kamera Y-Offset
+            view: Sichtbarer Welt-Bereich, z.B. Camera.get_visible_area()
+                  (Standard: Bildschirmgröße an Kameraposition)
         """
+        if view is None:
+            view = pygame.Rect(camera_x, camera_y, *screen.get_size())
+        
+        # Vorkomponierte Layer: ein Blit pro sichtbarem Chunk und Composite
+        if self.draw_below_entities(screen, camera_x, camera_y, view):
+            self.draw_overhang(screen, camera_x, camera_y, view)
+            return
+        
         # Zeichne Layer in korrekter Reihenfolge
-        layer_order = ["ground", "decor", "Tile Layer 1", "Tile Layer 2", 
-                      "objects", "Tile Layer 3", "overlay", "Tile Layer 4"]
+        for layer_name in self.LAYER_ORDER:
+            self.draw_layer(screen, layer_name, camera_x, camera_y, view)
+    
+    def draw_below_entities(self, screen: pygame.Surface, camera_x: int = 0, camera_y: int = 0,
+                            view: Optional[pygame.Rect] = None) -> bool:
+        """
+        Zeichnet den Composite aller statischen Layer unter den Entities.
         
-        for layer_name in layer_order:
-            if layer_name in self.layer_surfaces:
-                screen.blit(self.layer_surfaces[layer_name], 
-                          (-camera_x, -camera_y))
+        Returns:
+            True wenn ein Composite existiert (die Einzel-Layer sind damit abgedeckt)
+        """
+        if self.static_below is None:
+            return False
+        self.static_below.draw(screen, camera_x, camera_y, view)
+        return True
+    
+    def draw_overhang(self, screen: pygame.Surface, camera_x: int = 0, camera_y: int = 0,
+                      view: Optional[pygame.Rect] = None) -> bool:
+        """
+        Zeichnet den Composite der Überhang-Layer (über den Entities).
+        
+        Returns:
+            True wenn ein Composite existiert
+        """
+        if self.static_overhang is None:
+            return False
+        self.static_overhang.draw(screen, camera_x, camera_y, view)
+        return True
+    
+    def draw_layer(self, screen: pygame.Surface, layer_name: str, camera_x: int = 0,
+                   camera_y: int = 0, view: Optional[pygame.Rect] = None) -> bool:
+        """
+        Zeichnet einen einzelnen Layer; nur sichtbare Chunks werden geblittet.
+        
+        Args:
+            screen: Ziel-Surface
+            layer_name: Name des Layers
+            camera_x: Kamera X-Offset
+            camera_y: Kamera Y-Offset
+            view: Sichtbarer Welt-Bereich
+            
+        Returns:
+            True wenn die Area diesen Layer besitzt
+        """
+        chunks = self.layer_chunks.get(layer_name)
+        if chunks is not None:
+            chunks.draw(screen, camera_x, camera_y, view)
+            return True
+        
+        surface = self.layer_surfaces.get(layer_name)
+        if surface is not None:
+            screen.blit(surface, (-camera_x, -camera_y))
+            return True
+        return False
+    
+    def has_visual_layers(self) -> bool:
+        """Prüft ob die Area zeichenbare Layer besitzt"""
+        return bool(self.layer_chunks or self.layer_surfaces)
     
     def update(self, dt: float):
         """
@@ -377,7 +460,7 @@ class Area:
     
     def get_collision_at(self, x: int, y: int) -> bool:
         """
-        Prüft Kollision an einer Position.
+        Prüft Kollision an einer Position (statisch oder durch Entities belegt).
         
         Args:
             x: X-Position in Pixeln
@@ -386,38 +469,7 @@ class Area:
         Returns:
             True wenn Kollision, sonst False
         """
-        # Konvertiere zu Tile-Koordinaten
-        tile_x = x // TILE_SIZE
-        tile_y = y // TILE_SIZE
-        
-        # Prüfe Map-Grenzen
-        if self.map_data:
-            if tile_x < 0 or tile_x >= self.map_data.width:
-                return True
-            if tile_y < 0 or tile_y >= self.map_data.height:
-                return True
-            
-            # Prüfe Collision-Layer
-            if "collision" in self.map_data.layers:
-                collision_layer = self.map_data.layers["collision"]
-                if collision_layer[tile_y][tile_x]:
-                    return True
-        else:
-            # TMX-basierte Kollision
-            if hasattr(self, 'width') and hasattr(self, 'height'):
-                if tile_x < 0 or tile_x >= self.width:
-                    return True
-                if tile_y < 0 or tile_y >= self.height:
-                    return True
-        
-        # Prüfe NPC-Kollisionen
-        for npc in self.npcs:
-            npc_tile_x = npc.x // TILE_SIZE
-            npc_tile_y = npc.y // TILE_SIZE
-            if npc_tile_x == tile_x and npc_tile_y == tile_y:
-                return True
-        
-        return False
+        return self.collision_grid.is_blocked(int(x // TILE_SIZE), int(y // TILE_SIZE))
     
     def is_tile_solid(self, x: int, y: int) -> bool:
         """
@@ -429,29 +481,9 @@ class Area:
             y: Y-Position in Tiles
             
         Returns:
-            True wenn solid, sonst False
+            True wenn solid oder außerhalb der Map, sonst False
         """
-        # Prüfe Map-Grenzen
-        if x < 0 or y < 0:
-            return True
-        
-        if self.map_data:
-            if x >= self.map_data.width or y >= self.map_data.height:
-                return True
-            
-            # Prüfe Collision-Layer
-            if "collision" in self.map_data.layers:
-                collision_layer = self.map_data.layers["collision"]
-                if 0 <= y < len(collision_layer) and 0 <= x < len(collision_layer[y]):
-                    return bool(collision_layer[y][x])
-        else:
-            # TMX-basierte Kollision
-            if hasattr(self, 'width') and hasattr(self, 'height'):
-                if x >= self.width or y >= self.height:
-                    return True
-        
-        # Standardmäßig nicht solid
-        return False
+        return self.collision_grid.is_solid(x, y)
     
     def get_warp_at(self, x: int, y: int):
         """
@@ -464,17 +496,7 @@ class Area:
         Returns:
             Warp-Objekt oder None
         """
-        if not self.map_data:
-            return None
-        
-        tile_x = x // TILE_SIZE
-        tile_y = y // TILE_SIZE
-        
-        for warp in self.map_data.warps:
-            if warp.x == tile_x and warp.y == tile_y:
-                return warp
-        
-        return None
+        return self.warp_index.first_at(int(x // TILE_SIZE), int(y // TILE_SIZE))
     
     def get_trigger_at(self, x: int, y: int):
         """
@@ -487,17 +509,7 @@ class Area:
         Returns:
             Trigger-Objekt oder None
         """
-        if not self.map_data:
-            return None
-        
-        tile_x = x // TILE_SIZE
-        tile_y = y // TILE_SIZE
-        
-        for trigger in self.map_data.triggers:
-            if trigger.x == tile_x and trigger.y == tile_y:
-                return trigger
-        
-        return None
+        return self.trigger_index.first_at(int(x // TILE_SIZE), int(y // TILE_SIZE))
     
     def get_tile_type(self, tile_x: int, tile_y: int) -> int:
         """
@@ -534,8 +546,54 @@ class Area:
         Args:
             entity: Die hinzuzufügende Entity
         """
+        entity.set_collision_grid(self.collision_grid)
+        entity.set_spatial_index(self.entity_index)
         self.entities.append(entity)
     
+    def _sync_entity_index(self) -> None:
+        """Trägt Entities nach, die direkt an `entities`/`npcs` gehängt oder ersetzt wurden"""
+        lists = (id(self.entities), len(self.entities), id(self.npcs), len(self.npcs))
+        if lists == self._indexed_lists:
+            return
+        self._indexed_lists = lists
+        
+        current = {id(entity): entity for entity in self.entities + self.npcs}
+        for entity in list(self.entity_index):
+            if id(entity) not in current:
+                entity.set_spatial_index(None)
+        for entity in current.values():
+            if entity.spatial_index is not self.entity_index:
+                entity.set_spatial_index(self.entity_index)
+    
+    def get_entities_at(self, tile_x: int, tile_y: int) -> Sequence[Entity]:
+        """
+        Alle Entities auf einem Tile (Ziel-Tile bei laufender Bewegung).
+        
+        Args:
+            tile_x: Tile X
+            tile_y: Tile Y
+            
+        Returns:
+            Entities in Hinzufüge-Reihenfolge
+        """
+        self._sync_entity_index()
+        return self.entity_index.at(tile_x, tile_y)
+    
+    def get_entities_in_rect(self, rect: pygame.Rect) -> Iterator[Entity]:
+        """
+        Entities, deren Tile ein Welt-Rechteck (Pixel) berührt.
+        Ein Tile Rand deckt laufende Bewegungen ab; für exakte Tests danach Bounds prüfen.
+        
+        Args:
+            rect: Welt-Rechteck in Pixeln
+            
+        Returns:
+            Iterator über Entities
+        """
+        self._sync_entity_index()
+        return self.entity_index.in_rect(rect.left // TILE_SIZE - 1, rect.top // TILE_SIZE - 1,
+                                         -(-rect.right // TILE_SIZE) + 1, -(-rect.bottom // TILE_SIZE) + 1)
+    
     @property
     def layers(self):
         """Kompatibilitäts-Property für alten Code"""
@@ -545,12 +603,11 @@ class Area:
     
     # --- Pathfinding helpers ---
     def find_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
-        """Finde einen Pfad (A*) von `start` nach `goal` in Tile-Koordinaten.
+        """Finde einen Pfad (Jump Point Search) von `start` nach `goal` in Tile-Koordinaten.
 
         Gibt eine Liste von Tile-Positionen inkl. Start/Goal zurück. Leere Liste, wenn kein Pfad existiert.
         """
-        from .pathfinding import find_path as a_star_find_path
-        return a_star_find_path(self, start, goal)
+        return self.collision_grid.pathfinder.find_path(start, goal)
     
     def find_path_with_tile_manager(self, start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
         """
@@ -563,22 +620,9 @@ class Area:
         Returns:
             Liste von Positionen oder leere Liste wenn kein Pfad
         """
-        from engine.world.tile_manager import TileManager
-        
-        # Stelle sicher, dass TileManager die aktuelle Map kennt
+        # TileManager arbeitet auf dem Collision-Grid dieser Area
         tile_manager = TileManager.get_instance()
-        if not tile_manager.collision_map or            len(tile_manager.collision_map) != self.height or            (tile_manager.collision_map and len(tile_manager.collision_map[0]) != self.width):
-            # Baue Collision-Map aus Area-Daten
-            tile_manager.map_width = self.width
-            tile_manager.map_height = self.height
-            tile_manager.collision_map = []
-            
-            for y in range(self.height):
-                row = []
-                for x in range(self.width):
-                    # Verwende Area's is_tile_solid Methode
-                    row.append(self.is_tile_solid(x, y))
-                tile_manager.collision_map.append(row)
+        tile_manager.set_collision_grid(self.collision_grid)
         
         # Verwende TileManager's Pathfinding
         return tile_manager.find_path(start, goal)
@@ -594,12 +638,8 @@ class Area:
         Returns:
             Liste von Positionen oder leere Liste wenn kein Pfad
         """
-        from engine.world.tile_manager import TileManager
-        
-        # Synchronisiere Collision-Map
-        self.find_path_with_tile_manager(start, goal)  # Aktualisiert collision_map
-        
         tile_manager = TileManager.get_instance()
+        tile_manager.set_collision_grid(self.collision_grid)
         return tile_manager.find_path_diagonal(start, goal)
     
     def get_visible_tiles(self, camera_x: int, camera_y: int, 
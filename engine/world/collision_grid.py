@@ -0,0 +1,176 @@
+"""
+Collision-Grid - gemeinsame Begehbarkeits-Daten einer Map
+Statische Kollision, Kanten, Wasser und hohes Gras als Flags in einem uint8-Array,
+dazu ein Belegungs-Layer für bewegliche Entities (NPCs, Player)
+"""
+
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Flags des statischen Layers
+SOLID = 1
+LEDGE = 2
+WATER = 4
+TALL_GRASS = 8
+
+
+class CollisionGrid:
+    """
+    Begehbarkeit einer Map als NumPy-Arrays.
+
+    `tiles` hält pro Tile die statischen Flags (Kollisions-Layer, Kanten,
+    Wasser, hohes Gras), `occupancy` zählt die Entities pro Tile. Alle Abfragen sind
+    O(1)-Array-Zugriffe. `version` steigt bei jeder statischen Änderung,
+    damit abgeleitete Daten (z.B. Pfad-Caches) veralten können.
+    """
+
+    def __init__(self, width: int, height: int):
+        """
+        Args:
+            width: Map-Breite in Tiles
+            height: Map-Höhe in Tiles
+        """
+        self.width = width
+        self.height = height
+        self.tiles = np.zeros((height, width), dtype=np.uint8)
+        self.occupancy = np.zeros((height, width), dtype=np.uint8)
+        self._occupants: Dict[int, Tuple[int, int]] = {}
+        self.version = 0
+        self._pathfinder = None
+
+    @classmethod
+    def from_map_data(cls, map_data, tile_names: Optional[Mapping[int, str]] = None) -> 'CollisionGrid':
+        """
+        Baut das Grid aus MapData.
+        Kompilierte Maps bringen die Flags fertig mit (`tile_flags`), dann
+        werden die Layer nicht erneut ausgewertet.
+
+        Args:
+            map_data: MapData mit Layern in Tile-Koordinaten
+            tile_names: GID -> Tile-Name, um Kanten, Wasser und hohes Gras in den Grafik-Layern zu erkennen
+
+        Returns:
+            Neues CollisionGrid
+        """
+        grid = cls(map_data.width, map_data.height)
+        flags = getattr(map_data, "tile_flags", None)
+        if flags is not None:
+            grid.tiles[:] = flags
+            return grid
+        terrain_layers = []
+        # Kompilierte Maps liefern die Layer bereits als (memory-mapped) Arrays
+        layers = getattr(map_data, "layer_arrays", None) or map_data.layers
+        for layer_name, layer_data in layers.items():
+            if layer_name == "collision":
+                grid.set_layer(layer_data, SOLID)
+            else:
+                terrain_layers.append(layer_data)
+
+        if tile_names:
+            ledge_gids = [gid for gid, name in tile_names.items() if name == "ledge"]
+            water_gids = [gid for gid, name in tile_names.items() if name.startswith("water")]
+            grass_gids = [gid for gid, name in tile_names.items() if name.startswith("tall_grass")]
+            for layer_data in terrain_layers:
+                gids = grid._to_array(layer_data)
+                grid.tiles[np.isin(gids, ledge_gids)] |= LEDGE
+                grid.tiles[np.isin(gids, water_gids)] |= WATER
+                grid.tiles[np.isin(gids, grass_gids)] |= TALL_GRASS
+        return grid
+
+    def _to_array(self, layer_data: Sequence[Sequence[int]]) -> np.ndarray:
+        """Layer-Zeilen als Array in Grid-Größe (kurze Zeilen werden aufgefüllt)"""
+        if isinstance(layer_data, np.ndarray) and layer_data.shape == (self.height, self.width):
+            return layer_data.astype(np.int32)
+        array = np.zeros((self.height, self.width), dtype=np.int32)
+        for y, row in enumerate(layer_data[:self.height]):
+            row = row[:self.width]
+            array[y, :len(row)] = row
+        return array
+
+    def set_layer(self, layer_data: Sequence[Sequence[int]], flag: int) -> None:
+        """Setzt ein Flag auf allen Tiles, die im Layer ungleich 0 sind"""
+        self.tiles[self._to_array(layer_data) != 0] |= flag
+        self.version += 1
+
+    def set_solid(self, x: int, y: int, solid: bool = True) -> None:
+        """Ändert die statische Kollision eines Tiles"""
+        if not self.in_bounds(x, y):
+            return
+        if solid:
+            self.tiles[y, x] |= SOLID
+        else:
+            self.tiles[y, x] &= ~SOLID & 0xFF
+        self.version += 1
+
+    @property
+    def pathfinder(self):
+        """Pathfinding-Service dieses Grids (lazy angelegt, Caches hängen an `version`)"""
+        if self._pathfinder is None:
+            from engine.world.pathfinding import PathfindingService
+            self._pathfinder = PathfindingService(self)
+        return self._pathfinder
+
+    # --- Abfragen ---
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """Prüft ob ein Tile innerhalb der Map liegt"""
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def is_solid(self, x: int, y: int) -> bool:
+        """Statisch blockiert (außerhalb der Map immer True)"""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return True
+        return bool(self.tiles.item(y, x) & SOLID)
+
+    def has_flag(self, x: int, y: int, flag: int) -> bool:
+        """Prüft ein statisches Flag (LEDGE, WATER, TALL_GRASS, ...)"""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        return bool(self.tiles.item(y, x) & flag)
+
+    def is_occupied(self, x: int, y: int, ignore: object = None) -> bool:
+        """
+        Prüft ob eine Entity auf dem Tile steht.
+
+        Args:
+            x: Tile X
+            y: Tile Y
+            ignore: Entity, die nicht mitgezählt wird (z.B. die fragende selbst)
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        count = self.occupancy.item(y, x)
+        if ignore is not None and self._occupants.get(id(ignore)) == (x, y):
+            count -= 1
+        return count > 0
+
+    def is_blocked(self, x: int, y: int, ignore: object = None) -> bool:
+        """Statisch blockiert oder von einer Entity belegt"""
+        return self.is_solid(x, y) or self.is_occupied(x, y, ignore)
+
+    def walkable_mask(self) -> np.ndarray:
+        """Bool-Array (height, width): True wo das Tile statisch begehbar ist"""
+        return (self.tiles & SOLID) == 0
+
+    # --- Belegungs-Layer ---
+
+    def place(self, entity: object, x: int, y: int) -> None:
+        """Setzt (oder verschiebt) eine Entity auf ein Tile"""
+        key = id(entity)
+        if self._occupants.get(key) == (x, y):
+            return
+        self.remove(entity)
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.occupancy[y, x] += 1
+            self._occupants[key] = (x, y)
+
+    def remove(self, entity: object) -> None:
+        """Entfernt eine Entity aus dem Belegungs-Layer"""
+        tile = self._occupants.pop(id(entity), None)
+        if tile is not None:
+            self.occupancy[tile[1], tile[0]] -= 1
+
+    def occupant_tile(self, entity: object) -> Optional[Tuple[int, int]]:
+        """Tile, auf dem eine Entity registriert ist"""
+        return self._occupants.get(id(entity))
@@ -133,7 +133,7 @@ class EnhancedMapManager:
         area = Area(map_id)
         
         # Ensure we have the visual layers
-        if not hasattr(area, 'layer_surfaces') or not area.layer_surfaces:
+        if not area.has_visual_layers():
             print(f"[EnhancedMapManager] Warning: No visual layers found for {map_id}")
             # Create a basic grass field as fallback
             self._create_fallback_visuals(area)
@@ -509,16 +509,9 @@ class EnhancedMapManager:
         tile_x = x // TILE_SIZE
         tile_y = y // TILE_SIZE
         
-        # Check bounds
-        if tile_x < 0 or tile_x >= self.current_area.width:
+        # Check bounds, static collision and registered entities
+        if self.current_area.collision_grid.is_blocked(tile_x, tile_y):
             return True
-        if tile_y < 0 or tile_y >= self.current_area.height:
-            return True
-        
-        # Check collision map
-        if hasattr(self.current_area, 'collision_map'):
-            if self.current_area.collision_map[tile_y][tile_x]:
-                return True
         
         # Check NPC collisions
         npc = self.npc_manager.get_npc_at_position(tile_x, tile_y)
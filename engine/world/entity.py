@@ -4,12 +4,16 @@ Defines the base class for all game entities (player, NPCs, objects)
 """
 
 import pygame
-from typing import Optional, Tuple, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Tuple, Dict, Any, List
 from enum import Enum
 from dataclasses import dataclass
 from engine.world.tiles import TILE_SIZE, world_to_tile, tile_to_world
 import os
 
+if TYPE_CHECKING:
+    from engine.world.collision_grid import CollisionGrid
+    from engine.world.spatial_hash import SpatialHash
+
 
 class Direction(Enum):
     """Cardinal directions for entity facing."""
@@ -98,6 +102,8 @@ class Entity:
         self.height = height
         self.solid = True  # Whether this entity blocks movement
         self.collidable = True  # Whether this entity can collide
+        self.collision_grid: Optional['CollisionGrid'] = None  # Occupancy registration
+        self.spatial_index: Optional['SpatialHash'] = None  # Tile lookup of the entity's area
         
         # Calculate collision box offset to center it
         self.collision_offset_x = (TILE_SIZE - width) // 2
@@ -208,6 +214,7 @@ class Entity:
         """
         self.x = x
         self.y = y
+        self._occupy_tile(*self.get_tile_position())
     
     def set_tile_position(self, tile_x: int, tile_y: int) -> None:
         """
@@ -218,6 +225,39 @@ class Entity:
             tile_y: Tile Y coordinate
         """
         self.x, self.y = tile_to_world(tile_x, tile_y)
+        self._occupy_tile(tile_x, tile_y)
+    
+    def set_collision_grid(self, grid: Optional['CollisionGrid']) -> None:
+        """
+        Register the entity in a collision grid's occupancy layer.
+        
+        Args:
+            grid: Collision grid of the entity's area (None to unregister)
+        """
+        if self.collision_grid is not None:
+            self.collision_grid.remove(self)
+        self.collision_grid = grid
+        self._occupy_tile(*self.get_tile_position())
+    
+    def set_spatial_index(self, index: Optional['SpatialHash']) -> None:
+        """
+        Register the entity in an area's spatial index.
+        
+        Args:
+            index: Spatial hash of the entity's area (None to unregister)
+        """
+        if self.spatial_index is not None:
+            self.spatial_index.remove(self)
+        self.spatial_index = index
+        if index is not None:
+            index.move(self, *self.get_tile_position())
+    
+    def _occupy_tile(self, tile_x: int, tile_y: int) -> None:
+        """Move the entity's occupancy (solid entities only) and index entry to a tile."""
+        if self.collision_grid is not None and self.solid:
+            self.collision_grid.place(self, tile_x, tile_y)
+        if self.spatial_index is not None:
+            self.spatial_index.move(self, tile_x, tile_y)
     
     def move(self, dx: float, dy: float) -> None:
         """
@@ -8,9 +8,10 @@ Provides clean separation between visual TMX and game logic
 import json
 import pygame
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass, field
 from engine.world.tiles import TILE_SIZE
+from engine.world.spatial_hash import SpatialHash
 
 
 @dataclass
@@ -73,6 +74,27 @@ class InteractionData:
     warps: List[WarpData] = field(default_factory=list)
     objects: List[ObjectData] = field(default_factory=list)
     triggers: List[TriggerData] = field(default_factory=list)
+    # Tile indexes per kind, rebuilt when a list changes length
+    _indexes: Dict[str, Tuple[int, SpatialHash]] = field(default_factory=dict, repr=False, compare=False)
+    
+    def at(self, kind: str, tile_x: int, tile_y: int) -> Sequence[Any]:
+        """
+        Get all entries of one kind on a tile.
+        
+        Args:
+            kind: 'npcs', 'warps', 'objects' or 'triggers'
+            tile_x: Tile X coordinate
+            tile_y: Tile Y coordinate
+            
+        Returns:
+            Entries in file order
+        """
+        items = getattr(self, kind)
+        cached = self._indexes.get(kind)
+        if cached is None or cached[0] != len(items):
+            cached = (len(items), SpatialHash.from_positions(items, lambda item: tuple(item.position)))
+            self._indexes[kind] = cached
+        return cached[1].at(tile_x, tile_y)
 
 
 class InteractionManager:
@@ -286,10 +308,9 @@ class InteractionManager:
         if not self.active_interactions:
             return None
         
-        for npc in self.active_interactions.npcs:
-            if npc.position == (tile_x, tile_y):
-                if self.check_conditions(npc.conditions):
-                    return npc
+        for npc in self.active_interactions.at('npcs', tile_x, tile_y):
+            if self.check_conditions(npc.conditions):
+                return npc
         
         return None
     
@@ -307,10 +328,9 @@ class InteractionManager:
         if not self.active_interactions:
             return None
         
-        for warp in self.active_interactions.warps:
-            if warp.position == (tile_x, tile_y):
-                if self.check_conditions(warp.conditions):
-                    return warp
+        for warp in self.active_interactions.at('warps', tile_x, tile_y):
+            if self.check_conditions(warp.conditions):
+                return warp
         
         return None
     
@@ -328,13 +348,12 @@ class InteractionManager:
         if not self.active_interactions:
             return None
         
-        for obj in self.active_interactions.objects:
-            if obj.position == (tile_x, tile_y):
-                if self.check_conditions(obj.conditions):
-                    # Check if one-time interaction already used
-                    if obj.one_time and self.interaction_states.get(f"{self.active_interactions.map_id}_{obj.id}"):
-                        continue
-                    return obj
+        for obj in self.active_interactions.at('objects', tile_x, tile_y):
+            if self.check_conditions(obj.conditions):
+                # Check if one-time interaction already used
+                if obj.one_time and self.interaction_states.get(f"{self.active_interactions.map_id}_{obj.id}"):
+                    continue
+                return obj
         
         return None
     
@@ -352,13 +371,12 @@ class InteractionManager:
         if not self.active_interactions:
             return None
         
-        for trigger in self.active_interactions.triggers:
-            if trigger.position == (tile_x, tile_y):
-                if self.check_conditions(trigger.conditions):
-                    # Check if one-time trigger already used
-                    if trigger.one_time and self.interaction_states.get(f"{self.active_interactions.map_id}_{trigger.id}"):
-                        continue
-                    return trigger
+        for trigger in self.active_interactions.at('triggers', tile_x, tile_y):
+            if self.check_conditions(trigger.conditions):
+                # Check if one-time trigger already used
+                if trigger.one_time and self.interaction_states.get(f"{self.active_interactions.map_id}_{trigger.id}"):
+                    continue
+                return trigger
         
         return None
     
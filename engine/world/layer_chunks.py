@@ -0,0 +1,307 @@
+"""
+Layer-Chunks - Map-Layer als lazy gerenderte Kacheln fester Größe
+Nur Chunks im sichtbaren Bereich werden erzeugt und geblittet
+"""
+
+import numpy as np
+import pygame
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from engine.graphics.sprite_atlas import atlas_region
+from engine.world.tiles import TILE_SIZE
+
+# Kantenlänge eines Chunks in Tiles
+CHUNK_TILES = 16
+
+# Zeichnet den Inhalt eines Welt-Rechtecks auf eine Chunk-Surface (Ursprung = rect.topleft).
+# Gibt False zurück, wenn nichts gezeichnet wurde (leerer Chunk).
+RegionRenderer = Callable[[pygame.Surface, pygame.Rect], bool]
+
+# (Sprite, Welt-X, Welt-Y)
+Placement = Tuple[pygame.Surface, int, int]
+
+class ChunkedLayer:
+    """
+    Ein Map-Layer, aufgeteilt in Chunks von CHUNK_TILES x CHUNK_TILES Tiles.
+
+    Chunks werden beim ersten Sichtbarwerden gerendert und gecacht; leere
+    Chunks werden als None gemerkt und nie geblittet. Der Speicherbedarf
+    wächst damit mit der besuchten Fläche statt mit Map-Größe x Layer-Anzahl.
+    """
+
+    def __init__(self, name: str, width: int, height: int, render_region: RegionRenderer,
+                 chunk_size: int = CHUNK_TILES * TILE_SIZE, display_format: bool = False):
+        """
+        Args:
+            name: Layer-Name
+            width: Layer-Breite in Pixeln
+            height: Layer-Höhe in Pixeln
+            render_region: Zeichnet ein Welt-Rechteck auf eine Surface
+            chunk_size: Chunk-Kantenlänge in Pixeln
+            display_format: Chunks ins Pixelformat des Displays konvertieren
+        """
+        self.name = name
+        self.width = width
+        self.height = height
+        self.chunk_size = chunk_size
+        self.render_region = render_region
+        self.display_format = display_format
+        self.columns = max(1, -(-width // chunk_size))
+        self.rows = max(1, -(-height // chunk_size))
+        self._chunks: Dict[Tuple[int, int], Optional[pygame.Surface]] = {}
+        # Vorgerenderte Chunks, die noch ins Display-Format konvertiert werden müssen
+        self._unconverted: Set[Tuple[int, int]] = set()
+        # Speicher aller Chunk-Surfaces; Änderungen gehen an on_resize (Byte-Delta)
+        self.nbytes = 0
+        self.on_resize: Optional[Callable[[int], None]] = None
+
+    @property
+    def loaded_chunks(self) -> int:
+        """Anzahl bereits gerenderter Chunks (inkl. leerer)"""
+        return len(self._chunks)
+
+    def chunk_rect(self, cx: int, cy: int) -> pygame.Rect:
+        """Welt-Rechteck eines Chunks (am Map-Rand abgeschnitten)"""
+        x = cx * self.chunk_size
+        y = cy * self.chunk_size
+        return pygame.Rect(x, y, min(self.chunk_size, self.width - x),
+                           min(self.chunk_size, self.height - y))
+
+    def get_chunk(self, cx: int, cy: int) -> Optional[pygame.Surface]:
+        """Holt einen Chunk, rendert ihn beim ersten Zugriff"""
+        key = (cx, cy)
+        if key in self._chunks:
+            return self._chunks[key]
+
+        chunk = self._render_chunk(cx, cy)
+        if chunk is not None and self.display_format:
+            chunk = to_display_format(chunk)
+        self._chunks[key] = chunk
+        self._account(surface_bytes(chunk))
+        return chunk
+
+    def _render_chunk(self, cx: int, cy: int) -> Optional[pygame.Surface]:
+        """Rendert einen Chunk auf eine neue Surface (None wenn leer)"""
+        rect = self.chunk_rect(cx, cy)
+        surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+        return surface if self.render_region(surface, rect) else None
+
+    def prerender(self, view: pygame.Rect) -> int:
+        """
+        Rendert die Chunks eines Welt-Rechtecks vor, ohne sie zu konvertieren.
+        Kann auf einem Worker-Thread laufen, solange der Layer noch von keiner
+        anderen Area gezeichnet wird; konvertiert wird mit convert_prerendered.
+
+        Args:
+            view: Vorzurendernder Welt-Bereich
+
+        Returns:
+            Anzahl neu gerenderter Chunks
+        """
+        rendered = 0
+        for key in list(self.visible_chunks(view)):
+            if key in self._chunks:
+                continue
+            chunk = self._render_chunk(*key)
+            self._chunks[key] = chunk
+            self._account(surface_bytes(chunk))
+            if chunk is not None and self.display_format:
+                self._unconverted.add(key)
+            rendered += 1
+        return rendered
+
+    def convert_prerendered(self) -> int:
+        """
+        Konvertiert vorgerenderte Chunks ins Display-Format (Main-Thread).
+
+        Returns:
+            Anzahl konvertierter Chunks
+        """
+        converted = 0
+        for key in self._unconverted:
+            chunk = self._chunks.get(key)
+            if chunk is None:
+                continue
+            self._chunks[key] = to_display_format(chunk)
+            self._account(surface_bytes(self._chunks[key]) - surface_bytes(chunk))
+            converted += 1
+        self._unconverted.clear()
+        return converted
+
+    def _account(self, delta: int) -> None:
+        """Verbucht eine Speicheränderung und meldet sie weiter"""
+        if delta:
+            self.nbytes += delta
+            if self.on_resize is not None:
+                self.on_resize(delta)
+
+    def visible_chunks(self, view: pygame.Rect) -> Iterator[Tuple[int, int]]:
+        """Chunk-Koordinaten, die ein Welt-Rechteck schneiden"""
+        size = self.chunk_size
+        start_x = max(0, view.left // size)
+        start_y = max(0, view.top // size)
+        end_x = min(self.columns, -(-view.right // size))
+        end_y = min(self.rows, -(-view.bottom // size))
+        for cy in range(start_y, end_y):
+            for cx in range(start_x, end_x):
+                yield cx, cy
+
+    def draw(self, screen: pygame.Surface, camera_x: int, camera_y: int,
+             view: Optional[pygame.Rect] = None) -> int:
+        """
+        Blittet die sichtbaren Chunks.
+
+        Args:
+            screen: Ziel-Surface
+            camera_x: Kamera X-Offset
+            camera_y: Kamera Y-Offset
+            view: Sichtbarer Welt-Bereich (Standard: Bildschirm an Kameraposition)
+
+        Returns:
+            Anzahl geblitteter Chunks
+        """
+        if view is None:
+            view = pygame.Rect(camera_x, camera_y, *screen.get_size())
+
+        blits = []
+        size = self.chunk_size
+        for cx, cy in self.visible_chunks(view):
+            chunk = self.get_chunk(cx, cy)
+            if chunk is not None:
+                blits.append((chunk, (cx * size - camera_x, cy * size - camera_y)))
+        if blits:
+            screen.blits(blits, doreturn=False)
+        return len(blits)
+
+    def invalidate(self, region: Optional[pygame.Rect] = None) -> None:
+        """Verwirft gerenderte Chunks (alle oder die eines Welt-Rechtecks)"""
+        if region is None:
+            self._chunks.clear()
+            self._unconverted.clear()
+            self._account(-self.nbytes)
+            return
+        for key in list(self.visible_chunks(region)):
+            self._unconverted.discard(key)
+            self._account(-surface_bytes(self._chunks.pop(key, None)))
+
+    def to_surface(self) -> pygame.Surface:
+        """Rendert den kompletten Layer auf eine Surface (Kompatibilität/Debug)"""
+        surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self.draw(surface, 0, 0, surface.get_rect())
+        return surface
+
+
+def surface_bytes(surface: Optional[pygame.Surface]) -> int:
+    """Speicherbedarf einer Surface: Breite x Höhe x Bytes pro Pixel"""
+    if surface is None:
+        return 0
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """Konvertiert eine Surface ins Display-Pixelformat (ohne Display unverändert)"""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha()
+
+
+def composite_layer(name: str, layers: Sequence[ChunkedLayer],
+                    display_format: bool = True) -> Optional[ChunkedLayer]:
+    """
+    Verschmilzt mehrere Layer zu einem vorkomponierten Layer.
+    Die Chunks rendern alle Quell-Layer direkt übereinander, die Quell-Layer
+    selbst legen dabei keine eigenen Chunks an.
+
+    Args:
+        name: Name des Composite-Layers
+        layers: Quell-Layer in Zeichenreihenfolge (gleiche Größe)
+        display_format: Chunks ins Display-Pixelformat konvertieren
+
+    Returns:
+        Composite-Layer oder None ohne Quell-Layer
+    """
+    if not layers:
+        return None
+    renderers = [layer.render_region for layer in layers]
+
+    def render(surface: pygame.Surface, rect: pygame.Rect) -> bool:
+        drawn = False
+        for render_region in renderers:
+            drawn = render_region(surface, rect) or drawn
+        return drawn
+
+    first = layers[0]
+    return ChunkedLayer(name, first.width, first.height, render,
+                        chunk_size=first.chunk_size, display_format=display_format)
+
+
+def tile_region_renderer(layer_data: Sequence[Sequence[int]],
+                         get_sprite: Callable[[int], Optional[pygame.Surface]],
+                         gids: Optional[Iterable[int]] = None) -> RegionRenderer:
+    """
+    Renderer für einen Tile-Layer.
+    Sprites, die größer als ein Tile sind, ragen in Nachbar-Chunks hinein;
+    dafür werden die Tiles links/oberhalb des Chunks mit einbezogen.
+    Geblittet wird direkt aus den Atlas-Seiten (Seite + Quell-Rechteck je GID).
+
+    Args:
+        layer_data: Tile-GIDs als Zeilen (Listen oder 2D-Array, z.B. memory-mapped)
+        get_sprite: GID -> Sprite
+        gids: Vorab bekannte GIDs des Layers (kompilierte Maps), spart den Scan
+
+    Returns:
+        RegionRenderer für ChunkedLayer
+    """
+    if gids is not None:
+        gids = set(gids)
+    elif isinstance(layer_data, np.ndarray):
+        gids = set(np.unique(layer_data).tolist()) - {0}
+    else:
+        gids = {gid for row in layer_data for gid in row if gid}
+    regions = {gid: atlas_region(sprite) for gid, sprite in zip(gids, map(get_sprite, gids)) if sprite}
+    reach_x = max([rect.width for _, rect in regions.values()] + [TILE_SIZE])
+    reach_y = max([rect.height for _, rect in regions.values()] + [TILE_SIZE])
+    margin_x = -(-reach_x // TILE_SIZE) - 1
+    margin_y = -(-reach_y // TILE_SIZE) - 1
+    height = len(layer_data)
+
+    def render(surface: pygame.Surface, rect: pygame.Rect) -> bool:
+        blits: List[Tuple[pygame.Surface, Tuple[int, int], pygame.Rect]] = []
+        start_x = max(0, rect.left // TILE_SIZE - margin_x)
+        end_x = -(-rect.right // TILE_SIZE)
+        for ty in range(max(0, rect.top // TILE_SIZE - margin_y), min(height, -(-rect.bottom // TILE_SIZE))):
+            row = layer_data[ty][start_x:end_x]
+            if isinstance(row, np.ndarray):
+                row = row.tolist()  # Nur den Chunk-Ausschnitt eines Arrays dekodieren
+            for tx, gid in enumerate(row, start_x):
+                region = regions.get(gid)
+                if region:
+                    page, area = region
+                    blits.append((page, (tx * TILE_SIZE - rect.x, ty * TILE_SIZE - rect.y), area))
+        if blits:
+            surface.blits(blits, doreturn=False)
+        return bool(blits)
+
+    return render
+
+
+def placement_region_renderer(placements: Sequence[Placement]) -> RegionRenderer:
+    """
+    Renderer für frei platzierte Sprites (Object-Layer).
+
+    Args:
+        placements: (Sprite, Welt-X, Welt-Y) je Objekt
+
+    Returns:
+        RegionRenderer für ChunkedLayer
+    """
+    items = [(*atlas_region(sprite), pygame.Rect(x, y, *sprite.get_size())) for sprite, x, y in placements]
+
+    def render(surface: pygame.Surface, rect: pygame.Rect) -> bool:
+        blits = [(page, (bounds.x - rect.x, bounds.y - rect.y), area)
+                 for page, area, bounds in items if bounds.colliderect(rect)]
+        if blits:
+            surface.blits(blits, doreturn=False)
+        return bool(blits)
+
+    return render
@@ -3,7 +3,8 @@ Ledge Handler für das Grid-basierte Movement System
 Behandelt das Springen über Kanten (Ledges)
 """
 
-from typing import List, Tuple, Optional
+from typing import Tuple
+from engine.world.collision_grid import CollisionGrid, LEDGE
 from engine.world.movement_states import MovementState
 from engine.world.entity import Entity
 
@@ -13,51 +14,28 @@ class LedgeHandler:
     
     @staticmethod
     def can_jump_ledge(current_tile: Tuple[int, int], direction: 'Direction', 
-                       collision_layer: List[List[int]]) -> bool:
+                       grid: CollisionGrid, jumper: object = None) -> bool:
         """
         Check if the player can jump over a ledge in the given direction.
         
         Args:
             current_tile: Current tile position (x, y)
             direction: Direction to jump
-            collision_layer: Map collision data
+            grid: Collision grid of the map
+            jumper: Entity that jumps (its own occupancy is ignored)
             
         Returns:
             True if ledge jumping is possible
         """
-        if not collision_layer:
-            return False
-        
         current_x, current_y = current_tile
         dx, dy = direction.vector
         
-        # Check if target tile is solid (ledge)
-        target_x = current_x + dx
-        target_y = current_y + dy
-        
-        # Check bounds
-        if (target_y < 0 or target_y >= len(collision_layer) or
-            target_x < 0 or target_x >= len(collision_layer[0])):
-            return False
-        
-        # Check if target tile is solid (ledge)
-        if collision_layer[target_y][target_x] != 0:
-            return False
-        
-        # Check if landing tile is walkable
-        landing_x = current_x + (dx * 2)
-        landing_y = current_y + (dy * 2)
-        
-        # Check bounds
-        if (landing_y < 0 or landing_y >= len(collision_layer) or
-            landing_x < 0 or landing_x >= len(collision_layer[0])):
-            return False
-        
-        # Check if landing tile is walkable
-        if collision_layer[landing_y][landing_x] != 0:
+        # Target tile must be a ledge (out of bounds never is)
+        if not grid.has_flag(current_x + dx, current_y + dy, LEDGE):
             return False
         
-        return True
+        # Landing tile must be free (out of bounds counts as solid)
+        return not grid.is_blocked(current_x + dx * 2, current_y + dy * 2, ignore=jumper)
     
     @staticmethod
     def execute_ledge_jump(player: Entity, target_x: int, target_y: int) -> None:
@@ -0,0 +1,402 @@
+"""
+Compiled Map Cache for Untold Story
+Compiles .json/.tmx maps into one binary file per map that is memory-mapped on load
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import xml.etree.ElementTree as ET
+from collections.abc import Mapping
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from engine.world.collision_grid import CollisionGrid
+from engine.world.map_loader import MapData, MapLoader, Trigger, Warp
+
+# File layout: header | JSON metadata | padding | uint32 layer block (layers, height, width)
+# The block carries one extra plane with the static CollisionGrid flags when tile names resolved
+MAGIC = b"USMAP"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<5sBII")  # magic, version, metadata length, layer block offset
+ALIGNMENT = 16
+LAYER_DTYPE = np.dtype("<u4")
+CACHE_SUFFIX = ".mapc"
+SOURCE_SUFFIXES = (".json", ".tmx")
+
+# Maps whose compile failure was already reported (reported once per process)
+_reported_failures: Set[str] = set()
+
+
+def default_maps_dir() -> Path:
+    """Directory the map sources are read from."""
+    from engine.core.resources import resources
+    return resources.data_path / "maps"
+
+
+def default_cache_dir() -> Path:
+    """Directory the compiled maps are written to."""
+    from engine.core.resources import resources
+    return resources.data_path / "cache" / "maps"
+
+
+def find_source(map_id: str, maps_dir: Optional[Path] = None) -> Optional[Path]:
+    """
+    Locate the source file of a map, preferring JSON like MapLoader does.
+
+    Args:
+        map_id: Map identifier
+        maps_dir: Map source directory
+
+    Returns:
+        Path to the .json or .tmx file, or None
+    """
+    maps_dir = Path(maps_dir) if maps_dir else default_maps_dir()
+    for suffix in SOURCE_SUFFIXES:
+        path = maps_dir / f"{map_id}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def _fingerprint(path: Path) -> Dict[str, Any]:
+    """mtime, size and SHA-1 of a source file."""
+    stat = path.stat()
+    return {
+        "path": str(path),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha1": hashlib.sha1(path.read_bytes()).hexdigest(),
+    }
+
+
+def _tileset_refs(source: Path, raw: Any) -> List[Tuple[int, Path]]:
+    """(firstgid, .tsx path) pairs referenced by a map."""
+    if source.suffix == ".json":
+        entries = [(ts.get("firstgid", 1), ts.get("source")) for ts in raw.get("tilesets", [])]
+    else:
+        entries = [(int(ts.get("firstgid", 1)), ts.get("source"))
+                   for ts in raw.findall("tileset")]
+    return [(int(firstgid), source.parent / ref) for firstgid, ref in entries if ref]
+
+
+def _resolve_tile_names(tilesets: List[Tuple[int, Path]]) -> Dict[int, str]:
+    """
+    Resolve GIDs to sprite names (image file stems) from external tilesets.
+
+    Args:
+        tilesets: (firstgid, .tsx path) pairs
+
+    Returns:
+        GID -> sprite name
+    """
+    names = {}
+    for firstgid, path in tilesets:
+        root = ET.parse(path).getroot()
+        for tile in root.findall("tile"):
+            image = tile.find("image")
+            if image is not None and image.get("source"):
+                names[firstgid + int(tile.get("id", 0))] = Path(image.get("source")).stem
+    return names
+
+
+def _tmx_objects(root: ET.Element) -> List[Dict[str, Any]]:
+    """Tile objects from TMX object groups in Tiled JSON shape."""
+    objects = []
+    for group in root.findall("objectgroup"):
+        for obj in group.findall("object"):
+            if obj.get("gid"):
+                objects.append({
+                    "layer": group.get("name", "objects"),
+                    "gid": int(obj.get("gid")),
+                    "x": float(obj.get("x", 0)),
+                    "y": float(obj.get("y", 0)),
+                })
+    return objects
+
+
+def parse_source(map_id: str, source: Path) -> Tuple[MapData, List[Path]]:
+    """
+    Parse a map source with the regular MapLoader and resolve its tile names.
+
+    Args:
+        map_id: Map identifier
+        source: .json or .tmx file
+
+    Returns:
+        (MapData, tileset files the map depends on)
+    """
+    if source.suffix == ".json":
+        raw = json.loads(source.read_text(encoding="utf-8"))
+        if "tiledversion" in raw:
+            map_data = MapLoader._load_tiled_map(map_id, raw)
+        else:
+            map_data = MapLoader._load_simple_map(map_id, raw)
+    else:
+        raw = ET.parse(source).getroot()
+        map_data = MapLoader._load_tmx_file(map_id, source)
+        map_data.objects = _tmx_objects(raw)
+
+    tilesets = _tileset_refs(source, raw)
+    map_data.tile_names = _resolve_tile_names(tilesets)
+    return map_data, [path for _, path in tilesets]
+
+
+def _layer_block(map_data: MapData) -> np.ndarray:
+    """
+    Stack all tile layers into one (layers, height, width) array, followed by
+    the static collision flags if the map resolved its tile names.
+    """
+    flags = bool(map_data.tile_names)
+    block = np.zeros((len(map_data.layers) + flags, map_data.height, map_data.width), dtype=LAYER_DTYPE)
+    for index, name in enumerate(map_data.layers):
+        array = map_data.layer_arrays.get(name)
+        if array is not None:
+            block[index] = array
+            continue
+        for y, row in enumerate(map_data.layers[name][:map_data.height]):
+            row = row[:map_data.width]
+            block[index, y, :len(row)] = row
+    if flags:
+        block[-1] = CollisionGrid.from_map_data(map_data, map_data.tile_names).tiles
+    return block
+
+
+def _used_tile_names(map_data: MapData, layer_gids: Dict[str, List[int]]) -> Dict[int, str]:
+    """Tile names of the GIDs the map actually places (layers and objects)."""
+    used = {gid for gids in layer_gids.values() for gid in gids}
+    used.update(obj["gid"] for obj in map_data.objects if obj.get("gid"))
+    return {gid: name for gid, name in map_data.tile_names.items() if gid in used}
+
+
+def write_cache(path: Path, map_data: MapData, sources: List[Dict[str, Any]]) -> None:
+    """
+    Write a compiled map atomically.
+
+    Args:
+        path: Target .mapc file
+        map_data: Parsed map
+        sources: Fingerprints of every file the map was compiled from
+    """
+    block = _layer_block(map_data)
+    layer_gids = {name: [gid for gid in np.unique(block[index]).tolist() if gid]
+                  for index, name in enumerate(map_data.layers)}
+    meta = json.dumps({
+        "id": map_data.id,
+        "name": map_data.name,
+        "width": map_data.width,
+        "height": map_data.height,
+        "tile_size": map_data.tile_size,
+        "layers": list(map_data.layers),
+        "layer_gids": layer_gids,
+        "flags": bool(map_data.tile_names),
+        "warps": [asdict(warp) for warp in map_data.warps],
+        "triggers": [asdict(trigger) for trigger in map_data.triggers],
+        "properties": map_data.properties,
+        "tilesets": map_data.tilesets,
+        "objects": map_data.objects,
+        "tile_names": {str(gid): name for gid, name in _used_tile_names(map_data, layer_gids).items()},
+        "sources": sources,
+    }, separators=(",", ":")).encode("utf-8")
+
+    offset = HEADER.size + len(meta)
+    offset += -offset % ALIGNMENT
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(meta), offset))
+        f.write(meta)
+        f.write(b"\0" * (offset - HEADER.size - len(meta)))
+        f.write(block.tobytes())
+    os.replace(tmp_path, path)
+
+
+def read_cache(path: Path) -> Tuple[Dict[str, Any], np.ndarray]:
+    """
+    Read the metadata of a compiled map and memory-map its layers.
+
+    Args:
+        path: .mapc file
+
+    Returns:
+        (metadata, read-only (layers [+ flags], height, width) array)
+
+    Raises:
+        ValueError: If the file is not a compiled map of this format version
+    """
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+        if len(header) != HEADER.size:
+            raise ValueError(f"Truncated map cache: {path}")
+        magic, version, meta_length, offset = HEADER.unpack(header)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Incompatible map cache: {path}")
+        meta = json.loads(f.read(meta_length).decode("utf-8"))
+
+        shape = (len(meta["layers"]) + meta["flags"], meta["height"], meta["width"])
+        if 0 in shape:
+            return meta, np.zeros(shape, dtype=LAYER_DTYPE)
+        # Plain mmap + frombuffer: same mapping as np.memmap at a fraction of the setup cost
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    count = shape[0] * shape[1] * shape[2]
+    return meta, np.frombuffer(buffer, dtype=LAYER_DTYPE, count=count, offset=offset).reshape(shape)
+
+
+def _sources_current(sources: List[Dict[str, Any]]) -> Optional[bool]:
+    """
+    Check the recorded source fingerprints.
+
+    Returns:
+        True if unchanged, False if any content changed, None if only
+        mtimes moved (content identical, fingerprints should be refreshed)
+    """
+    touched = False
+    for entry in sources:
+        path = Path(entry["path"])
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        if stat.st_mtime_ns == entry["mtime_ns"] and stat.st_size == entry["size"]:
+            continue
+        if stat.st_size != entry["size"] or \
+                hashlib.sha1(path.read_bytes()).hexdigest() != entry["sha1"]:
+            return False
+        touched = True
+    return None if touched else True
+
+
+class LazyLayers(Mapping):
+    """
+    MapData.layers of a compiled map: list rows are only built for layers
+    that are actually read this way. Renderer and collision grid read the
+    memory-mapped MapData.layer_arrays instead.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self._arrays = arrays
+        self._rows: Dict[str, List[List[int]]] = {}
+
+    def __getitem__(self, name: str) -> List[List[int]]:
+        rows = self._rows.get(name)
+        if rows is None:
+            rows = self._rows[name] = self._arrays[name].tolist()
+        return rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._arrays)
+
+    def __len__(self) -> int:
+        return len(self._arrays)
+
+
+def _map_data_from_cache(meta: Dict[str, Any], block: np.ndarray) -> MapData:
+    """Build MapData from cache contents; layer arrays stay memory-mapped."""
+    arrays = {name: block[index] for index, name in enumerate(meta["layers"])}
+    flags = block[-1] if meta["flags"] else None
+    return MapData(
+        id=meta["id"],
+        name=meta["name"],
+        width=meta["width"],
+        height=meta["height"],
+        tile_size=meta["tile_size"],
+        layers=LazyLayers(arrays),
+        warps=[Warp(**warp) for warp in meta["warps"]],
+        triggers=[Trigger(**trigger) for trigger in meta["triggers"]],
+        properties=meta["properties"],
+        tilesets=meta["tilesets"],
+        tile_names={int(gid): name for gid, name in meta["tile_names"].items()},
+        objects=meta["objects"],
+        layer_arrays=arrays,
+        layer_gids=meta["layer_gids"],
+        tile_flags=flags,
+    )
+
+
+def _report_once(map_id: str, message: str) -> None:
+    """Print a cache problem only the first time it occurs for a map."""
+    if map_id not in _reported_failures:
+        _reported_failures.add(map_id)
+        print(f"[MapCache] {message}")
+
+
+def compile_map(map_id: str, maps_dir: Optional[Path] = None,
+                cache_dir: Optional[Path] = None) -> Path:
+    """
+    Compile one map into the cache.
+
+    Args:
+        map_id: Map identifier
+        maps_dir: Map source directory
+        cache_dir: Cache directory
+
+    Returns:
+        Path of the written .mapc file
+
+    Raises:
+        FileNotFoundError: If the map has no source file
+    """
+    source = find_source(map_id, maps_dir)
+    if source is None:
+        raise FileNotFoundError(f"No source for map {map_id}")
+    map_data, tilesets = parse_source(map_id, source)
+    path = Path(cache_dir or default_cache_dir()) / f"{map_id}{CACHE_SUFFIX}"
+    write_cache(path, map_data, [_fingerprint(p) for p in (source, *tilesets)])
+    return path
+
+
+def load_compiled(map_id: str, maps_dir: Optional[Path] = None,
+                  cache_dir: Optional[Path] = None) -> Optional[MapData]:
+    """
+    Load a map from its compiled cache, (re)building the cache if the
+    sources changed since it was written.
+
+    Args:
+        map_id: Map identifier
+        maps_dir: Map source directory
+        cache_dir: Cache directory
+
+    Returns:
+        MapData, or None if the map has no source or cannot be compiled.
+        None is deliberate: MapLoader then parses the sources itself and
+        reports the actual error; the compile failure is reported once.
+    """
+    source = find_source(map_id, maps_dir)
+    if source is None:
+        return None
+    path = Path(cache_dir or default_cache_dir()) / f"{map_id}{CACHE_SUFFIX}"
+
+    try:
+        meta, block = read_cache(path)
+        sources = meta["sources"]
+        if sources and Path(sources[0]["path"]) == source:
+            current = _sources_current(sources)
+            if current:
+                return _map_data_from_cache(meta, block)
+            if current is None:
+                # Only mtimes moved: refresh the fingerprints, skip re-parsing
+                map_data = _map_data_from_cache(meta, block)
+                write_cache(path, map_data, [_fingerprint(Path(entry["path"])) for entry in sources])
+                return map_data
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    try:
+        map_data, tilesets = parse_source(map_id, source)
+    except (OSError, ValueError, KeyError, TypeError, ET.ParseError) as e:
+        _report_once(map_id, f"Could not compile map {map_id}: {e}")
+        return None
+
+    try:
+        write_cache(path, map_data, [_fingerprint(p) for p in (source, *tilesets)])
+    except OSError as e:
+        _report_once(map_id, f"Could not write map cache for {map_id}: {e}")
+        return map_data
+    meta, block = read_cache(path)
+    return _map_data_from_cache(meta, block)
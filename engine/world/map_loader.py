@@ -7,7 +7,7 @@ import json
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from engine.core.resources import resources
 from engine.world.tiles import TILE_SIZE, TileType
 
@@ -47,11 +47,18 @@ class MapData:
     triggers: List[Trigger]
     properties: Dict[str, Any]  # Custom properties (music, encounters, etc.)
     tilesets: List[Dict[str, Any]]  # Tileset data if from Tiled
+    tile_names: Dict[int, str] = field(default_factory=dict)  # GID -> sprite name (compiled maps)
+    objects: List[Dict[str, Any]] = field(default_factory=list)  # Tile objects from object layers
+    layer_arrays: Dict[str, Any] = field(default_factory=dict, repr=False)  # Memory-mapped layers (compiled maps)
+    layer_gids: Dict[str, List[int]] = field(default_factory=dict)  # Non-zero GIDs used per layer (compiled maps)
+    tile_flags: Any = field(default=None, repr=False)  # Static CollisionGrid flags per tile (compiled maps)
 
 
 class MapLoader:
     """Handles loading and normalization of map data."""
     
+    use_cache = True  # Load maps through the compiled cache (engine.world.map_cache)
+    
     @staticmethod
     def load_map(map_id: str) -> MapData:
         """
@@ -66,6 +73,16 @@ class MapLoader:
         Raises:
             ValueError: If map cannot be loaded or parsed
         """
+        # Compiled binary cache, rebuilt automatically when the sources change
+        if MapLoader.use_cache:
+            from engine.world.map_cache import load_compiled
+            try:
+                map_data = load_compiled(map_id)
+                if map_data is not None:
+                    return map_data
+            except Exception as e:
+                print(f"Could not load compiled map for {map_id}: {e}")
+        
         # Try loading from data/maps/ as JSON (Tiled export format)
         try:
             map_path = f"maps/{map_id}.json"
@@ -165,6 +182,7 @@ class MapLoader:
         
         # Parse layers
         layers = {}
+        objects = []
         for layer in data.get("layers", []):
             layer_name = layer.get("name", "unknown")
             layer_type = layer.get("type", "tilelayer")
@@ -192,11 +210,13 @@ class MapLoader:
             
             elif layer_type == "objectgroup":
                 # Handle object layers (warps, triggers, etc.)
-                objects = layer.get("objects", [])
+                layer_objects = layer.get("objects", [])
                 if layer_name.lower() == "warps":
-                    warps = MapLoader._parse_tiled_warps(objects)
+                    warps = MapLoader._parse_tiled_warps(layer_objects)
                 elif layer_name.lower() == "triggers":
-                    triggers = MapLoader._parse_tiled_triggers(objects)
+                    triggers = MapLoader._parse_tiled_triggers(layer_objects)
+                # Tile objects (placed sprites) are rendered by Area
+                objects.extend(dict(obj, layer=layer_name) for obj in layer_objects if obj.get("gid"))
         
         # Parse properties
         properties = {}
@@ -213,11 +233,12 @@ class MapLoader:
             warps=MapLoader._parse_warps(data.get("warps", [])),
             triggers=MapLoader._parse_triggers(data.get("triggers", [])),
             properties=properties,
-            tilesets=data.get("tilesets", [])
+            tilesets=data.get("tilesets", []),
+            objects=objects
         )
     
     @staticmethod
-    def _load_tmx_file(map_id: str) -> MapData:
+    def _load_tmx_file(map_id: str, tmx_path: Optional[Path] = None) -> MapData:
         """
         Load a TMX file (legacy support).
         
@@ -226,7 +247,7 @@ class MapLoader:
         try:
             import xml.etree.ElementTree as ET
             
-            tmx_path = Path(f"data/maps/{map_id}.tmx")
+            tmx_path = tmx_path or Path(f"data/maps/{map_id}.tmx")
             if not tmx_path.exists():
                 raise FileNotFoundError(f"TMX file not found: {tmx_path}")
             
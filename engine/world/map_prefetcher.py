@@ -0,0 +1,153 @@
+"""
+Map-Prefetcher - Nachbar-Maps im Hintergrund vorbereiten
+Baut die Areas der Warp-Ziele der aktuellen Map auf einem Worker-Thread, damit ein Warp nur noch eine fertige Area einsetzt
+"""
+
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import pygame
+
+from engine.world.tiles import TILE_SIZE
+
+# (Map-ID, Spawn-Tile X, Spawn-Tile Y)
+WarpTarget = Tuple[str, int, int]
+
+
+class MapPrefetcher:
+    """
+    Bereitet Areas der Nachbar-Maps auf einem Worker-Thread vor.
+
+    Der Worker parst die MapData, baut die Area samt Collision-Grid, Tile-Indizes
+    und Layern auf und rendert die Chunks um die Spawn-Positionen vor. Die Area
+    ist dabei vom Surface-Cache abgekoppelt, der Worker teilt also keine Layer
+    mit dem Main-Thread. Die Sprite-Kategorien lädt prefetch() vorher auf dem
+    Main-Thread, der Worker liest sie nur. Beim Abholen bleibt auf dem
+    Main-Thread nur Area.finalize(): die Display-Konvertierung der vorgerenderten
+    Chunks und das Eintragen der Layer in den Surface-Cache.
+    """
+
+    _instance: Optional['MapPrefetcher'] = None
+
+    @classmethod
+    def get(cls) -> 'MapPrefetcher':
+        """Gibt die gemeinsame Prefetcher-Instanz zurück"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, area_factory: Optional[Callable[[str, object], object]] = None,
+                 map_loader: Optional[Callable[[str], object]] = None,
+                 view_size: Tuple[int, int] = (320, 240)):
+        """
+        Args:
+            area_factory: (Map-ID, MapData) -> Area auf dem Worker (Standard: abgekoppelte engine.world.area.Area)
+            map_loader: Map-ID -> MapData auf dem Worker (Standard: MapLoader.load_map)
+            view_size: Sichtbereich in Pixeln, der um jeden Spawn vorgerendert wird
+        """
+        self.area_factory = area_factory
+        self.map_loader = map_loader
+        self.view_size = view_size
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: Dict[str, Future] = {}
+
+    @property
+    def pending(self) -> Tuple[str, ...]:
+        """Map-IDs, die vorbereitet werden oder bereitliegen"""
+        return tuple(self._jobs)
+
+    def prefetch(self, targets: Iterable[WarpTarget]) -> None:
+        """
+        Plant die Vorbereitung der Warp-Ziele ein.
+        Ziele, die nicht mehr benachbart sind, werden verworfen.
+
+        Args:
+            targets: Warp-Ziele der aktuellen Map
+        """
+        spawns: Dict[str, List[Tuple[int, int]]] = {}
+        for map_id, x, y in targets:
+            if map_id:
+                spawns.setdefault(map_id, []).append((x, y))
+
+        for map_id in [map_id for map_id in self._jobs if map_id not in spawns]:
+            self.discard(map_id)
+
+        for map_id, tiles in spawns.items():
+            if map_id not in self._jobs:
+                if self._executor is None:
+                    self._preload_sprites()
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="map-prefetch")
+                self._jobs[map_id] = self._executor.submit(self._prepare, map_id, tiles)
+
+    def take(self, map_id: str) -> Optional[object]:
+        """
+        Holt eine vorbereitete Area ab und schließt sie auf dem Main-Thread ab.
+        Läuft die Vorbereitung gerade, wird auf sie gewartet; noch nicht
+        gestartete Jobs werden abgebrochen.
+
+        Args:
+            map_id: Ziel-Map
+
+        Returns:
+            Fertige Area oder None (dann synchron laden)
+        """
+        job = self._jobs.pop(map_id, None)
+        if job is None or job.cancel():
+            return None
+        try:
+            area = job.result()
+            finalize = getattr(area, 'finalize', None)
+            if finalize is not None:
+                finalize()
+            return area
+        except CancelledError:
+            return None
+        except Exception as e:
+            print(f"[MapPrefetcher] Vorbereitung von {map_id} fehlgeschlagen: {e}")
+            return None
+
+    def discard(self, map_id: Optional[str] = None) -> None:
+        """Verwirft vorbereitete Areas (alle oder die einer Map), z.B. nach Hot-Reload"""
+        map_ids = list(self._jobs) if map_id is None else [map_id]
+        for key in map_ids:
+            job = self._jobs.pop(key, None)
+            if job is not None:
+                job.cancel()
+
+    def shutdown(self) -> None:
+        """Beendet den Worker-Thread"""
+        self.discard()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _preload_sprites(self) -> None:
+        """Main-Thread: Sprite-Kategorien der Area laden, bevor der Worker startet"""
+        if self.area_factory is not None:
+            return
+        from engine.world.area import Area
+        from engine.graphics.sprite_manager import SpriteManager
+        SpriteManager.get().preload_categories(Area.SPRITE_CATEGORIES)
+
+    def _prepare(self, map_id: str, spawn_tiles: List[Tuple[int, int]]) -> object:
+        """Worker: MapData laden, Area aufbauen und die Chunks um die Spawns vorrendern"""
+        loader = self.map_loader
+        if loader is None:
+            from engine.world.map_loader import MapLoader
+            loader = MapLoader.load_map
+        map_data = loader(map_id)
+
+        if self.area_factory is not None:
+            area = self.area_factory(map_id, map_data)
+        else:
+            from engine.world.area import Area
+            area = Area(map_id, map_data=map_data, detached=True)
+
+        prerender = getattr(area, 'prerender', None)
+        if prerender is not None:
+            width, height = self.view_size
+            for x, y in spawn_tiles:
+                view = pygame.Rect(0, 0, width, height)
+                view.center = (x * TILE_SIZE + TILE_SIZE // 2, y * TILE_SIZE + TILE_SIZE // 2)
+                prerender(view)
+        return area
@@ -138,9 +138,12 @@ class NPC(Entity, PathfindingMixin):
         # Update movement timer
         self.movement_timer += dt
         
-        # Pathfinding-Update wenn wir einen Pfad haben
-        if self.current_path:
-            self.follow_path(dt)
+        # Pathfinding-Update wenn wir einen Pfad haben (oder er noch berechnet wird)
+        if self.current_path or self.path_pending:
+            if self.is_moving:
+                self._update_movement(dt)
+            else:
+                self.follow_path(dt)
             # Wenn Pfad folgen, normale Movement-Patterns ignorieren
             return
         
@@ -188,7 +191,7 @@ class NPC(Entity, PathfindingMixin):
     
     def _try_move(self) -> None:
         """Try to execute movement based on pattern - JETZT MIT PATHFINDING!"""
-        if self.is_moving or self.current_path:
+        if self.is_moving or self.current_path or self.path_pending:
             return
         
         if self.movement_pattern == MovementPattern.STATIC:
@@ -311,6 +314,10 @@ class NPC(Entity, PathfindingMixin):
         Returns:
             True if movement is possible
         """
+        # Shared collision grid: static collision and other entities
+        if self.collision_grid is not None:
+            return not self.collision_grid.is_blocked(tile_x, tile_y, ignore=self)
+        
         # Check bounds
         if not self.collision_layer:
             return True
@@ -334,8 +341,9 @@ class NPC(Entity, PathfindingMixin):
             target_grid_x: Target tile X
             target_grid_y: Target tile Y
         """
-        # Set target world coordinates
+        # Set target world coordinates and claim the target tile
         self.target_x, self.target_y = tile_to_world(target_grid_x, target_grid_y)
+        self._occupy_tile(target_grid_x, target_grid_y)
         
         # Update facing direction
         dx = target_grid_x - self.grid_x
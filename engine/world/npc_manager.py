@@ -151,8 +151,7 @@ class ManagedNPC(Entity):
         
         # TODO: Check collision with map
         # For now, just move and update direction
-        self.x = new_x
-        self.y = new_y
+        self.set_tile_position(int(new_x // TILE_SIZE), int(new_y // TILE_SIZE))
         self.direction = direction
     
     def get_dialogue_pages(self) -> List[DialoguePage]:
@@ -246,6 +245,7 @@ class NPCManager:
         self.game = game
         self.active_npcs: List[ManagedNPC] = []
         self.npc_registry: Dict[str, ManagedNPC] = {}
+        self.area = None  # Area the NPCs were spawned in (tile lookups via its spatial index)
         
     def spawn_npcs(self, interaction_data, area):
         """
@@ -257,6 +257,7 @@ class NPCManager:
         """
         # Clear existing NPCs
         self.clear_npcs()
+        self.area = area
         
         # Spawn each NPC from data
         for npc_data in interaction_data.npcs:
@@ -272,7 +273,7 @@ class NPCManager:
             self.npc_registry[npc_data.id] = npc
             
             # Add to area
-            area.entities.append(npc)
+            area.add_entity(npc)
             area.npcs.append(npc)
             
             print(f"[NPCManager] Spawned NPC: {npc_data.id} at {npc_data.position}")
@@ -309,6 +310,12 @@ class NPCManager:
     
     def get_npc_at_position(self, tile_x: int, tile_y: int) -> Optional[ManagedNPC]:
         """Get NPC at a specific tile position."""
+        if self.area is not None:
+            for entity in self.area.get_entities_at(tile_x, tile_y):
+                if self.npc_registry.get(getattr(entity, 'npc_id', None)) is entity:
+                    return entity
+            return None
+        
         for npc in self.active_npcs:
             npc_tile_x = npc.x // TILE_SIZE
             npc_tile_y = npc.y // TILE_SIZE
@@ -1,30 +1,42 @@
 """
-Grid-based A* pathfinding for 16x16 tile maps.
+Grid pathfinding for 16x16 tile maps.
 
-- Four-directional movement (no diagonals)
-- Uses `Area.is_tile_solid(x, y)` to determine walkability
+- One `PathfindingService` per `CollisionGrid` (static walkability, entities are ignored)
+- Jump Point Search for point-to-point queries, four- or eight-directional
+- Cached flow fields for many agents heading to the same tile (e.g. followers of the player)
+- Incremental searches that share a per-frame time budget
+- Every cache is keyed on `CollisionGrid.version`
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from collections import OrderedDict, deque
+from time import perf_counter
+from typing import Deque, Dict, Generator, List, Optional, Tuple
 import heapq
 
+import numpy as np
+
+from engine.world.collision_grid import CollisionGrid, SOLID
+
 
 GridPos = Tuple[int, int]
 
+# Seconds of search time per frame shared by all incremental requests
+FRAME_BUDGET = 0.002
+# Jump point expansions between two budget checks
+SLICE_EXPANSIONS = 16
+# Cached results per grid
+PATH_CACHE_SIZE = 256
+FLOW_CACHE_SIZE = 16
 
-@dataclass(order=False)
-class Node:
-    position: GridPos
-    g_cost: int  # Cost from start
-    h_cost: int  # Heuristic to goal
-    parent: Optional[GridPos]
+DIAGONAL_COST = 1.414
 
-    @property
-    def f_cost(self) -> int:
-        return self.g_cost + self.h_cost
+DIRECTIONS_4 = ((1, 0), (-1, 0), (0, 1), (0, -1))
+DIRECTIONS_8 = DIRECTIONS_4 + ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+# Generator that yields while searching and returns the finished path
+Search = Generator[None, None, List[GridPos]]
 
 
 def manhattan(a: GridPos, b: GridPos) -> int:
@@ -33,107 +45,476 @@ def manhattan(a: GridPos, b: GridPos) -> int:
     return abs(ax - bx) + abs(ay - by)
 
 
-def reconstruct_path(came_from: Dict[GridPos, GridPos], current: GridPos) -> List[GridPos]:
-    path: List[GridPos] = [current]
-    while current in came_from:
-        current = came_from[current]
-        path.append(current)
-    path.reverse()
-    return path
+def octile(a: GridPos, b: GridPos) -> float:
+    dx = abs(a[0] - b[0])
+    dy = abs(a[1] - b[1])
+    return max(dx, dy) + (DIAGONAL_COST - 1) * min(dx, dy)
 
 
 def in_bounds(area, x: int, y: int) -> bool:
     return 0 <= x < int(area.width) and 0 <= y < int(area.height)
 
 
-def get_neighbors(area, pos: GridPos) -> List[GridPos]:
-    x, y = pos
-    neighbors: List[GridPos] = []
-    for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-        nx, ny = x + dx, y + dy
-        if not in_bounds(area, nx, ny):
-            continue
-        # Solid tiles are not walkable
-        if area.is_tile_solid(nx, ny):
-            continue
-        neighbors.append((nx, ny))
-    return neighbors
+def _sign(value: int) -> int:
+    return (value > 0) - (value < 0)
 
 
-def find_path(area, start: GridPos, goal: GridPos, *, max_expansions: int = 8192) -> List[GridPos]:
+class PathRequest:
     """
-    Compute a path on the area grid using A*.
-
-    Args:
-        area: Area providing `width`, `height`, and `is_tile_solid(x, y)`
-        start: Start tile (x, y)
-        goal: Goal tile (x, y)
-        max_expansions: Safety limit to avoid infinite loops on malformed maps
+    A path query that may run across several frames.
 
-    Returns:
-        List of tiles from start to goal (inclusive). Empty if no path.
+    `path` holds the tiles from start to goal (inclusive) once `done` is True;
+    it stays empty if no path exists.
     """
-    sx, sy = start
-    gx, gy = goal
-
-    # Early validations
-    if not in_bounds(area, sx, sy) or not in_bounds(area, gx, gy):
-        return []
 
-    if area.is_tile_solid(sx, sy):
-        # Start position blocked
-        return []
+    def __init__(self, key: Tuple, path: Optional[List[GridPos]] = None):
+        self.key = key
+        self.start: GridPos = key[0]
+        self.goal: GridPos = key[1]
+        self.path: List[GridPos] = path or []
+        self.done = path is not None
+        self.search: Optional[Search] = None
 
-    if start == goal:
-        return [start]
-
-    # If the goal is blocked, try to route to the closest walkable neighbor of goal
-    effective_goals: Set[GridPos] = set()
-    if not area.is_tile_solid(gx, gy):
-        effective_goals.add(goal)
-    else:
-        for n in get_neighbors(area, goal):
-            effective_goals.add(n)
-        if not effective_goals:
-            return []
 
-    # Open set priority queue: (f_cost, h_cost, tie_breaker, position)
-    open_heap: List[Tuple[int, int, int, GridPos]] = []
-    tie: int = 0
+class PathfindingService:
+    """
+    Pathfinding on one collision grid.
 
-    g_score: Dict[GridPos, int] = {start: 0}
-    h0 = min(manhattan(start, g) for g in effective_goals)
-    heapq.heappush(open_heap, (h0, h0, tie, start))
-    tie += 1
+    Walkability is read from a padded flat copy of the grid, rebuilt whenever
+    `grid.version` changes; path and flow field caches are dropped at the same
+    time and pending searches restart on the new data.
+    """
 
-    came_from: Dict[GridPos, GridPos] = {}
-    closed: Set[GridPos] = set()
+    def __init__(self, grid: CollisionGrid, frame_budget: float = FRAME_BUDGET):
+        """
+        Args:
+            grid: Collision grid to search on
+            frame_budget: Seconds per frame available to incremental requests
+        """
+        self.grid = grid
+        self.frame_budget = frame_budget
+        self._version: Optional[int] = None
+        self._cells: List[bool] = []
+        self._stride = grid.width + 2
+        self._paths: 'OrderedDict[Tuple, Tuple[GridPos, ...]]' = OrderedDict()
+        self._flows: 'OrderedDict[GridPos, np.ndarray]' = OrderedDict()
+        self._pending: Deque[PathRequest] = deque()
+        # None until update() is driven by a frame loop: requests then run to completion
+        self._deadline: Optional[float] = None
+
+    # --- Cache handling ---
+
+    def _sync(self) -> None:
+        """Rebuilds walkability and drops caches if the grid changed"""
+        if self._version == self.grid.version:
+            return
+        self._version = self.grid.version
+        walkable = np.pad(self.grid.walkable_mask(), 1, constant_values=False)
+        self._stride = self.grid.width + 2
+        self._cells = walkable.ravel().tolist()
+        self._paths.clear()
+        self._flows.clear()
+        for request in self._pending:
+            request.search = self._route(*request.key)
+
+    def clear(self) -> None:
+        """Drops all cached paths and flow fields"""
+        self._version = None
+        self._paths.clear()
+        self._flows.clear()
+
+    def _store(self, key: Tuple, path: List[GridPos]) -> None:
+        self._paths[key] = tuple(path)
+        if len(self._paths) > PATH_CACHE_SIZE:
+            self._paths.popitem(last=False)
+
+    # --- Point-to-point queries ---
+
+    def find_path(self, start: GridPos, goal: GridPos, *, diagonal: bool = False,
+                  max_expansions: int = 8192) -> List[GridPos]:
+        """
+        Blocking path query.
+
+        Args:
+            start: Start tile (x, y)
+            goal: Goal tile (x, y); if it is blocked, the path ends next to it
+            diagonal: Allow diagonal steps (never cutting corners)
+            max_expansions: Limit of expanded jump points
+
+        Returns:
+            List of tiles from start to goal (inclusive). Empty if no path.
+        """
+        self._sync()
+        key = (start, goal, diagonal, max_expansions)
+        cached = self._paths.get(key)
+        if cached is not None:
+            return list(cached)
+
+        search = self._route(*key)
+        while True:
+            try:
+                next(search)
+            except StopIteration as stop:
+                path = stop.value
+                break
+        self._store(key, path)
+        return list(path)
+
+    def request_path(self, start: GridPos, goal: GridPos, *, diagonal: bool = False,
+                     max_expansions: int = 8192) -> PathRequest:
+        """
+        Incremental path query.
+
+        Runs immediately while the current frame budget lasts; otherwise the
+        request is queued and continued by `update()` in the following frames.
+
+        Returns:
+            PathRequest (check `done` before reading `path`)
+        """
+        self._sync()
+        key = (start, goal, diagonal, max_expansions)
+        cached = self._paths.get(key)
+        if cached is not None:
+            return PathRequest(key, list(cached))
+
+        request = PathRequest(key)
+        request.search = self._route(*key)
+        if self._pending or not self._advance(request):
+            self._pending.append(request)
+        return request
+
+    def cancel(self, request: PathRequest) -> None:
+        """Removes a queued request"""
+        if request in self._pending:
+            self._pending.remove(request)
 
-    expansions = 0
-    while open_heap and expansions < max_expansions:
-        _, _, _, current = heapq.heappop(open_heap)
-        if current in closed:
-            continue
-        closed.add(current)
-        expansions += 1
+    @property
+    def pending(self) -> int:
+        """Number of queued requests"""
+        return len(self._pending)
+
+    def update(self) -> None:
+        """
+        Starts a new frame: continues queued requests within the frame budget.
+        Must be called once per frame by the scene that owns the area.
+        """
+        self._sync()
+        self._deadline = perf_counter() + self.frame_budget
+        while self._pending and self._advance(self._pending[0]):
+            self._pending.popleft()
+
+    def _advance(self, request: PathRequest) -> bool:
+        """Steps a request until it finishes or the frame budget is used up"""
+        deadline = self._deadline
+        try:
+            while deadline is None or perf_counter() < deadline:
+                next(request.search)
+        except StopIteration as stop:
+            request.path = list(stop.value)
+            request.done = True
+            request.search = None
+            self._store(request.key, request.path)
+            return True
+        return False
+
+    def _route(self, start: GridPos, goal: GridPos, diagonal: bool, max_expansions: int) -> Search:
+        """Validates the query and searches to the goal (or its walkable neighbours)"""
+        grid = self.grid
+        if not grid.in_bounds(*start) or not grid.in_bounds(*goal) or grid.is_solid(*start):
+            return []
+        if start == goal:
+            return [start]
+        if not grid.is_solid(*goal):
+            return (yield from self._jps(start, goal, diagonal, max_expansions))
+
+        # Blocked goal: route to the closest walkable neighbour
+        best: List[GridPos] = []
+        for dx, dy in DIRECTIONS_4:
+            neighbour = (goal[0] + dx, goal[1] + dy)
+            if grid.is_solid(*neighbour):
+                continue
+            if neighbour == start:
+                return [start]
+            path = yield from self._jps(start, neighbour, diagonal, max_expansions)
+            if path and (not best or len(path) < len(best)):
+                best = path
+        return best
+
+    # --- Jump Point Search ---
+
+    def _jps(self, start: GridPos, goal: GridPos, diagonal: bool, max_expansions: int) -> Search:
+        """
+        Jump Point Search between two walkable tiles.
+        Yields every SLICE_EXPANSIONS expansions so callers can spread the work.
+        """
+        stride = self._stride
+        start_index = (start[1] + 1) * stride + start[0] + 1
+        goal_index = (goal[1] + 1) * stride + goal[0] + 1
+        if diagonal:
+            jump, neighbours, heuristic = self._jump8, self._neighbours8, octile
+        else:
+            jump, neighbours, heuristic = self._jump4, self._neighbours4, manhattan
+
+        open_heap: List[Tuple[float, int, int]] = [(heuristic(start, goal), 0, start_index)]
+        g_score: Dict[int, float] = {start_index: 0}
+        parent: Dict[int, Optional[int]] = {start_index: None}
+        closed = set()
+        tie = 0
+        expansions = 0
+
+        while open_heap:
+            _, _, current = heapq.heappop(open_heap)
+            if current in closed:
+                continue
+            if current == goal_index:
+                return self._expand(parent, current)
+            closed.add(current)
+
+            expansions += 1
+            if expansions > max_expansions:
+                break
+            if expansions % SLICE_EXPANSIONS == 0:
+                yield
+
+            cy, cx = divmod(current, stride)
+            came_from = parent[current]
+            if came_from is None:
+                dx = dy = 0
+            else:
+                py, px = divmod(came_from, stride)
+                dx, dy = _sign(cx - px), _sign(cy - py)
+
+            for ndx, ndy in neighbours(current, dx, dy):
+                point = jump(current + ndx + ndy * stride, ndx, ndy, goal_index)
+                if point < 0 or point in closed:
+                    continue
+                jy, jx = divmod(point, stride)
+                tentative = g_score[current] + heuristic((cx, cy), (jx, jy))
+                if tentative < g_score.get(point, float('inf')):
+                    g_score[point] = tentative
+                    parent[point] = current
+                    tie += 1
+                    heapq.heappush(open_heap, (tentative + heuristic((jx - 1, jy - 1), goal), tie, point))
+        return []
 
-        if current in effective_goals:
-            return reconstruct_path(came_from, current)
+    def _expand(self, parent: Dict[int, Optional[int]], end: int) -> List[GridPos]:
+        """Turns the jump point chain into consecutive tiles"""
+        stride = self._stride
+        points = []
+        node: Optional[int] = end
+        while node is not None:
+            y, x = divmod(node, stride)
+            points.append((x - 1, y - 1))
+            node = parent[node]
+        points.reverse()
+
+        path = [points[0]]
+        for x, y in points[1:]:
+            px, py = path[-1]
+            dx, dy = _sign(x - px), _sign(y - py)
+            while (px, py) != (x, y):
+                px += dx
+                py += dy
+                path.append((px, py))
+        return path
+
+    def _neighbours4(self, index: int, dx: int, dy: int) -> List[GridPos]:
+        cells, stride = self._cells, self._stride
+        if dx:
+            candidates = ((dx, 0), (0, 1), (0, -1))
+        elif dy:
+            candidates = ((0, dy), (1, 0), (-1, 0))
+        else:
+            candidates = DIRECTIONS_4
+        return [(nx, ny) for nx, ny in candidates if cells[index + nx + ny * stride]]
+
+    def _jump4(self, index: int, dx: int, dy: int, goal: int) -> int:
+        """Moves straight until a jump point (-1 if blocked); vertical moves probe sideways"""
+        cells = self._cells
+        step = dx + dy * self._stride
+        side = self._stride if dx else 1
+        while True:
+            if not cells[index]:
+                return -1
+            if index == goal:
+                return index
+            if ((cells[index - side] and not cells[index - step - side]) or
+                    (cells[index + side] and not cells[index - step + side])):
+                return index
+            if dy and (self._jump4(index + 1, 1, 0, goal) >= 0 or self._jump4(index - 1, -1, 0, goal) >= 0):
+                return index
+            index += step
+
+    def _neighbours8(self, index: int, dx: int, dy: int) -> List[GridPos]:
+        cells, stride = self._cells, self._stride
+        result: List[GridPos] = []
+        if not dx and not dy:
+            for nx, ny in DIRECTIONS_8:
+                if not cells[index + nx + ny * stride]:
+                    continue
+                if nx and ny and not (cells[index + nx] and cells[index + ny * stride]):
+                    continue
+                result.append((nx, ny))
+        elif dx and dy:
+            vertical = cells[index + dy * stride]
+            horizontal = cells[index + dx]
+            if vertical:
+                result.append((0, dy))
+            if horizontal:
+                result.append((dx, 0))
+            if vertical and horizontal:
+                result.append((dx, dy))
+        elif dx:
+            ahead = cells[index + dx]
+            below = cells[index + stride]
+            above = cells[index - stride]
+            if ahead:
+                result.append((dx, 0))
+                if below:
+                    result.append((dx, 1))
+                if above:
+                    result.append((dx, -1))
+            if below:
+                result.append((0, 1))
+            if above:
+                result.append((0, -1))
+        else:
+            ahead = cells[index + dy * stride]
+            right = cells[index + 1]
+            left = cells[index - 1]
+            if ahead:
+                result.append((0, dy))
+                if right:
+                    result.append((1, dy))
+                if left:
+                    result.append((-1, dy))
+            if right:
+                result.append((1, 0))
+            if left:
+                result.append((-1, 0))
+        return result
+
+    def _jump8(self, index: int, dx: int, dy: int, goal: int) -> int:
+        """Eight-directional jump without corner cutting (-1 if blocked)"""
+        cells, stride = self._cells, self._stride
+        vertical = dy * stride
+        step = dx + vertical
+        while True:
+            if not cells[index]:
+                return -1
+            if index == goal:
+                return index
+            if dx and dy:
+                if (self._jump8(index + dx, dx, 0, goal) >= 0 or
+                        self._jump8(index + vertical, 0, dy, goal) >= 0):
+                    return index
+                if not (cells[index + dx] and cells[index + vertical]):
+                    return -1
+            elif dx:
+                if ((cells[index - stride] and not cells[index - dx - stride]) or
+                        (cells[index + stride] and not cells[index - dx + stride])):
+                    return index
+            elif ((cells[index - 1] and not cells[index - 1 - vertical]) or
+                  (cells[index + 1] and not cells[index + 1 - vertical])):
+                return index
+            index += step
+
+    # --- Flow fields ---
+
+    def flow_field(self, goal: GridPos) -> np.ndarray:
+        """
+        Step distances to a goal tile for the whole grid (cached per goal).
+
+        Returns:
+            int32 array (height, width); -1 where the goal is unreachable
+        """
+        self._sync()
+        field = self._flows.get(goal)
+        if field is not None:
+            self._flows.move_to_end(goal)
+            return field
+
+        field = self._build_flow_field(goal)
+        self._flows[goal] = field
+        if len(self._flows) > FLOW_CACHE_SIZE:
+            self._flows.popitem(last=False)
+        return field
+
+    def _build_flow_field(self, goal: GridPos) -> np.ndarray:
+        """Breadth-first wavefront from the goal over all walkable tiles"""
+        walkable = self.grid.walkable_mask()
+        distances = np.full(walkable.shape, -1, dtype=np.int32)
+        if not self.grid.in_bounds(*goal):
+            return distances
+
+        frontier = np.zeros(walkable.shape, dtype=bool)
+        frontier[goal[1], goal[0]] = True
+        distances[goal[1], goal[0]] = 0
+        step = 0
+        while frontier.any():
+            step += 1
+            grown = np.zeros_like(frontier)
+            grown[1:, :] |= frontier[:-1, :]
+            grown[:-1, :] |= frontier[1:, :]
+            grown[:, 1:] |= frontier[:, :-1]
+            grown[:, :-1] |= frontier[:, 1:]
+            frontier = grown & walkable & (distances < 0)
+            distances[frontier] = step
+        return distances
+
+    def flow_path(self, start: GridPos, goal: GridPos) -> List[GridPos]:
+        """
+        Follows the flow field of `goal` downhill from `start`.
+        A blocked goal (e.g. an entity's tile) ends the path next to it.
+
+        Returns:
+            List of tiles from start to goal (inclusive), or to the tile next to
+            a blocked goal. Empty if unreachable.
+        """
+        field = self.flow_field(goal)
+        x, y = start
+        if not self.grid.in_bounds(x, y) or field.item(y, x) < 0:
+            return []
 
-        for neighbor in get_neighbors(area, current):
-            tentative_g = g_score[current] + 1
-            if neighbor in g_score and tentative_g >= g_score[neighbor]:
-                continue
+        path = [start]
+        distance = field.item(y, x)
+        stop = 1 if distance > 0 and self.grid.is_blocked(*goal) else 0
+        while distance > stop:
+            for dx, dy in DIRECTIONS_4:
+                nx, ny = x + dx, y + dy
+                if self.grid.in_bounds(nx, ny) and field.item(ny, nx) == distance - 1:
+                    x, y = nx, ny
+                    break
+            path.append((x, y))
+            distance -= 1
+        return path
+
+
+def grid_for(area) -> CollisionGrid:
+    """Collision grid of an area (built from `is_tile_solid` for areas without one)"""
+    grid = getattr(area, 'collision_grid', None)
+    if grid is not None:
+        return grid
+
+    grid = CollisionGrid(int(area.width), int(area.height))
+    for y in range(grid.height):
+        for x in range(grid.width):
+            if area.is_tile_solid(x, y):
+                grid.tiles[y, x] |= SOLID
+    return grid
 
-            came_from[neighbor] = current
-            g_score[neighbor] = tentative_g
-            # Use the best (minimum) heuristic among multiple effective goals
-            h = min(manhattan(neighbor, g) for g in effective_goals)
-            f = tentative_g + h
-            heapq.heappush(open_heap, (f, h, tie, neighbor))
-            tie += 1
 
-    # No path found within expansion budget
-    return []
+def find_path(area, start: GridPos, goal: GridPos, *, max_expansions: int = 8192) -> List[GridPos]:
+    """
+    Compute a four-directional path on the area grid.
 
+    Args:
+        area: Area providing `collision_grid` (or `width`, `height`, `is_tile_solid(x, y)`)
+        start: Start tile (x, y)
+        goal: Goal tile (x, y)
+        max_expansions: Safety limit of expanded jump points
 
+    Returns:
+        List of tiles from start to goal (inclusive). Empty if no path.
+    """
+    return grid_for(area).pathfinder.find_path(start, goal, max_expansions=max_expansions)
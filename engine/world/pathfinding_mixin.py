@@ -13,7 +13,8 @@ import time
 class PathfindingMixin:
     """
     Mixin für NPCs mit intelligenter Wegfindung.
-    Erweitert die normale NPC-Klasse um A* Pathfinding.
+    Erweitert die normale NPC-Klasse um Pathfinding über den PathfindingService
+    des Collision-Grids (Jump Point Search, Flow-Fields, Frame-Budget).
     """
     
     def __init__(self):
@@ -24,18 +25,34 @@ class PathfindingMixin:
         self.path_stuck_counter: int = 0
         self.last_pathfind_time: float = 0
         self.pathfind_cooldown: float = 0.5  # Halbe Sekunde zwischen Pathfinding-Versuchen
+        self.path_request = None  # Laufende Suche im PathfindingService des Grids
+    
+    @property
+    def path_pending(self) -> bool:
+        """True solange eine über mehrere Frames verteilte Suche läuft."""
+        return self.path_request is not None
+    
+    def cancel_path_request(self) -> None:
+        """Bricht eine laufende Suche ab."""
+        if self.path_request is not None:
+            area = getattr(self, 'current_area', None)
+            grid = getattr(area, 'collision_grid', None)
+            if grid is not None:
+                grid.pathfinder.cancel(self.path_request)
+            self.path_request = None
         
     def find_path_to(self, target_x: int, target_y: int, area=None) -> bool:
         """
-        Findet einen Pfad zum Ziel mit A* Algorithmus.
+        Findet einen Pfad zum Ziel (Jump Point Search auf dem Collision-Grid).
+        Reicht das Frame-Budget nicht, läuft die Suche über die nächsten Frames weiter.
         
         Args:
             target_x: Ziel-Tile X
             target_y: Ziel-Tile Y
-            area: Area-Objekt mit is_tile_solid() Methode
+            area: Area-Objekt mit collision_grid (oder is_tile_solid())
             
         Returns:
-            True wenn Pfad gefunden, sonst False
+            True wenn Pfad gefunden oder Suche noch läuft, sonst False
         """
         # Cooldown checken - nich zu oft pathfinden, sonst raucht die CPU ab!
         current_time = time.time()
@@ -59,33 +76,58 @@ class PathfindingMixin:
                 print(f"[PathfindingMixin] Ey, keine Area zum Pathfinden da!")
                 return False
         
-        # Pfad finden mit A*
+        # Pfad über den PathfindingService des Collision-Grids suchen
         try:
-            path = find_path(
-                area=area,
-                start=(current_x, current_y),
-                goal=(target_x, target_y),
-                max_expansions=256  # Nich zu viele Nodes checken, sonst dauert's ewig
-            )
+            target = (target_x, target_y)
+            grid = getattr(area, 'collision_grid', None)
+            if grid is None:
+                path = find_path(
+                    area=area,
+                    start=(current_x, current_y),
+                    goal=target,
+                    max_expansions=256  # Nich zu viele Nodes checken, sonst dauert's ewig
+                )
+                return self._apply_path(path, target)
             
-            if path and len(path) > 1:
-                # Ersten Punkt skippen (das is unsere aktuelle Position)
-                self.current_path = path[1:]
-                self.path_index = 0
-                self.path_target = (target_x, target_y)
-                self.path_stuck_counter = 0
-                print(f"[PathfindingMixin] Pfad gefunden! {len(self.current_path)} Schritte zum Ziel")
+            # Läuft sofort, solange das Frame-Budget reicht - sonst über die nächsten Frames
+            self.cancel_path_request()
+            request = grid.pathfinder.request_path(
+                (current_x, current_y), target, max_expansions=256
+            )
+            if not request.done:
+                self.path_request = request
+                self.path_target = target
                 return True
-            else:
-                print(f"[PathfindingMixin] Kein Pfad gefunden, Mist!")
-                self.current_path = None
-                return False
+            return self._apply_path(request.path, target)
                 
         except Exception as e:
             print(f"[PathfindingMixin] Fehler beim Pathfinding: {e}")
             self.current_path = None
             return False
     
+    def _apply_path(self, path: List[Tuple[int, int]], target: Optional[Tuple[int, int]]) -> bool:
+        """
+        Übernimmt einen gefundenen Pfad.
+        
+        Args:
+            path: Tiles vom Start bis zum Ziel (inklusive)
+            target: Ziel-Tile für spätere Neuberechnungen
+            
+        Returns:
+            True wenn der Pfad mindestens einen Schritt hat
+        """
+        if path and len(path) > 1:
+            # Ersten Punkt skippen (das is unsere aktuelle Position)
+            self.current_path = path[1:]
+            self.path_index = 0
+            self.path_target = target
+            self.path_stuck_counter = 0
+            print(f"[PathfindingMixin] Pfad gefunden! {len(self.current_path)} Schritte zum Ziel")
+            return True
+        
+        self.current_path = None
+        return False
+    
     def follow_path(self, dt: float) -> bool:
         """
         Folgt dem aktuellen Pfad Schritt für Schritt.
@@ -96,6 +138,14 @@ class PathfindingMixin:
         Returns:
             True wenn noch auf'm Weg, False wenn angekommen oder kein Pfad
         """
+        # Verteilte Suche abwarten
+        if self.path_request is not None:
+            if not self.path_request.done:
+                return True
+            request, self.path_request = self.path_request, None
+            if not self._apply_path(request.path, self.path_target):
+                return False
+        
         if not self.current_path or self.path_index >= len(self.current_path):
             self.current_path = None
             return False
@@ -144,7 +194,7 @@ class PathfindingMixin:
             area: Area-Objekt
             home_radius: Maximaler Radius um Home-Position
         """
-        if self.current_path:
+        if self.current_path or self.path_pending:
             # Schon auf'm Weg irgendwohin
             return
         
@@ -188,7 +238,23 @@ class PathfindingMixin:
         distance = abs(player_tile[0] - npc_tile[0]) + abs(player_tile[1] - npc_tile[1])
         
         # Zu weit weg? Dann hinterher!
-        if distance > max_distance:
+        grid = getattr(area, 'collision_grid', None)
+        if distance > max_distance and grid is not None:
+            # Alle Verfolger teilen sich das Flow-Field zum Spieler-Tile
+            path = grid.pathfinder.flow_path(npc_tile, player_tile)
+            # Mindestabstand: die letzten Tiles vor dem Spieler weglassen
+            # (ein belegtes Spieler-Tile enthält der Pfad schon nicht mehr)
+            reached = 0 if path and path[-1] == player_tile else 1
+            path = path[:len(path) - max(0, min_distance - reached)]
+            if len(path) < 2:
+                # Kein Weg oder schon nah genug
+                return
+            if self.current_path and self.path_target == path[-1]:
+                # Läuft schon dorthin, Fortschritt nicht zurücksetzen
+                return
+            self._apply_path(path, path[-1])
+        
+        elif distance > max_distance:
             # Ziel-Position in der Nähe vom Spieler suchen (nich direkt drauf!)
             possible_targets = []
             
@@ -238,7 +304,7 @@ class PathfindingMixin:
             return
         
         # Check ob wir schon ein Ziel haben
-        if not self.current_path:
+        if not self.current_path and not self.path_pending:
             # Nächsten Patrol-Punkt ansteuern
             if not hasattr(self, 'patrol_index'):
                 self.patrol_index = 0
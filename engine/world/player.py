@@ -270,9 +270,10 @@ class Player(Entity):
         
         # Check if target is valid
         if self._can_move_to_tile(target_x, target_y):
-            # Start moving
+            # Start moving (claims the target tile)
             self.target_grid_x = target_x
             self.target_grid_y = target_y
+            self._occupy_tile(target_x, target_y)
             self.move_progress = 0.0
             
             # Set movement state
@@ -313,6 +314,10 @@ class Player(Entity):
         if tile_y < 0 or tile_y >= self.map_height:
             return False
         
+        # Shared collision grid: static collision and other entities
+        if self.collision_grid is not None:
+            return not self.collision_grid.is_blocked(tile_x, tile_y, ignore=self)
+        
         # Check collision layer
         if self.collision_layer:
             if self.collision_layer[tile_y][tile_x] != 0:
@@ -350,7 +355,7 @@ class Player(Entity):
         Returns:
             True if ledge jumping is possible
         """
-        if not self.collision_layer:
+        if self.collision_grid is None:
             return False
         
         # Get current tile position
@@ -358,7 +363,7 @@ class Player(Entity):
         direction = Direction.from_vector(dx, dy)
         
         # Check if we can jump over this ledge
-        return LedgeHandler.can_jump_ledge(current_tile, direction, self.collision_layer)
+        return LedgeHandler.can_jump_ledge(current_tile, direction, self.collision_grid, jumper=self)
     
     def _execute_ledge_jump(self, dx: int, dy: int) -> None:
         """
@@ -374,6 +379,7 @@ class Player(Entity):
         
         # Execute the ledge jump using LedgeHandler
         LedgeHandler.execute_ledge_jump(self, target_x, target_y)
+        self._occupy_tile(self.target_grid_x, self.target_grid_y)
     
     def update(self, dt: float) -> None:
         """
@@ -571,6 +577,7 @@ class Player(Entity):
         self.y = tile_y * TILE_SIZE
         self.move_progress = 0.0
         self.movement_state = MovementState.IDLE
+        self._occupy_tile(tile_x, tile_y)
     
     def lock_movement(self, locked: bool = True) -> None:
         """
@@ -604,6 +611,7 @@ class Player(Entity):
         # Set pixel position
         self.x = x
         self.y = y
+        self._occupy_tile(self.grid_x, self.grid_y)
         
         # Reset movement
         self.move_progress = 0.0
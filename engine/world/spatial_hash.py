@@ -0,0 +1,134 @@
+"""
+Spatial-Hash - Objekte nach Tile-Koordinaten indiziert
+"Was steht auf Tile (x, y)?" in O(1) für Entities, Warps, Trigger und Interaktionen
+"""
+
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+Tile = Tuple[int, int]
+
+_EMPTY: Tuple = ()
+
+
+class SpatialHash:
+    """
+    Index Tile -> Objekte.
+
+    Objekte werden über ihre id() geführt (auch nicht-hashbare Dataclasses);
+    ein Objekt steht immer auf genau einem Tile. Bewegte Objekte werden mit
+    `move` inkrementell umgetragen, Bereichsabfragen kosten
+    O(min(Fläche, belegte Tiles)).
+    """
+
+    def __init__(self, items: Iterable[Tuple[object, int, int]] = ()):
+        """
+        Args:
+            items: Startbelegung als (Objekt, Tile X, Tile Y)
+        """
+        self._cells: Dict[Tile, List[object]] = {}
+        self._tiles: Dict[int, Tuple[Tile, object]] = {}
+        for obj, x, y in items:
+            self.move(obj, x, y)
+
+    @classmethod
+    def from_positions(cls, objects: Iterable[object],
+                       position: Callable[[object], Tile]) -> 'SpatialHash':
+        """
+        Baut einen Index aus statischen Objekten.
+
+        Args:
+            objects: Zu indizierende Objekte (Reihenfolge bleibt pro Tile erhalten)
+            position: Objekt -> Tile-Koordinaten
+
+        Returns:
+            Neuer SpatialHash
+        """
+        return cls((obj, *position(obj)) for obj in objects)
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def __contains__(self, obj: object) -> bool:
+        return id(obj) in self._tiles
+
+    def __iter__(self) -> Iterator[object]:
+        return iter([obj for _, obj in self._tiles.values()])
+
+    # --- Pflege ---
+
+    def move(self, obj: object, x: int, y: int) -> None:
+        """Trägt ein Objekt auf einem Tile ein (oder verschiebt es dorthin)"""
+        key = id(obj)
+        entry = self._tiles.get(key)
+        if entry is not None:
+            if entry[0] == (x, y):
+                return
+            self._discard(entry[0], obj)
+        self._tiles[key] = ((x, y), obj)
+        self._cells.setdefault((x, y), []).append(obj)
+
+    def remove(self, obj: object) -> None:
+        """Entfernt ein Objekt aus dem Index"""
+        entry = self._tiles.pop(id(obj), None)
+        if entry is not None:
+            self._discard(entry[0], obj)
+
+    def _discard(self, tile: Tile, obj: object) -> None:
+        cell = self._cells[tile]
+        for index, other in enumerate(cell):
+            if other is obj:
+                del cell[index]
+                break
+        if not cell:
+            del self._cells[tile]
+
+    def clear(self) -> None:
+        """Leert den Index"""
+        self._cells.clear()
+        self._tiles.clear()
+
+    # --- Abfragen ---
+
+    def tile_of(self, obj: object) -> Optional[Tile]:
+        """Tile, auf dem ein Objekt eingetragen ist"""
+        entry = self._tiles.get(id(obj))
+        return entry[0] if entry else None
+
+    def at(self, x: int, y: int) -> Sequence[object]:
+        """Alle Objekte auf einem Tile in Eintragungsreihenfolge (nicht verändern)"""
+        return self._cells.get((x, y), _EMPTY)
+
+    def first_at(self, x: int, y: int,
+                 predicate: Optional[Callable[[object], bool]] = None) -> Optional[object]:
+        """
+        Erstes Objekt auf einem Tile.
+
+        Args:
+            x: Tile X
+            y: Tile Y
+            predicate: Optionaler Filter
+
+        Returns:
+            Objekt oder None
+        """
+        for obj in self._cells.get((x, y), _EMPTY):
+            if predicate is None or predicate(obj):
+                return obj
+        return None
+
+    def in_rect(self, left: int, top: int, right: int, bottom: int) -> Iterator[object]:
+        """
+        Alle Objekte in einem Tile-Rechteck (rechts/unten exklusiv).
+        Iteriert über die kleinere Menge: Tiles des Rechtecks oder belegte Tiles.
+        """
+        cells = self._cells
+        if (right - left) * (bottom - top) > len(cells):
+            for (x, y), cell in list(cells.items()):
+                if left <= x < right and top <= y < bottom:
+                    yield from list(cell)
+            return
+        for y in range(top, bottom):
+            for x in range(left, right):
+                cell = cells.get((x, y))
+                if cell:
+                    yield from list(cell)
@@ -0,0 +1,129 @@
+"""
+Surface-Cache - Byte-budgetierter LRU-Cache für gerenderte Map-Layer
+Zählt den Speicher der tatsächlich gerenderten Chunks und verdrängt nach Budget statt nach Zeit
+"""
+
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from engine.world.layer_chunks import ChunkedLayer
+
+
+class SurfaceCache:
+    """
+    LRU-Cache für ChunkedLayer-Gruppen mit Speicherbudget.
+
+    Die Größe eines Eintrags ist die Summe der gerenderten Chunk-Surfaces
+    (Breite x Höhe x Bytes pro Pixel) seiner Layer. Die Layer melden jedes
+    neue oder verworfene Chunk über `ChunkedLayer.on_resize`, dadurch bleibt
+    die Buchhaltung O(1), auch wenn Chunks erst lange nach dem Einfügen
+    gerendert werden. get und put sind O(1); verdrängt wird der am längsten
+    unbenutzte Eintrag, sobald Bytes- oder Eintragsbudget überschritten sind.
+    Verdrängte Layer verwerfen ihre Chunks, damit der Speicher auch dann frei
+    wird, wenn eine Area die Layer noch hält.
+    """
+
+    def __init__(self, max_bytes: int, max_entries: int = 0):
+        """
+        Args:
+            max_bytes: Speicherbudget in Bytes
+            max_entries: Maximale Anzahl Einträge (0 = unbegrenzt)
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[str, Tuple[Any, Tuple[ChunkedLayer, ...]]]' = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[Any]:
+        """Holt einen Eintrag und markiert ihn als zuletzt benutzt"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: str, value: Any, layers: Iterable[ChunkedLayer]) -> None:
+        """
+        Legt einen Eintrag ab.
+
+        Args:
+            key: Cache-Schlüssel
+            value: Gecachter Wert (z.B. Layer-Dictionaries einer Map)
+            layers: Alle Layer, deren Chunks zum Eintrag zählen
+        """
+        layers = tuple({id(layer): layer for layer in layers if layer is not None}.values())
+        self.pop(key)
+        for layer in layers:
+            layer.on_resize = partial(self._resize, key)
+        self._entries[key] = (value, layers)
+        self._sizes[key] = sum(layer.nbytes for layer in layers)
+        self.nbytes += self._sizes[key]
+        self._evict(keep=key)
+
+    def pop(self, key: str) -> Optional[Any]:
+        """Entfernt einen Eintrag (Layer melden danach keine Größenänderungen mehr)"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self.nbytes -= self._sizes.pop(key)
+        for layer in entry[1]:
+            layer.on_resize = None
+        return entry[0]
+
+    def discard_prefix(self, prefix: str) -> None:
+        """Entfernt alle Einträge, deren Schlüssel mit prefix beginnt"""
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            self.pop(key)
+
+    def clear(self) -> None:
+        """Leert den Cache"""
+        for key in list(self._entries):
+            self.pop(key)
+
+    def _resize(self, key: str, delta: int) -> None:
+        """Größenänderung eines Layers eines Eintrags verbuchen"""
+        if key not in self._sizes:
+            return
+        self._sizes[key] += delta
+        self.nbytes += delta
+        if delta > 0:
+            self._evict(keep=key)
+
+    def _evict(self, keep: str) -> None:
+        """Verdrängt LRU-Einträge bis das Budget eingehalten ist (keep bleibt erhalten)"""
+        while len(self._entries) > 1 and (
+                self.nbytes > self.max_bytes or
+                (self.max_entries and len(self._entries) > self.max_entries)):
+            oldest = next(key for key in self._entries if key != keep)
+            layers = self._entries[oldest][1]
+            self.pop(oldest)
+            for layer in layers:
+                layer.invalidate()
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Kennzahlen für das Debug-Overlay"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'bytes': self.nbytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+        }
@@ -7,10 +7,10 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass
-import heapq
 import json
 
 from engine.world.tiles import TILE_SIZE
+from engine.world.collision_grid import CollisionGrid, SOLID
 
 @dataclass
 class TileData:
@@ -24,6 +24,48 @@ class TileData:
         if self.properties is None:
             self.properties = {}
 
+
+class _CollisionRow:
+    """
+    Zeile von TileManager.collision_map (Kompatibilität zu den alten Bool-Listen).
+    Liest nur das SOLID-Bit, Kanten und Wasser gelten also nicht als Wand.
+    Schreiben geht über CollisionGrid.set_solid und zählt damit die Version hoch.
+    """
+    
+    __slots__ = ('grid', 'y')
+    
+    def __init__(self, grid: CollisionGrid, y: int):
+        self.grid = grid
+        self.y = y
+    
+    def __len__(self) -> int:
+        return self.grid.width
+    
+    def _index(self, x: int) -> int:
+        if x < 0:
+            x += self.grid.width
+        if not 0 <= x < self.grid.width:
+            raise IndexError("collision row index out of range")
+        return x
+    
+    def __getitem__(self, x):
+        if isinstance(x, slice):
+            return list(self)[x]
+        return bool(self.grid.tiles.item(self.y, self._index(x)) & SOLID)
+    
+    def __setitem__(self, x: int, solid: bool) -> None:
+        self.grid.set_solid(self._index(x), self.y, bool(solid))
+    
+    def __iter__(self):
+        return iter(((self.grid.tiles[self.y] & SOLID) != 0).tolist())
+    
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+    
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 class TileManager:
     """
     Verwaltet alle Tile-bezogenen Operationen.
@@ -53,8 +95,8 @@ class TileManager:
         self.tiles: Dict[int, TileData] = {}
         self.tilesets: Dict[str, Dict] = {}
         
-        # Map-Daten
-        self.collision_map: List[List[bool]] = []
+        # Map-Daten (Kollision liegt im gemeinsamen Collision-Grid)
+        self.collision_grid: Optional[CollisionGrid] = None
         self.map_width: int = 0
         self.map_height: int = 0
         
@@ -63,9 +105,6 @@ class TileManager:
         self.warps_data: Dict = {}
         self.dialogues_data: Dict = {}
         
-        # Pathfinding-Cache
-        self._path_cache: Dict[Tuple, List] = {}
-        
         # Lade externe Daten
         self._load_external_data()
     
@@ -350,15 +389,40 @@ class TileManager:
         return properties
     
     def _build_collision_map(self, collision_layer: List[List[int]]):
-        """Baut die Kollisions-Map auf"""
-        self.collision_map = []
+        """Baut das Collision-Grid aus dem Collision-Layer auf"""
+        # Tile-ID > 0 bedeutet Kollision
+        grid = CollisionGrid(len(collision_layer[0]) if collision_layer else 0, len(collision_layer))
+        grid.set_layer(collision_layer, SOLID)
+        self.set_collision_grid(grid)
+    
+    def set_collision_grid(self, grid: CollisionGrid) -> None:
+        """
+        Setzt das Collision-Grid der aktuellen Map.
+        Pfad-Caches hängen am Grid selbst (siehe CollisionGrid.pathfinder).
         
-        for row in collision_layer:
-            collision_row = []
-            for tile_gid in row:
-                # Tile-ID > 0 bedeutet Kollision
-                collision_row.append(tile_gid > 0)
-            self.collision_map.append(collision_row)
+        Args:
+            grid: Collision-Grid (z.B. von der Area)
+        """
+        if grid is self.collision_grid:
+            return
+        self.collision_grid = grid
+        self.map_width = grid.width
+        self.map_height = grid.height
+    
+    @property
+    def collision_map(self) -> List[_CollisionRow]:
+        """
+        Kompatibilität: Kollisions-Zeilen als Bool-Views auf das SOLID-Bit des Grids.
+        Lesen ändert nichts; Zuweisungen an einzelne Tiles gehen über set_solid.
+        Neue Zeilen werden nicht angehängt, sondern als Ganzes zugewiesen.
+        """
+        if self.collision_grid is None:
+            return []
+        return [_CollisionRow(self.collision_grid, y) for y in range(self.collision_grid.height)]
+    
+    @collision_map.setter
+    def collision_map(self, rows: List[List[bool]]) -> None:
+        self._build_collision_map(rows)
     
     def get_tile(self, gid: int) -> Optional[pygame.Surface]:
         """
@@ -385,175 +449,46 @@ class TileManager:
         Returns:
             True wenn Kollision, sonst False
         """
-        # Prüfe Map-Grenzen
-        if x < 0 or x >= self.map_width or y < 0 or y >= self.map_height:
-            return True
-        
-        # Prüfe Collision-Map
-        if self.collision_map and y < len(self.collision_map) and x < len(self.collision_map[y]):
-            return self.collision_map[y][x]
+        if self.collision_grid is not None:
+            return self.collision_grid.is_solid(x, y)
         
-        return False
+        # Ohne Grid nur Map-Grenzen prüfen
+        return x < 0 or x >= self.map_width or y < 0 or y >= self.map_height
     
     def find_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
         """
-        Findet einen Pfad mit A*-Algorithmus.
+        Findet einen Pfad (Jump Point Search auf dem Collision-Grid).
         
         Args:
             start: Start-Position (x, y) in Tiles
             goal: Ziel-Position (x, y) in Tiles
             
         Returns:
-            Liste von Positionen oder leere Liste wenn kein Pfad
+            Liste von Positionen (ohne Start) oder leere Liste wenn kein Pfad
         """
-        # Prüfe Cache
-        cache_key = (start, goal)
-        if cache_key in self._path_cache:
-            return self._path_cache[cache_key].copy()
-        
-        # A* Implementierung
-        def heuristic(a: Tuple[int, int], b: Tuple[int, int]) -> float:
-            """Manhattan-Distanz als Heuristik"""
-            return abs(a[0] - b[0]) + abs(a[1] - b[1])
-        
-        # Priority Queue: (f_score, counter, position)
-        counter = 0
-        open_set = [(0, counter, start)]
-        came_from = {}
-        g_score = {start: 0}
-        f_score = {start: heuristic(start, goal)}
-        closed_set = set()
-        
-        while open_set:
-            current_f, _, current = heapq.heappop(open_set)
-            
-            if current == goal:
-                # Rekonstruiere Pfad
-                path = []
-                while current in came_from:
-                    path.append(current)
-                    current = came_from[current]
-                path.reverse()
-                
-                # Cache Pfad
-                self._path_cache[cache_key] = path.copy()
-                
-                return path
-            
-            if current in closed_set:
-                continue
-            
-            closed_set.add(current)
-            
-            # Prüfe Nachbarn (4-direktional)
-            neighbors = [
-                (current[0] + 1, current[1]),  # Rechts
-                (current[0] - 1, current[1]),  # Links
-                (current[0], current[1] + 1),  # Unten
-                (current[0], current[1] - 1)   # Oben
-            ]
-            
-            for neighbor in neighbors:
-                # Prüfe ob Nachbar begehbar ist
-                if self.is_collision(neighbor[0], neighbor[1]):
-                    continue
-                
-                if neighbor in closed_set:
-                    continue
-                
-                tentative_g = g_score[current] + 1
-                
-                if neighbor not in g_score or tentative_g < g_score[neighbor]:
-                    came_from[neighbor] = current
-                    g_score[neighbor] = tentative_g
-                    f_score[neighbor] = tentative_g + heuristic(neighbor, goal)
-                    
-                    counter += 1
-                    heapq.heappush(open_set, (f_score[neighbor], counter, neighbor))
-        
-        # Kein Pfad gefunden
-        return []
+        if self.collision_grid is None or self.is_collision(goal[0], goal[1]):
+            return []
+        return self.collision_grid.pathfinder.find_path(start, goal)[1:]
     
     def find_path_diagonal(self, start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
         """
-        Findet einen Pfad mit diagonaler Bewegung.
+        Findet einen Pfad mit diagonaler Bewegung (ohne Ecken zu schneiden).
         
         Args:
             start: Start-Position (x, y) in Tiles
             goal: Ziel-Position (x, y) in Tiles
             
         Returns:
-            Liste von Positionen oder leere Liste wenn kein Pfad
+            Liste von Positionen (ohne Start) oder leere Liste wenn kein Pfad
         """
-        def heuristic(a: Tuple[int, int], b: Tuple[int, int]) -> float:
-            """Euclidean-Distanz für diagonale Bewegung"""
-            dx = abs(a[0] - b[0])
-            dy = abs(a[1] - b[1])
-            return (dx * dx + dy * dy) ** 0.5
-        
-        # Priority Queue
-        counter = 0
-        open_set = [(0, counter, start)]
-        came_from = {}
-        g_score = {start: 0}
-        f_score = {start: heuristic(start, goal)}
-        closed_set = set()
-        
-        while open_set:
-            current_f, _, current = heapq.heappop(open_set)
-            
-            if current == goal:
-                # Rekonstruiere Pfad
-                path = []
-                while current in came_from:
-                    path.append(current)
-                    current = came_from[current]
-                path.reverse()
-                return path
-            
-            if current in closed_set:
-                continue
-            
-            closed_set.add(current)
-            
-            # Prüfe alle 8 Nachbarn
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx == 0 and dy == 0:
-                        continue
-                    
-                    neighbor = (current[0] + dx, current[1] + dy)
-                    
-                    # Prüfe ob Nachbar begehbar ist
-                    if self.is_collision(neighbor[0], neighbor[1]):
-                        continue
-                    
-                    # Bei diagonaler Bewegung: Prüfe ob Ecken frei sind
-                    if dx != 0 and dy != 0:
-                        if self.is_collision(current[0] + dx, current[1]) or \
-                           self.is_collision(current[0], current[1] + dy):
-                            continue
-                    
-                    if neighbor in closed_set:
-                        continue
-                    
-                    # Kosten: 1 für gerade, 1.414 für diagonal
-                    move_cost = 1.414 if (dx != 0 and dy != 0) else 1
-                    tentative_g = g_score[current] + move_cost
-                    
-                    if neighbor not in g_score or tentative_g < g_score[neighbor]:
-                        came_from[neighbor] = current
-                        g_score[neighbor] = tentative_g
-                        f_score[neighbor] = tentative_g + heuristic(neighbor, goal)
-                        
-                        counter += 1
-                        heapq.heappush(open_set, (f_score[neighbor], counter, neighbor))
-        
-        return []
+        if self.collision_grid is None or self.is_collision(goal[0], goal[1]):
+            return []
+        return self.collision_grid.pathfinder.find_path(start, goal, diagonal=True)[1:]
     
     def clear_path_cache(self):
         """Leert den Pathfinding-Cache"""
-        self._path_cache.clear()
+        if self.collision_grid is not None:
+            self.collision_grid.pathfinder.clear()
     
     def get_npcs_for_map(self, map_id: str) -> Dict:
         """
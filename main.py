@@ -12,6 +12,11 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+# --profile-startup: Import- und Init-Kosten bis zur ersten StartScene messen (vor allen Engine-Imports)
+if "--profile-startup" in sys.argv:
+    from engine.devtools.startup_profiler import StartupProfiler
+    StartupProfiler().start()
+
 import pygame
 from engine.core.game import Game
 
@@ -20,30 +25,24 @@ def initialize_sprite_system():
     """Initialisiert das Sprite-System"""
     from engine.graphics.sprite_manager import SpriteManager
     from engine.world.tmx_init import initialize_tmx_support
+    from engine.devtools.startup_profiler import measure as measure_startup
     
     print("Initializing sprite system...")
     
     # Create sprite manager (aber NICHT _ensure_loaded aufrufen!)
-    sprite_manager = SpriteManager.get()
+    with measure_startup("SpriteManager"):
+        sprite_manager = SpriteManager.get()
     
     # WICHTIG: Zuerst TMX-Support initialisieren
     print("Initializing TMX support FIRST...")
     initialize_tmx_support()
     
-    # Dann erst den Rest laden
-    sprite_manager._ensure_loaded()
-    
-    # Count loaded sprites
-    total_sprites = (len(sprite_manager._tiles) + len(sprite_manager._objects) + 
-                    len(sprite_manager._player_dir_map) + len(sprite_manager._npc_dir_map) + 
-                    len(sprite_manager._monster))
-    
-    # Add GID count if available
+    # Sprites werden pro Kategorie beim ersten Zugriff geladen (Monster einzeln)
     if hasattr(sprite_manager, 'gid_to_surface'):
         gid_count = len(sprite_manager.gid_to_surface)
-        print(f"Sprite system initialized with {total_sprites} sprites and {gid_count} TMX GIDs")
+        print(f"Sprite system initialized (lazy loading) with {gid_count} TMX GIDs")
     else:
-        print(f"Sprite system initialized with {total_sprites} sprites")
+        print("Sprite system initialized (lazy loading)")
     
     return sprite_manager
 
@@ -22,7 +22,7 @@ try:
         EnhancedPartyMenu, MenuManager
     )
     from engine.graphics.optimized_renderer import (
-        OptimizedRenderer, TextureAtlas, FontCache
+        OptimizedRenderer, FontCache
     )
     from engine.graphics.asset_manager import AssetManager, AssetType
     print("✓ Alle UI-Module erfolgreich importiert")
@@ -175,10 +175,9 @@ def test_optimized_renderer():
         assert renderer.use_caching == True
         print("✓ OptimizedRenderer-Erstellung erfolgreich")
         
-        # TextureAtlas testen
-        atlas = TextureAtlas()
-        assert atlas.max_size == 2048
-        print("✓ TextureAtlas-Erstellung erfolgreich")
+        # Sprite-Atlas des Renderers testen
+        assert renderer.texture_atlas.pages == []
+        print("✓ Sprite-Atlas-Erstellung erfolgreich")
         
         # FontCache testen
         font_cache = FontCache()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Gemeinsame Fixtures der Battle-Tests
+Dummy-Monster und -Moves mit genau den Attributen, die Pipeline, KI und Simulator lesen
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import pytest
+
+
+@dataclass
+class DummyMove:
+    """Minimal move for the damage pipeline and the AI"""
+    name: str
+    power: int = 40
+    accuracy: int = 100
+    type: str = "Bestie"
+    category: str = "phys"
+    pp: int = 35
+    max_pp: int = 35
+    priority: int = 0
+    crit_ratio: float = 0.0
+    effects: List = field(default_factory=list)
+
+    def use(self) -> bool:
+        if self.pp > 0:
+            self.pp -= 1
+            return True
+        return False
+
+
+@dataclass
+class DummySpecies:
+    name: str
+    types: List[str]
+
+
+@dataclass
+class DummyMonster:
+    """Dummy-Monster mit den Attributen, die Pipeline, KI und Simulator lesen"""
+    name: str = "Dummy"
+    level: int = 10
+    types: List[str] = field(default_factory=lambda: ["Bestie"])
+    moves: List[DummyMove] = field(default_factory=list)
+    status: Optional[str] = None
+    stats: dict = field(default_factory=lambda: {'hp': 120, 'atk': 60, 'def': 45,
+                                                 'mag': 55, 'res': 40, 'spd': 50})
+    stat_stages: dict = field(default_factory=dict)
+    current_hp: int = 120
+    max_hp: int = 120
+    traits: List[str] = field(default_factory=list)
+    is_fainted: bool = False
+
+    def __post_init__(self):
+        self.species = DummySpecies(self.name, self.types)
+
+    def take_damage(self, damage: int) -> int:
+        actual = min(damage, self.current_hp)
+        self.current_hp -= actual
+        if self.current_hp <= 0:
+            self.is_fainted = True
+        return actual
+
+
+def dummy_factory(species, level, seed):
+    """Picklable monster_factory: Werte skalieren mit dem Level"""
+    max_hp = 40 + level * 5
+    return DummyMonster(
+        str(species), level,
+        moves=[DummyMove("Tackle"), DummyMove("Biss", power=60, accuracy=90)],
+        stats={'hp': max_hp, 'atk': 30 + level * 2, 'def': 25 + level * 2,
+               'mag': 20, 'res': 20, 'spd': 50},
+        stat_stages={'atk': 0, 'def': 0, 'mag': 0, 'res': 0, 'spd': 0},
+        current_hp=max_hp, max_hp=max_hp,
+    )
+
+
+@pytest.fixture
+def make_move():
+    """Factory für DummyMove(name, power=..., accuracy=..., ...)"""
+    return DummyMove
+
+
+@pytest.fixture
+def make_monster():
+    """Factory für DummyMonster(name, level, types, moves, ...)"""
+    return DummyMonster
+
+
+@pytest.fixture
+def moves():
+    """Standard-Moveset: physisch, Feuer, Wasser (unsicher) und ein Support-Move"""
+    return [
+        DummyMove("Tackle"),
+        DummyMove("Glut", power=60, type="Feuer", category="mag"),
+        DummyMove("Aquastrahl", power=55, type="Wasser", category="mag", accuracy=80),
+        DummyMove("Heulen", power=0, category="support"),
+    ]
+
+
+@pytest.fixture
+def monster_factory():
+    """Level-skalierte Dummy-Monster für Simulator, Replays und Snapshots"""
+    return dummy_factory
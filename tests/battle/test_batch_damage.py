@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests für die vektorisierte Batch-Schadensberechnung
+Vergleicht preview_batch mit Einzelläufen der Pipeline
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from engine.systems.battle.damage_calc import (
+    CriticalTier, DamageCalculator, critical_tier_weights, roll_critical_tier
+)
+from engine.systems.battle.battle_ai import BattleAI, AILevel
+
+
+@pytest.fixture
+def teams(make_monster, moves):
+    attackers = [
+        make_monster("A1", 20, ["Bestie"], moves, stat_stages={'atk': 2}),
+        make_monster("A2", 30, ["Feuer"], moves, status='burn'),
+        make_monster("A3", 25, ["Wasser", "Erde"], moves[:2]),
+    ]
+    defenders = [
+        make_monster("D1", 18, ["Pflanze"], moves, stat_stages={'def': -1, 'eva': 1}),
+        make_monster("D2", 22, ["Pflanze", "Bestie"], moves, current_hp=15),
+        make_monster("D3", 28, ["Wasser"], moves, current_hp=1),
+    ]
+    return attackers, defenders
+
+
+def test_batch_shape_covers_all_options(teams, moves):
+    attackers, defenders = teams
+    result = DamageCalculator(seed=1).preview_batch(attackers, defenders)
+    assert result.expected.shape == (3, 4, 3)
+    assert result.index(attackers[2], moves[1], defenders[0]) == (2, 1, 0)
+    assert result.index(attackers[2], moves[3], defenders[0]) is None
+
+    # Padding and support moves never deal damage
+    assert np.all(result.maximum[2, 2:, :] == 0)
+    assert np.all(result.expected[:, 3, :] == 0)
+
+
+def test_batch_effectiveness_matches_type_chart(teams):
+    attackers, defenders = teams
+    calculator = DamageCalculator(seed=1)
+    result = calculator.preview_batch(attackers, defenders)
+    for a, attacker in enumerate(attackers):
+        for m, move in enumerate(result.moves[a]):
+            for d, defender in enumerate(defenders):
+                expected = calculator.type_chart.calculate_type_multiplier(move.type, defender.species.types)
+                assert result.effectiveness[a, m, d] == expected
+
+
+def test_pipeline_rolls_stay_within_batch_range(teams):
+    attackers, defenders = teams
+    calculator = DamageCalculator(seed=7, compiled=True)
+    result = calculator.preview_batch(attackers, defenders)
+    for a, attacker in enumerate(attackers):
+        for m, move in enumerate(result.moves[a]):
+            if move.power <= 0:
+                continue
+            for d, defender in enumerate(defenders):
+                for _ in range(50):
+                    hit = calculator.calculate(attacker, defender, move)
+                    if hit.missed or hit.is_critical:
+                        continue
+                    assert result.minimum[a, m, d] <= hit.damage <= result.maximum[a, m, d]
+
+
+def test_batch_crit_weights_match_scalar_roll():
+    weights = critical_tier_weights()
+    assert abs(sum(weights.values()) - 1.0) < 1e-9
+
+    rng = random.Random(3)
+    rolls = [roll_critical_tier(1.0, rng) for _ in range(20000)]
+    assert CriticalTier.NONE not in rolls
+    for tier, weight in weights.items():
+        assert abs(rolls.count(tier) / len(rolls) - weight) < 0.01
+    assert roll_critical_tier(0.0, rng) == CriticalTier.NONE
+
+
+def test_ko_probability(teams, moves):
+    attackers, defenders = teams
+    result = DamageCalculator(seed=1).preview_batch(attackers, defenders)
+    assert np.all((result.ko_probability >= 0) & (result.ko_probability <= 1))
+
+    # One HP left: every damaging hit knocks out
+    tackle = result.index(attackers[0], moves[0], defenders[2])
+    assert result.ko_probability[tackle] == result.hit_chance[tackle] == 1.0
+
+    # Full HP against a weak hit cannot be a KO
+    assert result.ko_probability[result.index(attackers[1], moves[0], defenders[0])] == 0.0
+
+
+def test_ai_scores_team_in_one_batch(teams):
+    attackers, defenders = teams
+    ai = BattleAI(AILevel.PERFECT, seed=1)
+    batches = []
+    evaluate = ai.evaluate_options
+
+    def counting_evaluate(*args, **kwargs):
+        batches.append(evaluate(*args, **kwargs))
+        return batches[-1]
+
+    ai.evaluate_options = counting_evaluate
+    actions = ai.decide_team_actions(None, attackers, defenders)
+
+    assert len(batches) == 1
+    assert batches[0].expected.shape == (3, 4, 3)
+    assert len(actions) == 3
+    assert all(action.move is not None and action.target in defenders for action in actions)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests für die LOOKAHEAD-Stufe der Kampf-KI
+Zeitbudget, KO-Erkennung und Gültigkeit der Transpositionstabelle
+"""
+
+import time
+
+import pytest
+
+from engine.systems.battle.battle_ai import BattleAI, AILevel
+
+
+@pytest.fixture
+def duel(make_monster, make_move):
+    finisher = make_move("Finisher", power=40)
+    gamble = make_move("Gamble", power=90, accuracy=50)
+    actor = make_monster("A", 30, ["Bestie"], [gamble, finisher])
+    target = make_monster("B", 30, ["Bestie"], [make_move("Tackle", power=60)], current_hp=6)
+    return actor, target, finisher
+
+
+def test_lookahead_prefers_reliable_knockout(duel):
+    actor, target, finisher = duel
+    ai = BattleAI(AILevel.LOOKAHEAD, seed=1, time_budget_ms=1000)
+    action = ai.decide_action(None, actor, [target])
+    assert action.move is finisher
+    assert action.target is target
+    assert ai.last_search_depth == ai.search_depth
+
+
+def test_lookahead_respects_time_budget(make_monster, make_move):
+    attackers = [make_monster(f"A{i}", 30, ["Bestie"],
+                              [make_move(f"M{m}", power=20 + 10 * m, accuracy=90) for m in range(4)])
+                 for i in range(3)]
+    defenders = [make_monster(f"D{i}", 30, ["Pflanze"], attackers[0].moves) for i in range(3)]
+    ai = BattleAI(AILevel.LOOKAHEAD, seed=1, time_budget_ms=1.0, search_depth=6)
+
+    start = time.perf_counter()
+    action = ai.decide_action(None, attackers[0], defenders)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    assert action.move in attackers[0].moves
+    assert ai.last_search_depth < 6
+    # Budget plus the batch evaluation around the search
+    assert elapsed < 50
+
+
+def test_transpositions_are_keyed_by_battle_state(duel):
+    actor, target, _ = duel
+    target.current_hp = 120
+    ai = BattleAI(AILevel.LOOKAHEAD, seed=1, time_budget_ms=1000)
+    ai.decide_action(None, actor, [target])
+    assert ai.transpositions
+
+    # Gleiche KP, aber der Gegner hat keine PP mehr: alte Werte dürfen nicht greifen
+    target.moves[0].pp = 0
+    action = ai.decide_action(None, actor, [target])
+    fresh = BattleAI(AILevel.LOOKAHEAD, seed=1, time_budget_ms=1000)
+    expected = fresh.decide_action(None, actor, [target])
+    assert (action.move, action.target) == (expected.move, expected.target)
+    assert fresh.transpositions.items() <= ai.transpositions.items()
+    assert len(ai.transpositions) > len(fresh.transpositions)
+
+
+def test_transpositions_persist_across_turns_within_bound(duel):
+    actor, target, _ = duel
+    target.current_hp = 120
+    ai = BattleAI(AILevel.LOOKAHEAD, seed=1, time_budget_ms=1000)
+    ai.decide_action(None, actor, [target])
+    known = dict(ai.transpositions)
+
+    # Nächster Zug im selben Kampfzustand: nur Treffer, keine neuen Einträge
+    ai.decide_action(None, actor, [target])
+    assert ai.transpositions == known
+
+    ai.TRANSPOSITION_LIMIT = 5
+    target.current_hp = 90
+    ai.decide_action(None, actor, [target])
+    assert len(ai.transpositions) == 5
+
+
+def test_turn_order_uses_staged_speed(duel):
+    actor, target, _ = duel
+    target.current_hp = 120
+    ai = BattleAI(AILevel.LOOKAHEAD, seed=1, time_budget_ms=1000)
+    ai.decide_action(None, actor, [target])
+    known = len(ai.transpositions)
+
+    # Gleiche Basis-Initiative, aber der Gegner hat eine Initiative-Stufe:
+    # er zieht zuerst, also andere Schlüssel
+    target.stat_stages['spd'] = 1
+    ai.decide_action(None, actor, [target])
+    assert len(ai.transpositions) > known
+
+    # Gleich schnell wie vorher, nur über die Stufe statt den Basiswert
+    fresh = BattleAI(AILevel.LOOKAHEAD, seed=1, time_budget_ms=1000)
+    target.stat_stages['spd'] = 0
+    actor.stats['spd'] = 25
+    fresh.decide_action(None, actor, [target])
+    actor.stats['spd'] = 50
+    actor.stat_stages['spd'] = -2
+    known = len(fresh.transpositions)
+    fresh.decide_action(None, actor, [target])
+    assert len(fresh.transpositions) == known
+
+
+def test_transposition_keys_hold_the_battle_state(duel):
+    actor, target, _ = duel
+    target.current_hp = 120
+    ai = BattleAI(AILevel.LOOKAHEAD, seed=1, time_budget_ms=1000)
+    ai.decide_action(None, actor, [target])
+
+    # Der Zustand selbst ist Teil des Schlüssels, nicht nur sein Hash
+    for state_key, depth, (actor_hp, target_hps) in ai.transpositions:
+        options, threats, faster, actor_max, target_max = state_key
+        assert actor_max == actor.max_hp and target_max == (target.max_hp,)
+        assert len(target_hps) == 1 and depth >= 1
+
+
+def test_boss_battles_use_lookahead():
+    from engine.systems.battle.battle_controller import BattleState
+    from engine.systems.battle.battle_enums import BattleType
+    from engine.systems.battle.battle_simulator import create_monster
+    from engine.systems.battle.command_collection import CommandCollector
+
+    player, enemy = [create_monster(1, 30, 1), create_monster(2, 30, 5)], [create_monster(4, 30, 2)]
+    assert BattleState(player, enemy, seed=4).battle_ai.level == AILevel.SMART
+    assert BattleState(player, enemy, battle_type=BattleType.TRAINER, seed=4,
+                       ai_level=AILevel.EXPERT).battle_ai.level == AILevel.EXPERT
+
+    battle = BattleState(player, enemy, battle_type=BattleType.GYM, seed=4)
+    assert battle.battle_ai.level == AILevel.LOOKAHEAD
+    assert CommandCollector(battle).battle_ai is battle.battle_ai
+
+    # Die Szene bekommt Team-Slots als Ziele
+    action = battle.battle_ai.choose_action(enemy[0], enemy, player, battle)
+    assert action['type'] == 'attack'
+    assert action['move_id'] in [move.id for move in enemy[0].moves]
+    assert action['targets'][0] in ('player_0', 'player_1')
+    assert battle.battle_ai.last_search_depth >= 1
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests für die Battle-Micro-Benchmarks
+Baseline-Speicherung, Regressionsvergleich und Headless-Lauf einzelner Benchmarks
+"""
+
+from engine.devtools import battle_bench
+from engine.devtools.battle_bench import (
+    BENCHMARKS, BenchmarkResult, compare, load_baseline, run_benchmarks, save_baseline
+)
+
+
+def result(name, best_us):
+    return BenchmarkResult(name, best_us, best_us, 100)
+
+
+def test_compare_flags_only_regressions_beyond_threshold():
+    baseline = {'a': result('a', 10.0), 'b': result('b', 10.0), 'c': result('c', 10.0)}
+    current = {'a': result('a', 10.9), 'b': result('b', 13.0), 'c': result('c', 5.0),
+               'new': result('new', 99.0)}
+
+    regressions = compare(current, baseline, threshold=10.0)
+    assert [r.name for r in regressions] == ['b']
+    assert round(regressions[0].percent) == 30
+    assert compare(current, baseline, threshold=50.0) == []
+
+
+def test_failed_or_missing_baseline_benchmarks_regress(monkeypatch, tmp_path):
+    def broken(seed):
+        raise ImportError("missing")
+
+    monkeypatch.setitem(BENCHMARKS, 'broken', broken)
+    results = run_benchmarks(['broken'])
+    assert not results['broken'].ok
+    assert 'ImportError' in results['broken'].error
+
+    baseline = {'broken': result('broken', 1.0), 'gone': result('gone', 1.0)}
+    regressions = compare(results, baseline)
+    assert sorted(r.name for r in regressions) == ['broken', 'gone']
+    assert all(r.error for r in regressions)
+    assert compare(results, {}) == []
+
+    save_baseline({'broken': result('broken', 1.0)}, tmp_path / "baseline.json")
+    exit_code = battle_bench.main(['--only', 'broken', '--compare',
+                                   '--baseline', str(tmp_path / "baseline.json")])
+    assert exit_code == 1
+
+
+def test_baseline_roundtrip(tmp_path):
+    results = {'a': result('a', 1.5),
+               'skipped': BenchmarkResult('skipped', 0.0, 0.0, 0, error="boom")}
+    path = save_baseline(results, tmp_path / "baseline.json")
+    loaded = load_baseline(path)
+    assert list(loaded) == ['a']
+    assert loaded['a'] == results['a']
+
+
+def test_committed_baseline_covers_every_benchmark():
+    # --compare ohne --baseline nutzt die eingecheckte Baseline
+    assert battle_bench.BASELINE_PATH.exists()
+    baseline = load_baseline()
+    assert set(baseline) == set(BENCHMARKS)
+    assert all(entry.best_us > 0 for entry in baseline.values())
+
+
+def test_damage_benchmarks_run_headless(tmp_path):
+    results = run_benchmarks(['damage.calculate_compiled', 'dqm.calculate_damage'],
+                             repeats=2, min_time=0.001)
+    assert all(r.ok and r.best_us > 0 and r.median_us >= r.best_us for r in results.values())
+
+    save_baseline(results, tmp_path / "baseline.json")
+    exit_code = battle_bench.main(['--only', 'dqm.calculate_damage', '--compare',
+                                   '--threshold', '1000', '--repeats', '1', '--min-time', '0.001',
+                                   '--baseline', str(tmp_path / "baseline.json")])
+    assert exit_code == 0
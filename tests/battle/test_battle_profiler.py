@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests für den Battle-Profiler
+Histogramm-Perzentile, Stage-Timer der Pipelines, JSON-Export des Simulators und schlanker F8-Import
+"""
+
+import json
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+from engine.systems.battle.battle_profiler import BattleProfiler, TimingHistogram, profiler
+from engine.systems.battle.battle_simulator import run_simulation
+from engine.systems.battle.damage_calc import DamageCalculator
+
+ROOT = Path(__file__).parent.parent.parent
+
+
+def test_histogram_percentiles_within_bucket_error():
+    rng = random.Random(3)
+    samples = sorted(rng.expovariate(1 / 20e-6) for _ in range(5000))
+    histogram = TimingHistogram()
+    for sample in samples:
+        histogram.record(sample)
+
+    assert histogram.count == 5000
+    for percent in (50, 95, 99):
+        exact = samples[int(len(samples) * percent / 100) - 1]
+        assert abs(histogram.percentile(percent) - exact) / exact < 0.07
+    assert histogram.percentile(100) <= samples[-1] + 1e-9
+
+
+def test_histogram_memory_is_fixed_and_mergeable():
+    a, b = TimingHistogram(), TimingHistogram()
+    for _ in range(1000):
+        a.record(1e-6)
+    b.record(5e-3)
+    size = len(a.counts)
+
+    a.merge(b)
+    assert len(a.counts) == size
+    assert a.count == 1001
+    assert a.max_ns == 5_000_000
+    assert a.percentile(50) < 2e-6
+
+
+def test_disabled_profiler_records_nothing(make_monster, moves):
+    profiler.reset()
+    calculator = DamageCalculator(seed=1, compiled=True)
+    attacker, defender = make_monster("A", 20, ["Feuer"], moves), make_monster("D", 20, ["Pflanze"], moves)
+    calculator.calculate(attacker, defender, moves[0])
+    assert profiler.histograms == {}
+    assert 'timing' not in calculator.get_performance_stats()
+
+
+def test_pipelines_record_stage_timers(make_monster, moves):
+    attacker, defender = make_monster("A", 20, ["Feuer"], moves), make_monster("D", 20, ["Pflanze"], moves)
+    profiler.reset()
+    profiler.enable()
+    try:
+        for compiled in (False, True):
+            calculator = DamageCalculator(seed=1, compiled=compiled)
+            for _ in range(20):
+                calculator.calculate(attacker, defender, moves[1])
+    finally:
+        profiler.disable()
+
+    stages = {name.split('.', 2)[2] for name in profiler.histograms if name.startswith('damage.stage.')}
+    assert {'accuracy_check', 'base_damage', 'type_effectiveness', 'finalize'} <= stages
+    assert stages <= set(calculator.pipeline.compile().stage_names)
+    assert profiler.histogram('damage.calculate').count == 40
+    assert calculator.get_performance_stats()['timing']['count'] == 40
+    profiler.reset()
+
+
+def test_profile_generator_keeps_events():
+    local = BattleProfiler()
+    generator = (i for i in range(5))
+    assert local.profile_generator('events.test', generator) is generator
+
+    local.enable()
+    events = list(local.profile_generator('events.test', generator))
+    assert events == [0, 1, 2, 3, 4]
+    assert local.histogram('events.test').count == 1
+
+
+def test_simulation_exports_profile_json(tmp_path, monster_factory):
+    report = run_simulation([("A", 10)], [("B", 10)], range(5), processes=1,
+                            monster_factory=monster_factory, profile=True)
+    timers = report.to_dict()['profile']
+    assert timers['battle.turn']['count'] > 0
+    assert timers['ai.decide.smart']['count'] > 0
+    assert any(name.startswith('damage.stage.') for name in timers)
+    assert not profiler.enabled
+
+    path = report.profile.export(tmp_path / "profile.json")
+    exported = json.loads(path.read_text(encoding='utf-8'))['timers']
+    assert exported['battle.turn']['p99_us'] >= exported['battle.turn']['p50_us']
+    assert run_simulation([("A", 10)], [("B", 10)], range(2), processes=1,
+                          monster_factory=monster_factory).profile is None
+
+
+def test_f8_toggle_loads_only_the_profiler_modules():
+    script = ("import sys; from engine.core.event_processor import EventProcessor; "
+              "EventProcessor._toggle_battle_profiler(None); "
+              "from engine.systems.battle.stat_cache import EffectiveStatCache; "
+              "print(EffectiveStatCache.debug); "
+              "print(sorted(m for m in sys.modules if m.startswith('engine.systems.battle.')))")
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    lines = result.stdout.strip().splitlines()
+    # The stat cache counts hits only while the profiler runs
+    assert lines[-2] == "True"
+    assert lines[-1] == ("['engine.systems.battle.battle_profiler', "
+                         "'engine.systems.battle.stat_cache']")
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Tests für Battle-Replays
+Aufnahme, Binärformat und Vorspulen per Checkpoints
+"""
+
+import pytest
+
+from engine.systems.battle.battle_replay import (
+    BattleReplay, ReplayEngine, ReplayError, record_battle
+)
+from engine.systems.battle.battle_simulator import create_battle
+
+PLAYER = [("A", 12), ("C", 10), ("D", 11)]
+ENEMY = [("B", 12), ("E", 11), ("F", 10)]
+
+
+def hp_state(battle):
+    return [m.current_hp for m in battle.player_team + battle.enemy_team]
+
+
+def test_replay_reproduces_outcome(monster_factory):
+    for seed in range(10):
+        outcome, replay = record_battle(PLAYER, ENEMY, seed, active_size=3,
+                                        monster_factory=monster_factory)
+        assert replay.turn_count == outcome.turns
+
+        replayed = ReplayEngine(replay, monster_factory=monster_factory).run_to_end()
+        assert replayed == outcome
+
+
+def test_binary_roundtrip(tmp_path, monster_factory):
+    _, replay = record_battle(PLAYER, [(7, 12), ("E", 11)], 5, active_size=2,
+                              monster_factory=monster_factory)
+    data = replay.to_bytes()
+    assert BattleReplay.from_bytes(data) == replay
+
+    path = tmp_path / "battle.usrp"
+    replay.save(path)
+    assert BattleReplay.load(path) == replay
+
+    # Six bytes per queued action plus a small header
+    actions = sum(len(turn) for turn in replay.turns)
+    assert len(data) < 100 + 6 * actions
+
+    with pytest.raises(ReplayError):
+        BattleReplay.from_bytes(b"nope" + data[4:])
+    with pytest.raises(ReplayError):
+        BattleReplay.from_bytes(data[:len(data) // 2])
+
+
+def test_seek_matches_straight_playthrough(monster_factory):
+    outcome, replay = record_battle(PLAYER, ENEMY, 3, active_size=3, max_turns=40,
+                                    monster_factory=monster_factory)
+
+    # Reference states from an uninterrupted replay
+    reference = ReplayEngine(replay, monster_factory=monster_factory)
+    states = [hp_state(reference.battle)]
+    while reference.turn < replay.turn_count:
+        reference.step()
+        states.append(hp_state(reference.battle))
+
+    engine = ReplayEngine(replay, monster_factory=monster_factory, snapshot_interval=2)
+    for turn in [replay.turn_count, 1, replay.turn_count // 2, 0, replay.turn_count - 1]:
+        battle = engine.seek(turn)
+        assert battle.turn_count == turn
+        assert hp_state(battle) == states[turn]
+
+    assert engine.run_to_end() == outcome
+
+
+def test_replay_needs_no_ai(monster_factory):
+    outcome, replay = record_battle(PLAYER, ENEMY, 11, active_size=3,
+                                    monster_factory=monster_factory)
+    engine = ReplayEngine(replay, monster_factory=monster_factory)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("AI must not be consulted during replay")
+
+    engine.battle.player_ai.decide_team_actions = fail
+    engine.battle.enemy_ai.decide_team_actions = fail
+    assert engine.run_to_end() == outcome
+
+    # A fresh live battle with the same seed agrees as well
+    live = create_battle(PLAYER, ENEMY, 11, active_size=3, monster_factory=monster_factory)
+    assert live.run() == outcome
+
+
+def test_replay_owns_its_rng():
+    import random
+
+    state = random.getstate()
+    outcome, replay = record_battle([(1, 20), (2, 20)], [(4, 20), (5, 20)], 8, active_size=2)
+    engine = ReplayEngine(replay)
+    engine.seek(replay.turn_count // 2)
+    engine.seek(1)
+    assert random.getstate() == state  # weder Aufnahme noch Rücksprung setzen den Modul-RNG
+
+    random.seed(12345)
+    assert engine.run_to_end() == outcome
+
+
+def test_live_battle_state_recording(caplog):
+    import copy
+    import random
+
+    from engine.systems.battle.battle_controller import BattleState
+    from engine.systems.battle.battle_replay import BattleRecorder
+    from engine.systems.battle.battle_simulator import create_monster
+    from engine.systems.battle.turn_logic import ActionType, BattleAction
+    from engine.systems.monster_instance import StatusCondition
+
+    player, enemy = [create_monster(1, 30, 1), create_monster(2, 30, 5)], [create_monster(4, 30, 2)]
+    for monster in player + enemy:
+        monster.max_hp = monster.current_hp = 300
+    player[0].status = enemy[0].status = StatusCondition.SLEEP
+
+    battle = BattleState(player, enemy, seed=4)
+    recorder = BattleRecorder(battle)
+    battle.start_battle()
+    for _ in range(6):
+        battle.action_queue = [
+            BattleAction(actor=player[0], action_type=ActionType.ATTACK, move=player[0].moves[0], target=enemy[0]),
+            BattleAction(actor=enemy[0], action_type=ActionType.ATTACK, move=enemy[0].moves[0], target=player[0])
+        ]
+        random.random()
+        battle.resolve_turn()
+    final = [(m.current_hp, m.status) for m in player + enemy]
+    live = copy.deepcopy(player + enemy)
+
+    # Schaden kommt aus der echten Pipeline, nicht aus dem Fallback
+    assert "using fallback" not in caplog.text
+    assert player[0].current_hp < 300 and enemy[0].current_hp < 300
+
+    assert len(recorder.turns) == 6
+    random.seed(999)
+    replayed = recorder.replay()
+    assert replayed.battle_log == battle.battle_log  # gleiche Zugreihenfolge und Aufwach-Würfe
+    assert [(m.current_hp, m.status) for m in replayed.player_team + replayed.enemy_team] == final
+
+    # Die Wiederholung läuft auf Kopien, die Live-Teams bleiben unverändert
+    assert replayed.player_team[0] is not player[0]
+    assert [(m.current_hp, m.status) for m in player + enemy] == final
+    assert [m.rng.getstate() for m in player + enemy] == [m.rng.getstate() for m in live]
+
+
+def test_live_recording_roundtrips_through_replay_engine(tmp_path):
+    from engine.systems.battle.battle_controller import BattleState
+    from engine.systems.battle.battle_replay import BattleRecorder
+    from engine.systems.battle.battle_simulator import create_monster
+    from engine.systems.battle.turn_logic import ActionType, BattleAction
+    from engine.systems.monster_instance import StatusCondition
+
+    player, enemy = [create_monster(1, 30, 1), create_monster(2, 30, 5)], [create_monster(4, 30, 2)]
+    for monster in player + enemy:
+        monster.max_hp = monster.current_hp = 300
+    player[0].status = StatusCondition.PARALYSIS
+    player[0].nickname = "Blitz"
+
+    # Wie die BattleScene: kein start_battle(), can_act würfelt zwischen den Zügen
+    battle = BattleState(player, enemy, seed=4)
+    recorder = BattleRecorder(battle)
+    for _ in range(8):
+        player[0].can_act(battle.rng)
+        battle.action_queue = [
+            BattleAction(actor=player[0], action_type=ActionType.ATTACK, move=player[0].moves[0], target=enemy[0]),
+            BattleAction(actor=enemy[0], action_type=ActionType.ATTACK, move=enemy[0].moves[-1], target=player[0])
+        ]
+        battle.resolve_turn()
+    final = [(m.current_hp, m.status) for m in player + enemy]
+
+    path = tmp_path / "live.usrp"
+    recorder.save(path)
+    replay = BattleReplay.load(path)
+    assert replay == recorder.to_replay()
+    assert replay.player_spec == [(1, 30), (2, 30)] and replay.turn_count == 8
+    assert not replay.live.started and replay.live.names[0] == "Blitz"
+
+    engine = ReplayEngine(replay, snapshot_interval=3)
+    outcome = engine.run_to_end()
+    assert outcome.turns == 8
+    assert [(m.current_hp, m.status) for m in engine.battle.player_team + engine.battle.enemy_team] == final
+    assert engine.battle.state.battle_log == battle.battle_log
+
+    # Zurückspulen über Checkpoints landet wieder im selben Endzustand
+    middle = hp_state(engine.seek(4))
+    assert middle != hp_state(engine.seek(8))
+    assert [(m.current_hp, m.status) for m in engine.battle.player_team + engine.battle.enemy_team] == final
+    assert hp_state(engine.seek(4)) == middle
+
+
+def test_event_rolls_draw_from_battle_rng():
+    import random
+
+    from engine.systems.battle.battle_controller import BattleState
+    from engine.systems.battle.battle_simulator import create_monster
+    from engine.systems.battle.turn_logic import ActionType, BattleAction
+
+    player, enemy = [create_monster(1, 30, 1)], [create_monster(4, 30, 2)]
+    enemy[0].current_hp = 1
+    battle = BattleState(player, enemy, seed=4)
+    events = battle.event_generator
+    attack = BattleAction(actor=player[0], action_type=ActionType.ATTACK,
+                          move=player[0].moves[0], target=enemy[0])
+    other = BattleAction(actor=player[0], action_type=ActionType.FLEE, target=enemy[0])
+
+    def rolls(module_seed):
+        random.seed(module_seed)
+        battle.rng.seed(7)
+        enemy[0].current_hp = 1
+        messages = []
+        for _ in range(10):
+            for generator in (events._flee_event_generator(other), events._tame_event_generator(other)):
+                messages.extend(event.data.get('message') for event in generator)
+            enemy[0].current_hp = enemy[0].max_hp
+            messages.extend(event.data.get('damage') for event in events._attack_event_generator(attack))
+        return messages
+
+    assert rolls(1) == rolls(2)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests für den Headless-Battle-Simulator
+Nutzt überwiegend Dummy-Monster; ein Test läuft mit echten Spezies aus data/monsters.json
+"""
+
+import subprocess
+import sys
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from engine.systems.battle.battle_simulator import (
+    create_monster, run_simulation, simulate_battle, summarize_distribution, SimulationReport,
+    HeadlessBattle
+)
+from engine.systems.monster_instance import StatusCondition
+from engine.systems.moves import EffectKind, MoveEffect
+
+
+def broken_factory(species, level, seed):
+    """Picklable factory that always fails"""
+    raise KeyError(species)
+
+
+def test_single_battle_finishes(monster_factory):
+    outcome = simulate_battle([("A", 10)], [("B", 5)], seed=1, monster_factory=monster_factory)
+    assert outcome.winner in ('player', 'enemy', 'draw')
+    assert outcome.turns >= 1
+    assert all(d > 0 for d in outcome.player_damage)
+
+
+def test_battle_is_deterministic_per_seed(monster_factory):
+    a = simulate_battle([("A", 10)], [("B", 10)], seed=42, monster_factory=monster_factory)
+    b = simulate_battle([("A", 10)], [("B", 10)], seed=42, monster_factory=monster_factory)
+    assert a == b
+
+
+def test_stronger_team_wins_more_often(monster_factory):
+    report = run_simulation([("A", 30)], [("B", 3)], range(50),
+                            processes=1, monster_factory=monster_factory)
+    assert report.battles == 50
+    assert report.player_win_rate > 0.9
+
+
+def test_pool_matches_in_process_run(monster_factory):
+    seeds = range(40)
+    serial = run_simulation([("A", 10), ("C", 8), ("D", 9)], [("B", 10), ("E", 9), ("F", 8)],
+                            seeds, processes=1, active_size=3, monster_factory=monster_factory)
+    pooled = run_simulation([("A", 10), ("C", 8), ("D", 9)], [("B", 10), ("E", 9), ("F", 8)],
+                            seeds, processes=2, chunk_size=10, active_size=3,
+                            monster_factory=monster_factory)
+    assert serial.battles == 40
+    assert serial.failures == 0
+    assert serial.to_dict() == pooled.to_dict()
+
+
+def test_real_species_battles():
+    a = simulate_battle([("Glutstummel", 12)], [(2, 12)], seed=3)
+    b = simulate_battle([("Glutstummel", 12)], [(2, 12)], seed=3)
+    assert a == b
+    assert a.player_damage and a.enemy_damage
+    # Die Verteidigung kommt aus BaseStats.def_, nicht aus einem fehlenden 'def'-Attribut
+    monster = create_monster("Glutstummel", 12, seed=3)
+    assert monster.stats['def'] >= int(2 * monster.species.base_stats.def_ * 12 / 100 + 5)
+
+    report = run_simulation([("Glutstummel", 12), (3, 11)], [(2, 12), (4, 10)], range(20),
+                            processes=1, active_size=2)
+    assert report.battles == 20
+    assert report.failures == 0
+    assert report.draws < report.battles
+
+
+def test_move_effects_and_status_follow_the_executor(make_monster, make_move):
+    growl = make_move("Heulen", power=0, category="support",
+                      effects=[MoveEffect(kind=EffectKind.DEBUFF, stat='atk', stages=-1)])
+    player = make_monster("A", moves=[growl], stat_stages={'atk': 0})
+    enemy = make_monster("B", moves=[make_move("Tackle", power=0, category="support")],
+                         status=StatusCondition.POISON, stat_stages={'atk': 0})
+    for monster in (player, enemy):
+        monster.nickname = None
+
+    battle = HeadlessBattle([player], [enemy], seed=5)
+    battle.step()
+    # Heulen senkt den Angriff, Gift zieht am Rundenende 1/16 der KP ab
+    assert enemy.stat_stages['atk'] == -1
+    assert enemy.current_hp == enemy.max_hp - enemy.max_hp // 16
+    assert battle.player_damage == []
+
+
+def test_failing_chunk_raises():
+    with pytest.raises(RuntimeError):
+        run_simulation([("A", 5)], [("B", 5)], range(5), processes=1,
+                       monster_factory=broken_factory)
+
+
+def test_simulator_import_stays_headless():
+    code = ("import sys, engine.systems.battle.battle_simulator as sim; "
+            "sim.simulate_battle([('Glutstummel', 5)], [(2, 5)], seed=0); "
+            "assert 'pygame' not in sys.modules")
+    subprocess.run([sys.executable, "-c", code], check=True,
+                   cwd=Path(__file__).parent.parent.parent)
+
+
+def test_summarize_distribution():
+    summary = summarize_distribution(Counter({1: 50, 2: 40, 10: 10}))
+    assert summary['count'] == 100
+    assert summary['p50'] == 1
+    assert summary['p90'] == 2
+    assert summary['p99'] == 10
+    assert summary['max'] == 10
+    assert summarize_distribution(Counter())['count'] == 0
+    assert SimulationReport().player_win_rate == 0.0
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests für BattleSnapshot
+Rundreise Kampf -> Snapshot -> Kampf, Klonen und Diffs
+"""
+
+import time
+
+import pytest
+
+from engine.systems.battle.battle_snapshot import BattleSnapshot, decode_status, encode_status
+from engine.systems.battle.battle_simulator import create_battle
+from engine.systems.monster_instance import StatusCondition
+
+PLAYER = [("A", 12), ("C", 10), ("D", 11)]
+ENEMY = [("B", 12), ("E", 11), ("F", 10)]
+
+
+def full_state(battle):
+    return [(m.current_hp, m.status, dict(m.stat_stages), [move.pp for move in m.moves])
+            for m in battle.player_team + battle.enemy_team]
+
+
+def test_roundtrip_restores_battle(monster_factory):
+    battle = create_battle(PLAYER, ENEMY, 4, active_size=3, monster_factory=monster_factory)
+    for _ in range(3):
+        battle.step()
+    snapshot = BattleSnapshot.from_battle_state(battle)
+    expected = full_state(battle)
+
+    while battle.step() is None:
+        pass
+    assert full_state(battle) != expected
+
+    snapshot.apply_to(battle)
+    assert full_state(battle) == expected
+    assert battle.turn_count == snapshot.turn == 3
+    assert BattleSnapshot.from_battle_state(battle) == snapshot
+
+
+def test_apply_to_other_battle_with_same_layout(monster_factory):
+    source = create_battle(PLAYER, ENEMY, 1, active_size=3, monster_factory=monster_factory)
+    source.step()
+    target = create_battle(PLAYER, ENEMY, 2, active_size=3, monster_factory=monster_factory)
+
+    BattleSnapshot.from_battle_state(source).apply_to(target)
+    assert full_state(target) == full_state(source)
+
+    smaller = create_battle(PLAYER[:2], ENEMY, 2, active_size=2, monster_factory=monster_factory)
+    with pytest.raises(ValueError):
+        BattleSnapshot.from_battle_state(source).apply_to(smaller)
+
+
+def test_copy_is_independent_and_cheap(monster_factory):
+    battle = create_battle(PLAYER, ENEMY, 4, active_size=3, monster_factory=monster_factory)
+    snapshot = BattleSnapshot.from_battle_state(battle)
+    clone = snapshot.copy()
+    clone.enemy[0, 0] = 1
+    assert snapshot.enemy[0, 0] != 1
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        snapshot.copy()
+    assert (time.perf_counter() - start) / 1000 < 1e-4
+
+
+def test_diff_lists_changed_fields(monster_factory):
+    battle = create_battle(PLAYER, ENEMY, 4, active_size=3, monster_factory=monster_factory)
+    before = BattleSnapshot.from_battle_state(battle)
+    battle.enemy_team[1].current_hp -= 5
+    battle.player_team[0].stat_stages['atk'] = 2
+    after = BattleSnapshot.from_battle_state(battle)
+
+    changes = before.diff(after)
+    assert sorted((side, index, field) for side, index, field, _, _ in changes) == [
+        ('enemy', 1, 'hp'), ('player', 0, 'stage.atk')]
+    assert after.diff(after.copy()) == []
+
+
+def test_status_codes_roundtrip():
+    assert encode_status(None) == 0
+    assert decode_status(encode_status('burn')) == 'burn'
+    assert encode_status('burn') == encode_status('burn')
+    assert encode_status('poison') != encode_status('burn')
+    assert decode_status(encode_status(StatusCondition.SLEEP)) is StatusCondition.SLEEP
+    assert encode_status(StatusCondition.NORMAL) == encode_status(StatusCondition.NONE)
+    # Die Tabelle ist konstant, unbekannte Werte werden nicht nachgetragen
+    with pytest.raises(ValueError):
+        encode_status('petrified')
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Differential tests for the compiled damage pipeline
+Compiled and dict-based pipelines must produce identical results per seed
+"""
+
+import pytest
+
+from engine.systems.battle.damage_calc import (
+    DamageCalculator, DamageCalculationPipeline, DamageContext, has_active_traits
+)
+from engine.systems.battle.monster_traits import TraitManager
+
+
+@pytest.fixture
+def moves(make_move):
+    """Moveset with a high-crit and a never-miss move on top of the usual cases"""
+    return [
+        make_move("Tackle", accuracy=95, crit_ratio=1 / 32),
+        make_move("Glut", power=60, accuracy=95, type="Feuer", category="mag", crit_ratio=1 / 32),
+        make_move("Aquastrahl", power=55, type="Wasser", category="mag", accuracy=80, crit_ratio=1 / 32),
+        make_move("Klinge", power=70, accuracy=95, type="Chaos", crit_ratio=0.3),
+        make_move("Sicher", power=30, accuracy=-1, crit_ratio=1 / 32),
+        make_move("Heulen", power=0, accuracy=95, category="support", crit_ratio=1 / 32),
+    ]
+
+
+@pytest.fixture
+def make_pair(make_monster):
+    """Build a fresh attacker/defender pair for a scenario index"""
+    def build(case: int):
+        if case % 3 == 0:
+            attacker = make_monster("A", 20, ["Bestie"], stat_stages={'atk': -1, 'acc': 1})
+            defender = make_monster("B", 18, ["Pflanze"], stat_stages={'def': 2, 'eva': 1})
+        elif case % 3 == 1:
+            attacker = make_monster("A", 35, ["Feuer"], status='burn')
+            defender = make_monster("B", 30, ["Wasser", "Erde"])
+        else:
+            attacker = make_monster("A", 25, ["Chaos"], traits=["Attack Boost", "Critical Master"])
+            defender = make_monster("B", 25, ["Bestie"], traits=["Defense Boost", "Counter"])
+        return attacker, defender
+    return build
+
+
+def run_calculator(make_pair, moves, compiled: bool, seed: int, weather=None, terrain=None):
+    """Run all scenarios through one calculator and collect comparable results"""
+    calculator = DamageCalculator(seed=seed, compiled=compiled)
+    results = []
+    for case in range(9):
+        for move in moves:
+            attacker, defender = make_pair(case)
+            result = calculator.calculate(attacker, defender, move,
+                                          weather=weather, terrain=terrain)
+            results.append((result.damage, result.is_critical, result.critical_tier,
+                            result.effectiveness, result.missed, result.has_stab,
+                            result.type_text, tuple(result.modifiers_applied)))
+    return results
+
+
+def test_compiled_matches_pipeline(make_pair, moves):
+    for seed in range(25):
+        for weather, terrain in [(None, None), ('sunny', None), (None, 'volcanic'), ('fog', 'misty')]:
+            assert (run_calculator(make_pair, moves, True, seed, weather, terrain) ==
+                    run_calculator(make_pair, moves, False, seed, weather, terrain))
+
+
+def test_plans_skip_inactive_stages():
+    pipeline = DamageCalculationPipeline()
+    compiled = pipeline.compile()
+    full = compiled.plan(True, True, True)
+    bare = compiled.plan(False, False, False)
+    assert len(full) == len(pipeline.stages)
+    assert len(bare) == len(pipeline.stages) - 7
+    assert compiled.plan(False, False, False) is bare
+
+
+def test_empty_trait_lists_and_idle_managers_skip_trait_stages(make_pair, make_monster):
+    attacker, defender = make_pair(0)
+    assert not has_active_traits(attacker, defender)
+
+    attacker = make_monster("A", 20, ["Bestie"])
+    defender = make_monster("B", 20, ["Bestie"])
+    attacker.trait_manager = TraitManager(attacker)
+    defender.trait_manager = TraitManager(defender)
+    assert not has_active_traits(attacker, defender)
+
+    defender.traits = ["Defense Boost"]
+    assert has_active_traits(attacker, defender)
+
+
+def test_traits_without_a_damage_stage_skip_trait_stages(make_monster):
+    attacker = make_monster("A", 20, ["Bestie"], traits=["Entflammbar"])
+    defender = make_monster("B", 20, ["Bestie"], traits=["Stur", "Defense Boost"])
+    assert has_active_traits(attacker, defender)
+
+    # Known traits only count on the side whose stages handle them
+    attacker.traits, defender.traits = ["Defense Boost"], ["Attack Boost"]
+    assert not has_active_traits(attacker, defender)
+
+    defender.traits = ["Fire Breath Guard"]
+    assert has_active_traits(attacker, defender)
+
+
+def test_real_species_traits_keep_trait_stages_off():
+    from engine.systems.battle.battle_simulator import create_monster
+
+    attacker = create_monster("Glutstummel", 20, seed=1)
+    defender = create_monster("Urmolch", 20, seed=2)
+    assert attacker.traits
+    assert not has_active_traits(attacker, defender)
+
+
+def test_custom_stage_runs_and_invalidates_cache(make_pair, moves):
+    pipeline = DamageCalculationPipeline()
+    first = pipeline.compile()
+    assert pipeline.compile() is first
+
+    seen = []
+
+    def double(context):
+        context['result'].damage *= 2
+        context['custom_seen'] = True
+        seen.append(context)
+
+    pipeline.add_stage("double", double, 14)
+    compiled = pipeline.compile()
+    assert compiled is not first
+    assert "double" in compiled.stage_names
+
+    attacker, defender = make_pair(1)
+    calculator = DamageCalculator(seed=3, compiled=True)
+    calculator.pipeline = pipeline
+    calculator.calculate(attacker, defender, moves[0])
+    assert seen[0]['custom_seen'] is True
+
+
+def test_nested_calculation_keeps_outer_context(make_pair, moves):
+    def run(nested: bool):
+        pipeline = DamageCalculationPipeline()
+        inner = DamageCalculator(seed=9, compiled=True)
+        inner.pipeline = pipeline
+
+        def counter(context):
+            # Ein Stage, der selbst Schaden berechnet, z.B. für Konter
+            if nested and context['attacker'].name == "A":
+                inner.calculate(*make_pair(1), moves[1])
+
+        pipeline.add_stage("counter", counter, 8)
+        calculator = DamageCalculator(seed=3, compiled=True)
+        calculator.pipeline = pipeline
+        results = []
+        for case in range(3):
+            for move in moves:
+                result = calculator.calculate(*make_pair(case), move)
+                results.append((result.damage, result.is_critical, result.effectiveness,
+                                result.missed, tuple(result.modifiers_applied)))
+        return results
+
+    assert run(nested=True) == run(nested=False)
+
+
+def test_context_mapping_protocol():
+    context = DamageContext()
+    assert 'attacker_stats_modified' not in context
+    assert context.get('weather') is None
+    context['attacker_stats_modified'] = {'atk': 10}
+    context['tension'] = 2
+    assert context['attacker_stats_modified']['atk'] == 10
+    assert 'tension' in context
+    context.reset(None, None, None)
+    assert 'attacker_stats_modified' not in context
+    assert 'tension' not in context
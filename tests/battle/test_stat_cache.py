@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests für den Effektivwert-Cache der Monster-Stats
+Invalidierung über versionierte Stat-Stufen, Manager-Versionen und Debug-Zähler
+"""
+
+import pickle
+
+from engine.systems.battle.monster_traits import TraitManager
+from engine.systems.battle.stat_cache import EffectiveStatCache, effective_stats, invalidate_stats
+from engine.systems.battle.status_effects_dqm import DQMStatus, DQMStatusManager
+from engine.systems.battle.turn_logic import ActionType, BattleAction
+from engine.systems.stats import Stat, StatStages
+
+
+def reference_stat(monster, stat):
+    """Formel aus DamageCalculationPipeline vor dem Cache"""
+    stage = monster.stat_stages.get(stat, 0)
+    multiplier = (2 + stage) / 2 if stage >= 0 else 2 / (2 - stage)
+    return int(monster.stats.get(stat, 100) * multiplier)
+
+
+def test_stat_stages_bump_version_on_every_write():
+    stages = StatStages()
+    assert stages == {'atk': 0, 'def': 0, 'mag': 0, 'res': 0, 'spd': 0}
+
+    stages['atk'] = 2
+    assert stages.version == 1 and stages.get_stage(Stat.ATK) == 2
+    assert stages.modify_stage(Stat.ATK, 6) == 4
+    assert stages.version == 2
+    # Changes at the bound do not bump the version
+    assert stages.modify_stage('atk', 1) == 0
+    assert stages.version == 2
+
+    stages.reset()
+    assert stages.version == 3 and stages['atk'] == 0
+    assert stages.get_multiplier(Stat.EVA) == 1.0
+
+    # Pickled and copied stages stay versioned
+    restored = pickle.loads(pickle.dumps(stages))
+    assert type(restored) is StatStages and restored == stages
+    assert type(stages.copy()) is StatStages
+
+
+def test_staged_values_follow_versioned_stages(make_monster):
+    monster = make_monster(stat_stages=StatStages())
+    cache = effective_stats(monster)
+    for stage in range(-6, 7):
+        monster.stat_stages['atk'] = stage
+        assert cache.staged('atk') == reference_stat(monster, 'atk')
+    assert effective_stats(monster) is cache
+
+    # Plain dict stages carry no version and are computed directly
+    monster.stat_stages = {'atk': 2}
+    assert cache.staged('atk') == 120
+
+
+def test_speed_tracks_status_and_stages(make_monster):
+    monster = make_monster(stat_stages=StatStages())
+    action = BattleAction(actor=monster, action_type=ActionType.ATTACK)
+    assert action.get_speed() == 50
+
+    monster.status = 'paralysis'
+    assert action.get_speed() == 25
+
+    monster.stat_stages.modify_stage(Stat.SPD, 2)
+    assert action.get_speed() == 50
+
+    monster.status = None
+    monster.stat_stages['spd'] = -6
+    assert action.get_speed() == 12
+
+
+def test_manager_versions_invalidate_modified_stats(make_monster):
+    monster = make_monster(stat_stages=StatStages())
+    monster.status_manager = DQMStatusManager(monster)
+    monster.trait_manager = TraitManager(monster)
+    cache = effective_stats(monster)
+    assert cache.modified('atk') == 60 and cache.speed() == 50
+
+    assert monster.status_manager.apply_status(DQMStatus.CURSE)
+    assert cache.modified('atk') == 45
+    assert cache.speed() == 37
+
+    monster.status_manager.remove_status(DQMStatus.CURSE)
+    assert cache.modified('atk') == 60
+
+    monster.trait_manager.add_trait("Agility Boost")
+    assert cache.speed() == 60
+
+
+def test_in_place_stat_writes_need_invalidate(make_monster):
+    monster = make_monster(stat_stages=StatStages())
+    cache = effective_stats(monster)
+    assert cache.staged('def') == 45
+
+    monster.stats['def'] = 90
+    invalidate_stats(monster)
+    assert cache.staged('def') == 90
+
+    # Replacing the dict is detected without a hook
+    monster.stats = dict(monster.stats, res=80)
+    assert cache.staged('res') == 80
+
+
+def test_debug_counters_report_hit_rate(make_monster):
+    monster = make_monster(stat_stages=StatStages())
+    EffectiveStatCache.debug = True
+    EffectiveStatCache.reset_counters()
+    try:
+        for _ in range(9):
+            effective_stats(monster).staged('mag')
+        monster.stat_stages.modify_stage(Stat.MAG, 1)
+        effective_stats(monster).staged('mag')
+    finally:
+        EffectiveStatCache.debug = False
+
+    assert EffectiveStatCache.misses == 2
+    assert EffectiveStatCache.hits == 8
+    assert EffectiveStatCache.hit_rate() == 0.8
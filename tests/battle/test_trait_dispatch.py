@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests für die vorberechneten Trait-Dispatch-Tabellen
+Vergleicht TraitManager.process_traits mit der Prüfung über can_activate
+"""
+
+import random
+
+import pytest
+
+from engine.systems.battle.monster_traits import TraitManager, TraitTrigger
+from engine.systems.battle.damage_calc import direct_trait_plan
+
+TRAITS = ["Last Stand", "Attack Boost", "Critical Master", "Counter", "Psycho",
+          "HP Regeneration", "Fire Breath Guard", "Intimidating", "Lucky Devil"]
+
+
+def reference_process(manager, trigger, context):
+    """Ursprünglicher Ablauf: alle Traits scannen und can_activate prüfen"""
+    context['monster'] = manager.monster
+    context['hp_percent'] = manager.monster.current_hp / max(1, manager.monster.max_hp)
+    relevant = manager.get_traits_by_trigger(trigger)
+    if trigger != TraitTrigger.ALWAYS:
+        relevant.extend(manager.get_traits_by_trigger(TraitTrigger.ALWAYS))
+    applied = []
+    for trait in relevant:
+        if trait.can_activate(context):
+            applied.extend(trait.apply_effects(context))
+    return applied
+
+
+@pytest.fixture
+def make_manager(make_monster):
+    def build(hp=100):
+        manager = TraitManager(make_monster(current_hp=hp, max_hp=100))
+        for name in TRAITS:
+            assert manager.add_trait(name)
+        return manager
+    return build
+
+
+def test_dispatch_matches_can_activate(make_manager):
+    for hp in (100, 20, 5):
+        manager = make_manager(hp)
+        for trigger in TraitTrigger:
+            for phase in ('', 'on_attack', 'on_defend', 'turn_end', 'turn_start'):
+                random.seed(hp)
+                fast = manager.process_traits(trigger, {'phase': phase, 'stats': {'atk': 50}})
+                random.seed(hp)
+                slow = reference_process(manager, trigger, {'phase': phase, 'stats': {'atk': 50}})
+                assert fast == slow
+
+
+def test_triggers_without_traits_are_skipped(make_monster):
+    manager = TraitManager(make_monster())
+    assert not manager.has_trigger(TraitTrigger.ON_ATTACK)
+    assert manager.process_traits(TraitTrigger.ON_ATTACK, {'phase': 'on_attack'}) == []
+
+    manager.add_trait("Counter")
+    assert manager.has_trigger(TraitTrigger.ON_DEFEND)
+    assert not manager.has_trigger(TraitTrigger.ON_ATTACK)
+
+    manager.remove_trait("Counter")
+    assert not manager.has_trigger(TraitTrigger.ON_DEFEND)
+
+
+def test_cached_modifiers_follow_trait_changes(make_monster):
+    manager = TraitManager(make_monster())
+    assert manager.get_stat_modifiers()['atk'] == 1.0
+
+    manager.add_trait("Attack Boost")
+    boosted = manager.get_stat_modifiers()
+    assert boosted['atk'] > 1.0
+
+    # Callers get copies, the cache stays intact
+    boosted['atk'] = 99
+    assert manager.get_stat_modifiers()['atk'] < 2
+
+    manager.add_trait("Fire Breath Guard")
+    assert manager.get_element_resistances()
+    manager.remove_trait("Fire Breath Guard")
+    assert manager.get_element_resistances() == {}
+
+
+def test_direct_trait_plan_keeps_order_and_drops_unknown():
+    plan = direct_trait_plan(("Counter", "Unbekannt", "Attack Boost", "Critical Master"))
+    assert plan['pre_damage'] == ("Attack Boost",)
+    assert plan['on_attack'] == ("Attack Boost", "Critical Master")
+    assert plan['on_defend'] == ("Counter",)
+    assert direct_trait_plan(()) == {'pre_damage': (), 'on_attack': (), 'on_defend': ()}
+
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests für das Asset-Pack
+Rohpixel-Pack pixelgleich zu den PNGs, Deduplizierung per Inhalts-Hash, Fallback auf lose Dateien
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pygame
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from engine.graphics.asset_pack import AssetPack, default_pack_path, sprite_files, write_pack
+from engine.graphics.sprite_manager import SpriteManager
+
+
+def make_project(root):
+    tiles, monsters = root / "data" / "maps" / "tiles", root / "assets" / "gfx" / "monster"
+    tiles.mkdir(parents=True)
+    monsters.mkdir(parents=True)
+    for name, color in (("grass", (10, 200, 10, 255)), ("grass_copy", (10, 200, 10, 255)),
+                        ("water", (0, 100, 255, 90))):
+        sprite = pygame.Surface((16, 16), pygame.SRCALPHA)
+        sprite.fill(color)
+        pygame.draw.line(sprite, (0, 0, 0, 128), (0, 0), (15, 15))
+        pygame.image.save(sprite, str(tiles / f"{name}.png"))
+    monster = pygame.Surface((56, 40), pygame.SRCALPHA)
+    monster.fill((200, 50, 50, 255))
+    pygame.image.save(monster, str(monsters / "25.png"))
+    return tiles, monsters
+
+
+def pixels(surface):
+    return [surface.get_at((x, y)) for y in range(surface.get_height()) for x in range(surface.get_width())]
+
+
+def test_pack_matches_png_files(tmp_path):
+    tiles, monsters = make_project(tmp_path)
+    pack_path = default_pack_path(tmp_path)
+    stats = write_pack(pack_path, tmp_path, sprite_files(tmp_path))
+    assert stats["files"] == 4 and stats["blobs"] == 3  # grass_copy teilt sich den Blob
+
+    pack = AssetPack.open(pack_path, tmp_path)
+    assert len(pack) == 4 and tiles / "water.png" in pack
+    for png in sprite_files(tmp_path):
+        assert pixels(pack.load(png)) == pixels(pygame.image.load(str(png)))
+    assert pack.load(monsters / "26.png") is None
+    assert pack.load(Path("/elsewhere/grass.png")) is None
+
+
+def test_stale_or_broken_pack_falls_back(tmp_path):
+    tiles, _ = make_project(tmp_path)
+    pack_path = default_pack_path(tmp_path)
+    write_pack(pack_path, tmp_path, sprite_files(tmp_path))
+
+    grass = tiles / "grass.png"
+    stat = grass.stat()
+    os.utime(grass, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert AssetPack.open(pack_path, tmp_path) is None
+
+    write_pack(pack_path, tmp_path, sprite_files(tmp_path))
+    assert AssetPack.open(pack_path, tmp_path) is not None
+    pack_path.write_bytes(b"garbage")
+    assert AssetPack.open(pack_path, tmp_path) is None
+    assert AssetPack.open(tmp_path / "missing.uspk", tmp_path) is None
+
+
+def test_sprite_manager_loads_from_pack(tmp_path, monkeypatch):
+    make_project(tmp_path)
+    write_pack(default_pack_path(tmp_path), tmp_path, sprite_files(tmp_path))
+
+    manager = SpriteManager()
+    try:
+        manager.__init__(tmp_path)
+        manager.use_asset_pack = False
+        manager._ensure_loaded()
+        expected = pixels(manager.get_tile("water")), pixels(manager.get_monster_sprite("25"))
+
+        # Mit Pack wird keine einzige PNG-Datei dekodiert
+        def no_decode(*args):
+            raise AssertionError("PNG dekodiert")
+        monkeypatch.setattr(pygame.image, "load", no_decode)
+        manager.__init__(tmp_path)
+        manager._ensure_loaded()
+        assert (pixels(manager.get_tile("water")), pixels(manager.get_monster_sprite("25"))) == expected
+    finally:
+        SpriteManager._instance = None
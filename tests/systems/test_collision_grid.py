@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests für das gemeinsame Collision-Grid
+Statische Flags aus MapData, Belegungs-Layer für Entities, Kanten/Gras-Abfragen und TileManager-Kompatibilität
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from types import SimpleNamespace
+
+from engine.scenes.field.encounters import FieldEncounterSystem
+from engine.world.collision_grid import CollisionGrid, LEDGE, SOLID, TALL_GRASS, WATER
+from engine.world.entity import Direction, Entity
+from engine.world.ledge_handler import LedgeHandler
+from engine.world.map_loader import MapData
+from engine.world.tile_manager import TileManager
+
+
+def make_map_data():
+    collision = [[0, 0, 0, 0],
+                 [0, 1, 1, 0],
+                 [0, 0, 0]]  # kurze Zeile wird aufgefüllt
+    ground = [[14, 14, 18, 14],
+              [14, 43, 43, 45],
+              [39, 14, 14, 52]]
+    return MapData(id="test", name="Test", width=4, height=3, tile_size=16,
+                   layers={"Tile Layer 1": ground, "collision": collision},
+                   warps=[], triggers=[], properties={}, tilesets=[])
+
+
+def test_static_flags_from_map_data():
+    names = {14: "grass", 18: "ledge", 39: "tall_grass", 43: "wall", 45: "water_1", 52: "water_edge_n"}
+    grid = CollisionGrid.from_map_data(make_map_data(), names)
+
+    assert grid.tiles.shape == (3, 4)
+    assert grid.is_solid(1, 1) and grid.is_solid(2, 1)
+    assert not grid.is_solid(3, 2)
+    assert grid.is_solid(-1, 0) and grid.is_solid(4, 0)
+    assert grid.has_flag(2, 0, LEDGE)
+    assert grid.has_flag(3, 1, WATER) and grid.has_flag(3, 2, WATER)
+    assert grid.has_flag(0, 2, TALL_GRASS) and not grid.has_flag(1, 2, TALL_GRASS)
+    assert grid.walkable_mask().sum() == 10
+
+    version = grid.version
+    grid.set_solid(0, 0)
+    assert grid.is_solid(0, 0) and grid.version == version + 1
+    grid.set_solid(0, 0, False)
+    assert not grid.tiles[0, 0] & SOLID
+
+
+def test_entities_update_occupancy():
+    grid = CollisionGrid(5, 5)
+    npc, player = Entity(16, 16), Entity(48, 16)
+    npc.set_collision_grid(grid)
+    player.set_collision_grid(grid)
+
+    assert grid.is_occupied(1, 1)
+    assert grid.is_blocked(1, 1) and not grid.is_blocked(1, 1, ignore=npc)
+    assert not grid.is_solid(1, 1)
+
+    npc.set_tile_position(2, 3)
+    assert not grid.is_occupied(1, 1)
+    assert grid.occupant_tile(npc) == (2, 3)
+
+    npc.set_collision_grid(None)
+    assert grid.occupancy.sum() == 1
+    assert grid.occupant_tile(player) == (3, 1)
+
+
+def test_ledge_jumps_use_the_ledge_flag():
+    grid = CollisionGrid(5, 3)
+    grid.tiles[1, 2] |= LEDGE | SOLID
+    jumper = Entity(16, 16)
+    jumper.set_collision_grid(grid)
+
+    assert LedgeHandler.can_jump_ledge((1, 1), Direction.RIGHT, grid, jumper=jumper)
+    assert not LedgeHandler.can_jump_ledge((1, 1), Direction.DOWN, grid, jumper=jumper)
+    assert not LedgeHandler.can_jump_ledge((4, 1), Direction.RIGHT, grid)  # Kartenrand
+
+    # Belegte oder gesperrte Landefelder verhindern den Sprung
+    blocker = Entity(48, 16)
+    blocker.set_collision_grid(grid)
+    assert not LedgeHandler.can_jump_ledge((1, 1), Direction.RIGHT, grid, jumper=jumper)
+    grid.tiles[1, 1] |= LEDGE
+    grid.set_solid(0, 1)
+    assert not LedgeHandler.can_jump_ledge((2, 1), Direction.LEFT, grid)
+
+
+def test_encounters_only_roll_on_tall_grass():
+    grid = CollisionGrid(3, 1)
+    grid.tiles[0, 1] |= TALL_GRASS
+    area = SimpleNamespace(collision_grid=grid, encounter_rate=1.0)
+    encounters = FieldEncounterSystem(SimpleNamespace(current_area=area))
+    encounters.min_steps_between_encounters = 0
+
+    encounters.check_encounter(0, 0)
+    assert not encounters.encounter_check_pending
+    encounters.check_encounter(1, 0)
+    assert encounters.encounter_check_pending
+
+
+def test_tile_manager_uses_grid_and_legacy_rows():
+    tile_manager = TileManager.get_instance()
+    tile_manager.collision_map = [[False] * 3 for _ in range(2)]
+    assert (tile_manager.map_width, tile_manager.map_height) == (3, 2)
+    assert not tile_manager.is_collision(1, 1)
+
+    version = tile_manager.collision_grid.version
+    assert tile_manager.collision_map == [[False] * 3, [False] * 3]
+    assert tile_manager.collision_grid.version == version  # Lesen lässt Pfad-Caches gültig
+
+    tile_manager.collision_map[1][1] = True
+    assert tile_manager.is_collision(1, 1)
+    assert tile_manager.is_collision(3, 0)
+    assert tile_manager.collision_grid.version == version + 1
+
+    # Kanten und Wasser sind keine Wände
+    tile_manager.collision_grid.tiles[0, 0] |= LEDGE
+    tile_manager.collision_grid.tiles[0, 2] |= WATER | SOLID
+    assert list(tile_manager.collision_map[0]) == [False, False, True]
+
+    grid = CollisionGrid(6, 6)
+    tile_manager.set_collision_grid(grid)
+    assert tile_manager.collision_grid is grid
+    assert tile_manager.find_path((0, 0), (5, 5))[-1] == (5, 5)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests für chunkweise gerenderte Map-Layer
+Nur sichtbare Chunks werden erzeugt; das Ergebnis entspricht dem Vollbild-Rendering
+"""
+
+import sys
+from pathlib import Path
+
+import pygame
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from engine.world.layer_chunks import (
+    ChunkedLayer, composite_layer, placement_region_renderer, tile_region_renderer
+)
+from engine.world.tiles import TILE_SIZE
+
+MAP_TILES = 40  # 40x40 Tiles -> 3x3 Chunks à 16 Tiles
+
+
+def make_sprites():
+    sprites = {}
+    for gid, color in ((1, (40, 160, 40)), (2, (120, 80, 40)), (3, (30, 60, 200))):
+        sprite = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+        sprite.fill(color)
+        sprites[gid] = sprite
+    return sprites
+
+
+def make_layer_data():
+    return [[(x * 7 + y * 3) % 4 for x in range(MAP_TILES)] for y in range(MAP_TILES)]
+
+
+def reference_surface(layer_data, sprites):
+    surface = pygame.Surface((MAP_TILES * TILE_SIZE, MAP_TILES * TILE_SIZE), pygame.SRCALPHA)
+    for y, row in enumerate(layer_data):
+        for x, gid in enumerate(row):
+            if gid:
+                surface.blit(sprites[gid], (x * TILE_SIZE, y * TILE_SIZE))
+    return surface
+
+
+def pixels(surface):
+    return pygame.image.tobytes(surface, 'RGBA')
+
+
+def test_only_visible_chunks_are_rendered():
+    sprites = make_sprites()
+    size = MAP_TILES * TILE_SIZE
+    layer = ChunkedLayer("ground", size, size, tile_region_renderer(make_layer_data(), sprites.get))
+    assert (layer.columns, layer.rows) == (3, 3)
+
+    screen = pygame.Surface((160, 144))
+    assert layer.draw(screen, 0, 0) == 1
+    assert layer.loaded_chunks == 1
+
+    # Kamera über der Chunk-Ecke: vier Chunks sichtbar
+    assert layer.draw(screen, 200, 200) == 4
+    assert layer.loaded_chunks == 4
+
+
+def test_chunked_draw_matches_full_surface():
+    sprites = make_sprites()
+    layer_data = make_layer_data()
+    size = MAP_TILES * TILE_SIZE
+    layer = ChunkedLayer("ground", size, size, tile_region_renderer(layer_data, sprites.get))
+    reference = reference_surface(layer_data, sprites)
+
+    for camera in ((0, 0), (123, 77), (size - 160, size - 144), (-20, -10)):
+        chunked = pygame.Surface((160, 144), pygame.SRCALPHA)
+        full = pygame.Surface((160, 144), pygame.SRCALPHA)
+        layer.draw(chunked, *camera)
+        full.blit(reference, (-camera[0], -camera[1]))
+        assert pixels(chunked) == pixels(full)
+
+
+def test_empty_chunks_are_skipped_and_invalidated():
+    size = MAP_TILES * TILE_SIZE
+    layer_data = [[0] * MAP_TILES for _ in range(MAP_TILES)]
+    layer_data[0][0] = 1
+    layer = ChunkedLayer("decor", size, size, tile_region_renderer(layer_data, make_sprites().get))
+
+    assert layer.get_chunk(0, 0) is not None
+    assert layer.get_chunk(2, 2) is None
+    layer.invalidate(pygame.Rect(0, 0, 1, 1))
+    assert layer.loaded_chunks == 1
+    layer.invalidate()
+    assert layer.loaded_chunks == 0
+
+
+def test_large_objects_reach_into_neighbour_chunks():
+    tree = pygame.Surface((TILE_SIZE * 2, TILE_SIZE * 3), pygame.SRCALPHA)
+    tree.fill((10, 90, 10))
+    chunk = 16 * TILE_SIZE
+    layer = ChunkedLayer("objects", chunk * 2, chunk * 2,
+                         placement_region_renderer([(tree, chunk - TILE_SIZE, chunk - TILE_SIZE)]))
+
+    surface = layer.to_surface()
+    assert surface.get_at((chunk - 1, chunk - 1))[:3] == (10, 90, 10)
+    assert surface.get_at((chunk + TILE_SIZE - 1, chunk + 2 * TILE_SIZE - 1))[:3] == (10, 90, 10)
+    assert layer.get_chunk(1, 1) is not None
+    assert layer.get_chunk(1, 0) is not None
+
+
+def test_composite_matches_stacked_layers():
+    sprites = make_sprites()
+    size = MAP_TILES * TILE_SIZE
+    ground = ChunkedLayer("ground", size, size, tile_region_renderer(make_layer_data(), sprites.get))
+    decor_data = [[3 if (x + y) % 5 == 0 else 0 for x in range(MAP_TILES)] for y in range(MAP_TILES)]
+    decor = ChunkedLayer("decor", size, size, tile_region_renderer(decor_data, sprites.get))
+    composite = composite_layer("static_below", [ground, decor])
+
+    camera = (200, 200)
+    stacked = pygame.Surface((160, 144), pygame.SRCALPHA)
+    merged = pygame.Surface((160, 144), pygame.SRCALPHA)
+    assert ground.draw(stacked, *camera) + decor.draw(stacked, *camera) == 8
+    assert composite.draw(merged, *camera) == 4
+    assert pixels(merged) == pixels(stacked)
+    assert composite_layer("empty", []) is None
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests für den kompilierten Map-Cache
+Binärformat mit memory-mapped Layern, vorberechneten Kollisions-Flags und GIDs, aufgelöste Tile-Namen und Neuaufbau bei Quelländerungen
+"""
+
+import json
+import mmap
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from engine.world.collision_grid import CollisionGrid, SOLID
+from engine.world.map_cache import CACHE_SUFFIX, compile_map, load_compiled, read_cache
+from engine.world.map_loader import MapLoader
+
+TILESET = """<?xml version="1.0" encoding="UTF-8"?>
+<tileset name="tiles" tilewidth="16" tileheight="16" tilecount="3" columns="0">
+ <tile id="0"><image source="tiles/grass.png" width="16" height="16"/></tile>
+ <tile id="1"><image source="tiles/wall.png" width="16" height="16"/></tile>
+ <tile id="2"><image source="tiles/water_1.png" width="16" height="16"/></tile>
+</tileset>
+"""
+
+
+def write_map(maps_dir, ground_gid=1):
+    data = {
+        "tiledversion": "1.11.2", "width": 3, "height": 2, "tilewidth": 16,
+        "tilesets": [{"firstgid": 1, "source": "tiles.tsx"}],
+        "properties": [{"name": "music", "value": "town"}],
+        "warps": [{"x": 2, "y": 1, "to_map": "house", "to_x": 1, "to_y": 4}],
+        "layers": [
+            {"name": "Tile Layer 1", "type": "tilelayer", "data": [ground_gid, 1, 2, 1, 1, 0x80000002]},
+            {"name": "collision", "type": "tilelayer", "data": [0, 0, 1, 0, 0, 1]},
+            {"name": "Object Layer 1", "type": "objectgroup",
+             "objects": [{"gid": 2, "x": 16, "y": 32}, {"name": "spawn", "x": 0, "y": 0}]},
+        ],
+    }
+    (maps_dir / "test.json").write_text(json.dumps(data), encoding="utf-8")
+    (maps_dir / "tiles.tsx").write_text(TILESET, encoding="utf-8")
+
+
+def test_compiled_map_matches_loader(tmp_path):
+    maps_dir, cache_dir = tmp_path / "maps", tmp_path / "cache"
+    maps_dir.mkdir()
+    write_map(maps_dir)
+    expected = MapLoader._load_tiled_map("test", json.loads((maps_dir / "test.json").read_text()))
+
+    path = compile_map("test", maps_dir, cache_dir)
+    assert path == cache_dir / f"test{CACHE_SUFFIX}"
+    meta, block = read_cache(path)
+    assert isinstance(block.base.base.obj, mmap.mmap) and not block.flags.writeable
+    assert block.shape == (3, 2, 3)  # Zwei Layer plus Kollisions-Flags
+
+    map_data = load_compiled("test", maps_dir, cache_dir)
+    assert map_data.layers == expected.layers
+    assert map_data.layers["Tile Layer 1"][1][2] == 2  # Flip-Flags entfernt
+    assert map_data.warps == expected.warps and map_data.properties == {"music": "town"}
+    assert map_data.objects == [{"gid": 2, "x": 16, "y": 32, "layer": "Object Layer 1"}]
+    assert map_data.tile_names == {1: "grass", 2: "wall"}  # Nur benutzte GIDs
+    assert map_data.layer_arrays["collision"].sum() == 2
+    assert map_data.layer_gids == {"Tile Layer 1": [1, 2], "collision": [1]}
+
+    # Flags sind vorberechnet und entsprechen dem Aufbau aus den Quellen
+    parsed = CollisionGrid.from_map_data(expected, {1: "grass", 2: "wall"})
+    grid = CollisionGrid.from_map_data(map_data, map_data.tile_names)
+    assert np.array_equal(grid.tiles, parsed.tiles) and grid.tiles[1, 2] == SOLID
+
+
+def test_compiled_layers_stay_memory_mapped(tmp_path):
+    import pygame
+    from engine.world.layer_chunks import tile_region_renderer
+
+    maps_dir, cache_dir = tmp_path / "maps", tmp_path / "cache"
+    maps_dir.mkdir()
+    write_map(maps_dir)
+    map_data = load_compiled("test", maps_dir, cache_dir)
+
+    # Listen-Zeilen entstehen nur für Layer, die tatsächlich so gelesen werden
+    assert list(map_data.layers) == ["Tile Layer 1", "collision"]
+    assert map_data.layers._rows == {}
+    assert map_data.layers["collision"] == [[0, 0, 1], [0, 0, 1]]
+    assert list(map_data.layers._rows) == ["collision"]
+
+    # Der Renderer liest das Array direkt und zeichnet wie mit Listen
+    sprites = {gid: pygame.Surface((16, 16)) for gid in (1, 2)}
+    sprites[1].fill((0, 200, 0))
+    sprites[2].fill((90, 90, 90))
+    rect = pygame.Rect(0, 0, 48, 32)
+    from_array, from_rows = pygame.Surface(rect.size), pygame.Surface(rect.size)
+    tile_region_renderer(map_data.layer_arrays["Tile Layer 1"], sprites.get)(from_array, rect)
+    tile_region_renderer(map_data.layers["Tile Layer 1"], sprites.get)(from_rows, rect)
+    assert pygame.image.tobytes(from_array, "RGB") == pygame.image.tobytes(from_rows, "RGB")
+
+
+def test_cache_rebuilds_when_sources_change(tmp_path):
+    maps_dir, cache_dir = tmp_path / "maps", tmp_path / "cache"
+    maps_dir.mkdir()
+    write_map(maps_dir)
+    assert load_compiled("test", maps_dir, cache_dir).layers["Tile Layer 1"][0][0] == 1
+
+    # Nur mtime geändert: Inhalt gleich, Fingerprints werden aufgefrischt
+    source = maps_dir / "test.json"
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert load_compiled("test", maps_dir, cache_dir).layers["Tile Layer 1"][0][0] == 1
+    meta, _ = read_cache(cache_dir / f"test{CACHE_SUFFIX}")
+    assert meta["sources"][0]["mtime_ns"] == stat.st_mtime_ns + 10**9
+
+    # Inhalt geändert: neu kompiliert
+    write_map(maps_dir, ground_gid=2)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+    assert load_compiled("test", maps_dir, cache_dir).layers["Tile Layer 1"][0][0] == 2
+
+    # Beschädigter Cache wird ersetzt
+    (cache_dir / f"test{CACHE_SUFFIX}").write_bytes(b"garbage")
+    assert load_compiled("test", maps_dir, cache_dir).width == 3
+    assert load_compiled("missing", maps_dir, cache_dir) is None
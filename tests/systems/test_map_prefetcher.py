@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests für den Map-Prefetcher
+Areas der Warp-Ziele entstehen auf einem Worker-Thread, beim Abholen bleibt nur finalize() auf dem Main-Thread
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from engine.world.map_prefetcher import MapPrefetcher
+from engine.world.tiles import TILE_SIZE
+
+
+class FakeMapData:
+    def __init__(self, map_id):
+        self.map_id = map_id
+        self.thread = threading.current_thread()
+
+
+class FakeArea:
+    def __init__(self, map_id, map_data):
+        self.map_id = map_id
+        self.map_data = map_data
+        self.thread = threading.current_thread()
+        self.views = []
+        self.finalized_on = None
+
+    def prerender(self, view):
+        assert threading.current_thread() is self.thread
+        self.views.append(view)
+        return 1
+
+    def finalize(self):
+        self.finalized_on = threading.current_thread()
+
+
+def test_warp_targets_are_prepared_on_worker():
+    started = {name: threading.Event() for name in ("house", "cave", "forest")}
+
+    def load(map_id):
+        started[map_id].set()
+        return FakeMapData(map_id)
+
+    prefetcher = MapPrefetcher(area_factory=FakeArea, map_loader=load)
+    try:
+        prefetcher.prefetch([("house", 3, 4), ("cave", 30, 30), ("house", 10, 2), ("", 0, 0)])
+        assert set(prefetcher.pending) == {"house", "cave"}
+
+        # Laufende Jobs werden abgewartet, noch nicht gestartete abgebrochen
+        assert started["house"].wait(timeout=5.0)
+
+        # Area und vorgerenderte Chunks entstehen auf dem Worker, finalize() läuft beim Abholen
+        house = prefetcher.take("house")
+        assert isinstance(house, FakeArea) and house.map_data.map_id == "house"
+        assert house.map_data.thread is not threading.current_thread()
+        assert house.thread is house.map_data.thread
+        assert house.finalized_on is threading.current_thread()
+
+        # Vorgerendert wird ein Sichtbereich um jeden Spawn
+        centers = [(view.centerx // TILE_SIZE, view.centery // TILE_SIZE) for view in house.views]
+        assert centers == [(3, 4), (10, 2)]
+        assert house.views[0].size == prefetcher.view_size
+
+        # Nicht mehr benachbarte Ziele werden verworfen, unbekannte liefern None
+        prefetcher.prefetch([("forest", 1, 1)])
+        assert prefetcher.pending == ("forest",)
+        assert prefetcher.take("cave") is None
+        assert started["forest"].wait(timeout=5.0)
+        assert prefetcher.take("forest").map_id == "forest"
+        assert prefetcher.take("forest") is None
+    finally:
+        prefetcher.shutdown()
+
+
+def test_failed_preparation_falls_back():
+    def broken(map_id):
+        raise ValueError("kaputt")
+
+    prefetcher = MapPrefetcher(area_factory=FakeArea, map_loader=broken)
+    try:
+        prefetcher.prefetch([("house", 1, 1)])
+        assert prefetcher.take("house") is None
+        prefetcher.prefetch([("house", 1, 1)])
+        prefetcher.discard("house")
+        assert prefetcher.pending == ()
+    finally:
+        prefetcher.shutdown()
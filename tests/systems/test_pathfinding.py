@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Tests für den PathfindingService
+Jump Point Search, Flow-Fields, verteilte Suchen und Cache-Invalidierung über die Grid-Version
+"""
+
+import sys
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from engine.world.collision_grid import CollisionGrid
+from engine.world.pathfinding import find_path
+from engine.world.tile_manager import TileManager
+from engine.world.tiles import TILE_SIZE
+
+MAZE = [
+    "..........",
+    ".####.###.",
+    ".#......#.",
+    ".#.####.#.",
+    "...#..#...",
+    "####..###.",
+    "..........",
+]
+
+
+def make_grid(rows=MAZE):
+    grid = CollisionGrid(len(rows[0]), len(rows))
+    for y, row in enumerate(rows):
+        for x, char in enumerate(row):
+            if char == "#":
+                grid.set_solid(x, y)
+    return grid
+
+
+def bfs_length(grid, start, goal):
+    queue = deque([(start, 0)])
+    seen = {start}
+    while queue:
+        (x, y), steps = queue.popleft()
+        if (x, y) == goal:
+            return steps
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if (nx, ny) not in seen and not grid.is_solid(nx, ny):
+                seen.add((nx, ny))
+                queue.append(((nx, ny), steps + 1))
+    return None
+
+
+def assert_walkable_steps(grid, path, diagonal=False):
+    for (ax, ay), (bx, by) in zip(path, path[1:]):
+        dx, dy = bx - ax, by - ay
+        assert max(abs(dx), abs(dy)) == 1
+        assert diagonal or not (dx and dy)
+        assert not grid.is_solid(bx, by)
+        if dx and dy:
+            assert not grid.is_solid(ax + dx, ay) and not grid.is_solid(ax, ay + dy)
+
+
+def test_jump_point_search_finds_shortest_paths():
+    grid = make_grid()
+    pathfinder = grid.pathfinder
+    free = [(x, y) for y in range(grid.height) for x in range(grid.width) if not grid.is_solid(x, y)]
+
+    for start in free[::3]:
+        for goal in free[::4]:
+            path = pathfinder.find_path(start, goal)
+            expected = bfs_length(grid, start, goal)
+            assert len(path) - 1 == expected
+            assert path[0] == start and path[-1] == goal
+            assert_walkable_steps(grid, path)
+
+    diagonal = pathfinder.find_path((2, 2), (7, 4), diagonal=True)
+    assert diagonal[-1] == (7, 4)
+    assert_walkable_steps(grid, diagonal, diagonal=True)
+
+    # Freies Feld: diagonal ist kürzer, um Hindernisse wird nicht über Ecken gelaufen
+    field = CollisionGrid(8, 8)
+    field.set_solid(6, 1)
+    diagonal = field.pathfinder.find_path((0, 0), (7, 7), diagonal=True)
+    assert len(diagonal) == 8 and diagonal[-1] == (7, 7)
+    around = field.pathfinder.find_path((5, 2), (7, 0), diagonal=True)
+    assert len(around) == 5
+    assert_walkable_steps(field, around, diagonal=True)
+
+
+def test_blocked_goal_and_version_invalidation():
+    grid = make_grid()
+    pathfinder = grid.pathfinder
+
+    # Blockiertes Ziel: Pfad endet am nächsten begehbaren Nachbarn
+    assert pathfinder.find_path((0, 0), (2, 1))[-1] in ((2, 0), (2, 2))
+    assert pathfinder.find_path((0, 0), (0, 0)) == [(0, 0)]
+    assert pathfinder.find_path((1, 1), (0, 0)) == []
+
+    before = pathfinder.find_path((9, 0), (9, 6))
+    assert len(before) == 7
+    grid.set_solid(9, 3)
+    after = pathfinder.find_path((9, 0), (9, 6))
+    assert after[-1] == (9, 6) and (9, 3) not in after and len(after) > len(before)
+
+
+def test_incremental_requests_respect_frame_budget():
+    grid = make_grid()
+    pathfinder = grid.pathfinder
+    pathfinder.frame_budget = 0.0
+    pathfinder.update()
+
+    request = pathfinder.request_path((0, 6), (9, 0))
+    assert not request.done and pathfinder.pending == 1
+    pathfinder.update()
+    assert not request.done
+
+    pathfinder.frame_budget = 1.0
+    pathfinder.update()
+    assert request.done and pathfinder.pending == 0
+    assert request.path == find_path(grid_area(grid), (0, 6), (9, 0))
+
+    # Fertige Ergebnisse kommen aus dem Cache, auch ohne Budget
+    pathfinder.frame_budget = 0.0
+    pathfinder.update()
+    assert pathfinder.request_path((0, 6), (9, 0)).done
+
+
+def grid_area(grid):
+    class GridArea:
+        width, height = grid.width, grid.height
+
+        def is_tile_solid(self, x, y):
+            return grid.is_solid(x, y)
+
+    return GridArea()
+
+
+def test_flow_field_is_shared_by_followers():
+    grid = make_grid()
+    pathfinder = grid.pathfinder
+    goal = (4, 4)
+
+    field = pathfinder.flow_field(goal)
+    assert field[4, 4] == 0 and field[1, 1] == -1
+    for start in ((0, 0), (9, 6), (0, 6)):
+        path = pathfinder.flow_path(start, goal)
+        assert path[-1] == goal and len(path) - 1 == bfs_length(grid, start, goal)
+        assert_walkable_steps(grid, path)
+    assert pathfinder.flow_field(goal) is field
+
+    grid.set_solid(9, 3)
+    assert pathfinder.flow_field(goal) is not field
+
+
+def test_flow_path_stops_next_to_blocked_goal():
+    grid = make_grid()
+    pathfinder = grid.pathfinder
+
+    # Statisch blockiertes Ziel: der Pfad endet auf einem Nachbar-Tile
+    path = pathfinder.flow_path((0, 0), (1, 1))
+    assert len(path) == 2 and (1, 1) not in path
+    assert path[-1] in ((1, 0), (0, 1))
+
+    # Von einer Entity belegtes Ziel ebenso, ein freies Ziel wird erreicht
+    goal = (4, 4)
+    free = pathfinder.flow_path((0, 0), goal)
+    grid.place(object(), *goal)
+    path = pathfinder.flow_path((0, 0), goal)
+    assert path == free[:-1]
+    assert_walkable_steps(grid, path)
+    assert pathfinder.flow_path(goal, goal) == [goal]
+
+
+def test_follow_player_ignores_empty_trimmed_paths(capsys):
+    from engine.world.pathfinding_mixin import PathfindingMixin
+
+    class Follower(PathfindingMixin):
+        def __init__(self, x, y):
+            super().__init__()
+            self.x, self.y = x * TILE_SIZE, y * TILE_SIZE
+
+    grid = make_grid()
+    area = grid_area(grid)
+    area.collision_grid = grid
+    follower = Follower(0, 0)
+    player = Follower(0, 3)
+
+    # Kürzer als der Mindestabstand: kein Pfad, keine Ausgabe
+    follower.follow_player(player, area, min_distance=4, max_distance=1)
+    assert follower.current_path is None
+    assert capsys.readouterr().out == ""
+
+    # Ein laufender Pfad zum selben Ziel wird nicht jedes Tick neu gesetzt
+    player.x, player.y = 9 * TILE_SIZE, 6 * TILE_SIZE
+    follower.follow_player(player, area)
+    path = follower.current_path
+    assert path and path[-1] == follower.path_target
+    follower.path_index = 1
+    capsys.readouterr()
+    follower.follow_player(player, area)
+    assert follower.current_path is path and follower.path_index == 1
+    assert capsys.readouterr().out == ""
+
+
+def test_tile_manager_paths_follow_grid_version():
+    tile_manager = TileManager.get_instance()
+    tile_manager.collision_map = [[False] * 5 for _ in range(3)]
+    assert tile_manager.find_path((0, 1), (4, 1)) == [(1, 1), (2, 1), (3, 1), (4, 1)]
+
+    tile_manager.collision_map[1][2] = True
+    path = tile_manager.find_path((0, 1), (4, 1))
+    assert (2, 1) not in path and len(path) == 6
+    assert tile_manager.find_path((0, 1), (2, 1)) == []
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests für die Präsentation des logischen Surfaces
+Dirty-Rect-Modus: nur gemeldete Bereiche werden skaliert, statische Frames übersprungen
+Persistentes Skalierungsziel: Letterbox-Geometrie nur bei Größenänderung neu berechnet
+"""
+
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from engine.core.game import Game
+from engine.core.scene_base import Scene
+
+
+class ReportingScene(Scene):
+    """Scene, die vorgegebene Dirty-Rects meldet"""
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.color = (40, 120, 40)
+        self.dirty = None
+
+    def handle_event(self, event):
+        return False
+
+    def update(self, dt):
+        pass
+
+    def draw(self, surface):
+        surface.fill(self.color)
+        return self.dirty
+
+
+def make_game():
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    game = Game(screen, pygame.Surface((320, 180)), (320, 180), (1280, 720), 4)
+    game.dirty_rects_enabled = True
+    game.show_fps = False
+    game.push_scene(ReportingScene)
+    return game
+
+
+def present_frame(game, monkeypatch):
+    calls = []
+    monkeypatch.setattr(pygame.display, 'flip', lambda: calls.append('flip'))
+    monkeypatch.setattr(pygame.display, 'update', lambda rects: calls.append(list(rects)))
+    game._draw()
+    game._present()
+    return calls
+
+
+def test_scene_switch_and_none_present_full_frame(monkeypatch):
+    game = make_game()
+    scene = game.current_scene
+    scene.dirty = []
+    assert present_frame(game, monkeypatch) == ['flip']
+
+    scene.dirty = None
+    assert present_frame(game, monkeypatch) == ['flip']
+
+
+def test_static_frames_are_skipped(monkeypatch):
+    game = make_game()
+    game.current_scene.dirty = []
+    present_frame(game, monkeypatch)
+    assert present_frame(game, monkeypatch) == []
+
+
+def test_only_dirty_regions_are_scaled_and_uploaded(monkeypatch):
+    game = make_game()
+    scene = game.current_scene
+    scene.dirty = []
+    present_frame(game, monkeypatch)
+
+    scene.color = (200, 30, 30)
+    scene.dirty = [pygame.Rect(10, 120, 300, 50)]
+    assert present_frame(game, monkeypatch) == [[pygame.Rect(40, 480, 1200, 200)]]
+    assert game.screen.get_at((40, 480))[:3] == (200, 30, 30)
+    assert game.screen.get_at((39, 479))[:3] == (40, 120, 40)
+
+
+def test_expose_event_forces_full_present(monkeypatch):
+    game = make_game()
+    game.current_scene.dirty = []
+    present_frame(game, monkeypatch)
+
+    game.request_full_present()
+    assert present_frame(game, monkeypatch) == ['flip']
+    assert present_frame(game, monkeypatch) == []
+
+
+def test_scale_target_is_reused_until_resize(monkeypatch):
+    game = make_game()
+    game.dirty_rects_enabled = False
+    present_frame(game, monkeypatch)
+    target = game._present_target
+    present_frame(game, monkeypatch)
+    assert game._present_target is target
+    assert game._present_rect == pygame.Rect(0, 0, 1280, 720)
+
+    expected = pygame.transform.scale(game.logical_surface, (1280, 720))
+    assert pygame.image.tobytes(game.screen, 'RGB') == pygame.image.tobytes(expected, 'RGB')
+
+
+def test_resize_recomputes_letterbox(monkeypatch):
+    game = make_game()
+    present_frame(game, monkeypatch)
+
+    pygame.display.set_mode((1000, 720))
+    game.invalidate_present_geometry()
+    assert present_frame(game, monkeypatch) == ['flip']
+    assert game._present_scale == 3
+    assert game._present_rect == pygame.Rect(20, 90, 960, 540)
+    assert game.screen.get_at((10, 10))[:3] == (0, 0, 0)
+    assert game.screen.get_at((20, 90))[:3] == (40, 120, 40)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests für den Spatial-Hash
+Tile-Abfragen in O(1), inkrementelle Pflege über Entity.set_tile_position und Bereichsabfragen
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from engine.world.entity import Entity
+from engine.world.interaction_manager import InteractionData, WarpData
+from engine.world.spatial_hash import SpatialHash
+
+
+def test_point_queries_and_moves():
+    index = SpatialHash()
+    a, b, c = object(), object(), object()
+    index.move(a, 1, 1)
+    index.move(b, 1, 1)
+    index.move(c, 4, 2)
+
+    assert list(index.at(1, 1)) == [a, b]
+    assert index.first_at(1, 1, lambda obj: obj is b) is b
+    assert index.at(0, 0) == ()
+
+    index.move(a, 4, 2)
+    assert list(index.at(1, 1)) == [b]
+    assert list(index.at(4, 2)) == [c, a]
+    assert index.tile_of(a) == (4, 2)
+
+    index.remove(b)
+    assert index.first_at(1, 1) is None
+    assert len(index) == 2 and b not in index
+
+
+def test_range_query_matches_scan():
+    index = SpatialHash()
+    objects = [(object(), (i * 7) % 50, (i * 3) % 40) for i in range(60)]
+    for obj, x, y in objects:
+        index.move(obj, x, y)
+
+    for left, top, right, bottom in ((0, 0, 10, 8), (5, 5, 45, 38), (-3, -3, 60, 60)):
+        expected = {id(obj) for obj, x, y in objects if left <= x < right and top <= y < bottom}
+        assert {id(obj) for obj in index.in_rect(left, top, right, bottom)} == expected
+
+
+def test_entities_maintain_their_index_entry():
+    index = SpatialHash()
+    npc = Entity(32, 16)
+    npc.solid = False
+    npc.set_spatial_index(index)
+    assert list(index.at(2, 1)) == [npc]
+
+    npc.set_tile_position(5, 6)
+    assert index.at(2, 1) == () and list(index.at(5, 6)) == [npc]
+
+    npc.set_spatial_index(None)
+    assert len(index) == 0
+
+
+def test_interaction_data_lookup_by_tile():
+    warp = WarpData(id="door", position=(3, 4), destination_map="house",
+                    destination_position=(1, 1))
+    data = InteractionData(map_id="test", warps=[warp])
+    assert list(data.at('warps', 3, 4)) == [warp]
+    assert data.at('warps', 4, 3) == ()
+
+    # Nachträglich ergänzte Einträge werden beim nächsten Zugriff indiziert
+    late = WarpData(id="stairs", position=(7, 7), destination_map="cellar",
+                    destination_position=(2, 2))
+    data.warps.append(late)
+    assert list(data.at('warps', 7, 7)) == [late]
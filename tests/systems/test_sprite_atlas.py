@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests für den Sprite-Atlas
+Gepackte Sprites bleiben pixelgleich, SpriteManager und OptimizedRenderer teilen den Packer, Renderer blitten aus dem Atlas
+"""
+
+import sys
+from pathlib import Path
+
+import pygame
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from engine.graphics.optimized_renderer import OptimizedRenderer
+from engine.graphics.sprite_atlas import SpriteAtlas, atlas_region
+from engine.graphics.sprite_manager import CATEGORIES, SpriteManager
+from engine.graphics.tile_renderer import TileRenderer
+
+ROOT = Path(__file__).parent.parent.parent
+
+
+def make_sprite(size, color, alpha=255):
+    sprite = pygame.Surface(size, pygame.SRCALPHA)
+    sprite.fill((*color, alpha))
+    pygame.draw.line(sprite, (0, 0, 0, 128), (0, 0), (size[0] - 1, size[1] - 1))
+    return sprite
+
+
+def pixels(surface):
+    return [surface.get_at((x, y)) for y in range(surface.get_height()) for x in range(surface.get_width())]
+
+
+def test_packed_sprites_keep_pixels():
+    shared = make_sprite((16, 16), (10, 200, 10))
+    sprites = {
+        "grass": shared, "grass_1": shared,
+        "water": make_sprite((16, 16), (0, 100, 255), alpha=90),
+        "monster": make_sprite((56, 56), (200, 50, 50)),
+        "huge": make_sprite((80, 20), (1, 2, 3)),
+    }
+    atlas = SpriteAtlas(page_size=64)
+    packed = atlas.pack(sprites)
+
+    for key, sprite in sprites.items():
+        assert packed[key].get_size() == sprite.get_size()
+        assert pixels(packed[key]) == pixels(sprite)
+
+    # Gleiche Quelle -> gleiche Region; zu große Sprites bleiben eigenständig
+    assert atlas_region(packed["grass"])[1] == atlas_region(packed["grass_1"])[1]
+    assert atlas.page_of(packed["huge"]) is None
+    page, rect = atlas_region(packed["water"])
+    assert page in atlas.pages and rect.size == (16, 16)
+    assert atlas.stats()["pages"] == 2 and atlas.stats()["sprites"] == 3
+
+
+def test_sprite_manager_packs_everything_into_few_pages():
+    manager = SpriteManager()
+    manager.__init__(ROOT)
+    try:
+        manager._ensure_loaded()
+        assert manager.get_player_sprite("down").get_abs_parent() in manager.atlas.pages
+        assert manager.get_npc_sprite("biker", "left").get_abs_parent() in manager.atlas.pages
+        assert manager.get_tile("grass") is None or manager.atlas.page_of(manager.get_tile("grass")) is not None
+        stats = manager.atlas.stats()
+        assert stats["sprites"] > 100 and stats["pages"] <= len(CATEGORIES)
+    finally:
+        SpriteManager._instance = None
+
+
+def test_optimized_renderer_packs_into_the_sprite_atlas():
+    renderer = OptimizedRenderer()
+    packed = renderer.add_to_atlas({"a": make_sprite((16, 16), (1, 2, 3)), "b": make_sprite((8, 8), (4, 5, 6))})
+
+    assert {sprite.get_abs_parent() for sprite in packed.values()} == set(renderer.texture_atlas.pages)
+    assert renderer.get_stats()["atlas_usage"] > 0
+
+
+class FakeSpriteManager:
+    def __init__(self, sprites):
+        self.sprites = sprites
+
+    def get_tile_sprite(self, tile_id):
+        return self.sprites.get(tile_id)
+
+    def get_tile_by_mapping(self, tile_id):
+        return None
+
+    def get_tile_by_gid(self, gid):
+        return None
+
+    def get_tile(self, name):
+        return None
+
+
+def test_render_layer_blits_from_atlas():
+    sources = {1: make_sprite((16, 16), (40, 160, 40)), 2: make_sprite((16, 16), (90, 60, 20), alpha=200)}
+    packed = SpriteAtlas().pack(sources)
+    layer = [[1, 2, 0, 1], [2, 2, 1, 0], [0, 1, 1, 2]]
+
+    expected = pygame.Surface((48, 40))
+    for y, row in enumerate(layer):
+        for x, gid in enumerate(row):
+            if gid:
+                expected.blit(sources[gid], (x * 16 - 5, y * 16 - 3))
+
+    screen = pygame.Surface((48, 40))
+    renderer = TileRenderer(FakeSpriteManager(packed))
+    renderer.render_layer(screen, layer, (5, 3))
+    assert pixels(screen) == pixels(expected)
+
+    # Fehlende Tiles bekommen einmal einen Platzhalter
+    layer[0][0] = 7
+    renderer.render_layer(screen, layer, (0, 0))
+    assert renderer.missing_tiles == {7}
+    assert screen.get_at((2, 8))[:3] == (255, 0, 255)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests für das Lazy Loading des SpriteManagers
+Kategorien erst beim ersten Zugriff, Monster-Sprites einzeln mit LRU-Grenze und Hintergrund-Vorladen
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pygame
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from engine.graphics.sprite_manager import SpriteManager
+
+
+def make_project(root, monsters=5):
+    player, monster_dir = root / "data" / "maps" / "player", root / "assets" / "gfx" / "monster"
+    player.mkdir(parents=True)
+    monster_dir.mkdir(parents=True)
+    for direction in ("up", "down", "left", "right"):
+        sprite = pygame.Surface((16, 16), pygame.SRCALPHA)
+        sprite.fill((0, 0, 200, 255))
+        pygame.image.save(sprite, str(player / f"player_{direction}.png"))
+    for dex_id in range(1, monsters + 1):
+        sprite = pygame.Surface((40, 40), pygame.SRCALPHA)
+        sprite.fill((dex_id * 40, 0, 0, 255))
+        pygame.image.save(sprite, str(monster_dir / f"{dex_id}.png"))
+
+
+def make_manager(root):
+    manager = SpriteManager()
+    manager.__init__(root)
+    manager.use_asset_pack = False
+    return manager
+
+
+def test_categories_load_on_first_access(tmp_path):
+    make_project(tmp_path)
+    manager = make_manager(tmp_path)
+    try:
+        assert manager.get_player_sprite("down").get_at((0, 0)) == (0, 0, 200, 255)
+        assert manager._loaded_categories == {"player"}
+        assert len(manager._monster) == 0 and not manager._tiles
+
+        # Monster-Sprites über die Mapping-Sicht: Mitgliedschaft ohne Laden
+        assert "3" in manager.monster_sprites and len(manager.monster_sprites) == 5
+        assert len(manager._monster) == 0
+        assert manager.monster_sprites["3"].get_at((0, 0))[:3] == (120, 0, 0)
+        assert manager.get_sprite("monster_3") is manager.monster_sprites["3"]
+        assert manager.get_monster_sprite("99") is None
+
+        manager.get_sprite("tile_grass")
+        assert manager._loaded_categories == {"player", "tiles"}
+    finally:
+        SpriteManager._instance = None
+
+
+def test_monster_sprites_are_lru_bounded(tmp_path):
+    make_project(tmp_path)
+    manager = make_manager(tmp_path)
+    manager.max_monster_sprites = 2
+    try:
+        first = manager.get_monster_sprite(1)
+        manager.get_monster_sprite(2)
+        assert manager.get_monster_sprite(1) is first  # 1 ist jetzt zuletzt benutzt
+        manager.get_monster_sprite(3)
+        assert list(manager._monster) == ["1", "3"]
+        assert manager.monster_evictions == 1
+        assert manager.get_monster_sprite(2).get_at((0, 0))[:3] == (80, 0, 0)
+    finally:
+        SpriteManager._instance = None
+
+
+def test_encounter_sprites_are_preloaded_in_background(tmp_path):
+    make_project(tmp_path)
+    manager = make_manager(tmp_path)
+    threads = []
+    read = manager._read_monster
+    manager._read_monster = lambda key: (threads.append(threading.current_thread()), read(key))[1]
+    try:
+        manager.preload_monsters([1, 2, 42])  # 42 existiert nicht und wird ignoriert
+        assert set(manager._monster_jobs) == {"1", "2"}
+        manager._monster_jobs["1"].result(timeout=5.0)
+
+        sprite = manager.get_monster_sprite(1)
+        assert sprite.get_at((0, 0))[:3] == (40, 0, 0)
+        assert threads and threads[0] is not threading.current_thread()
+        assert "1" not in manager._monster_jobs
+
+        # Neue Map: nicht mehr erwartete Monster werden aus der Warteschlange genommen
+        manager.preload_monsters([4])
+        assert set(manager._monster_jobs) == {"4"}
+        assert manager.get_cache_info()["monster_preloads"] == 1
+    finally:
+        manager._preload_executor.shutdown(wait=True)
+        SpriteManager._instance = None
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests für das Startup-Profiling
+Import- und Init-Zeiten werden erfasst, --profile-startup endet nach dem ersten Frame, schwere Module bleiben beim Start ungeladen
+"""
+
+import builtins
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from engine.devtools.startup_profiler import StartupProfiler, finish, measure
+
+ROOT = Path(__file__).parent.parent.parent
+ENV = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+
+
+def test_profiler_records_imports_and_inits(capsys):
+    original_import = builtins.__import__
+    sys.modules.pop("colorsys", None)
+    profiler = StartupProfiler().start()
+    try:
+        import colorsys  # noqa: F401
+        with measure("Demo"):
+            pass
+    finally:
+        assert finish(budget_ms=0) == 1
+    assert builtins.__import__ is original_import and StartupProfiler.active() is None
+    assert "colorsys" in [record.module for record in profiler.imports]
+    assert [record.name for record in profiler.inits] == ["Demo"]
+    assert "OVER BUDGET" in capsys.readouterr().out
+
+    StartupProfiler().start()
+    assert finish(budget_ms=10**6) == 0
+    assert finish() == 0  # ohne aktiven Profiler
+
+
+def test_profile_startup_exits_after_first_frame():
+    script = "import sys; sys.argv = ['main.py', '--profile-startup']; import main; sys.exit(main.main())"
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=ENV,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "Startup profile: first StartScene frame" in result.stdout
+    assert "ResourceManager" in result.stdout
+
+
+def test_start_path_skips_heavy_modules():
+    # pygame lädt numpy selbst (pygame.surfarray), das zählt nicht zum Startpfad
+    script = ("import sys, pygame; preloaded = set(sys.modules); "
+              "import main, engine.scenes.start_scene; "
+              "print(sorted(m for m in ('numpy', 'engine.systems.battle', 'engine.systems.items', "
+              "'engine.systems.types') if m in sys.modules and m not in preloaded))")
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=ENV,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "[]"
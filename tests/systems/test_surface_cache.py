@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests für den byte-budgetierten Surface-Cache
+Buchhaltung über gerenderte Chunks, LRU-Verdrängung nach Bytes und Anzahl, Statistiken
+"""
+
+import sys
+from pathlib import Path
+
+import pygame
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from engine.world.layer_chunks import ChunkedLayer, surface_bytes
+from engine.world.surface_cache import SurfaceCache
+
+CHUNK = 64
+CHUNK_BYTES = CHUNK * CHUNK * 4
+
+
+def make_layer(name="ground", chunks=4):
+    def render(surface, rect):
+        surface.fill((200, 100, 50))
+        return True
+
+    return ChunkedLayer(name, chunks * CHUNK, CHUNK, render, chunk_size=CHUNK)
+
+
+def test_layers_account_rendered_chunks():
+    layer = make_layer()
+    deltas = []
+    layer.on_resize = deltas.append
+
+    layer.draw(pygame.Surface((3 * CHUNK, CHUNK)), 0, 0)
+    assert layer.nbytes == 3 * CHUNK_BYTES == sum(deltas)
+
+    # Bereits gerenderte Chunks ändern die Summe nicht
+    layer.get_chunk(1, 0)
+    assert layer.nbytes == 3 * CHUNK_BYTES
+
+    layer.invalidate(pygame.Rect(0, 0, CHUNK, CHUNK))
+    assert layer.nbytes == 2 * CHUNK_BYTES
+    layer.invalidate()
+    assert layer.nbytes == 0 and sum(deltas) == 0
+    assert surface_bytes(None) == 0
+
+
+def test_lru_evicts_on_byte_budget():
+    cache = SurfaceCache(max_bytes=5 * CHUNK_BYTES)
+    first, second = make_layer("first"), make_layer("second")
+    cache.put("first", {"ground": first}, [first])
+    cache.put("second", {"ground": second}, [second])
+
+    for cx in range(3):
+        first.get_chunk(cx, 0)
+    assert cache.nbytes == 3 * CHUNK_BYTES
+
+    assert cache.get("first") == {"ground": first}  # first ist jetzt zuletzt benutzt
+    for cx in range(3):
+        second.get_chunk(cx, 0)
+
+    # Budget überschritten: der am längsten unbenutzte Eintrag (first) fliegt,
+    # der gerade wachsende bleibt erhalten
+    assert "first" not in cache and "second" in cache
+    assert cache.nbytes == 3 * CHUNK_BYTES
+    assert first.on_resize is None
+
+    # Der verdrängte Layer gibt seine Chunks frei, auch wenn er noch benutzt wird
+    assert first.loaded_chunks == 0 and first.nbytes == 0
+
+    first.get_chunk(3, 0)
+    assert cache.nbytes == 3 * CHUNK_BYTES
+
+    stats = cache.stats()
+    assert stats["entries"] == 1 and stats["evictions"] == 1
+    assert stats["hits"] == 1 and cache.get("first") is None and cache.stats()["misses"] == 1
+
+
+def test_lru_respects_entry_limit_and_prefix_discard():
+    cache = SurfaceCache(max_bytes=10**9, max_entries=2)
+    for name in ("a_layers_1", "b_layers_1", "c_layers_1"):
+        layer = make_layer(name)
+        cache.put(name, layer, [layer])
+    assert len(cache) == 2 and "a_layers_1" not in cache
+
+    cache.discard_prefix("b_layers_")
+    assert len(cache) == 1 and "c_layers_1" in cache
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
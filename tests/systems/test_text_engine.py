@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests für die Text-Engine
+Zeilen-Cache über font.render, Glyph-Zeilen wie font.render (Grundlinie, Umlaute), Glyph-Offsets aus den Präfixbreiten, gecachte Umbrüche, Kürzen per Binärsuche, TextLine-Wiederverwendung
+"""
+
+import sys
+from pathlib import Path
+
+import pygame
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from engine.graphics.text_engine import TextEngine, TextLine
+
+pygame.font.init()
+
+WHITE = (255, 255, 255)
+TEXT = "Volltreffer! Schlurp hat Glumander mit Glutkralle erwischt, das war sehr effektiv!"
+
+
+def pixels(surface):
+    return [surface.get_at((x, y)) for y in range(surface.get_height()) for x in range(surface.get_width())]
+
+
+def max_alpha_diff(a, b):
+    return max(abs(pa.a - pb.a) for pa, pb in zip(pixels(a), pixels(b)))
+
+
+def composed(engine, text, font):
+    """Zeile aus Atlas-Glyphen, wie TextLine sie setzt"""
+    offsets, width, baseline, height = engine.glyph_layout(text, font)
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    surface.fill((*WHITE, 0))
+    engine.draw_glyphs(surface, text, font, WHITE, baseline=baseline, offsets=offsets)
+    return surface
+
+
+def test_render_caches_font_render_lines():
+    engine = TextEngine()
+    font = engine.get_font(14)
+    assert engine.get_font(14) is font
+
+    line = engine.render("Wüste!", font, WHITE)
+    expected = font.render("Wüste!", True, WHITE)
+    assert line.get_size() == expected.get_size()
+    assert line.get_width() == engine.width("Wüste!", font)
+    assert max_alpha_diff(line, expected) == 0
+
+    assert engine.render("Wüste!", font, WHITE) is line
+    assert engine.render("⚔️", font, WHITE).get_width() == engine.width("⚔️", font)
+    assert engine.render("Wüste!", font, WHITE, antialias=False).get_flags() & pygame.SRCALPHA
+    stats = engine.stats()
+    assert stats["line_hits"] == 1 and stats["glyphs"] == 0
+
+    # Nur Zeichen ohne Breite: font.render scheitert, die Zeile wird aus Glyphen gesetzt
+    assert engine.render("\ufe0f", font, WHITE).get_width() == 0
+    assert engine.stats()["glyphs"] == 1
+
+
+def test_capital_umlauts_sit_on_the_baseline():
+    engine = TextEngine()
+    for size in (16, 20, 24):
+        font = engine.get_font(size)
+        for text in ("Ärger über Öl", "Zähe Kämpfe gegen Ögre"):
+            line = composed(engine, text, font)
+            expected = font.render(text, True, WHITE)
+            # Höhere Zeile als linesize; Abweichung nur im Antialiasing überlappender Kanten
+            assert line.get_size() == expected.get_size()
+            assert max_alpha_diff(line, expected) <= 16
+
+    font = engine.get_font(16)
+    typed = TextLine(font, WHITE, engine=engine)
+    for n in range(1, len("Zähe Ögre") + 1):
+        typed.set_text("Zähe Ögre"[:n])
+    assert typed.surface.get_height() == font.render("Zähe Ögre", True, WHITE).get_height()
+    screen, expected = pygame.Surface((200, 30)), pygame.Surface((200, 30))
+    typed.draw(screen, (0, 0))
+    expected.blit(composed(engine, "Zähe Ögre", font), (0, 0))
+    assert pixels(screen) == pixels(expected)
+
+
+def test_glyph_offsets_follow_the_prefix_widths():
+    engine = TextEngine()
+    font = engine.get_font(14)
+
+    offsets, width, _, _ = engine.glyph_layout(TEXT, font)
+    assert list(offsets) == [font.size(TEXT[:n + 1])[0] - font.size(TEXT[n])[0] for n in range(len(TEXT))]
+    assert width == font.size(TEXT)[0]
+    assert engine.glyph_layout(TEXT, font) is engine.glyph_layout(TEXT, font)
+
+    # Aufsummierte ganzzahlige Vorschübe lägen am Zeilenende weit daneben
+    assert sum(metrics[4] for metrics in font.metrics(TEXT)) < width - 8
+    assert max_alpha_diff(composed(engine, TEXT, font), font.render(TEXT, True, WHITE)) <= 16
+
+    # Beim Tippen werden nur die neuen Glyphen vermessen, die Offsets bleiben gleich
+    line = TextLine(font, WHITE, engine=engine)
+    for n in range(1, len(TEXT) + 1):
+        line.set_text(TEXT[:n])
+    assert line.offsets == list(offsets)
+    assert line.width == width
+
+
+def test_wrap_and_truncate():
+    engine = TextEngine()
+    font = engine.get_font(12)
+
+    lines = engine.wrap(TEXT + " Donnerwetterkanonenkugel", font, 60)
+    assert " ".join(lines) == TEXT + " Donnerwetterkanonenkugel"
+    assert all(engine.width(line, font) <= 60 or " " not in line for line in lines)
+    assert "Donnerwetterkanonenkugel" in lines  # zu langes Wort steht allein
+    assert engine.wrap(TEXT + " Donnerwetterkanonenkugel", font, 60) is lines
+
+    assert engine.truncate("Kurz", font, 200) == "Kurz"
+    short = engine.truncate(TEXT, font, 150)
+    assert short.endswith("...") and TEXT.startswith(short[:-3])
+    assert engine.width(short, font) <= 150
+    # Binärsuche liefert das längste passende Präfix
+    longest = max(n for n in range(len(TEXT)) if engine.width(TEXT[:n].rstrip() + "...", font) <= 150)
+    assert short == TEXT[:longest].rstrip() + "..."
+
+
+def test_text_line_reuses_surface_while_typing():
+    engine = TextEngine()
+    font = engine.get_font(14)
+    line = TextLine(font, WHITE, engine=engine)
+
+    surfaces = set()
+    for n in range(1, len(TEXT) + 1):
+        line.set_text(TEXT[:n])
+        surfaces.add(id(line.surface))
+    assert len(surfaces) <= 8  # wächst nur durch Verdoppeln
+
+    screen, expected = pygame.Surface((500, 20)), pygame.Surface((500, 20))
+    line.draw(screen, (2, 3))
+    expected.blit(composed(engine, TEXT, font), (2, 3))
+    assert pixels(screen) == pixels(expected)
+
+    line.set_text("Neu")
+    screen.fill((0, 0, 0))
+    line.draw(screen, (0, 0))
+    assert screen.get_at((engine.width("Neu", font) + 2, 4))[:3] == (0, 0, 0)
+
+
+def test_battle_log_truncates_long_messages(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    from engine.ui.battle_log import BattleLog
+
+    log = BattleLog()
+    log.add_message(TEXT * 3, is_critical=True)
+    screen = pygame.Surface((320, 180))
+    log.draw(screen)
+    hits = log.text_engine.line_hits
+    log.draw(screen)
+    assert log.text_engine.line_hits >= hits + 4  # Titel, Icon, Text, CRIT aus dem Cache
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Map Compiler für Untold Story
+==============================
+Kompiliert alle Maps vorab in den binären Map-Cache (data/cache/maps),
+damit der erste Warp auf eine Map nicht erst parsen muss
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from engine.world.map_cache import SOURCE_SUFFIXES, compile_map, default_maps_dir
+
+
+def main():
+    """Hauptfunktion"""
+    maps_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else default_maps_dir()
+    map_ids = sorted({path.stem for path in maps_dir.iterdir() if path.suffix in SOURCE_SUFFIXES})
+
+    failed = 0
+    for map_id in map_ids:
+        start = time.perf_counter()
+        try:
+            path = compile_map(map_id, maps_dir)
+            print(f"✅ {map_id} -> {path.name} ({(time.perf_counter() - start) * 1000:.1f} ms)")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {map_id}: {e}")
+
+    print(f"\n{len(map_ids) - failed}/{len(map_ids)} Maps kompiliert")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
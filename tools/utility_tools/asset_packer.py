@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Asset Packer für Untold Story
+==============================
+Dekodiert alle Sprite-PNGs einmalig und schreibt sie als Rohpixel in das
+Asset-Pack (data/cache/sprites.uspk), das der SpriteManager mit einem
+Lesezugriff lädt. Ohne (aktuelles) Pack werden die losen Dateien geladen.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from engine.graphics.asset_pack import default_pack_path, sprite_files, write_pack
+
+
+def main():
+    """Hauptfunktion"""
+    project_root = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).parent.parent.parent
+    pack_path = default_pack_path(project_root)
+
+    start = time.perf_counter()
+    stats = write_pack(pack_path, project_root, sprite_files(project_root))
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"✅ {stats['files']} Sprites ({stats['blobs']} eindeutige) -> {pack_path}")
+    print(f"   {stats['bytes'] / 1024:.1f} KB in {elapsed:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
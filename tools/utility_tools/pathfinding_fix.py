@@ -42,16 +42,11 @@ def fix_area_pathfinding():
            len(tile_manager.collision_map) != self.height or \
            (tile_manager.collision_map and len(tile_manager.collision_map[0]) != self.width):
             # Baue Collision-Map aus Area-Daten
-            tile_manager.map_width = self.width
-            tile_manager.map_height = self.height
-            tile_manager.collision_map = []
-            
-            for y in range(self.height):
-                row = []
-                for x in range(self.width):
-                    # Verwende Area's is_tile_solid Methode
-                    row.append(self.is_tile_solid(x, y))
-                tile_manager.collision_map.append(row)
+            # Zeilen erst aufbauen, dann als Ganzes zuweisen (baut das Collision-Grid)
+            tile_manager.collision_map = [
+                [self.is_tile_solid(x, y) for x in range(self.width)]
+                for y in range(self.height)
+            ]
         
         # Verwende TileManager's Pathfinding
         return tile_manager.find_path(start, goal)
@@ -111,16 +106,11 @@ def fix_npc_pathfinding():
         if not tile_manager.collision_map or \
            len(tile_manager.collision_map) != self.area.height:
             # Baue Collision-Map aus Area-Daten
-            tile_manager.map_width = self.area.width
-            tile_manager.map_height = self.area.height
-            tile_manager.collision_map = []
-            
-            for y in range(self.area.height):
-                row = []
-                for x in range(self.area.width):
-                    # Verwende Area's is_tile_solid Methode
-                    row.append(self.area.is_tile_solid(x, y))
-                tile_manager.collision_map.append(row)
+            # Zeilen erst aufbauen, dann als Ganzes zuweisen (baut das Collision-Grid)
+            tile_manager.collision_map = [
+                [self.area.is_tile_solid(x, y) for x in range(self.area.width)]
+                for y in range(self.area.height)
+            ]
         
         # Verwende TileManager's Pathfinding
         if hasattr(tile_manager, 'find_path_diagonal'):